@@ -9,12 +9,11 @@ import copy
 import VariableParser
 import ParserUtil
 import MethodParser
+import Diagnostics
+import ProgramGrammar
 
-class ActorclassParseStatus:
-    NoneStatus = 0
-    ToGetActorclassName = 1
-    GetActorclassName = 2
-    ActorclassVarMethodDeclaration = 4
+diag = Diagnostics.getChannel('actorclass')
+codegen = Diagnostics.getChannel('codegen')
 
 class ActorclassMethodCallInfo:
     def __init__(self):
@@ -23,6 +22,8 @@ class ActorclassMethodCallInfo:
     
 
 class ActorclassInfo:
+    __slots__ = ('actorclassName', 'variables', 'methods', 'childActorclasses')
+
     def __init__(self):
         self.actorclassName = ''
         self.variables = {}
@@ -37,15 +38,21 @@ class ActorclassInfo:
             if not child_actorclasses[i] in self.childActorclasses:
                 self.childActorclasses.append( child_actorclasses[i] )
         
+    def sortedMethods(self):
+        # Methods are emitted by name, so reordering definitions in the
+        # source does not change the output
+        return [self.methods[name] for name in sorted(self.methods)]
+
     def updateActorclassMethodImplementation(self, method_name, implementations):
-        print("ActorclassDefinitionInfo::updateActorclassMethodImplementation")
-        if method_name in self.methods.keys():
+        if diag.debug:
+            diag.write("ActorclassDefinitionInfo::updateActorclassMethodImplementation")
+        if method_name in self.methods:
             self.methods[method_name].implementation = implementations
 
     def getOutputContextMethodName(self, method_name, method_type):
         # print "ContextDefinitionInfo::getOutputContextMethodName %s %s" % (method_name, method_type)
         return_method_name = ''
-        if method_name in self.methods.keys():
+        if method_name in self.methods:
             return_method_name = ''
             if method_type == 'event':
                 return_method_name = "%s_event_%s_%s"%('async', self.methods[method_name].context_type, self.methods[method_name].define_name)
@@ -56,13 +63,14 @@ class ActorclassInfo:
         return return_method_name
 
     def checkContextMethod(self, method_name):
-        if method_name in self.methods.keys():
+        if method_name in self.methods:
             return True
         else:
             return False
     
     def generateActorclassDefinition(self):
-        print("ContextDefinitionInfo::generateContextDefinition: %s" % self.actorclassName)
+        if codegen.debug:
+            codegen.write("ContextDefinitionInfo::generateContextDefinition: %s" % self.actorclassName)
         lines = []
         line = 'context %s<int ctxId> {' % self.actorclassName
         lines.append(line)
@@ -76,18 +84,20 @@ class ActorclassInfo:
         return lines
 
     def generateEventAndAsyncMethodDefinition(self):
-        print("ActorclassDefinitionInfo::generateEventAndAsyncMethodDefinition: %s" % self.actorclassName)
+        if codegen.debug:
+            codegen.write("ActorclassDefinitionInfo::generateEventAndAsyncMethodDefinition: %s" % self.actorclassName)
         lines = []
-        for key, method in self.methods.items():
+        for method in self.sortedMethods():
             m_lines = method.generateEventAndAsyncMethodDefinition(self.actorclassName)
             for i in range(len(m_lines)):
                 lines.append(m_lines[i])
         return lines
 
     def generateSyncMethodDefinition(self):
-        print("ActorclassDefinitionInfo::generateSyncMethodDefinition: %s" % self.actorclassName)
+        if codegen.debug:
+            codegen.write("ActorclassDefinitionInfo::generateSyncMethodDefinition: %s" % self.actorclassName)
         lines = []
-        for key, method in self.methods.items():
+        for method in self.sortedMethods():
             m_lines = method.generateSyncMethodDefinition(self.actorclassName)
             for i in range(len(m_lines)):
                 lines.append(m_lines[i])
@@ -96,7 +106,8 @@ class ActorclassInfo:
     def getMethodReturnType(self, methodName):
         # print 'ContextDefinitionInfo::getContextMethodReturnType'
         if not methodName in self.methods:
-            print("Fail to find method %s" % methodName)
+            if diag.warning:
+                diag.write("Fail to find method %s" % methodName)
             return ""
         else:
             return self.methods[methodName].getReturnType()
@@ -123,94 +134,49 @@ class ActorclassInfo:
             return var_info
 
     def markActorclassMethodCallType(self, prefix, methodName):
-        if methodName in self.methods.keys():
+        if methodName in self.methods:
             self.methods[methodName].markMethodCallType(prefix)
 
 
 class ActorclassParser:
     @staticmethod
-    def parseVarMethodDeclaration(line, actorclass_info, actorclasses, actorclass_collection_vars):
-        print("ActorclassParser::parseVarMethodDeclaration")
-        l = len(line)
-        if l == 0:
-            return
-
-        is_yield = False
-        for i in range(len(line)):
-            if line[i].value == "yield":
-                is_yield = True
-                break
-
-        if line[l-1].type == 'CLOSE_PAREN':
-            actorclassMethodInfo = MethodParser.ActorclassMethodParser.parseMethodDeclaration(line, actorclass_info.actorclassName, actorclasses)
-            if actorclassMethodInfo.valid:
-                actorclass_info.methods[actorclassMethodInfo.definedName] = actorclassMethodInfo
+    def parseVarMethodDeclaration(member, actorclass_info, actorclasses, actorclass_collection_vars):
+        if diag.debug:
+            diag.write("ActorclassParser::parseVarMethodDeclaration")
+        if isinstance(member, ProgramGrammar.MethodDeclaration):
+            actorclassMethodInfo = MethodParser.ActorclassMethodParser.makeMethodDeclaration(member, actorclass_info.actorclassName, actorclasses)
+            actorclass_info.methods[actorclassMethodInfo.definedName] = actorclassMethodInfo
+        else:
+            variableInfo = VariableParser.VariableParser.makeVariable(member, actorclasses, actorclass_collection_vars)
+            if diag.debug:
+                diag.write('Add variable %s of type %s to actorclass(%s)' % (variableInfo.varName, variableInfo.varType, actorclass_info.actorclassName))
+            if 'yield' in member.type.qualifiers:
+                variableInfo.isChildActor = False
             else:
-                ParserUtil.MyUtil.exitWithError('Fail to parse context method declaration!')
-        elif line[l-1].type == 'NAME':
-            variableInfo = VariableParser.VariableParser.parseVariableDeclaration(line, actorclasses, actorclass_collection_vars) 
-            if variableInfo.type != VariableParser.VariableInfo.InvalidType:
-                print('Add variable %s of type %s to actorclass(%s)' % (variableInfo.varName, variableInfo.varType, actorclass_info.actorclassName))
-                if is_yield:
-                    variableInfo.isChildActor = False
-                else:
-                    variableInfo.isChildActor = True
-                    if variableInfo.actorclass != "" and not variableInfo.actorclass in actorclass_info.childActorclasses:
-                        actorclass_info.childActorclasses.append(variableInfo.actorclass)
-                        print("Add child %s to %s" % (variableInfo.actorclass, actorclass_info.actorclassName))
-                actorclass_info.variables[variableInfo.varName] = variableInfo
+                variableInfo.isChildActor = True
+                if variableInfo.actorclass != "" and not variableInfo.actorclass in actorclass_info.childActorclasses:
+                    actorclass_info.childActorclasses.append(variableInfo.actorclass)
+                    if diag.debug:
+                        diag.write("Add child %s to %s" % (variableInfo.actorclass, actorclass_info.actorclassName))
+            actorclass_info.variables[variableInfo.varName] = variableInfo
 
     @staticmethod
-    def parse(tokens, actorclasses, actorclass_collection_vars ):
-        print("ActorclassParser::parse")
-        current_parse_status = ActorclassParseStatus.NoneStatus
+    def parse(declaration, symbols):
+        # The ActorclassInfo of a ProgramGrammar.ActorclassDeclaration
+        if diag.debug:
+            diag.write("ActorclassParser::parse")
         actorclass_info = ActorclassInfo()
+        actorclass_info.actorclassName = declaration.name.value
 
+        actorclasses = symbols.actorclasses
+        actorclass_collection_vars = symbols.getCollectionVars(actorclass_info.actorclassName)
         for var, var_info in actorclass_collection_vars.items():
             if var_info.actorclass != "" and not var_info.actorclass in actorclass_info.childActorclasses:
                 actorclass_info.childActorclasses.append(var_info.actorclass)
-                print("Add child %s to %s" % (var_info.actorclass, actorclass_info.actorclassName))
-        
-        line = []
-        paren_depth = 0
-        brace_depth = 0
-        for i in range(len(tokens)):
-            tok = tokens[i]
-            print("type=%s, value=%s" % ( tok.type, tok.value))
-
-            if tok.type == 'OPEN_PAREN':
-                paren_depth = paren_depth + 1
-            elif tok.type == 'CLOSE_PAREN':
-                paren_depth = paren_depth - 1
-            elif tok.type == 'OPEN_BRACE':
-                brace_depth = brace_depth + 1
-            elif tok.type == 'CLOSE_BRACE':
-                brace_depth = brace_depth - 1
-
-            if current_parse_status == ActorclassParseStatus.NoneStatus:
-                if tok.type == 'NAME' and tok.value == 'actorclass':
-                    current_parse_status = ActorclassParseStatus.ToGetActorclassName
-                else:
-                	ParserUtil.MyUtil.exitWithError('Syntax error here!')
-            elif current_parse_status == ActorclassParseStatus.ToGetActorclassName:
-                if tok.type == 'NAME':
-                    actorclass_info.actorclassName = tok.value
-                    # print "Start to parse actorclasses %s" % tok.value
-                    current_parse_status = ActorclassParseStatus.GetActorclassName
-                else:
-                	ParserUtil.MyUtil.exitWithError('Syntax error here!')
-            elif current_parse_status == ActorclassParseStatus.GetActorclassName:
-                if tok.type == 'OPEN_BRACE':
-                    current_parse_status = ActorclassParseStatus.ActorclassVarMethodDeclaration
-                else:
-                	ParserUtil.MyUtil.exitWithError('Syntax error here!')
-            elif current_parse_status == ActorclassParseStatus.ActorclassVarMethodDeclaration:
-                if tok.type == 'SEMI_COLON' and paren_depth == 0:
-                    ActorclassParser.parseVarMethodDeclaration(line, actorclass_info, actorclasses, actorclass_collection_vars)
-                    line = []
-                else:
-                    line.append(tok)
-            else:
-            	ParserUtil.MyUtil.exitWithError('Syntax error here!')
+                if diag.debug:
+                    diag.write("Add child %s to %s" % (var_info.actorclass, actorclass_info.actorclassName))
+
+        for member in declaration.members:
+            ActorclassParser.parseVarMethodDeclaration(member, actorclass_info, actorclasses, actorclass_collection_vars)
 
-        return actorclass_info
\ No newline at end of file
+        return actorclass_info
@@ -0,0 +1,268 @@
+import os
+import io
+import sys
+import glob
+import json
+import time
+import argparse
+import contextlib
+import multiprocessing
+
+import CppHeaderParser
+import CompileCache
+import Diagnostics
+
+# Compiles many AEON sources on a pool of worker processes.
+#
+# Workers are started once and import the compiler (and build the lexer)
+# once, so each further file only pays for its own compile.  Every file is
+# compiled independently into its own output, and results are returned in
+# the order the files were given whatever order the workers finish in; the
+# output of a compile, including any diagnostics it prints, is captured and
+# returned with its result rather than interleaved on stdout.
+#
+# With a cache directory every worker reads and writes the shared
+# CompileCache; the parent merges the workers' hit counts and flushes the
+# cache once per batch.
+
+class CompileResult:
+    __slots__ = ('index', 'input', 'output', 'status', 'message', 'outputChanged', 'log', 'wall', 'cpu', 'worker',
+                 'cacheStats')
+
+    def __init__(self, index, input, output):
+        self.index = index
+        self.input = input
+        self.output = output
+        # 'ok' or 'error'
+        self.status = 'error'
+        self.message = ''
+        # False when the output already had the generated content and was left alone
+        self.outputChanged = False
+        # Everything the compile wrote to stdout
+        self.log = ''
+        self.wall = 0.0
+        self.cpu = 0.0
+        self.worker = os.getpid()
+        # kind -> counters, when compiled with a cache
+        self.cacheStats = None
+
+    def ok(self):
+        return self.status == 'ok'
+
+    def toDict(self):
+        return {
+            'input': self.input,
+            'output': self.output,
+            'status': self.status,
+            'message': self.message,
+            'outputChanged': self.outputChanged,
+            'wall': round(self.wall, 6),
+            'cpu': round(self.cpu, 6),
+            'worker': self.worker,
+            'cache': self.cacheStats,
+        }
+
+def initWorker(diagnostics):
+    if diagnostics is not None:
+        Diagnostics.configure(diagnostics)
+
+def compileTask(task):
+    # Runs in a worker: task is (index, input, output, cache_dir, cache_max_bytes)
+    index, input, output, cache_dir, cache_max_bytes = task
+    result = CompileResult(index, input, output)
+    cache = None
+    if cache_dir is not None:
+        cache = CompileCache.CompileCache(cache_dir, cache_max_bytes)
+
+    log = io.StringIO()
+    wall_start = time.perf_counter()
+    cpu_start = time.process_time()
+    try:
+        with contextlib.redirect_stdout(log):
+            parser = CppHeaderParser.AEONParser(input, output, cache=cache)
+        result.status = 'ok'
+        result.outputChanged = parser.outputChanged
+    except CppHeaderParser.CppParseError as e:
+        result.message = str(e)
+    except Exception as e:
+        # One broken file must not take the rest of the batch down
+        result.message = "%s: %s" % (type(e).__name__, e)
+    result.wall = time.perf_counter() - wall_start
+    result.cpu = time.process_time() - cpu_start
+    result.log = log.getvalue()
+    if cache is not None:
+        result.cacheStats = cache.report()['kinds']
+    return result
+
+def availableCPUs():
+    if hasattr(os, 'sched_getaffinity'):
+        return len(os.sched_getaffinity(0))
+    return os.cpu_count() or 1
+
+class BatchCompiler:
+    def __init__(self, jobs=None, cache_dir=None, cache_max_bytes=CompileCache.DEFAULT_MAX_BYTES, diagnostics=None):
+        if jobs is None:
+            jobs = availableCPUs()
+        self.jobs = jobs
+        self.cacheDir = cache_dir
+        self.cacheMaxBytes = cache_max_bytes
+        self.diagnostics = diagnostics
+        # Started on the first compile() and reused by later ones
+        self.pool = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+        return False
+
+    def close(self):
+        if self.pool is not None:
+            self.pool.close()
+            self.pool.join()
+            self.pool = None
+
+    def compile(self, files):
+        # files is a list of (input, output); returns a CompileResult per file, in the same order
+        outputs = {}
+        for input, output in files:
+            path = os.path.abspath(output)
+            if path in outputs:
+                raise ValueError("%s and %s both compile to %s" % (outputs[path], input, output))
+            outputs[path] = input
+
+        tasks = []
+        for index in range(len(files)):
+            input, output = files[index]
+            tasks.append((index, input, output, self.cacheDir, self.cacheMaxBytes))
+
+        if self.jobs <= 1 or len(tasks) <= 1:
+            initWorker(self.diagnostics)
+            results = [compileTask(task) for task in tasks]
+        else:
+            if self.pool is None:
+                self.pool = multiprocessing.Pool(self.jobs, initWorker, (self.diagnostics,))
+            results = list(self.pool.imap_unordered(compileTask, tasks))
+            results.sort(key=lambda result: result.index)
+
+        if self.cacheDir is not None and len(results) > 0:
+            cache = CompileCache.CompileCache(self.cacheDir, self.cacheMaxBytes)
+            for result in results:
+                if result.cacheStats is not None:
+                    cache.addStats(result.cacheStats)
+            cache.flush()
+        return results
+
+def expandSources(patterns):
+    # Files and glob patterns to a sorted list of files; raises ValueError for a pattern that matches nothing
+    sources = set()
+    for pattern in patterns:
+        matches = glob.glob(pattern)
+        if len(matches) == 0:
+            raise ValueError("No source matches '%s'" % pattern)
+        for match in matches:
+            sources.add(os.path.normpath(match))
+    return sorted(sources)
+
+def outputPath(source, output_dir=None, suffix=".mac"):
+    name = os.path.splitext(os.path.basename(source))[0] + suffix
+    if output_dir is None:
+        return os.path.join(os.path.dirname(source), name)
+    return os.path.join(output_dir, name)
+
+def readPairs(path):
+    # Lines of "input output"; blank lines and # comments are skipped
+    files = []
+    fd = open(path)
+    for line in fd:
+        line = line.strip()
+        if line == "" or line.startswith("#"):
+            continue
+        fields = line.split()
+        if len(fields) != 2:
+            fd.close()
+            raise ValueError("%s: expected 'input output', got '%s'" % (path, line))
+        files.append((fields[0], fields[1]))
+    fd.close()
+    return files
+
+def main(argv=None):
+    arg_parser = argparse.ArgumentParser(description="Translate many AEON programs into Mace services in parallel")
+    arg_parser.add_argument("sources", nargs="*", help="AEON source files or glob patterns")
+    arg_parser.add_argument("--pairs", metavar="FILE", help="read 'input output' lines from FILE")
+    arg_parser.add_argument("-o", "--output-dir", metavar="DIR",
+                            help="write outputs to DIR instead of next to each source")
+    arg_parser.add_argument("--suffix", default=".mac", help="output file suffix (default .mac)")
+    arg_parser.add_argument("-j", "--jobs", type=int, default=None,
+                            help="worker processes (default: one per available CPU)")
+    arg_parser.add_argument("--cache", metavar="DIR", help="share a compile cache in DIR between the workers")
+    arg_parser.add_argument("--cache-max-size", metavar="SIZE", default=None,
+                            help="with --cache, evict least recently used entries beyond SIZE bytes (default 64M)")
+    arg_parser.add_argument("--trace", action="append", default=[], metavar="SPEC",
+                            help="diagnostics to enable in the workers, as for CppHeaderParser.py")
+    arg_parser.add_argument("-v", "--verbose", action="store_true", help="print each compile's captured output")
+    arg_parser.add_argument("--json", metavar="FILE", help="write per-file status and timings to FILE")
+    args = arg_parser.parse_args(argv)
+
+    try:
+        files = []
+        if args.pairs is not None:
+            files.extend(readPairs(args.pairs))
+        for source in expandSources(args.sources):
+            files.append((source, outputPath(source, args.output_dir, args.suffix)))
+        diagnostics = ",".join(args.trace)
+        Diagnostics.configure(diagnostics)
+    except (ValueError, IOError, OSError) as e:
+        arg_parser.error(str(e))
+    if len(files) == 0:
+        arg_parser.error("no sources given")
+    if args.cache is None and args.cache_max_size is not None:
+        arg_parser.error("--cache-max-size needs --cache")
+    cache_max_bytes = CompileCache.DEFAULT_MAX_BYTES
+    if args.cache_max_size is not None:
+        try:
+            cache_max_bytes = CompileCache.parseSize(args.cache_max_size)
+        except ValueError:
+            arg_parser.error("invalid --cache-max-size '%s'" % args.cache_max_size)
+    if args.output_dir is not None and not os.path.isdir(args.output_dir):
+        os.makedirs(args.output_dir)
+
+    start = time.perf_counter()
+    batch = BatchCompiler(args.jobs, args.cache, cache_max_bytes, diagnostics)
+    try:
+        results = batch.compile(files)
+    except ValueError as e:
+        arg_parser.error(str(e))
+    finally:
+        batch.close()
+    wall = time.perf_counter() - start
+
+    failed = 0
+    compile_wall = 0.0
+    for result in results:
+        compile_wall = compile_wall + result.wall
+        if result.ok() and not result.outputChanged:
+            print("same   %8.3fs  %s -> %s" % (result.wall, result.input, result.output))
+        elif result.ok():
+            print("ok     %8.3fs  %s -> %s" % (result.wall, result.input, result.output))
+        else:
+            failed = failed + 1
+            print("error  %8.3fs  %s: %s" % (result.wall, result.input, result.message))
+        if args.verbose and result.log != "":
+            sys.stdout.write(result.log)
+    print("%d files, %d ok, %d failed in %.3fs (%.3fs compiling) on %d workers" % (
+        len(results), len(results) - failed, failed, wall, compile_wall, min(batch.jobs, len(results))))
+
+    if args.json is not None:
+        fd = open(args.json, "w")
+        json.dump({'wall': round(wall, 6), 'jobs': batch.jobs, 'files': [result.toDict() for result in results]}, fd, indent=2)
+        fd.write("\n")
+        fd.close()
+
+    if failed > 0:
+        return 1
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
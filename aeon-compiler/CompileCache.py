@@ -0,0 +1,356 @@
+import os
+import json
+import hashlib
+import tempfile
+import collections
+
+# On-disk, content-addressed cache of translated program pieces.
+#
+# AEONParser stores two kinds of entries:
+#   actorclass  the generated context declaration of one actorclass, keyed by
+#               the declaration's tokens and the set of actorclass names
+#   method      the translated body of one Class::method (or main), keyed by
+#               the definition's tokens and the set of actorclass names
+#
+# A method body also depends on symbol-index entries that its tokens do not
+# show: the variables and declarations of its own actorclass and the return
+# type of every method it calls.  Those are recorded with the entry and
+# checked on lookup; an entry whose dependencies changed is a miss.  The
+# calls the translation marked as event/async/sync are stored too and
+# replayed on a hit.
+#
+# Every key includes a fingerprint of the compiler's own sources, so a change
+# to the translator never reuses old output.  Entries are single JSON files
+# under <dir>/<key[:2]>/, written atomically so several compiles may share a
+# directory.  A hit refreshes the entry's mtime and flush() evicts the least
+# recently used entries once the directory grows past max_bytes.
+#
+# MemoryCache keeps the same entries in process memory instead, for a
+# long-running compiler such as CompileServer.
+
+FORMAT_VERSION = 1
+
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+
+KINDS = ('actorclass', 'method')
+
+STATS_FILE = "stats.json"
+
+COMPILER_DIR = os.path.dirname(os.path.abspath(__file__))
+
+compilerFingerprint = None
+
+def getCompilerFingerprint():
+    global compilerFingerprint
+    if compilerFingerprint is None:
+        h = hashlib.sha256()
+        h.update(("aeon-cache-%d\0" % FORMAT_VERSION).encode())
+        for name in sorted(os.listdir(COMPILER_DIR)):
+            if not name.endswith(".py"):
+                continue
+            fd = open(os.path.join(COMPILER_DIR, name), "rb")
+            h.update(name.encode() + b"\0")
+            h.update(fd.read())
+            fd.close()
+        compilerFingerprint = h.hexdigest()
+    return compilerFingerprint
+
+def tokenDigest(tokens):
+    text = "\n".join(["%s\0%s" % (tok.type, tok.value) for tok in tokens])
+    return hashlib.sha256(text.encode()).hexdigest()
+
+def parseSize(text):
+    # "65536", "512K", "64M" or "1G"
+    text = text.strip().upper()
+    scale = 1
+    if text.endswith("B"):
+        text = text[:-1]
+    if text[-1:] in ("K", "M", "G"):
+        scale = 1024 ** ("KMG".index(text[-1]) + 1)
+        text = text[:-1]
+    return int(float(text) * scale)
+
+class CacheStats:
+    __slots__ = ('hits', 'misses', 'stale', 'stores')
+
+    def __init__(self):
+        self.hits = 0
+        self.misses = 0
+        # Entries that were found but whose dependencies changed; also misses
+        self.stale = 0
+        self.stores = 0
+
+    def lookups(self):
+        return self.hits + self.misses
+
+    def hitRate(self):
+        if self.lookups() == 0:
+            return 0.0
+        return float(self.hits) / self.lookups()
+
+    def toDict(self):
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'stale': self.stale,
+            'stores': self.stores,
+        }
+
+class CompileCache:
+    def __init__(self, path, max_bytes=DEFAULT_MAX_BYTES):
+        self.path = os.path.abspath(os.path.expandvars(path))
+        self.maxBytes = max_bytes
+        self.fingerprint = getCompilerFingerprint()
+        # kind -> CacheStats, since this object was created
+        self.stats = {}
+        for kind in KINDS:
+            self.stats[kind] = CacheStats()
+        self.evictions = 0
+        # Counters already added to the lifetime stats by flush()
+        self.flushedStats = {}
+        for kind in KINDS:
+            self.flushedStats[kind] = CacheStats()
+        self.flushedEvictions = 0
+        if not os.path.isdir(self.path):
+            os.makedirs(self.path)
+
+    def makeKey(self, kind, *parts):
+        h = hashlib.sha256()
+        h.update(self.fingerprint.encode())
+        h.update(b"\0" + kind.encode())
+        for part in parts:
+            h.update(b"\0" + part.encode())
+        return h.hexdigest()
+
+    def addStats(self, kinds):
+        # Adds counters reported by another process, e.g. a batch worker
+        for kind, counts in kinds.items():
+            stats = self.stats[kind]
+            stats.hits = stats.hits + counts['hits']
+            stats.misses = stats.misses + counts['misses']
+            stats.stale = stats.stale + counts['stale']
+            stats.stores = stats.stores + counts['stores']
+
+    def entryPath(self, key):
+        return os.path.join(self.path, key[:2], key[2:] + ".json")
+
+    def lookup(self, kind, key, validate=None):
+        # Returns the stored entry, or None on a miss.  validate, if given, is
+        # called with the entry and returns False when it is out of date.
+        stats = self.stats[kind]
+        path = self.entryPath(key)
+        try:
+            fd = open(path)
+            entry = json.load(fd)
+            fd.close()
+        except (IOError, OSError):
+            stats.misses = stats.misses + 1
+            return None
+        except ValueError:
+            # A damaged entry is dropped and rebuilt
+            self.removeEntry(path)
+            stats.misses = stats.misses + 1
+            return None
+
+        if validate is not None and not validate(entry):
+            stats.misses = stats.misses + 1
+            stats.stale = stats.stale + 1
+            return None
+
+        stats.hits = stats.hits + 1
+        try:
+            os.utime(path, None)
+        except OSError:
+            pass
+        return entry
+
+    def store(self, kind, key, entry):
+        path = self.entryPath(key)
+        directory = os.path.dirname(path)
+        if not os.path.isdir(directory):
+            try:
+                os.makedirs(directory)
+            except OSError:
+                if not os.path.isdir(directory):
+                    raise
+        self.writeAtomically(path, json.dumps(entry))
+        self.stats[kind].stores = self.stats[kind].stores + 1
+
+    def writeAtomically(self, path, text):
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), prefix=".tmp-")
+        try:
+            f = os.fdopen(fd, "w")
+            f.write(text)
+            f.close()
+            os.replace(tmp_path, path)
+        except:
+            self.removeEntry(tmp_path)
+            raise
+
+    def removeEntry(self, path):
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+    def entries(self):
+        # [(mtime, size, path)] of every entry file
+        result = []
+        for sub in os.listdir(self.path):
+            directory = os.path.join(self.path, sub)
+            if len(sub) != 2 or not os.path.isdir(directory):
+                continue
+            for name in os.listdir(directory):
+                if not name.endswith(".json"):
+                    continue
+                path = os.path.join(directory, name)
+                try:
+                    st = os.stat(path)
+                except OSError:
+                    continue
+                result.append((st.st_mtime, st.st_size, path))
+        return result
+
+    def totalBytes(self):
+        total = 0
+        for mtime, size, path in self.entries():
+            total = total + size
+        return total
+
+    def trim(self):
+        # Evicts least recently used entries until the cache fits in maxBytes
+        entries = self.entries()
+        total = 0
+        for mtime, size, path in entries:
+            total = total + size
+        if total <= self.maxBytes:
+            return
+        entries.sort()
+        for mtime, size, path in entries:
+            if total <= self.maxBytes:
+                break
+            self.removeEntry(path)
+            total = total - size
+            self.evictions = self.evictions + 1
+
+    def flush(self):
+        # Called once a compile (or a batch of them) is done: applies the
+        # size bound and adds the new counters to the lifetime stats
+        self.trim()
+
+        lifetime = self.lifetimeStats()
+        for kind in KINDS:
+            counts = lifetime['kinds'].setdefault(kind, CacheStats().toDict())
+            current = self.stats[kind].toDict()
+            flushed = self.flushedStats[kind].toDict()
+            for name in current:
+                counts[name] = counts.get(name, 0) + current[name] - flushed[name]
+            for name in current:
+                setattr(self.flushedStats[kind], name, current[name])
+        lifetime['evictions'] = lifetime.get('evictions', 0) + self.evictions - self.flushedEvictions
+        self.flushedEvictions = self.evictions
+        self.writeAtomically(os.path.join(self.path, STATS_FILE), json.dumps(lifetime, indent=2, sort_keys=True) + "\n")
+
+    def lifetimeStats(self):
+        try:
+            fd = open(os.path.join(self.path, STATS_FILE))
+            lifetime = json.load(fd)
+            fd.close()
+        except (IOError, OSError, ValueError):
+            lifetime = {}
+        if lifetime.get('version') != FORMAT_VERSION:
+            lifetime = {'version': FORMAT_VERSION, 'kinds': {}, 'evictions': 0}
+        return lifetime
+
+    def report(self):
+        kinds = {}
+        for kind in KINDS:
+            kinds[kind] = self.stats[kind].toDict()
+            kinds[kind]['hitRate'] = round(self.stats[kind].hitRate(), 4)
+        return {
+            'version': FORMAT_VERSION,
+            'path': self.path,
+            'maxBytes': self.maxBytes,
+            'kinds': kinds,
+            'evictions': self.evictions,
+        }
+
+    def formatStats(self):
+        lines = []
+        lines.append("compile cache %s" % self.path)
+        lifetime = self.lifetimeStats()
+        for kind in KINDS:
+            stats = self.stats[kind]
+            line = "  %-10s %6d hits %6d misses (%d stale)  hit rate %5.1f%%" % (
+                kind, stats.hits, stats.misses, stats.stale, stats.hitRate() * 100)
+            counts = lifetime['kinds'].get(kind)
+            if counts is not None:
+                lookups = counts['hits'] + counts['misses']
+                rate = 0.0
+                if lookups > 0:
+                    rate = float(counts['hits']) / lookups
+                line = line + "  [lifetime %5.1f%% of %d]" % (rate * 100, lookups)
+            lines.append(line)
+        lines.append("  %d evictions, %d of %d bytes used" % (self.evictions, self.totalBytes(), self.maxBytes))
+        return lines
+
+class MemoryCache(CompileCache):
+    def __init__(self, max_bytes=DEFAULT_MAX_BYTES):
+        self.path = None
+        self.maxBytes = max_bytes
+        self.fingerprint = getCompilerFingerprint()
+        self.stats = {}
+        for kind in KINDS:
+            self.stats[kind] = CacheStats()
+        self.evictions = 0
+        # key -> (size, entry), least recently used first
+        self.memoryEntries = collections.OrderedDict()
+        self.memoryBytes = 0
+
+    def lookup(self, kind, key, validate=None):
+        stats = self.stats[kind]
+        item = self.memoryEntries.get(key)
+        if item is None:
+            stats.misses = stats.misses + 1
+            return None
+        entry = item[1]
+        if validate is not None and not validate(entry):
+            stats.misses = stats.misses + 1
+            stats.stale = stats.stale + 1
+            return None
+        stats.hits = stats.hits + 1
+        self.memoryEntries.move_to_end(key)
+        return entry
+
+    def store(self, kind, key, entry):
+        # Entries are kept as they are, so the stored lines must not change later
+        size = 256
+        for line in entry['lines']:
+            size = size + len(line) + 8
+        old = self.memoryEntries.pop(key, None)
+        if old is not None:
+            self.memoryBytes = self.memoryBytes - old[0]
+        self.memoryEntries[key] = (size, entry)
+        self.memoryBytes = self.memoryBytes + size
+        self.stats[kind].stores = self.stats[kind].stores + 1
+        self.trim()
+
+    def totalBytes(self):
+        return self.memoryBytes
+
+    def trim(self):
+        while self.memoryBytes > self.maxBytes and len(self.memoryEntries) > 0:
+            key, item = self.memoryEntries.popitem(last=False)
+            self.memoryBytes = self.memoryBytes - item[0]
+            self.evictions = self.evictions + 1
+
+    def flush(self):
+        pass
+
+    def lifetimeStats(self):
+        return {'version': FORMAT_VERSION, 'kinds': {}, 'evictions': self.evictions}
+
+    def formatStats(self):
+        lines = CompileCache.formatStats(self)
+        lines[0] = "compile cache in memory, %d entries" % len(self.memoryEntries)
+        return lines
@@ -0,0 +1,419 @@
+import os
+import io
+import sys
+import json
+import time
+import socket
+import argparse
+import selectors
+import contextlib
+
+import CppHeaderParser
+import CompileCache
+import BatchCompiler
+import Diagnostics
+
+# Long-running compiler for a set of watched sources.
+#
+# The server keeps the translated declarations and method bodies of every
+# compile in a MemoryCache (or a CompileCache directory), so recompiling a
+# source after an edit only translates the definitions that changed.  A
+# source is recompiled when its mtime or size differs from the last compile,
+# either on request or, in watch mode, as soon as polling notices.
+#
+# Clients talk to it in JSON lines, one request and one response per line,
+# over stdin/stdout or a Unix socket:
+#
+#   {"id": 1, "cmd": "add", "input": "app.cc", "output": "app.mac"}
+#   {"id": 2, "cmd": "compile"}                  changed watched sources
+#   {"id": 3, "cmd": "compile", "inputs": ["app.cc"], "force": true}
+#   {"id": 4, "cmd": "remove", "input": "app.cc"}
+#   {"id": 5, "cmd": "status"}
+#   {"id": 6, "cmd": "stats"}                    latencies and cache hits
+#   {"id": 7, "cmd": "shutdown"}
+#
+# Every response echoes the id, has "ok" and, unless ok is false with an
+# "error", the command's results; "latency" is the seconds the server took
+# to answer.  In watch mode over stdin/stdout, compiles triggered by polling
+# are reported as {"event": "compiled", "result": {...}} lines.
+
+PROTOCOL_VERSION = 1
+
+DEFAULT_POLL_INTERVAL = 0.5
+
+class WatchedSource:
+    __slots__ = ('input', 'output', 'signature', 'result', 'compiles')
+
+    def __init__(self, input, output):
+        self.input = input
+        self.output = output
+        # (mtime_ns, size) of the input at the last compile
+        self.signature = None
+        self.result = None
+        self.compiles = 0
+
+def sourceSignature(path):
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return (st.st_mtime_ns, st.st_size)
+
+class LatencyStats:
+    __slots__ = ('count', 'total', 'min', 'max')
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.min = None
+        self.max = 0.0
+
+    def add(self, seconds):
+        self.count = self.count + 1
+        self.total = self.total + seconds
+        if self.min is None or seconds < self.min:
+            self.min = seconds
+        if seconds > self.max:
+            self.max = seconds
+
+    def toDict(self):
+        mean = 0.0
+        if self.count > 0:
+            mean = self.total / self.count
+        return {
+            'count': self.count,
+            'mean': round(mean, 6),
+            'min': round(self.min or 0.0, 6),
+            'max': round(self.max, 6),
+        }
+
+class CompileServer:
+    def __init__(self, cache=None):
+        if cache is None:
+            cache = CompileCache.MemoryCache()
+        self.cache = cache
+        # input path -> WatchedSource, in the order they were added
+        self.sources = {}
+        self.running = True
+        self.commands = {
+            'add': self.addCommand,
+            'remove': self.removeCommand,
+            'compile': self.compileCommand,
+            'status': self.statusCommand,
+            'stats': self.statsCommand,
+            'shutdown': self.shutdownCommand,
+        }
+        # command name -> LatencyStats
+        self.latencies = {}
+        # wall time of every compile, edit-triggered or not
+        self.compileTimes = LatencyStats()
+
+    ## Sources #################################################################
+    def add(self, input, output):
+        input = os.path.abspath(input)
+        source = self.sources.get(input)
+        if source is None:
+            source = WatchedSource(input, os.path.abspath(output))
+            self.sources[input] = source
+        else:
+            source.output = os.path.abspath(output)
+            source.signature = None
+        return self.compileSource(source)
+
+    def remove(self, input):
+        return self.sources.pop(os.path.abspath(input), None) is not None
+
+    def changedSources(self):
+        changed = []
+        for input, source in self.sources.items():
+            if source.signature is None or sourceSignature(input) != source.signature:
+                changed.append(source)
+        return changed
+
+    def poll(self):
+        # Recompiles every watched source whose file changed; returns their results
+        results = []
+        for source in self.changedSources():
+            signature = sourceSignature(source.input)
+            if signature is None and source.result is not None and source.result['status'] == 'missing':
+                continue
+            results.append(self.compileSource(source))
+        return results
+
+    def compileSource(self, source):
+        signature = sourceSignature(source.input)
+        hits_before = self.cache.stats['method'].hits
+        misses_before = self.cache.stats['method'].misses
+        log = io.StringIO()
+        status = 'ok'
+        message = ''
+        output_changed = False
+        start = time.perf_counter()
+        if signature is None:
+            status = 'missing'
+            message = "No such file: %s" % source.input
+        else:
+            try:
+                with contextlib.redirect_stdout(log):
+                    parser = CppHeaderParser.AEONParser(source.input, source.output, cache=self.cache)
+                output_changed = parser.outputChanged
+            except CppHeaderParser.CppParseError as e:
+                status = 'error'
+                message = str(e)
+            except Exception as e:
+                status = 'error'
+                message = "%s: %s" % (type(e).__name__, e)
+            self.cache.flush()
+        wall = time.perf_counter() - start
+        self.compileTimes.add(wall)
+
+        source.signature = signature
+        source.compiles = source.compiles + 1
+        source.result = {
+            'input': source.input,
+            'output': source.output,
+            'status': status,
+            'message': message,
+            'outputChanged': output_changed,
+            'log': log.getvalue(),
+            'wall': round(wall, 6),
+            'compiles': source.compiles,
+            'methodHits': self.cache.stats['method'].hits - hits_before,
+            'methodMisses': self.cache.stats['method'].misses - misses_before,
+        }
+        return source.result
+
+    ## Requests ################################################################
+    def handle(self, request):
+        # Returns the response to one request
+        start = time.perf_counter()
+        response = {'id': request.get('id')}
+        cmd = request.get('cmd')
+        try:
+            if not cmd in self.commands:
+                raise ValueError("Unknown command '%s', expected one of %s" % (cmd, ", ".join(sorted(self.commands))))
+            response.update(self.commands[cmd](request))
+            response['ok'] = True
+        except KeyError as e:
+            response['ok'] = False
+            response['error'] = "Request is missing '%s'" % e.args[0]
+        except (ValueError, TypeError) as e:
+            response['ok'] = False
+            response['error'] = str(e)
+        latency = time.perf_counter() - start
+        self.latencies.setdefault(str(cmd), LatencyStats()).add(latency)
+        response['latency'] = round(latency, 6)
+        return response
+
+    def addCommand(self, request):
+        input = request['input']
+        output = request.get('output')
+        if output is None:
+            output = BatchCompiler.outputPath(input)
+        return {'result': self.add(input, output)}
+
+    def removeCommand(self, request):
+        return {'removed': self.remove(request['input'])}
+
+    def compileCommand(self, request):
+        inputs = request.get('inputs')
+        if inputs is None:
+            selected = list(self.sources.values())
+        else:
+            selected = []
+            for input in inputs:
+                source = self.sources.get(os.path.abspath(input))
+                if source is None:
+                    raise ValueError("%s is not watched; add it first" % input)
+                selected.append(source)
+        results = []
+        unchanged = []
+        changed = set([source.input for source in self.changedSources()])
+        for source in selected:
+            if request.get('force', False) or source.input in changed:
+                results.append(self.compileSource(source))
+            else:
+                unchanged.append(source.input)
+        return {'results': results, 'unchanged': unchanged}
+
+    def statusCommand(self, request):
+        return {'sources': [source.result for source in self.sources.values()]}
+
+    def statsCommand(self, request):
+        latencies = {}
+        for cmd, stats in self.latencies.items():
+            latencies[cmd] = stats.toDict()
+        return {
+            'protocol': PROTOCOL_VERSION,
+            'sources': len(self.sources),
+            'compiles': self.compileTimes.toDict(),
+            'latencies': latencies,
+            'cache': self.cache.report(),
+        }
+
+    def shutdownCommand(self, request):
+        self.running = False
+        return {}
+
+class LineChannel:
+    # A connection carrying newline-separated JSON messages
+    def __init__(self, read_fd, write):
+        self.readFd = read_fd
+        self.write = write
+        self.buffer = b""
+
+    def readLines(self):
+        # Returns the complete lines received so far, or None once the peer closed
+        data = os.read(self.readFd, 65536)
+        if data == b"":
+            return None
+        self.buffer = self.buffer + data
+        lines = self.buffer.split(b"\n")
+        self.buffer = lines.pop()
+        return [line.decode() for line in lines if line.strip() != b""]
+
+    def send(self, message):
+        self.write((json.dumps(message) + "\n").encode())
+
+def handleLine(server, channel, line):
+    try:
+        request = json.loads(line)
+        if not isinstance(request, dict):
+            raise ValueError("a request is a JSON object")
+    except ValueError as e:
+        channel.send({'id': None, 'ok': False, 'error': "Bad request: %s" % e})
+        return
+    channel.send(server.handle(request))
+
+def serveStdio(server, poll_interval=None):
+    # Serves requests from stdin until it closes or a shutdown request
+    def write(data):
+        sys.stdout.buffer.write(data)
+        sys.stdout.buffer.flush()
+    channel = LineChannel(sys.stdin.fileno(), write)
+    selector = selectors.DefaultSelector()
+    selector.register(channel.readFd, selectors.EVENT_READ)
+    while server.running:
+        if len(selector.select(poll_interval)) > 0:
+            lines = channel.readLines()
+            if lines is None:
+                break
+            for line in lines:
+                handleLine(server, channel, line)
+                if not server.running:
+                    break
+        if poll_interval is not None and server.running:
+            for result in server.poll():
+                channel.send({'event': 'compiled', 'result': result})
+    selector.close()
+
+def serveUnixSocket(server, path, poll_interval=None):
+    # Serves any number of clients on the Unix socket at path until a shutdown request
+    if os.path.exists(path):
+        os.remove(path)
+    listener = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    listener.bind(path)
+    listener.listen(8)
+    selector = selectors.DefaultSelector()
+    selector.register(listener, selectors.EVENT_READ)
+    try:
+        while server.running:
+            for key, mask in selector.select(poll_interval):
+                if key.fileobj is listener:
+                    conn, addr = listener.accept()
+                    selector.register(conn, selectors.EVENT_READ, LineChannel(conn.fileno(), conn.sendall))
+                    continue
+                conn = key.fileobj
+                channel = key.data
+                try:
+                    lines = channel.readLines()
+                except OSError:
+                    lines = None
+                if lines is None:
+                    selector.unregister(conn)
+                    conn.close()
+                    continue
+                for line in lines:
+                    handleLine(server, channel, line)
+            if poll_interval is not None and server.running:
+                for result in server.poll():
+                    sys.stderr.write("%s %s (%.3fs)\n" % (result['status'], result['input'], result['wall']))
+    finally:
+        for key in list(selector.get_map().values()):
+            key.fileobj.close()
+        selector.close()
+        if os.path.exists(path):
+            os.remove(path)
+
+def sendRequest(path, request):
+    # Client side: sends one request to the server at path and returns its response
+    conn = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    conn.connect(path)
+    try:
+        conn.sendall((json.dumps(request) + "\n").encode())
+        data = b""
+        while not data.endswith(b"\n"):
+            chunk = conn.recv(65536)
+            if chunk == b"":
+                break
+            data = data + chunk
+    finally:
+        conn.close()
+    return json.loads(data.decode())
+
+def main(argv=None):
+    arg_parser = argparse.ArgumentParser(description="Keep compiling a set of AEON programs as they change")
+    arg_parser.add_argument("sources", nargs="*", metavar="INPUT[:OUTPUT]",
+                            help="sources to watch from the start; OUTPUT defaults to INPUT with a .mac suffix")
+    mode = arg_parser.add_mutually_exclusive_group(required=True)
+    mode.add_argument("--stdio", action="store_true", help="serve JSON-line requests on stdin/stdout")
+    mode.add_argument("--socket", metavar="PATH", help="serve JSON-line requests on a Unix socket")
+    mode.add_argument("--send", nargs=2, metavar=("PATH", "REQUEST"),
+                      help="send one JSON request to the server at PATH and print the response")
+    arg_parser.add_argument("--watch", action="store_true", help="recompile watched sources as soon as they change")
+    arg_parser.add_argument("--poll-interval", type=float, default=DEFAULT_POLL_INTERVAL,
+                            help="with --watch, seconds between checks (default %.1f)" % DEFAULT_POLL_INTERVAL)
+    arg_parser.add_argument("--cache", metavar="DIR",
+                            help="keep translations in a CompileCache in DIR instead of in memory")
+    arg_parser.add_argument("--trace", action="append", default=[], metavar="SPEC",
+                            help="diagnostics to enable, as for CppHeaderParser.py; returned in each result's log")
+    args = arg_parser.parse_args(argv)
+
+    if args.send is not None:
+        try:
+            request = json.loads(args.send[1])
+        except ValueError as e:
+            arg_parser.error("invalid request: %s" % e)
+        response = sendRequest(args.send[0], request)
+        print(json.dumps(response, indent=2))
+        if response.get('ok'):
+            return 0
+        return 1
+
+    try:
+        Diagnostics.configure(",".join(args.trace))
+    except ValueError as e:
+        arg_parser.error(str(e))
+
+    cache = None
+    if args.cache is not None:
+        cache = CompileCache.CompileCache(args.cache)
+    server = CompileServer(cache)
+    for spec in args.sources:
+        input, sep, output = spec.partition(":")
+        if output == "":
+            output = BatchCompiler.outputPath(input)
+        result = server.add(input, output)
+        sys.stderr.write("%s %s (%.3fs)\n" % (result['status'], result['input'], result['wall']))
+
+    poll_interval = None
+    if args.watch:
+        poll_interval = args.poll_interval
+    if args.stdio:
+        serveStdio(server, poll_interval)
+    else:
+        serveUnixSocket(server, args.socket, poll_interval)
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -52,6 +52,11 @@ import re
 
 import inspect
 import copy
+import shutil
+import filecmp
+import tempfile
+import argparse
+import threading
 
 import ParserUtil
 import MessageParser
@@ -59,6 +64,45 @@ import MethodParser
 import StructureParser
 import VariableParser
 import ActorclassParser
+import Tokenizer
+import Preprocessor
+import SymbolIndex
+import Diagnostics
+import Profiler
+import CompileCache
+import ParallelTranslator
+import ProgramIR
+import LineSpool
+import OwnershipGraph
+import TypeSystem
+import ProgramGrammar
+
+# Serializes the fallback of currentUmask()
+umaskLock = threading.Lock()
+
+def currentUmask():
+    # The process umask, which a file created by open() gets its mode from.
+    # Read from /proc where it is shown there; otherwise it has to be set to
+    # be read, and is set to the most restrictive one for that moment so
+    # files other threads create meanwhile are not opened up
+    try:
+        fd = open("/proc/self/status")
+        try:
+            for line in fd:
+                if line.startswith("Umask:"):
+                    return int(line.split()[1], 8)
+        finally:
+            fd.close()
+    except (OSError, ValueError):
+        pass
+    with umaskLock:
+        umask = os.umask(0o777)
+        os.umask(umask)
+    return umask
+
+diag = Diagnostics.getChannel('program')
+lexer_diag = Diagnostics.getChannel('lexer')
+codegen = Diagnostics.getChannel('codegen')
 
 
 def lineno():
@@ -149,9 +193,12 @@ def t_NEWLINE(t):
     t.lexer.lineno += len(t.value)
 
 def t_error(v):
-    print(( "Lex error: ", v ))
+    if lexer_diag.error:
+        lexer_diag.write("Lex error: %s" % v)
+
+# Built once per process; AEONParser instances share the compiled master pattern
+tokenizer = Tokenizer.AEONTokenizer(globals())
 
-lex.lex()
 # Controls error_print
 print_errors = 1
 # Controls warning_print
@@ -178,71 +225,66 @@ def trace_print(*arg):
         for a in arg: sys.stdout.write("%s "%a)
         sys.stdout.write("\n")
 
-supportedAccessSpecifier = [
+# Module-level tables are read-only defaults; everything an AEONParser changes
+# while it parses lives on the instance so several parsers can run at once.
+supportedAccessSpecifier = (
     'public',
     'protected', 
     'private'
-]
+)
 
 #Symbols to ignore, usually special macros
-ignoreSymbols = [
+ignoreSymbols = (
     'Q_OBJECT',
-]
+)
 
-doxygenCommentCache = ""
-
-#Track what was added in what order and at what depth
-parseHistory = []
+preprocessor = Preprocessor.AEONPreprocessor(ignoreSymbols)
 
 class CppParseError(Exception): pass
 
-class ProgramParseStatus:
-    NoneStatus = "ProgramNoneStatus"
-    ToGetActorclassName = "ToGetActorclassName"
-    ActorclassDefinition = "ActorclassDefinition"
-    ActorclassMethodDefinition = "ActorclassMethodDefinition"
-    MethodDefinition = "MethodDefinition"
-    StructureDefinition = "StructureDefinition"
-    RoutineDefinition = "RoutineDefinition"
-    GetActorclassMethodName = "GetActorclassMethodName"
-    MessageDefinition = "MessageDefinition"
-    UpcallDefinition = "UpcallDefinition"
-    ConfigVariable = "ConfigVariable"
+def releaseTokens(program_tokens):
+    # Yields the tokens, dropping the list's reference to each so those of
+    # finished definitions can be freed as the scan moves on
+    for k in range(0, len(program_tokens)):
+        tok = program_tokens[k]
+        program_tokens[k] = None
+        yield tok
 
 class AEONParser:
     IGNORE_NAMES = '__extension__'.split()
 
     ## Configurable variable #########################################################################################################
     def parseConfigVariable(self):
-        print("AEONParser::parseConfigVariable")
+        if diag.debug:
+            diag.write("AEONParser::parseConfigVariable")
         actorclasses = [ ]
         actorclass_collection_vars = { }
-        var_info = VariableParser.VariableParser.parseVariableDeclaration(self.tokens, actorclasses, actorclass_collection_vars)
+        var_info = VariableParser.VariableParser.makeVariable(self.declaration, actorclasses, actorclass_collection_vars)
         self.configVariables[ var_info.varName ] = var_info
         self.tokens = [ ]
 
     ##################################################################################################################################
    
     def checkContextType(self, ctx_name):
-        print("AEONParser::checkContextName: ", ctx_name)
+        if diag.debug:
+            diag.write("AEONParser::checkContextName: %s" % ctx_name)
 
-        if ctx_name in self.actorclasses.keys():
-            return True
-        else:
-            return False
+        return self.symbols.isActorclass(ctx_name)
 
     def checkChildContext(self, contextType, varName):
-        print('AEONParser::checkChildContext')
+        if diag.debug:
+            diag.write('AEONParser::checkChildContext')
 
-        if contextType in self.actorclasses.keys():
+        if contextType in self.actorclasses:
             return self.actorclasses[contextType].checkChildContext(varName)
         else:
             return False
 
     def getChildContext(self, contextType, varName):
-        print('AEONParser::checkChildContext')
+        if diag.debug:
+            diag.write('AEONParser::checkChildContext')
         var_info = VariableParser.VariableInfo()
-        if contextType in self.actorclasses.keys():
+        if contextType in self.actorclasses:
             return self.actorclasses[contextType].getChildContext(varName)
         else:
             return var_info
@@ -251,37 +293,40 @@ class AEONParser:
         return self.actorclasses.keys()
 
     def getContextInfo(self, ctx_name):
-        print('AEONParser::getContextInfo: ', ctx_name)
-        if ctx_name in self.actorclasses.keys():
+        if diag.debug:
+            diag.write('AEONParser::getContextInfo: %s' % ctx_name)
+        if ctx_name in self.actorclasses:
             return self.actorclasses[ctx_name]
         else:
             ctxInfo = ActorclassParser.ActorclassInfo()
             return ctxInfo
 
     def getActorclassMethodReturnType(self, contextType, methodName):
-        print("AEONParser::getActorclassMethodReturnType %s::%s" % (contextType, methodName))
-        name = "%s::%s" % (contextType, methodName)
-        if not name in self.actorclass_methods_returntype:
-            ParserUtil.MyUtil.exitWithError("Fail to find %s" % name)
+        if diag.debug:
+            diag.write("AEONParser::getActorclassMethodReturnType %s::%s" % (contextType, methodName))
+        return_type = self.symbols.getMethodReturnType(contextType, methodName)
+        if return_type is None:
+            ParserUtil.MyUtil.exitWithError("Fail to find %s::%s" % (contextType, methodName))
         else:
-            return self.actorclass_methods_returntype[name]
+            if self.methodReturnTypeDeps is not None:
+                self.methodReturnTypeDeps.append([contextType, methodName, return_type])
+            return return_type
 
     def getActorclassVariables(self, actorcalss):
-        if not actorcalss in self.actorclasses.keys():
-            return {}
-        else:
-            return self.actorclasses[actorcalss].getVariables()
+        return self.symbols.getVariables(actorcalss)
 
 
     def getActorclassMethodArgs( self, actorclass, method_name ):
-        if not actorclass in self.actorclasses.keys():
-            print("Fail to find actorclass %s", actorclass)
+        if not self.symbols.isActorclass(actorclass):
+            if diag.warning:
+                diag.write("Fail to find actorclass %s" % actorclass)
             return []
         else:
-            return self.actorclasses[actorclass].getActorclassMethodArgs(method_name)
+            return self.symbols.getMethodArgs(actorclass, method_name)
 
     def checkContextMethodDefinition(self, ctx_type):
-        print("AEONParser::checkContextMethodDefinition")
+        if diag.debug:
+            diag.write("AEONParser::checkContextMethodDefinition")
         pos = len(self.tokens) - 1
         if pos < 3:
             return False
@@ -298,76 +343,212 @@ class AEONParser:
         else:
             return False
 
-    def checkMethodDefinition(self):
-        pos = len(self.tokens) - 1
-        if pos < 2 or pos > 3:
-            return False
-
-        tok = self.tokens[pos-1]
-        if tok.type == 'NAME':
-            return True
-        else:
-            return False
-
     ## Actorclasses #########################################################################################################
     def parseActorclassDefinition(self):
-        print("AEONParser::parseActorclassDefinition")
-        actorclass_info = ActorclassParser.ActorclassParser.parse(self.tokens, self.defined_actorclasses, self.actorclass_collection_vars )
-        
-        if actorclass_info.actorclassName in self.actorclassMethodCallInfos:
-            call_infos = self.actorclassMethodCallInfos[actorclass_info.actorclassName]
-            for i in range(0, len(call_infos)):
-                actorclass_info.markActorclassMethodCallType( call_infos[i].call_prefix, call_infos[i].method_name)
-        
-        self.tokens = []
-        self.actorclasses[ actorclass_info.actorclassName ] = actorclass_info
+        if diag.debug:
+            diag.write("AEONParser::parseActorclassDefinition")
+        with self.profiler.phase('parseActorclassDefinition') as phase:
+            phase.count('tokens', len(self.tokens))
+            cache_key = None
+            if self.cache is not None:
+                cache_key = self.cache.makeKey('actorclass', CompileCache.tokenDigest(self.tokens), self.symbols.namesDigest())
+            actorclass_info = ActorclassParser.ActorclassParser.parse(self.declaration, self.symbols)
+            self.symbols.registerActorclass(actorclass_info)
+            
+            if actorclass_info.actorclassName in self.actorclassMethodCallInfos:
+                call_infos = self.actorclassMethodCallInfos[actorclass_info.actorclassName]
+                for i in range(0, len(call_infos)):
+                    actorclass_info.markActorclassMethodCallType( call_infos[i].call_prefix, call_infos[i].method_name)
+            
+            self.tokens = []
+            self.actorclasses[ actorclass_info.actorclassName ] = actorclass_info
+            self.actorclassCacheKeys[ actorclass_info.actorclassName ] = cache_key
+            phase.setItem(actorclass_info.actorclassName)
+            phase.count('variables', len(actorclass_info.variables))
+            phase.count('methods', len(actorclass_info.methods))
 
     def parseStructDefinition(self):
-        print("AEONParser::parseStructDefinition: Analyze struct definition")
-        structInfo = StructureParser.StructDefinitionParser.parse(self.tokens)
+        if diag.debug:
+            diag.write("AEONParser::parseStructDefinition: Analyze struct definition")
+        structInfo = StructureParser.StructDefinitionParser.parse(self.declaration)
         #print "Get struct %s definition" % structInfo.struct_name
-        self.structs[ structInfo.struct_name ] = structInfo
+        self.structures[ structInfo.struct_name ] = structInfo
         self.tokens = []
 
     def parseMessageDefinition(self):
-        print("AEONParser::parseMessageDefinition")
-        msgInfo = MessageParser.MessageDefinitionParser.parse(self.tokens)
+        if diag.debug:
+            diag.write("AEONParser::parseMessageDefinition")
+        msgInfo = MessageParser.MessageDefinitionParser.parse(self.declaration)
         #print "Get struct %s definition" % structInfo.struct_name
         self.messages[ msgInfo.message_name ] = msgInfo
         self.tokens = []
 
     def parseActorclassMethodDefinition(self):
-        print("AEONParser::parseActorclassMethodDefinition")
-        implementations = []
-        parser_info = MethodParser.ActorclassMethodParser.parseActorclassMethodDefinition(self, implementations)
-        if parser_info.context_type in self.actorclasses.keys():
-            self.actorclasses[parser_info.context_type].updateActorclassMethodImplementation(parser_info.method_name, implementations)
-        else:
-            ParserUtil.MyUtil.exitWithError('Fail to parse actorclass method!!')
-        self.tokens = []
+        if diag.debug:
+            diag.write("AEONParser::parseActorclassMethodDefinition")
+        with self.profiler.phase('parseActorclassMethodDefinition') as phase:
+            phase.count('tokens', len(self.tokens))
+            implementations = []
+            parser_info = None
+            if self.jobs > 1:
+                parser_info = self.deferMethodDefinition(implementations)
+                if parser_info is not None:
+                    phase.count('deferred', 1)
+            if parser_info is None:
+                parser_info = self.translateMethodDefinition(implementations)
+            if self.spool is not None:
+                implementations = self.spool.add(implementations)
+            if parser_info.context_type in self.actorclasses:
+                self.actorclasses[parser_info.context_type].updateActorclassMethodImplementation(parser_info.method_name, implementations)
+            else:
+                ParserUtil.MyUtil.exitWithError('Fail to parse actorclass method!!')
+            self.tokens = []
+            phase.setItem("%s::%s" % (parser_info.context_type, parser_info.method_name))
+            phase.count('lines', len(implementations))
 
     def parseMethodDefinition(self):
-        print('AEONParser::parseMethodDefinition')
-        implementations = []
-        parser_info = MethodParser.ActorclassMethodParser.parseActorclassMethodDefinition(self, implementations)
-        
+        if diag.debug:
+            diag.write('AEONParser::parseMethodDefinition')
+        with self.profiler.phase('parseMethodDefinition') as phase:
+            phase.count('tokens', len(self.tokens))
+            implementations = []
+            parser_info = self.translateMethodDefinition(implementations)
+            if self.spool is not None:
+                implementations = self.spool.add(implementations)
+            
+            method_info = MethodParser.ActorclassMethodInfo()
+            method_info.returnType = self.declaration.returnType
+            method_info.definedName = self.declaration.name
+            method_info.implementation = implementations
+
+            self.methods[method_info.definedName] = method_info
+            self.tokens = []
+            phase.setItem(method_info.definedName)
+            phase.count('lines', len(implementations))
+
+    def parseMethodDeclaration(self):
+        # The signature of the global method in self.tokens, whose body the
+        # declaration-only scan has left out
+        if diag.debug:
+            diag.write('AEONParser::parseMethodDeclaration')
         method_info = MethodParser.ActorclassMethodInfo()
-        method_info.returnType = self.tokens[0].value
-        method_info.definedName = parser_info.method_name
-        method_info.implementation = implementations
-
+        method_info.returnType = self.declaration.returnType
+        method_info.definedName = self.declaration.name
         self.methods[method_info.definedName] = method_info
         self.tokens = []
 
+    def translateMethodDefinition(self, implementations):
+        # Translates the definition in self.tokens, reusing the cached body
+        # when the tokens, the actorclass and the callees are unchanged
+        if self.cache is None:
+            return MethodParser.ActorclassMethodParser.parseActorclassMethodDefinition(self, implementations)
+
+        key = self.methodCacheKey()
+        parser_info = self.applyCachedMethod(key, implementations)
+        if parser_info is not None:
+            return parser_info
+
+        parser_info, return_types, call_marks = self.recordMethodTranslation(implementations)
+        self.storeCachedMethod(key, parser_info.context_type, parser_info.method_name, return_types, call_marks, implementations)
+        return parser_info
+
+    def recordMethodTranslation(self, implementations):
+        # Translates self.tokens, also returning the return types the
+        # translation looked up and the call types it marked
+        self.methodReturnTypeDeps = []
+        self.methodCallMarks = []
+        try:
+            parser_info = MethodParser.ActorclassMethodParser.parseActorclassMethodDefinition(self, implementations)
+            return parser_info, self.methodReturnTypeDeps, self.methodCallMarks
+        finally:
+            self.methodReturnTypeDeps = None
+            self.methodCallMarks = None
+
+    def methodCacheKey(self):
+        return self.cache.makeKey('method', CompileCache.tokenDigest(self.tokens), self.symbols.namesDigest())
+
+    def applyCachedMethod(self, key, implementations):
+        entry = self.cache.lookup('method', key, self.checkMethodCacheEntry)
+        if entry is None:
+            return None
+        for prefix, actorclass, method_name in entry['callMarks']:
+            self.markActorclassMethodCallType(prefix, actorclass, method_name)
+        implementations.extend(entry['lines'])
+        parser_info = MethodParser.ActorclassMethodParserInfo()
+        parser_info.context_type = entry['actorclass']
+        parser_info.method_name = entry['method']
+        return parser_info
+
+    def storeCachedMethod(self, key, actorclass, method_name, return_types, call_marks, implementations):
+        self.cache.store('method', key, {
+            'actorclass': actorclass,
+            'method': method_name,
+            'actorclassDigest': self.symbols.actorclassDigest(actorclass),
+            'returnTypes': return_types,
+            'callMarks': call_marks,
+            'lines': implementations,
+        })
+
+    def deferMethodDefinition(self, implementations):
+        # Queues the definition in self.tokens for translateDeferredMethods()
+        # if its actorclass has been parsed, so everything the translation
+        # reads is final; returns None when it must be translated now
+        context_type = self.declaration.actorclass
+        method_name = self.declaration.name
+        if not context_type in self.actorclasses or not self.symbols.hasMethod(context_type, method_name):
+            return None
+
+        key = None
+        if self.cache is not None:
+            key = self.methodCacheKey()
+            parser_info = self.applyCachedMethod(key, implementations)
+            if parser_info is not None:
+                return parser_info
+
+        self.deferredMethods.append(ParallelTranslator.MethodJob(self.tokens, self.declaration, implementations, context_type, method_name,
+                                                                 self.currentToken, key))
+        parser_info = MethodParser.ActorclassMethodParserInfo()
+        parser_info.context_type = context_type
+        parser_info.method_name = method_name
+        return parser_info
+
+    def translateDeferredMethods(self):
+        jobs = self.deferredMethods
+        self.deferredMethods = []
+        results = ParallelTranslator.translate(self, jobs, self.jobs)
+        for i in range(len(jobs)):
+            job = jobs[i]
+            result = results[i]
+            if result.log != "":
+                sys.stdout.write(result.log)
+            if result.failed:
+                self.currentToken = job.token
+                sys.exit(1)
+            job.implementations.extend(result.lines)
+            for prefix, actorclass, method_name in result.callMarks:
+                self.markActorclassMethodCallType(prefix, actorclass, method_name)
+            if job.cacheKey is not None:
+                self.storeCachedMethod(job.cacheKey, job.contextType, job.methodName, result.returnTypes, result.callMarks, job.implementations)
+
+    def checkMethodCacheEntry(self, entry):
+        if self.symbols.actorclassDigest(entry['actorclass']) != entry['actorclassDigest']:
+            return False
+        for actorclass, method_name, return_type in entry['returnTypes']:
+            if self.symbols.getMethodReturnType(actorclass, method_name) != return_type:
+                return False
+        return True
+
     def parseUpcallDefinition(self):
-        print('AEONParser::parseUpcallDefinition:')
+        if diag.debug:
+            diag.write('AEONParser::parseUpcallDefinition:')
         method_info = MethodParser.ContextMethodParser.parseUpcallDefinition(self)
         self.upcall_methods[method_info.define_name] = method_info
         self.tokens = []
 
 
     def getOutputContextMethodName(self, contextType, method_name, method_type):
-        print("AEONParser::getOutputContextMethodName %s %s %s" % (contextType, method_name, method_type))
+        if diag.debug:
+            diag.write("AEONParser::getOutputContextMethodName %s %s %s" % (contextType, method_name, method_type))
         return_method_name = ''
         if contextType in self.contexts.keys():
             return_method_name = self.contexts[contextType].getOutputContextMethodName(method_name, method_type)
@@ -379,17 +560,21 @@ class AEONParser:
             self.contexts[contextType].addContextMethodType(method_name, method_type)
 
     def checkActorclassMethodDeclaration(self, actorclass_name, method_name):
-        print("AEONParser::checkActorclassMethodDeclaration")
-        if actorclass_name not in self.actorclasses.keys():
-            print("Fail to find actorclass %s in defined actorclasses." % actorclass_name)
-            print(self.actorclasses.keys)
+        if diag.debug:
+            diag.write("AEONParser::checkActorclassMethodDeclaration")
+        if not self.symbols.isActorclass(actorclass_name):
+            if diag.warning:
+                diag.write("Fail to find actorclass %s in defined actorclasses." % actorclass_name)
+                diag.write("%s" % self.symbols.actorclassNames)
             return False
-        ctx_info = self.actorclasses[actorclass_name]
-        return ctx_info.checkContextMethod(method_name)
+        return self.symbols.hasMethod(actorclass_name, method_name)
 
     def markActorclassMethodCallType( self, prefix, contextType, methodName ):
-        print("AEONParser::markActorclassMethodCallType actorclass=%s, prefix=%s, methodName=%s" % (contextType, prefix, methodName))
-        if contextType in self.actorclasses.keys():
+        if diag.debug:
+            diag.write("AEONParser::markActorclassMethodCallType actorclass=%s, prefix=%s, methodName=%s" % (contextType, prefix, methodName))
+        if self.methodCallMarks is not None:
+            self.methodCallMarks.append([prefix, contextType, methodName])
+        if contextType in self.actorclasses:
             self.actorclasses[contextType].markActorclassMethodCallType(prefix, methodName)
         else:
             call_info = ActorclassParser.ActorclassMethodCallInfo()
@@ -401,38 +586,24 @@ class AEONParser:
 
             self.actorclassMethodCallInfos[contextType].append(call_info)
 
-    def checkActorclassCycleIter(self, name, children, decendants):
-        if name in children:
-            return True
-        
-        for i in range(len(children)):
-            if self.checkActorclassCycleIter(name, decendants[children[i]], decendants):
-                return True
-
-        return False
-
     def checkActorclassCycle(self):
-        decendants = {}
-        anames = []
-
-        for name, actorclass in self.actorclasses.items():
-            decendants[name] = actorclass.childActorclasses
-            print(name, ": ", decendants[name])
-            if name in decendants[name]:
-                decendants[name].remove(name)
-            anames.append(name)
-
-        for i in range(len(anames)):
-            name = anames[i]
-            dnames = decendants[name]
-            if self.checkActorclassCycleIter(name, dnames, decendants):
-                return True
-
-        return False
-         
-
-    def generateAEONFile(self):
-        print("AEONParser::generateAEONFile")
+        # Builds self.ownership; returns an ownership cycle as a path, or None
+        self.ownership = OwnershipGraph.build(self.actorclasses, self.symbols)
+        if diag.trace:
+            for name, children in self.ownership.children.items():
+                diag.write("%s: %s" % (name, children))
+        return self.ownership.findCycle()
+
+    def sortedActorclasses(self):
+        # Actorclasses are emitted by name, so reordering definitions in the
+        # source does not change the output
+        return [self.actorclasses[name] for name in sorted(self.actorclasses)]
+
+    def generateAEONSections(self):
+        # Yields the output a section at a time, so it can be written out
+        # without holding every line of the file
+        if codegen.debug:
+            codegen.write("AEONParser::generateAEONSections")
         filelines = []
 
         line = "service GameApp;\n\nprovides Null;"
@@ -441,8 +612,14 @@ class AEONParser:
         line = "services {\n\tTransport t;\n}"
         filelines.append(line)
 
-        line = "constants {\n\n}"
-        filelines.append(line)
+        filelines.append('constants {')
+        # Actorclasses are numbered for the runtime's context name lookups
+        type_id = 1
+        for value in self.sortedActorclasses():
+            line = "\tuint32_t %s = %d;" % (ParserUtil.MyUtil.generateActorclassTypeIdName(value.actorclassName), type_id)
+            filelines.append(line)
+            type_id = type_id + 1
+        filelines.append('}')
 
         line = "constructor_parameters {\n\n}"
         filelines.append(line)
@@ -464,11 +641,12 @@ class AEONParser:
         filelines.append('state_variables {\n')
         tline = "context Root {\n}"
         filelines.append(tline)
+        yield filelines
 
-        for key, value in self.actorclasses.items():
-            lines = value.generateActorclassDefinition()
-            for i in range(len(lines)):
-                filelines.append(lines[i])
+        for value in self.sortedActorclasses():
+            yield self.generateActorclassDefinition(value)
+
+        filelines = []
         filelines.append('\n}')
         
         filelines.append('transitions {\n')
@@ -478,15 +656,12 @@ class AEONParser:
         filelines.append(tline)
         tline = "}"
         filelines.append(tline)
+        yield filelines
 
-        for key, value in self.actorclasses.items():
-            lines = value.generateEventAndAsyncMethodDefinition()
-            for i in range(len(lines)):
-                filelines.append(lines[i])
+        for value in self.sortedActorclasses():
+            yield value.generateEventAndAsyncMethodDefinition()
 
-        lines = self.methods["main"].generateMainMethodDefinition()
-        for i in range(len(lines)):
-            filelines.append(lines[i]) 
+        filelines = self.methods["main"].generateMainMethodDefinition()
         filelines.append('\n}')
         # for key, value in self.upcall_methods.iteritems():
         #     lines = value.generateUpcallDefinition()
@@ -495,34 +670,163 @@ class AEONParser:
         # filelines.append('}')
 
         filelines.append('routines {')
-        for key, value in self.actorclasses.items():
-            lines = value.generateSyncMethodDefinition()
-            for i in range(len(lines)):
-                filelines.append(lines[i])
+        yield filelines
 
-        line = "[__null] mace::string generateActorName( const mace::string& ctxName, const uint32_t& id) {"
-        filelines.append(line)
-        line = "\tstd::ostringstream oss;\n\toss << ctxName <<\"[\"<<id<<\"]\";\n\treturn oss.str();\n}"
-        filelines.append(line)
+        for value in self.sortedActorclasses():
+            yield value.generateSyncMethodDefinition()
 
-        filelines.append('}')
+        yield ['}']
+
+    def generateAEONLines(self):
+        filelines = []
+        for lines in self.generateAEONSections():
+            filelines.extend(lines)
+        return filelines
+
+    def generateActorclassDefinition(self, actorclass_info):
+        key = self.actorclassCacheKeys.get(actorclass_info.actorclassName)
+        if key is None:
+            return actorclass_info.generateActorclassDefinition()
+        entry = self.cache.lookup('actorclass', key)
+        if entry is not None:
+            return entry['lines']
+        lines = actorclass_info.generateActorclassDefinition()
+        self.cache.store('actorclass', key, {'actorclass': actorclass_info.actorclassName, 'lines': lines})
+        return lines
 
-        ofile = open(self.oFileName, "w")
-        for i in range(len(filelines)):
-            # print(filelines[i])
-            ofile.write(filelines[i] + "\n")
+    def generateAEONFile(self):
+        # The output is written next to the old one and moved over it only
+        # when the two differ, so an unchanged .mac keeps its modification
+        # time and the service build after it can be skipped
+        with self.profiler.phase('generateAEONFile') as phase:
+            if os.path.exists(self.oFileName) and not os.path.isfile(self.oFileName):
+                # e.g. /dev/stdout
+                phase.count('lines', self.writeAEONFile(self.oFileName))
+                self.outputChanged = True
+                return
+
+            # A temporary file of its own, so compiles of the same output in
+            # one process do not write over each other
+            directory, name = os.path.split(self.oFileName)
+            fd, tmp_path = tempfile.mkstemp(dir=directory or ".", prefix=".%s." % name, suffix=".tmp")
+            os.close(fd)
+            try:
+                phase.count('lines', self.writeAEONFile(tmp_path))
+                self.outputChanged = not os.path.isfile(self.oFileName) or not filecmp.cmp(tmp_path, self.oFileName, shallow=False)
+                if self.outputChanged:
+                    if os.path.isfile(self.oFileName):
+                        shutil.copymode(self.oFileName, tmp_path)
+                    else:
+                        # mkstemp creates the file readable by its owner only
+                        os.chmod(tmp_path, 0o666 & ~currentUmask())
+                    os.replace(tmp_path, self.oFileName)
+                else:
+                    os.remove(tmp_path)
+            except:
+                if os.path.exists(tmp_path):
+                    os.remove(tmp_path)
+                raise
+            if diag.info and not self.outputChanged:
+                diag.write("%s is unchanged" % self.oFileName)
+
+    def writeAEONFile(self, path):
+        n_lines = 0
+        ofile = open(path, "w")
+        for lines in self.generateAEONSections():
+            for i in range(len(lines)):
+                ofile.write(lines[i] + "\n")
+            n_lines = n_lines + len(lines)
 
         ofile.close()
+        return n_lines
 
         
 
 
-    def __init__(self, appFileName, oFileName):
+    def __init__(self, appFileName, oFileName, profiler=None, cache=None, jobs=1, declarations_only=False,
+                 streaming=False):
+        if streaming and jobs > 1:
+            raise ValueError("A streaming compile translates method bodies as it reads them and cannot use several jobs")
+        self.initState(appFileName, oFileName, profiler, cache, jobs)
+        # Only collect actorclass declarations, method signatures and
+        # collection variables: method bodies are not lexed or translated and
+        # no output is written
+        self.declarationsOnly = declarations_only
+        # Read, translate and release the program a top-level definition at
+        # a time, spooling translated bodies to a temporary file; see
+        # compileStream()
+        if streaming:
+            self.spool = LineSpool.LineSpool()
+
+        self.profiler.setInfo('input', self.appFileName)
+        self.profiler.setInfo('output', self.oFileName)
+        self.profiler.start()
+        try:
+            if streaming:
+                self.compileStream()
+            else:
+                appFileStr = ""
+                if (len(self.appFileName)):
+                    fd = open(self.appFileName)
+                    appFileStr = "".join(fd.readlines())
+                    fd.close()  
+                self.compileProgram(appFileStr)
+        except:
+            self.close()
+            raise
+        finally:
+            self.profiler.stop()
+
+    def close(self):
+        # Releases the spool of a streaming compile.  The translated method
+        # bodies are read from it until then, so a ProgramIR.dump() of the
+        # parser has to come first
+        if self.spool is not None:
+            self.spool.close()
+            self.spool = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+        return False
+
+    @classmethod
+    def fromProgramIR(cls, irFileName, oFileName):
+        # A parser restored from a ProgramIR file without lexing or parsing,
+        # for analysis or to run generateAEONFile() again.  An oFileName is
+        # refused for the IR of a declarations-only compile
+        parser = cls.__new__(cls)
+        parser.initState("", oFileName, None, None, 1)
+        ProgramIR.load(os.path.expandvars(irFileName), parser)
+        if parser.declarationsOnly and len(parser.oFileName):
+            raise ProgramIR.ProgramIRError("%s was written by a declarations-only compile and has no method bodies to "
+                                           "generate %s from" % (irFileName, oFileName))
+        return parser
+
+    def initState(self, appFileName, oFileName, profiler, cache, jobs):
+        # Diagnostics are not set per parser: the channels are process-wide
+        # and are set with Diagnostics.configure() before compiling
+        # A Profiler.CompileProfiler to record per-phase costs in
+        if profiler is None:
+            profiler = Profiler.NULL_PROFILER
+        self.profiler = profiler
+        # A CompileCache.CompileCache to reuse translated declarations and
+        # method bodies from; the caller flushes it
+        self.cache = cache
+        self.actorclassCacheKeys = { }
+        # Filled while a method is translated for the cache
+        self.methodReturnTypeDeps = None
+        self.methodCallMarks = None
+        # With jobs > 1, method bodies are translated after the main scan on
+        # that many processes; see ParallelTranslator
+        self.jobs = jobs
+        self.deferredMethods = []
+
         self.appFileName = os.path.expandvars(appFileName)
         self.oFileName = os.path.expandvars(oFileName)
         
-        appFileStr = ""
-                
         self.actorclasses = { }
         self.methods = {}
         self.structures = { }
@@ -535,297 +839,376 @@ class AEONParser:
         self.parsed_contexts = { }
 
         self.actorclassMethodCallInfos = { }
-            
-        if (len(self.appFileName)):
-            fd = open(self.appFileName)
-            appFileStr = "".join(fd.readlines())
-            fd.close()  
 
-        # Make sure supportedAccessSpecifier are sane
-        for i in range(0, len(supportedAccessSpecifier)):
-            if " " not in supportedAccessSpecifier[i]: continue
-            supportedAccessSpecifier[i] = re.sub("[ ]+", " ", supportedAccessSpecifier[i]).strip()
-        
-        # Strip out template declarations
-        appFileStr = re.sub("template[\t ]*<[^>]*>", "", appFileStr)
-
-        # Change multi line #defines and expressions to single lines maintaining line nubmers
-        # Based from http://stackoverflow.com/questions/2424458/regular-expression-to-match-cs-multiline-preprocessor-statements
-        is_define = re.compile(r'[ \t\v]*#[Dd][Ee][Ff][Ii][Nn][Ee]')
-        
-        matches = re.findall(r'(?m)^(?:.*\\\r?\n)+.*$', appFileStr)
-        for m in matches:
-            #Keep the newlines so that linecount doesnt break
-            num_newlines = len([a for a in m if a=="\n"])
-            if is_define.match(m):
-                new_m = m.replace("\n", "<CppHeaderParser_newline_temp_replacement>\\n")
-            else:
-                # Just expression taking up multiple lines, make it take 1 line for easier parsing
-                new_m = m.replace("\\\n", " ")
-            if (num_newlines > 0):
-                new_m += "\n"*(num_newlines)
-            appFileStr = appFileStr.replace(m, new_m)
+        self.doxygenCommentCache = ""
+        #Track what was added in what order and at what depth
+        self.parseHistory = []
 
+        # Make sure supportedAccessSpecifier are sane
+        self.supportedAccessSpecifier = []
+        for spec in supportedAccessSpecifier:
+            self.supportedAccessSpecifier.append(re.sub("[ ]+", " ", spec).strip())
         
-        #Filter out Extern "C" statements.  These are order dependent
-        matches = re.findall(re.compile(r'extern[\t ]+"[Cc]"[\t \n\r]*{', re.DOTALL), appFileStr)
-        for m in matches:
-            #Keep the newlines so that linecount doesnt break
-            num_newlines = len([a for a in m if a=="\n"])
-            appFileStr = appFileStr.replace(m, "\n" * num_newlines)        
-        appFileStr = re.sub(r'extern[ ]+"[Cc]"[ ]*', "", appFileStr)
-                
-        #Filter out any ignore symbols that end with "()" to account for #define magic functions
-        for ignore in ignoreSymbols:
-            if not ignore.endswith("()"): continue
-            while True:
-                locStart = appFileStr.find(ignore[:-1])
-                if locStart == -1:
-                    break
-                locEnd = None
-                #Now walk till we find the last paren and account for sub parens
-                parenCount = 1
-                inQuotes = False
-                for i in range(locStart + len(ignore) - 1, len(appFileStr)):
-                    c = appFileStr[i]
-                    if not inQuotes:
-                        if c == "(":
-                            parenCount += 1
-                        elif c == ")":
-                            parenCount -= 1
-                        elif c == '"':
-                            inQuotes = True
-                        if parenCount == 0:
-                            locEnd = i + 1
-                            break
-                    else:
-                        if c == '"' and appFileStr[i-1] != '\\':
-                            inQuotes = False
-                        
-                if locEnd:
-                    #Strip it out but keep the linecount the same so line numbers are right
-                    match_str = appFileStr[locStart:locEnd]
-                    debug_print("Striping out '%s'"%match_str)
-                    num_newlines = len([a for a in match_str if a=="\n"])
-                    appFileStr = appFileStr.replace(appFileStr[locStart:locEnd], "\n"*num_newlines)
-
-                
         self.braceDepth = 0
-        lex.lex()
-        lex.input(appFileStr)
-        
-        
         
-        self.current_parse_status = ProgramParseStatus.NoneStatus
         self.tokens = []
-        self.defined_actorclasses = []
+        # The ProgramGrammar declaration of the definition in self.tokens
+        self.declaration = None
+        self.symbols = SymbolIndex.SymbolIndex()
+        # The token being parsed, for error messages
+        self.currentToken = None
+        # Source and compiler of the ProgramIR file a parser was restored from
+        self.irInfo = None
+        self.declarationsOnly = False
+        # A LineSpool.LineSpool holding the translated method bodies of a
+        # streaming compile
+        self.spool = None
+        # Whether generateAEONFile() replaced the output file
+        self.outputChanged = False
+        # The OwnershipGraph.OwnershipGraph of the actorclasses, once parsed
+        self.ownership = None
+
+    def compileProgram(self, appFileStr):
+        profiler = self.profiler
+
+        with profiler.phase('preprocess') as phase:
+            # Strip out templates, fold continuations, drop extern "C" and ignored macros
+            self.source = preprocessor.process(appFileStr)
+            phase.count('bytes', len(appFileStr))
 
-        brace_depth = 0        
-        paren_depth = 0
+        try:
+            with profiler.phase('lex') as phase:
+                if self.declarationsOnly:
+                    program_tokens = tokenizer.tokenizeDeclarations(self.source.text)
+                else:
+                    program_tokens = tokenizer.tokenize(self.source.text)
+                phase.count('tokens', len(program_tokens))
 
-        small_large_count = 0
+            with profiler.phase('prescan') as phase:
+                self.prescanProgram(program_tokens)
+                phase.count('actorclasses', len(self.symbols.actorclassNames))
+                phase.count('methods', len(self.symbols.methodReturnTypes))
 
-        name_space = ''
-        name_space_n_colon = 0
+            with profiler.phase('parse'):
+                self.parseProgram(releaseTokens(program_tokens))
+
+            self.finishProgram()
+        except:
+            self.raiseParseError()
+
+    def compileStream(self):
+        # As compileProgram(), but the source is read twice a piece at a
+        # time, first for the prescan, which needs only the declarations,
+        # and then for the parse; only one top-level definition's text and
+        # tokens are held at once
+        profiler = self.profiler
+        try:
+            with profiler.phase('prescan') as phase:
+                self.prescanProgram(self.streamTokens(True))
+                phase.count('actorclasses', len(self.symbols.actorclassNames))
+                phase.count('methods', len(self.symbols.methodReturnTypes))
+
+            with profiler.phase('parse'):
+                self.parseProgram(self.streamTokens(self.declarationsOnly))
 
-        current_actorclass = ''
-        current_method_name = ''
+            self.finishProgram()
+        except:
+            self.raiseParseError()
 
-        program_tokens = []
+    def streamTokens(self, declarations_only):
+        fd = open(self.appFileName)
+        try:
+            for text, first_line in Preprocessor.readTopLevelChunks(fd):
+                # Error messages map token positions through the piece being parsed
+                self.source = preprocessor.process(text, first_line)
+                if declarations_only:
+                    chunk_tokens = tokenizer.tokenizeDeclarations(self.source.text)
+                else:
+                    chunk_tokens = tokenizer.tokenize(self.source.text)
+                for tok in releaseTokens(chunk_tokens):
+                    yield tok
+        finally:
+            fd.close()
+
+    def finishProgram(self):
+        profiler = self.profiler
+        if len(self.deferredMethods) > 0:
+            with profiler.phase('translateDeferredMethods') as phase:
+                phase.count('methods', len(self.deferredMethods))
+                self.translateDeferredMethods()
+
+        with profiler.phase('checkActorclassCycle') as phase:
+            cycle = self.checkActorclassCycle()
+            phase.count('actorclasses', len(self.actorclasses))
+
+        if cycle is not None:
+            ParserUtil.MyUtil.exitWithError("There is cycle in actorclass definition: %s!" % OwnershipGraph.formatCycle(cycle))
+        else:
+            if diag.info:
+                diag.write("There is no cycle!")
+        
+        if not self.declarationsOnly:
+            self.generateAEONFile()
 
+    def raiseParseError(self):
+        tok = self.currentToken
+        if tok is None:
+            raise CppParseError("Not able to parse on current line!")
+        raise CppParseError("Not able to parse on line %d near '%s'!" % (self.source.originalLine(tok.lexpos), tok.value))
+
+    def prescanProgram(self, program_tokens):
+        # Collect actorclass names and method return types before anything
+        # is parsed, since definitions may refer to later actorclasses
+        brace_depth = 0
         next_is_actorclass = False
         curr_actorclass = ""
+        # The two tokens before tok
+        prev_tok = None
+        prev_prev_tok = None
+
+        for tok in program_tokens:
+            self.currentToken = tok
+            if next_is_actorclass:
+                self.symbols.addActorclass(tok.value)
+                curr_actorclass = tok.value
+                next_is_actorclass = False
+            if tok.type == "NAME" and tok.value == "actorclass":
+                next_is_actorclass = True
+            elif tok.type == "OPEN_BRACE":
+                brace_depth = brace_depth + 1
+            elif tok.type == "CLOSE_BRACE":
+                brace_depth = brace_depth - 1
+                if brace_depth == 0:
+                    curr_actorclass = ""
+            elif tok.type == "OPEN_PAREN" and brace_depth == 1 and curr_actorclass != "":
+                method_name = prev_tok.value
+                method_return_type = prev_prev_tok.value
+                self.symbols.addMethod(curr_actorclass, method_name, method_return_type)
+                if diag.debug:
+                    diag.write("Add %s::%s with return type %s" % (curr_actorclass, method_name, method_return_type))
+            prev_prev_tok = prev_tok
+            prev_tok = tok
+
+        if diag.debug:
+            diag.write("%s" % self.symbols.actorclassNames)
+            diag.write("%s" % self.symbols.methodReturnTypes)
+
+    def parseProgram(self, program_tokens):
+        # One pass of the program grammar; each definition is parsed as soon
+        # as the grammar has read all of it
+        try:
+            ProgramGrammar.parse(self.normalizeTokens(program_tokens), self.parseDefinition)
+        except ProgramGrammar.ProgramSyntaxError as e:
+            if e.token is not None:
+                self.currentToken = e.token
+            ParserUtil.MyUtil.exitWithError('Syntax error here!')
+
+    def parseDefinition(self, definition):
+        if diag.debug:
+            diag.write("AEONParser::parseDefinition: %s" % definition.kind)
+        self.tokens = definition.tokens
+        self.declaration = definition.declaration
+        if definition.kind == ProgramGrammar.Definition.CONFIGURABLE:
+            self.parseConfigVariable()
+        elif definition.kind == ProgramGrammar.Definition.ACTORCLASS:
+            self.parseActorclassDefinition()
+        elif definition.kind == ProgramGrammar.Definition.STRUCT:
+            self.parseStructDefinition()
+        elif definition.kind == ProgramGrammar.Definition.MESSAGE:
+            self.parseMessageDefinition()
+        elif definition.kind == ProgramGrammar.Definition.UPCALL:
+            self.parseUpcallDefinition()
+        elif definition.kind == ProgramGrammar.Definition.ACTORCLASS_METHOD:
+            if self.declarationsOnly:
+                # Declared in its actorclass already
+                self.tokens = []
+            else:
+                self.parseActorclassMethodDefinition()
+        elif self.declarationsOnly:
+            self.parseMethodDeclaration()
+        else:
+            self.parseMethodDefinition()
+
+    def normalizeTokens(self, program_tokens):
+        # The tokens the grammar reads: macros are collected and left out,
+        # collection types become one COLLECTION_TYPE token, std:: and mace::
+        # are joined to the following name, and the collections of actors
+        # declared in actorclasses are recorded
+        brace_depth = 0
+        small_large_count = 0
 
-        self.actorclass_methods_returntype = {}
-        self.actorclass_collection_vars = {}
+        name_space = ''
+        name_space_n_colon = 0
 
-        # e.g., vector
-        collection_type = ""
-        # e.g., vector<Item>
-        collection_var_type = ""
-        # e.g., Item
-        actorclass_in_collection_var_type = ""
+        # The actorclass whose declaration is being read
+        curr_actorclass = ""
+        next_is_actorclass = False
 
-        try:
-            while True:
-                tok = lex.token()
-                if not tok: break
+        # Token values of a collection type being read, e.g. ['vector', '<', 'Item']
+        collection_parts = None
+        # The TypeSystem.TypeInfo of an actorclass's collection of actors,
+        # until its variable name is read
+        actor_collection_type = None
+
+        for tok in program_tokens:
+            self.currentToken = tok
+            if diag.trace:
+                diag.write("type=%s, value=%s" % (tok.type, tok.value))
+
+            if actor_collection_type is not None and tok.type == 'NAME':
+                v = VariableParser.VariableParser.makeActorCollectionVariable(actor_collection_type, tok.value, self.symbols.actorclasses)
+                self.symbols.addCollectionVar(curr_actorclass, v)
+                if diag.debug:
+                    diag.write("Add actor collection %s of %s with %s" % (v.varName, v.varType, v.actorclass))
+
+                actor_collection_type = None
+
+            if tok.type == 'PRECOMP_MACRO':
+                self.precompMacros.append(tok.value)
+                continue
+            elif tok.type == 'NAME' and tok.value in self.IGNORE_NAMES: 
+                continue
+
+            # process collection type
+            if tok.type == 'NAME' and collection_parts is None and tok.value in TypeSystem.COLLECTION_KINDS:
+                collection_parts = [tok.value]
+                # std::vector and the like become the mace collections
+                name_space = ''
+                name_space_n_colon = 0
+                continue
+            elif collection_parts is not None:
+                collection_parts.append(tok.value)
+                if tok.type == 'SMALL':
+                    small_large_count = small_large_count + 1
+                    continue
+                elif tok.type == 'LARGE':
+                    small_large_count = small_large_count - 1
+                    if small_large_count == 0:
+                        collection_type = TypeSystem.parseParts(collection_parts)
+                        collection_parts = None
+                        tok.type = 'COLLECTION_TYPE'
+                        tok.value = collection_type.outputSpelling(self.symbols.actorclasses)
+                        actorclass, pos = collection_type.actorclassElement(self.symbols.actorclasses)
+                        if actorclass is not None and curr_actorclass != "" and brace_depth > 0:
+                            # The next name is an actor collection variable
+                            actor_collection_type = collection_type
+                    else:
+                        continue
+                else:
+                    continue
 
+            # process types with namespace
+            if tok.type == 'NAME' and tok.value in ['std', 'mace']:
+                name_space = tok.value
+                continue
+            elif name_space != '' and tok.type == 'COLON':
+                name_space_n_colon = name_space_n_colon + 1
+                continue
+            elif name_space_n_colon == 2 and tok.type == 'NAME':
+                tok.value = name_space + '::' + tok.value
+                if diag.trace:
+                    diag.write("Generated new token: type=%s, value=%s" % (tok.type, tok.value))
+                name_space = ''
+                name_space_n_colon = 0
+
+            if tok.type == 'OPEN_BRACE':
+                brace_depth = brace_depth + 1
+            elif tok.type == 'CLOSE_BRACE':
+                brace_depth = brace_depth - 1
+                if brace_depth == 0:
+                    curr_actorclass = ""
+            elif tok.type == 'NAME' and brace_depth == 0:
                 if next_is_actorclass:
-                    self.defined_actorclasses.append(tok.value)
                     curr_actorclass = tok.value
                     next_is_actorclass = False
-                if tok.type == "NAME" and tok.value == "actorclass":
+                elif tok.value == 'actorclass':
                     next_is_actorclass = True
-                elif tok.type == "OPEN_BRACE":
-                    brace_depth = brace_depth + 1
-                elif tok.type == "CLOSE_BRACE":
-                    brace_depth = brace_depth - 1
-                    if brace_depth == 0:
-                        curr_actorclass = ""
-                elif tok.type == "OPEN_PAREN" and brace_depth == 1 and curr_actorclass != "":
-                    l = len(program_tokens)
-                    method_name = program_tokens[l-1].value
-                    method_return_type = program_tokens[l-2].value
-                    mname = "%s::%s" % (curr_actorclass, method_name)
-                    self.actorclass_methods_returntype[mname] = method_return_type
-                    print("Add %s with return type %s" % (mname, method_return_type))
-                program_tokens.append(tok)
-            
-            print(self.defined_actorclasses)
-            print(self.actorclass_methods_returntype)
-
-            brace_depth = 0
-            for k in range(0, len(program_tokens)):
-                tok = program_tokens[k]
-                print("type=%s, value=%s, status=%s" % ( tok.type, tok.value, self.current_parse_status))
-
-                if collection_var_type != "" and small_large_count == 0 and actorclass_in_collection_var_type != "" and tok.type == 'NAME':
-                    v = VariableParser.VariableInfo()
-                    v.type = VariableParser.VariableInfo.ActorCollectionType
-                    v.varType = collection_var_type
-                    v.varName = tok.value
-                    v.collectionType = collection_type
-                    v.actorclass = actorclass_in_collection_var_type
-                    v.isChildActor = True
-                    
-                    self.actorclass_collection_vars[ tok.value ] = v
-                    print("Add actor collection %s of %s with %s" % (v.varName, v.varType, v.actorclass))
-
-                    collection_type = ""
-                    collection_var_type = ""
-                    actorclass_in_collection_var_type = ""
-                    
-                if tok.type == 'PRECOMP_MACRO':
-                    self.precompMacros.append(tok.value)
-                    continue
-                elif tok.type == 'NAME' and tok.value in self.IGNORE_NAMES: 
-                    continue
-                elif self.current_parse_status == ProgramParseStatus.NoneStatus and tok.type == 'SEMI_COLON':
-                    continue
 
-                # process collection type
-                if tok.type == 'NAME' and collection_type == '' and tok.value in ['map', 'vector', 'deque', 'set']:
-                    collection_type = tok.value
-                    collection_var_type = "mace::" + tok.value
-                    continue
-                elif collection_type != '':
-                    if tok.type == 'SMALL':
-                        collection_var_type = collection_var_type + tok.value
-                        small_large_count = small_large_count + 1
-                        continue
-                    elif tok.type == 'LARGE':
-                        collection_var_type = collection_var_type + tok.value
-                        small_large_count = small_large_count - 1
-                        if small_large_count == 0:
-                            tok.type = 'COLLECTION_TYPE'
-                            tok.value = collection_var_type
-                            if actorclass_in_collection_var_type == "":
-                                collection_type = ""
-                                collection_var_type = ""
-                        else:
-                            continue
-                    elif tok.type == 'NAME' and tok.value in self.defined_actorclasses and self.current_parse_status == ProgramParseStatus.ActorclassDefinition:
-                        collection_var_type = collection_var_type + "int"
-                        actorclass_in_collection_var_type = tok.value
-                        continue
-                    else:
-                        collection_type = collection_type+tok.value
-                        continue
-
-                # process types with namespace
-                if tok.type == 'NAME' and tok.value in ['std', 'mace']:
-                    name_space = tok.value
-                    continue
-                elif name_space != '' and tok.type == 'COLON':
-                    name_space_n_colon = name_space_n_colon + 1
-                    continue
-                elif name_space_n_colon == 2 and tok.type == 'NAME':
-                    tok.value = name_space + '::' + tok.value
-                    print("Generated new token: type=%s, value=%s" % (tok.type, tok.value))
-                    name_space = ''
-                    name_space_n_colon = 0
-                elif name_space_n_colon == 2 and tok.type == 'COLLECTION_TYPE':
-                    tok.value = name_space + '::' + tok.value
-                    print('Generated new token: type=%s, value=%s' % ( tok.type, tok.value))
-                    name_space = ''
-                    name_space_n_colon = 0                
-                
-                
-                self.tokens.append(tok)
-                
-                if tok.type == 'OPEN_BRACE':
-                    brace_depth = brace_depth + 1
-                elif tok.type == 'CLOSE_BRACE':
-                    brace_depth = brace_depth - 1
-                elif tok.type == 'OPEN_PAREN':
-                    paren_depth = paren_depth + 1
-                elif tok.type == 'CLOSE_PAREN':
-                    paren_depth = paren_depth - 1
-                    
-                if self.current_parse_status == ProgramParseStatus.NoneStatus:
-                    if tok.type == 'NAME':
-                        if tok.value == 'configurable':
-                            self.current_parse_status = ProgramParseStatus.ConfigVariable
-                        elif tok.value == 'actorclass':
-                            self.current_parse_status = ProgramParseStatus.ToGetActorclassName
-                        elif tok.value == 'struct':
-                            self.current_parse_status = ProgramParseStatus.StructDefinition
-                        elif tok.value == 'message':
-                            self.current_parse_status = ProgramParseStatus.MessageDefinition
-                        elif tok.value == 'upcall':
-                            self.current_parse_status = ProgramParseStatus.UpcallDefinition
-                        elif tok.value == "main":
-                            self.current_parse_status = ProgramParseStatus.MethodDefinition
-                    elif tok.type == 'COLON':
-                        self.current_parse_status = ProgramParseStatus.GetActorclassMethodName
-                    elif tok.type == 'OPEN_PAREN':
-                        if paren_depth == 1 and self.checkMethodDefinition():
-                            self.current_parse_status = ProgramParseStatus.MethodDefinition
-                    else:
-                        ParserUtil.MyUtil.exitWithError('Syntax error here!')
-                elif self.current_parse_status == ProgramParseStatus.ToGetActorclassName:
-                    if tok.type == 'NAME':
-                        self.current_parse_status = ProgramParseStatus.ActorclassDefinition
-                    else:
-                       ParserUtil.MyUtil.exitWithError('Fail to get the name of actorclass!!') 
-                elif self.current_parse_status == ProgramParseStatus.GetActorclassMethodName:
-                    if tok.type == 'NAME':
-                        self.current_method_name = tok.value
-                        self.current_parse_status = ProgramParseStatus.ActorclassMethodDefinition
-                elif self.current_parse_status == ProgramParseStatus.ConfigVariable:
-                    if tok.type == 'SEMI_COLON':
-                        self.parseConfigVariable()
-                        self.current_parse_status = ProgramParseStatus.NoneStatus
-                else:
-                    if tok.type == 'CLOSE_BRACE' and brace_depth == 0:
-                        if self.current_parse_status == ProgramParseStatus.ActorclassDefinition:
-                            self.parseActorclassDefinition()
-                            self.actorclass_collection_vars.clear()
-                            self.current_parse_status = ProgramParseStatus.NoneStatus
-                        elif self.current_parse_status == ProgramParseStatus.StructureDefinition:
-                            self.parseStructDefinition()
-                            self.current_parse_status = ProgramParseStatus.NoneStatus
-                        elif self.current_parse_status == ProgramParseStatus.ActorclassMethodDefinition:
-                            self.parseActorclassMethodDefinition()
-                            self.current_parse_status = ProgramParseStatus.NoneStatus
-                        elif self.current_parse_status == ProgramParseStatus.MethodDefinition:
-                            self.parseMethodDefinition()
-                            self.current_parse_status = ProgramParseStatus.NoneStatus
-                        elif self.current_parse_status == ProgramParseStatus.MessageDefinition:
-                            self.parseMessageDefinition()
-                            self.current_parse_status = ProgramParseStatus.NoneStatus
-                        elif self.current_parse_status == ProgramParseStatus.UpcallDefinition:
-                            self.parseUpcallDefinition()
-                            self.current_parse_status = ProgramParseStatus.NoneStatus
-
-            if self.checkActorclassCycle():
-                ParserUtil.MyUtil.exitWithError("There is cycle in actorclass definition!")
+            yield tok
+
+
+def main(argv=None):
+    arg_parser = argparse.ArgumentParser(description="Translate an AEON program into a Mace service")
+    arg_parser.add_argument("input", help="AEON source file")
+    arg_parser.add_argument("output", nargs="?", help="generated .mac file")
+    arg_parser.add_argument("--trace", action="append", default=[], metavar="SPEC",
+                            help="diagnostics to enable, e.g. 'method', 'method=debug,codegen' or 'all'; may be repeated")
+    arg_parser.add_argument("--profile", metavar="FILE",
+                            help="write wall time, CPU time, peak memory and counts per phase, actorclass and method to FILE as JSON")
+    arg_parser.add_argument("--profile-cprofile", metavar="FILE",
+                            help="with --profile, also write cProfile stats of the slowest phase to FILE")
+    arg_parser.add_argument("--profile-no-memory", action="store_true",
+                            help="with --profile, skip tracemalloc; peak memory per phase is then not recorded")
+    arg_parser.add_argument("--emit-ir", metavar="FILE",
+                            help="also write the compiled program model to FILE; see ProgramIR.py")
+    arg_parser.add_argument("--declarations-only", action="store_true",
+                            help="only scan actorclass declarations, method signatures and collection variables; "
+                            "method bodies are skipped and no output is written")
+    arg_parser.add_argument("--stream", action="store_true",
+                            help="read and translate the program one top-level definition at a time, keeping memory "
+                            "bounded by the largest definition; cannot be combined with -j")
+    arg_parser.add_argument("-j", "--jobs", type=int, default=1,
+                            help="translate method bodies on N processes once the declarations are parsed (default 1)")
+    arg_parser.add_argument("--cache", metavar="DIR",
+                            help="reuse translated actorclass declarations and method bodies cached in DIR")
+    arg_parser.add_argument("--cache-max-size", metavar="SIZE", default=None,
+                            help="with --cache, evict least recently used entries beyond SIZE bytes, e.g. 64M (default 64M)")
+    arg_parser.add_argument("--cache-stats", action="store_true",
+                            help="with --cache, print cache hits and misses after the compile")
+    args = arg_parser.parse_args(argv)
+
+    try:
+        Diagnostics.configure(",".join(args.trace))
+    except ValueError as e:
+        arg_parser.error(str(e))
+    if args.stream and args.jobs > 1:
+        arg_parser.error("--stream cannot be combined with -j")
+    if args.output is None and not args.declarations_only:
+        arg_parser.error("an output file is needed unless --declarations-only is given")
+    if args.profile is None and (args.profile_cprofile is not None or args.profile_no_memory):
+        arg_parser.error("--profile-cprofile and --profile-no-memory need --profile")
+    if args.cache is None and (args.cache_max_size is not None or args.cache_stats):
+        arg_parser.error("--cache-max-size and --cache-stats need --cache")
+
+    cache = None
+    if args.cache is not None:
+        max_bytes = CompileCache.DEFAULT_MAX_BYTES
+        if args.cache_max_size is not None:
+            try:
+                max_bytes = CompileCache.parseSize(args.cache_max_size)
+            except ValueError:
+                arg_parser.error("invalid --cache-max-size '%s'" % args.cache_max_size)
+        cache = CompileCache.CompileCache(args.cache, max_bytes)
+
+    profiler = None
+    if args.profile is not None:
+        profiler = Profiler.CompileProfiler(trace_memory=not args.profile_no_memory, cprofile=args.profile_cprofile is not None)
+
+    status = 0
+    try:
+        with AEONParser(args.input, args.output or "", profiler=profiler, cache=cache, jobs=args.jobs,
+                        declarations_only=args.declarations_only, streaming=args.stream) as parser:
+            if args.emit_ir is not None:
+                ProgramIR.dump(parser, args.emit_ir)
+    except CppParseError as e:
+        print(e)
+        status = 1
+
+    if cache is not None:
+        cache.flush()
+        if args.cache_stats:
+            for line in cache.formatStats():
+                print(line)
+
+    if profiler is not None:
+        profiler.writeJSON(args.profile)
+        if args.profile_cprofile is not None:
+            name = profiler.dumpSlowestPhase(args.profile_cprofile)
+            if name is None:
+                print("No phase was profiled; %s not written" % args.profile_cprofile)
             else:
-                print("There is no cycle!")
-            
-            self.generateAEONFile()
+                print("cProfile stats of phase %s written to %s" % (name, args.profile_cprofile))
+    return status
 
-
-        except:
-            raise CppParseError("Not able to parse on current line!")
+if __name__ == '__main__':
+    sys.exit(main())
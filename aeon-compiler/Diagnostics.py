@@ -0,0 +1,101 @@
+import sys
+
+# Leveled diagnostics with one channel per translator component.
+#
+# Components log through module-level Channel objects and test the channel's
+# flag for a level before building a message:
+#
+#     if diag.trace:
+#         diag.write("type=%s, value=%s" % (tok.type, tok.value))
+#
+# A disabled level therefore costs one attribute read, with no formatting and
+# no I/O.  Levels are process-wide, like the logging module's loggers: they
+# are set once per process with configure(), by the command lines of
+# CppHeaderParser.py and CompileServer.py or by the worker initializer of
+# BatchCompiler, and apply to every parser compiling in that process.
+
+SILENT = 0
+ERROR = 1
+WARNING = 2
+INFO = 3
+DEBUG = 4
+TRACE = 5
+
+LEVELS = {
+    'silent': SILENT,
+    'error': ERROR,
+    'warning': WARNING,
+    'info': INFO,
+    'debug': DEBUG,
+    'trace': TRACE,
+}
+
+DEFAULT_LEVEL = WARNING
+
+CHANNEL_NAMES = ('lexer', 'program', 'actorclass', 'method', 'codegen')
+
+class Channel:
+    __slots__ = ('name', 'level', 'stream', 'error', 'warning', 'info', 'debug', 'trace')
+
+    def __init__(self, name, level=DEFAULT_LEVEL):
+        self.name = name
+        # None writes to whatever sys.stdout is when the message is emitted
+        self.stream = None
+        self.setLevel(level)
+
+    def setLevel(self, level):
+        self.level = level
+        self.error = level >= ERROR
+        self.warning = level >= WARNING
+        self.info = level >= INFO
+        self.debug = level >= DEBUG
+        self.trace = level >= TRACE
+
+    def write(self, msg):
+        stream = self.stream
+        if stream is None:
+            stream = sys.stdout
+        stream.write("[%s] %s\n" % (self.name, msg))
+
+channels = {}
+for name in CHANNEL_NAMES:
+    channels[name] = Channel(name)
+
+def getChannel(name):
+    return channels[name]
+
+def parseLevel(name):
+    if not name in LEVELS:
+        raise ValueError("Unknown diagnostics level '%s', expected one of %s" % (name, ", ".join(sorted(LEVELS, key=LEVELS.get))))
+    return LEVELS[name]
+
+def setLevel(level, names=CHANNEL_NAMES):
+    for name in names:
+        if not name in channels:
+            raise ValueError("Unknown diagnostics channel '%s', expected one of %s" % (name, ", ".join(CHANNEL_NAMES)))
+        channels[name].setLevel(level)
+
+def configure(spec):
+    # spec is a comma separated list of items, applied in order:
+    #   channel=level   set one channel, e.g. method=debug
+    #   channel         trace one channel
+    #   level           set every channel, e.g. silent
+    #   all             trace every channel
+    for item in spec.split(","):
+        item = item.strip()
+        if item == "":
+            continue
+        if "=" in item:
+            name, level = item.split("=", 1)
+            name = name.strip()
+            names = CHANNEL_NAMES if name == "all" else (name,)
+            setLevel(parseLevel(level.strip()), names)
+        elif item == "all":
+            setLevel(TRACE)
+        elif item in LEVELS:
+            setLevel(LEVELS[item])
+        else:
+            setLevel(TRACE, (item,))
+
+def reset():
+    setLevel(DEFAULT_LEVEL)
@@ -0,0 +1,46 @@
+import json
+import tempfile
+
+# Translated method bodies kept in a temporary file instead of in memory.
+#
+# A streaming compile cannot write a method body out when it is translated:
+# whether the body is emitted as an event, async or sync method depends on
+# calls made from bodies further down the program.  It spools the lines
+# instead and keeps a SpooledLines handle in the method's info, which reads
+# them back when the output is generated.
+
+class SpooledLines:
+    __slots__ = ('spool', 'offset', 'count')
+
+    def __init__(self, spool, offset, count):
+        self.spool = spool
+        self.offset = offset
+        self.count = count
+
+    def __len__(self):
+        return self.count
+
+    def __iter__(self):
+        return iter(self.spool.read(self.offset))
+
+class LineSpool:
+    def __init__(self):
+        # Removed by the OS when closed
+        self.fd = tempfile.TemporaryFile()
+        self.size = 0
+
+    def add(self, lines):
+        # Spools a list of lines; returns the handle that reads them back
+        data = (json.dumps(lines) + "\n").encode("utf-8")
+        offset = self.size
+        self.fd.seek(offset)
+        self.fd.write(data)
+        self.size = self.size + len(data)
+        return SpooledLines(self, offset, len(lines))
+
+    def read(self, offset):
+        self.fd.seek(offset)
+        return json.loads(self.fd.readline().decode("utf-8"))
+
+    def close(self):
+        self.fd.close()
@@ -0,0 +1,311 @@
+import VariableParser
+
+# Recognizes loops whose iterations create actors, so a method body can
+# create them in bulk.
+#
+# A bulk loop is a counted for loop, for(int i=A; i<B; i++) with A and B
+# names or numbers the body does not mention and i not assigned in the body,
+# whose body has no break, continue, return or goto.  Each statement
+#
+#     T x = createActor<T>();
+#
+# directly in its body is a BulkCreation: all B-A contexts are created by
+# one createNewContexts() call before the loop, and x takes the i-th id.
+# When the body also inserts x into a vector of child actors of the
+# actorclass,
+#
+#     items.push_back(x);
+#
+# or the method is main, whose actors are owned by Root, the ownership of
+# the new actors is recorded by one createNewOwnerships() call after the
+# loop instead of once per iteration.
+
+#
+# A broadcast loop is a for loop whose body only makes async calls on
+# elements of actor collections,
+#
+#     async players[i].update();
+#
+# Its calls are batched: the runtime forwards them together when the loop
+# ends, rather than one at a time.
+
+LOOP_EXITS = ('break', 'continue', 'return', 'goto')
+
+class BulkLoop:
+    __slots__ = ('openBrace', 'closeBrace', 'indexVar', 'first', 'bound', 'creations')
+
+    def __init__(self, openBrace, closeBrace, indexVar, first, bound):
+        # The braces of the loop body, tokens of the method
+        self.openBrace = openBrace
+        self.closeBrace = closeBrace
+        self.indexVar = indexVar
+        self.first = first
+        self.bound = bound
+        self.creations = []
+
+    def countExpression(self):
+        if self.first == '0':
+            return self.bound
+        return '%s-%s' % (self.bound, self.first)
+
+    def indexExpression(self):
+        if self.first == '0':
+            return self.indexVar
+        return '%s-%s' % (self.indexVar, self.first)
+
+    def ownedCreations(self):
+        return [creation for creation in self.creations if creation.owned]
+
+class BroadcastLoop:
+    __slots__ = ('openBrace', 'closeBrace', 'calls')
+
+    def __init__(self, openBrace, closeBrace, calls):
+        self.openBrace = openBrace
+        self.closeBrace = closeBrace
+        # The number of async calls in the body
+        self.calls = calls
+
+class BulkCreation:
+    __slots__ = ('loop', 'actorclass', 'varName', 'createToken', 'insertToken', 'owned', 'idsName')
+
+    def __init__(self, loop, actorclass, varName, createToken):
+        self.loop = loop
+        self.actorclass = actorclass
+        self.varName = varName
+        # The createActor token of the statement
+        self.createToken = createToken
+        # The push_back token inserting the actor into a child collection
+        self.insertToken = None
+        # Whether ownership is recorded after the loop
+        self.owned = False
+        # The vector of new ids, named when the loop is translated
+        self.idsName = ''
+
+def findLoops(tokens, start, actorclasses, is_main, getVarInfo):
+    # The BulkLoops and BroadcastLoops of the method body in tokens[start:],
+    # each loop read once through one brace index of the body; getVarInfo
+    # looks a name up in the method's scope
+    matches, loop_starts = indexBlocks(tokens, start)
+    bulk_loops = []
+    broadcast_loops = []
+    for pos in loop_starts:
+        braces = loopBraces(tokens, pos, matches)
+        if braces is None:
+            continue
+        statements, plain = blockStatements(tokens, braces[2], braces[3], matches)
+        loop = analyzeLoop(tokens, braces, statements, actorclasses, is_main, getVarInfo)
+        if loop is not None:
+            bulk_loops.append(loop)
+        elif plain:
+            loop = analyzeBroadcastLoop(tokens, braces, statements, getVarInfo)
+            if loop is not None:
+                broadcast_loops.append(loop)
+    return bulk_loops, broadcast_loops
+
+def analyzeLoop(tokens, braces, statements, actorclasses, is_main, getVarInfo):
+    open_paren, close_paren, open_brace, close_brace = braces
+    header = parseCountedHeader(withoutTabs(tokens[open_paren+1:close_paren]))
+    if header is None:
+        return None
+    index_var, first, bound = header
+
+    loop = BulkLoop(tokens[open_brace], tokens[close_brace], index_var, first, bound)
+    created = {}
+    for statement in statements:
+        creation = matchCreation(statement, actorclasses)
+        if creation is not None:
+            actorclass, var_name = creation
+            if var_name in created:
+                # Declared twice; not a simple loop
+                return None
+            created[var_name] = BulkCreation(loop, actorclass, var_name, statement[3])
+            created[var_name].owned = is_main
+            loop.creations.append(created[var_name])
+            continue
+        insertion = matchInsertion(statement, getVarInfo)
+        if insertion is not None:
+            var_name, insert_token = insertion
+            creation = created.get(var_name)
+            if creation is not None and creation.insertToken is None and not is_main:
+                creation.insertToken = insert_token
+                creation.owned = True
+
+    if len(loop.creations) == 0:
+        return None
+    # Only a loop creating actors is read through its nested blocks.  A
+    # created actor reassigned in the body would not be the one whose id the
+    # ownership is recorded for
+    for i in range(open_brace + 1, close_brace):
+        tok = tokens[i]
+        if tok.type != 'NAME':
+            continue
+        if tok.value in LOOP_EXITS or tok.value == first or tok.value == bound:
+            return None
+        if tok.value == index_var and isAssigned(tokens, i, open_brace, close_brace):
+            return None
+        if tok.value in created and isAssigned(tokens, i, open_brace, close_brace) and not isDeclaration(tokens, i, open_brace, actorclasses):
+            return None
+    return loop
+
+def analyzeBroadcastLoop(tokens, braces, statements, getVarInfo):
+    # statements are those of a body without nested blocks
+    if len(statements) == 0:
+        return None
+    for statement in statements:
+        if not isElementAsyncCall(statement, getVarInfo):
+            return None
+    return BroadcastLoop(tokens[braces[2]], tokens[braces[3]], len(statements))
+
+def isElementAsyncCall(statement, getVarInfo):
+    # async c[...].m(...); with c an actor collection
+    values = [tok.value for tok in statement]
+    if len(values) < 9 or values[0] != 'async' or statement[1].type != 'NAME' or values[2] != '[' or values[-1] != ';':
+        return False
+    close_bracket = matchingToken(statement, 2, 'OPEN_SQUARE_BRACKET', 'CLOSE_SQUARE_BRACKET')
+    rest = values[close_bracket+1:]
+    if len(rest) < 5 or rest[0] != '.' or statement[close_bracket+2].type != 'NAME' or rest[2] != '(' or rest[-2] != ')':
+        return False
+    if matchingToken(statement, close_bracket + 3, 'OPEN_PAREN', 'CLOSE_PAREN') != len(statement) - 2:
+        return False
+    var_info = getVarInfo(values[1])
+    return var_info.type == VariableParser.VariableInfo.ActorCollectionType
+
+def parseCountedHeader(header):
+    # (i, A, B) of [type] i = A ; i < B ; i++ or ++i
+    if len(header) == 12 and header[0].type == 'NAME' and header[1].type == 'NAME':
+        # Declares the index
+        header = header[1:]
+    if len(header) != 11 or header[0].type != 'NAME':
+        return None
+    values = [tok.value for tok in header]
+    index_var = values[0]
+    if values[1] != '=' or values[3] != ';' or values[4] != index_var or values[5] != '<' or values[7] != ';':
+        return None
+    if not isSimpleOperand(header[2]) or not isSimpleOperand(header[6]):
+        return None
+    if values[8:] != [index_var, '+', '+'] and values[8:] != ['+', '+', index_var]:
+        return None
+    return index_var, values[2], values[6]
+
+def isSimpleOperand(tok):
+    return tok.type == 'NAME' or tok.type == 'NUMBER'
+
+def matchCreation(statement, actorclasses):
+    # (T, x) of T x = createActor<T>();
+    values = [tok.value for tok in statement]
+    if len(values) != 10 or values[9] != ';':
+        return None
+    if not values[0] in actorclasses or statement[1].type != 'NAME' or values[2] != '=' or values[3] != 'createActor':
+        return None
+    if values[4:9] != ['<', values[0], '>', '(', ')']:
+        return None
+    return values[0], values[1]
+
+def matchInsertion(statement, getVarInfo):
+    # (x, push_back token) of c.push_back(x); with c a vector of child actors
+    values = [tok.value for tok in statement]
+    if len(values) != 7 or values[1] != '.' or values[2] != 'push_back' or values[3] != '(' or values[5] != ')' or values[6] != ';':
+        return None
+    if statement[0].type != 'NAME' or statement[4].type != 'NAME':
+        return None
+    var_info = getVarInfo(values[0])
+    if var_info.type != VariableParser.VariableInfo.ActorCollectionType or not var_info.isChildActor or var_info.collectionType != 'vector':
+        return None
+    return values[4], statement[2]
+
+def indexBlocks(tokens, start):
+    # One pass over the method body in tokens[start:]: the position of the
+    # closing brace or parenthesis matching each opening one, and the
+    # positions of the for tokens
+    matches = {}
+    loop_starts = []
+    braces = []
+    parens = []
+    for pos in range(start, len(tokens)):
+        tok = tokens[pos]
+        if tok.type == 'OPEN_BRACE':
+            braces.append(pos)
+        elif tok.type == 'CLOSE_BRACE':
+            if len(braces) > 0:
+                matches[braces.pop()] = pos
+        elif tok.type == 'OPEN_PAREN':
+            parens.append(pos)
+        elif tok.type == 'CLOSE_PAREN':
+            if len(parens) > 0:
+                matches[parens.pop()] = pos
+        elif tok.type == 'NAME' and tok.value == 'for':
+            loop_starts.append(pos)
+    return matches, loop_starts
+
+def loopBraces(tokens, pos, matches):
+    # The positions of the parentheses and braces of the for loop at pos
+    open_paren = skipTabs(tokens, pos + 1)
+    if not open_paren in matches or tokens[open_paren].type != 'OPEN_PAREN':
+        return None
+    close_paren = matches[open_paren]
+    open_brace = skipTabs(tokens, close_paren + 1)
+    if not open_brace in matches or tokens[open_brace].type != 'OPEN_BRACE':
+        return None
+    return open_paren, close_paren, open_brace, matches[open_brace]
+
+def blockStatements(tokens, open_brace, close_brace, matches):
+    # The statements directly in the block between the braces, tabs left
+    # out, and whether the block is only those statements, with no nested
+    # block and nothing after the last one; nested blocks are stepped over
+    # through matches
+    statements = []
+    statement = []
+    plain = True
+    paren_depth = 0
+    pos = open_brace + 1
+    while pos < close_brace:
+        tok = tokens[pos]
+        if tok.type == 'OPEN_BRACE':
+            statement = []
+            plain = False
+            pos = matches[pos]
+        elif tok.type != 'TAB':
+            statement.append(tok)
+            if tok.type == 'OPEN_PAREN':
+                paren_depth = paren_depth + 1
+            elif tok.type == 'CLOSE_PAREN':
+                paren_depth = paren_depth - 1
+            elif tok.type == 'SEMI_COLON' and paren_depth == 0:
+                statements.append(statement)
+                statement = []
+        pos = pos + 1
+    return statements, plain and len(statement) == 0
+
+def isAssigned(tokens, i, open_brace, close_brace):
+    # Whether tokens[i] is assigned, incremented or decremented, looking no
+    # further than the braces of its block
+    following = [tok.value for tok in tokens[i+1:min(i+3, close_brace)]]
+    preceding = [tok.value for tok in tokens[max(open_brace+1, i-2):i]]
+    if len(following) > 0 and following[0] == '=' and following[1:2] != ['=']:
+        return True
+    if len(following) == 2 and following[1] == '=' and following[0] in ('+', '-', '*', '/', '%', '|', '&', '^'):
+        return True
+    return following in (['+', '+'], ['-', '-']) or preceding in (['+', '+'], ['-', '-'])
+
+def isDeclaration(tokens, i, open_brace, actorclasses):
+    return i > open_brace + 1 and tokens[i-1].value in actorclasses
+
+def matchingToken(tokens, pos, open_type, close_type):
+    depth = 0
+    while pos < len(tokens):
+        if tokens[pos].type == open_type:
+            depth = depth + 1
+        elif tokens[pos].type == close_type:
+            depth = depth - 1
+            if depth == 0:
+                return pos
+        pos = pos + 1
+    return pos
+
+def skipTabs(tokens, pos):
+    while pos < len(tokens) and tokens[pos].type == 'TAB':
+        pos = pos + 1
+    return pos
+
+def withoutTabs(tokens):
+    return [tok for tok in tokens if tok.type != 'TAB']
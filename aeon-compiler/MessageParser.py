@@ -21,7 +21,7 @@ class MessageDefinitionInfo:
         line = '%s {' % self.message_name
         lines.append(line)
 
-        for key, var in self.vars.iteritems():
+        for key, var in self.vars.items():
             line = var.generateVarDeclaration()
             if line != '':
                 line = '\t'+line+';'
@@ -34,33 +34,16 @@ class MessageDefinitionInfo:
 
 class MessageDefinitionParser:
     @staticmethod
-    def parse(tokens):
+    def parse(declaration):
+        # The MessageDefinitionInfo of a ProgramGrammar.RecordDeclaration
         # print "MessageDefinitionParser::parse"
-        current_parse_status = StructureParser.StructParseStatus.NoneStatus
         message_info = MessageDefinitionInfo()
+        message_info.message_name = declaration.name.value
 
-        line = []
-        
-        for i in range(len(tokens)):
-            tok = tokens[i]
-            # print tok.value
+        context_types = []
+        context_collection_vars = {}
+        for field in declaration.fields:
+            var_info = VariableParser.VariableParser.makeVariable(field, context_types, context_collection_vars)
+            message_info.vars[var_info.varName] = var_info
 
-            if current_parse_status == StructureParser.StructParseStatus.NoneStatus:
-                if tok.type == 'NAME' and tok.value == 'message':
-                    current_parse_status = StructureParser.StructParseStatus.ToGetStructName
-            elif current_parse_status == StructureParser.StructParseStatus.ToGetStructName:
-                if tok.type == 'NAME':
-                    message_info.message_name = tok.value
-                    current_parse_status = StructureParser.StructParseStatus.GetStructName
-            elif current_parse_status == StructureParser.StructParseStatus.GetStructName:
-                if tok.type == 'OPEN_BRACE':
-                    current_parse_status = StructureParser.StructParseStatus.VarDefinition
-            elif current_parse_status == StructureParser.StructParseStatus.VarDefinition:
-                if tok.type == 'SEMI_COLON':
-                    context_types = []
-                    var_info = VariableParser.VariableParser.parseVariableDeclaration(line, context_types)
-                    message_info.vars[var_info.varName] = var_info
-                    line = []
-                else:
-                    line.append(tok)
-        return message_info
\ No newline at end of file
+        return message_info
@@ -9,17 +9,18 @@ import copy
 import VariableParser
 import ParserUtil
 import MessageParser
+import ScopedSymbolTable
+import TokenRewriter
+import Diagnostics
+import LoopAnalyzer
 
-class MethodParseStatus:
-    NoneStatus = 0
-    ToGetReturnType = 1
-    ToGetMethodType = 2
-    ToGetMethodName = 3
-    ParseMethodArgsDeclaration = 4
-    GetMethodDeclarationInfo = 5
-    MethodImplementation = 6
+diag = Diagnostics.getChannel('method')
+codegen = Diagnostics.getChannel('codegen')
 
 class ActorclassMethodInfo:
+    __slots__ = ('valid', 'returnType', 'actorclass', 'methodType', 'definedName', 'generatedName', 'arguments',
+                 'eventTag', 'asyncTag', 'syncTag', 'implementation')
+
     def __init__(self):
         self.valid = False
         self.returnType = ''
@@ -50,7 +51,8 @@ class ActorclassMethodInfo:
             self.syncTag = True
 
     def generateEventAndAsyncMethodDefinition(self, actorclass):
-        print("ActorclassMethodInfo::generateEventAndAsyncMethodDefinition: %s::%s" % (actorclass, self.definedName))
+        if codegen.debug:
+            codegen.write("ActorclassMethodInfo::generateEventAndAsyncMethodDefinition: %s::%s" % (actorclass, self.definedName))
         lines = []
 
         if self.eventTag:
@@ -61,8 +63,7 @@ class ActorclassMethodInfo:
             line = line + ') [locking=ownership] {'
             lines.append(line) 
 
-            for i in range(len(self.implementation)):
-                lines.append(self.implementation[i])
+            lines.extend(self.implementation)
             # lines.append('}')
 
         if self.asyncTag:
@@ -73,8 +74,7 @@ class ActorclassMethodInfo:
             line = line + ') {'
             lines.append(line) 
 
-            for i in range(len(self.implementation)):
-                lines.append(self.implementation[i])
+            lines.extend(self.implementation)
             # lines.append('}') 
         
         return lines
@@ -86,8 +86,7 @@ class ActorclassMethodInfo:
         lines.append(line)
 
 
-        for i in range(len(self.implementation)):
-            lines.append(self.implementation[i])
+        lines.extend(self.implementation)
         # lines.append('}')
 
         return lines
@@ -106,13 +105,13 @@ class ActorclassMethodInfo:
                     line = line+', '+arg.generateVarDeclaration()
             line = line + ') {'
             lines.append(line)
-            for i in range(len(self.implementation)):
-                lines.append(self.implementation[i])
+            lines.extend(self.implementation)
             lines.append('}')
         return lines
 
     def generateSyncMethodDefinition(self, actorclass):
-        print("ActorclassMethodInfo::generateSyncMethodDefinition: %s::%s" % (actorclass, self.definedName))
+        if codegen.debug:
+            codegen.write("ActorclassMethodInfo::generateSyncMethodDefinition: %s::%s" % (actorclass, self.definedName))
         lines = []
 
         if self.syncTag:
@@ -123,42 +122,15 @@ class ActorclassMethodInfo:
             line = line + ') {'
             lines.append(line) 
 
-            for i in range(len(self.implementation)):
-                lines.append(self.implementation[i])
+            lines.extend(self.implementation)
             # lines.append('}')
         return lines
 
-class MethodBlockInfo:
-    def __init__(self):
-        self.vars = {}
-
-    def insertVarInfo(self, varName, varInfo):
-        #print "Insert var=%s type=%s context=%s id=%s" % (varName, varInfo.varType, varInfo.contextType, varInfo.contextObjId)
-        self.vars[varName] = varInfo
-
-    def getVarInfo(self, varName):
-        # print "MethodBlockInfo::getVarInfo %s" % varName
-        if varName in self.vars.keys():
-            varInfo = self.vars[varName]
-            return varInfo
-        else:
-            varInfo = VariableParser.VariableInfo()
-            return varInfo  
-
-    def updateVarInfo(self, varName, varInfo):
-        if varName in self.vars.keys():
-            #print 'Update var=%s context=%s objId=%s' % (varName, varInfo.contextType, varInfo.contextObjId)
-            self.vars[varName] = varInfo
-            return True
-        else:
-            return False
-
 class ActorclassMethodParserInfo:
     def __init__(self):
-        self.block_infos = []
         self.brace_depth = 0
         self.paren_depth = 0
-        self.current_block_info = MethodBlockInfo()
+        self.symbol_table = ScopedSymbolTable.ScopedSymbolTable()
 
         self.context_type = ''
         self.method_name = ''
@@ -166,117 +138,121 @@ class ActorclassMethodParserInfo:
         self.actorclass_vars = {}
 
         self.nextVariable = 0
+
+        # Tokens of the bulk loops of the method: loop braces -> BulkLoop or
+        # BroadcastLoop, createActor and push_back tokens -> BulkCreation
+        self.bulkTokens = {}
     
     def nextVariableName(self):
         var_name = '%s_%s_%d' % (self.context_type, self.method_name, self.nextVariable)
         self.nextVariable = self.nextVariable+1
         return var_name
 
+    def setActorclassVars(self, actorclass_vars):
+        self.actorclass_vars = actorclass_vars
+        self.symbol_table.setBaseScope(actorclass_vars)
+
     def createMethodBlock(self):
-        self.block_infos.append(self.current_block_info)
-        self.current_block_info = MethodBlockInfo()
+        self.symbol_table.pushScope()
 
     def popMethodBlock(self):
-        if len(self.block_infos) > 0:
-            self.current_block_info = self.block_infos.pop()
+        self.symbol_table.popScope()
+
+    def addBulkLoops(self, loops):
+        for loop in loops:
+            self.bulkTokens[loop.openBrace] = loop
+            self.bulkTokens[loop.closeBrace] = loop
+            for creation in loop.creations:
+                self.bulkTokens[creation.createToken] = creation
+                if creation.insertToken is not None:
+                    self.bulkTokens[creation.insertToken] = creation
+
+    def addBroadcastLoops(self, loops):
+        for loop in loops:
+            self.bulkTokens[loop.openBrace] = loop
+            self.bulkTokens[loop.closeBrace] = loop
+
+    def getBulkCreation(self, tok):
+        bulk = self.bulkTokens.get(tok)
+        if isinstance(bulk, LoopAnalyzer.BulkCreation):
+            return bulk
+        return None
 
     def getVarInfo(self, varName):
         # print("ActorclassMethodParser::getVarInfo %s" % varName)
-        
-        varInfo = self.current_block_info.getVarInfo(varName)
-        if varInfo.type == VariableParser.VariableInfo.InvalidType:
-            j = len(self.block_infos) - 1
-            while j >= 0:
-                varInfo = self.block_infos[j].getVarInfo(varName)
-                if varInfo.type != VariableParser.VariableInfo.InvalidType:
-                    break
-                j = j - 1
-        
-        if varInfo.type == VariableParser.VariableInfo.InvalidType and varName in self.actorclass_vars:
-            return self.actorclass_vars[varName]
-        return varInfo
+        return self.symbol_table.lookup(varName)
 
     def updateVarInfo(self, varName, varInfo):
-        succ = self.current_block_info.updateVarInfo(varName, varInfo)
-        if not succ:
-            j = len(self.block_infos) - 1
-            while (j >= 0):
-                block_info = self.block_infos[j]
-                succ = block_info.updateVarInfo(varName, varInfo)
-                if succ:
-                    break
-                j = j - 1
-        return succ
+        return self.symbol_table.update(varName, varInfo)
 
     def insertVarInfo(self, varName, varInfo):
-        self.current_block_info.insertVarInfo(varName, varInfo)
+        self.symbol_table.insert(varName, varInfo)
 
 class ActorclassMethodParser:
     @staticmethod
-    def parseMethodDeclaration(line, actorclassName, actorclasses):
-        print("ActorclassMethodParser::parseMethodDeclaration")
+    def makeMethodDeclaration(declaration, actorclassName, actorclasses):
+        # The ActorclassMethodInfo of a ProgramGrammar.MethodDeclaration in
+        # actorclass actorclassName
+        if diag.debug:
+            diag.write("ActorclassMethodParser::makeMethodDeclaration: %s" % declaration.name.value)
         method_info = ActorclassMethodInfo()
-        status = MethodParseStatus.ToGetReturnType
-
-        arg_tokens = []
         method_info.actorclass = actorclassName
         method_info.valid = True
         method_info.methodType = 'routine'
-        paren_depth = 0
-
-        for i in range(len(line)):
-            tok = line[i]
-            # print tok.value
+        method_info.returnType = declaration.type.type.value
+        method_info.definedName = declaration.name.value
 
-            if tok.type == 'OPEN_PAREN':
-                paren_depth = paren_depth + 1
-            elif tok.type == 'CLOSE_PAREN':
-                paren_depth = paren_depth - 1
-
-            if status == MethodParseStatus.ToGetReturnType:
-                if tok.type == 'NAME' or tok.type == 'COLLECTION_TYPE':
-                    method_info.returnType = tok.value
-                    status = MethodParseStatus.ToGetMethodName
-                else:
-                    continue
-            elif status == MethodParseStatus.ToGetMethodName:
-                if tok.type == 'NAME':
-                    method_info.definedName = tok.value
-                    status = MethodParseStatus.ParseMethodArgsDeclaration
-            elif status == MethodParseStatus.ParseMethodArgsDeclaration:
-                if tok.type == 'OPEN_PAREN':
-                    pass
-                elif tok.type == 'COMMA' and paren_depth == 1 and len(arg_tokens)>0:
-                    actorclass_collection_vars = { }
-                    variableInfo = VariableParser.VariableParser.parseVariableDeclaration(arg_tokens, actorclasses, actorclass_collection_vars)
-                    arg_tokens = []
-                    method_info.arguments.append(variableInfo)
-                elif tok.type == 'CLOSE_PAREN' and paren_depth == 0 and len(arg_tokens)>0:
-                    actorclass_collection_vars = { }
-                    variableInfo = VariableParser.VariableParser.parseVariableDeclaration(arg_tokens, actorclasses, actorclass_collection_vars)
-                    arg_tokens = []
-                    method_info.arguments.append(variableInfo)
-                else:
-                    arg_tokens.append(tok)
+        actorclass_collection_vars = { }
+        for parameter in declaration.parameters:
+            method_info.arguments.append(VariableParser.VariableParser.makeVariable(parameter, actorclasses, actorclass_collection_vars))
         # print "Get Actorclass Method: type=%s name=%s" % (method_info.methodType, method_info.definedName)
         return method_info
 
-    
     @staticmethod
     def parseActorclassMethodDefinition(program_parser, implementations):
-        print("ActorclassMethodParser::parseActorclassMethodDefinition begin: ", program_parser.defined_actorclasses)
+        # Translates the body of the method definition in
+        # program_parser.tokens, whose ProgramGrammar.MethodHeader is
+        # program_parser.declaration; of the global methods only main is
+        # translated
+        if diag.debug:
+            diag.write("ActorclassMethodParser::parseActorclassMethodDefinition begin: %s" % program_parser.symbols.actorclassNames)
         tokens = program_parser.tokens
-        status = MethodParseStatus.NoneStatus
+        header = program_parser.declaration
 
         parser_info = ActorclassMethodParserInfo()
+        pos = header.bodyStart
+        if header.actorclass is not None:
+            parser_info.context_type = header.actorclass
+            parser_info.method_name = header.name
+
+            parser_info.setActorclassVars(program_parser.getActorclassVariables(parser_info.context_type))
+
+            if not program_parser.checkActorclassMethodDeclaration(parser_info.context_type, parser_info.method_name):
+                ParserUtil.MyUtil.exitWithError('Fail to find method %s:%s' % (parser_info.context_type, parser_info.method_name) )
+            args = program_parser.getActorclassMethodArgs( parser_info.context_type, parser_info.method_name )
+            for i in range(0, len(args)):
+                if args[i].type == VariableParser.VariableInfo.ActorType or args[i].type == VariableParser.VariableInfo.ActorCollectionType:
+                    if diag.debug:
+                        diag.write('Insert arg: %s of type %s' % (args[i].varName, args[i].varType))
+                    parser_info.insertVarInfo(args[i].varName, args[i])
+            bulk_loops, broadcast_loops = LoopAnalyzer.findLoops(tokens, pos, program_parser.symbols.actorclasses, False, parser_info.getVarInfo)
+            parser_info.addBulkLoops(bulk_loops)
+            parser_info.addBroadcastLoops(broadcast_loops)
+        elif header.name == "main":
+            parser_info.context_type = "main"
+            parser_info.method_name = "main"
+            bulk_loops, broadcast_loops = LoopAnalyzer.findLoops(tokens, pos, program_parser.symbols.actorclasses, True, parser_info.getVarInfo)
+            parser_info.addBulkLoops(bulk_loops)
+            parser_info.addBroadcastLoops(broadcast_loops)
+        else:
+            return parser_info
 
-        pos = 0
-        
+        parser_info.brace_depth = 1
         line = []
-
         while pos < len(tokens):
             tok = tokens[pos]
-            print("type=%s, value=%s, pos=%d" % (tok.type, tok.value, pos))
+            if diag.trace:
+                diag.write("type=%s, value=%s, pos=%d" % (tok.type, tok.value, pos))
 
             if tok.type == 'OPEN_BRACE':
                 parser_info.brace_depth = parser_info.brace_depth + 1
@@ -287,66 +263,84 @@ class ActorclassMethodParser:
             elif tok.type == 'CLOSE_PAREN':
                 parser_info.paren_depth = parser_info.paren_depth - 1
 
-            if status == MethodParseStatus.NoneStatus:
-                if tok.type == 'COLON' and ParserUtil.MyUtil.checkContextMethodDefinition(tokens, pos):
-                    parser_info.context_type = tokens[pos-1].value
-                    parser_info.method_name = tokens[pos+2].value
-                    
-                    parser_info.actorclass_vars = program_parser.getActorclassVariables(parser_info.context_type)
-                    
-                    if program_parser.checkActorclassMethodDeclaration(parser_info.context_type, parser_info.method_name):
-                        status = MethodParseStatus.GetMethodDeclarationInfo 
-                    else:
-                        ParserUtil.MyUtil.exitWithError('Fail to find method %s:%s' % (parser_info.context_type, parser_info.method_name) ) 
-                elif tok.type == 'OPEN_BRACE':
-                    if tokens[pos-3].value == "main":
-                        parser_info.context_type = "main"
-                        parser_info.method_name = "main"
-                        status = MethodParseStatus.MethodImplementation
-            elif status == MethodParseStatus.GetMethodDeclarationInfo:
-                if tok.type == 'OPEN_BRACE':
-                    args = program_parser.getActorclassMethodArgs( parser_info.context_type, parser_info.method_name )
-                    for i in range(0, len(args)):
-                        if args[i].type == VariableParser.VariableInfo.ActorType or args[i].type == VariableParser.VariableInfo.ActorCollectionType:
-                            print('Insert arg: %s of type %s' % (args[i].varName, args[i].varType))
-                            parser_info.insertVarInfo(args[i].varName, args[i])                            
-                    status = MethodParseStatus.MethodImplementation
-            elif status == MethodParseStatus.MethodImplementation:
-                line.append(tok)
-                if tok.type == 'OPEN_BRACE' or tok.type == 'CLOSE_BRACE':
-                    new_lines = ActorclassMethodParser.parseImplementationLine(parser_info, program_parser, line)
-                    for j in range(0, len(new_lines)):
-                        implementations.append(new_lines[j])
-
-                    line = []
-                elif tok.type == 'SEMI_COLON' and parser_info.paren_depth == 0:
-                    new_lines = ActorclassMethodParser.parseImplementationLine(parser_info, program_parser, line)
-                    for j in range(0, len(new_lines)):
-                        implementations.append(new_lines[j])
-
-                    line = []
+            line.append(tok)
+            if tok.type == 'OPEN_BRACE' or tok.type == 'CLOSE_BRACE':
+                new_lines = ActorclassMethodParser.translateLine(parser_info, program_parser, line)
+                for j in range(0, len(new_lines)):
+                    implementations.append(new_lines[j])
+
+                line = []
+            elif tok.type == 'SEMI_COLON' and parser_info.paren_depth == 0:
+                new_lines = ActorclassMethodParser.translateLine(parser_info, program_parser, line)
+                for j in range(0, len(new_lines)):
+                    implementations.append(new_lines[j])
+
+                line = []
             pos = pos + 1
 
-        print("ActorclassMethodParser::parseActorclassMethodDefinition end")
+        if diag.debug:
+            diag.write("ActorclassMethodParser::parseActorclassMethodDefinition end")
         return parser_info
 
     @staticmethod
-    def parseImplementationLine(parser_info, program_parser, input_tokens):
-        print("ActorclassMethodParser::parseImplementationLine begin")
-        line = []
+    def translateLine(parser_info, program_parser, line):
+        # parseImplementationLine(), with the bulk creation of a bulk loop
+        # before its header and the ownership of its actors after its body,
+        # and a broadcast loop between the start and the end of a batch
+        loop = parser_info.bulkTokens.get(line[-1])
+        if loop is None:
+            return ActorclassMethodParser.parseImplementationLine(parser_info, program_parser, line)
 
-        for i in range(0, len(input_tokens)):
-            tok = ParserUtil.MyToken()
-            tok.type = input_tokens[i].type
-            tok.value = input_tokens[i].value
+        tabs = ""
+        for tok in line:
+            if tok.type != 'TAB':
+                break
+            tabs = tabs + "\t"
 
+        output_lines = []
+        if isinstance(loop, LoopAnalyzer.BroadcastLoop):
+            if line[-1] is loop.openBrace:
+                output_lines.append(tabs + "beginBroadcastBatch();")
+            output_lines.extend(ActorclassMethodParser.parseImplementationLine(parser_info, program_parser, line))
+            if line[-1] is loop.closeBrace:
+                output_lines.append(tabs + "endBroadcastBatch();")
+            return output_lines
+
+        if line[-1] is loop.openBrace:
+            for creation in loop.creations:
+                creation.idsName = parser_info.nextVariableName()
+                impl_line = "mace::vector<uint32_t> %s = createNewContexts(\"%s\", %s);" % (creation.idsName, creation.actorclass, loop.countExpression())
+                output_lines.append(tabs + impl_line)
+        output_lines.extend(ActorclassMethodParser.parseImplementationLine(parser_info, program_parser, line))
+        if line[-1] is loop.closeBrace:
+            owned = loop.ownedCreations()
+            if len(owned) > 0:
+                if parser_info.method_name == "main":
+                    pname = "\"Root\""
+                else:
+                    pname = parser_info.nextVariableName()
+                    impl_line = ParserUtil.MyUtil.generateActorNameDeclaration(pname, parser_info.context_type, ParserUtil.MyConstants.ActorThisID)
+                    output_lines.append(tabs + impl_line)
+                for creation in owned:
+                    impl_line = "createNewOwnerships(%s, \"%s\", %s);" % (pname, creation.actorclass, creation.idsName)
+                    output_lines.append(tabs + impl_line)
+        return output_lines
+
+    @staticmethod
+    def parseImplementationLine(parser_info, program_parser, input_tokens):
+        if diag.debug:
+            diag.write("ActorclassMethodParser::parseImplementationLine begin")
+        # Lexer tokens are MyTokens already and belong to this line only, so
+        # they are rewritten in place
+        line = input_tokens
+
+        for tok in line:
+            tok.reset()
             if tok.value == "this":
                 tok.type = ParserUtil.TokenType.ACTOR
                 tok.value = ParserUtil.MyConstants.ActorThisID
                 tok.contextType = parser_info.context_type
                 tok.isChildContext = True
-
-            line.append(tok)
         
         prefix_lines = []
         post_lines = []
@@ -359,7 +353,8 @@ class ActorclassMethodParser:
         is_line_head = True
         while pos < len(line):
             tok = line[pos]
-            print("type=%s, value=%s, pos=%d" % ( tok.type, tok.value, pos))
+            if diag.trace:
+                diag.write("type=%s, value=%s, pos=%d" % ( tok.type, tok.value, pos))
 
             if tok.type == "TAB" and is_line_head:
                 n_tab = n_tab + 1
@@ -379,10 +374,9 @@ class ActorclassMethodParser:
                 for i in range(0, len(new_toks)):
                     tok_stack.push_back( new_toks[i] )
             elif tok.type == 'COLLECTION_TYPE':
-                new_tok = copy.copy(tok)
-                # pos = ContextMethodParser.parseContextCollectionOrIterDeclare( parser_info, program_parser, line, pos, new_tok )
-                tok_stack.push_back(new_tok)
-                # print 'COLLECTION_TYPE: ', new_tok.value
+                # pos = ContextMethodParser.parseContextCollectionOrIterDeclare( parser_info, program_parser, line, pos, tok )
+                tok_stack.push_back(tok)
+                # print 'COLLECTION_TYPE: ', tok.value
             elif tok.type == 'CLOSE_SQUARE_BRACKET':
                 tok_stack.push_back( tok )
                 pos = pos + 1
@@ -392,7 +386,8 @@ class ActorclassMethodParser:
                 last_tok = tok_stack.end()
                 tok_stack.pop()
 
-                print(last_tok.type, ", ", last_tok.contextType)
+                if diag.trace:
+                    diag.write("%s, %s" % (last_tok.type, last_tok.contextType))
 
                 last_tok.value = last_tok.value + new_tok.value
                 if last_tok.type == ParserUtil.TokenType.ACTOR_COLLECTION:
@@ -415,9 +410,10 @@ class ActorclassMethodParser:
                 for i in range(0, len(new_toks) ):
                     tok_stack.push_back( new_toks[i] )
 
-                toks = tok_stack.getTokens()
-                for i in range(len(toks)):
-                    print(toks[i].type, ": ", toks[i].value)
+                if diag.trace:
+                    toks = tok_stack.getTokens()
+                    for i in range(len(toks)):
+                        diag.write("%s: %s" % (toks[i].type, toks[i].value))
 
                 last_tok = tok_stack.end()
                 if last_tok.type == ParserUtil.TokenType.ACTOR:
@@ -446,7 +442,7 @@ class ActorclassMethodParser:
                     parser_info.createMethodBlock()
                     tok_stack.push_back(tok)
                     pos = pos + 1
-                elif tok.value in program_parser.defined_actorclasses:
+                elif tok.value in program_parser.symbols.actorclasses:
                     new_tok = ParserUtil.MyToken()
                     pos = ActorclassMethodParser.parseActorclassDeclaration( parser_info, line, pos, new_tok )
                     tok_stack.push_back( new_tok )
@@ -456,12 +452,13 @@ class ActorclassMethodParser:
                     tok_stack.push_back(new_tok)
                 elif tok.value == "createActor":
                     new_tok = ParserUtil.MyToken()
+                    bulk_creation = parser_info.getBulkCreation(tok)
                     pos = ActorclassMethodParser.parseCreateActorAPI( parser_info, line, pos, new_tok, prefix_lines)
                     tok_stack.push_back(new_tok)
 
-                    if parser_info.method_name == "main":
+                    if parser_info.method_name == "main" and bulk_creation is None:
                         cname = parser_info.nextVariableName()
-                        impl_line = "mace::string %s = generateActorName(\"%s\", %s);" % (cname, new_tok.contextType, new_tok.value)
+                        impl_line = ParserUtil.MyUtil.generateActorNameDeclaration(cname, new_tok.contextType, new_tok.value)
                         post_lines.append(impl_line)
 
                         impl_line = "createNewOwnership(\"Root\", %s);" % cname
@@ -515,17 +512,18 @@ class ActorclassMethodParser:
         output_line = ''
         for i in range(0, len(new_tokens) ):
             tok = new_tokens[i]
-            print(tok.type, ": ", tok.value)
+            if diag.trace:
+                diag.write("%s: %s" % (tok.type, tok.value))
             output_line = output_line + tok.value
             if tok.type == 'EQUALS' and new_tokens[i-1].type == ParserUtil.TokenType.ACTOR and new_tokens[i-1].isChildContext:
                 post_line = ''
                 if new_tokens[i+1].value == 'NULL':
                     pname = parser_info.nextVariableName()
-                    post_line = "mace::string %s = generateActorName(\"%s\", %s);" % (pname, parser_info.context_type, ParserUtil.MyConstants.ActorThisID)
+                    post_line = ParserUtil.MyUtil.generateActorNameDeclaration(pname, parser_info.context_type, ParserUtil.MyConstants.ActorThisID)
                     post_lines.append(post_line)
 
                     cname = parser_info.nextVariableName()
-                    post_line = "mace::string %s = generateActorName(\"%s\", %s);" % (cname, new_tokens[i-1].contextType, new_tokens[i-1].value)
+                    post_line = ParserUtil.MyUtil.generateActorNameDeclaration(cname, new_tokens[i-1].contextType, new_tokens[i-1].value)
                     post_lines.append(post_line)
 
                     post_line = 'removeOwnership(%s, %s);' % (pname, cname)
@@ -533,15 +531,26 @@ class ActorclassMethodParser:
                     new_tokens[i+1].value = '-1'
                 else:
                     pname = parser_info.nextVariableName()
-                    post_line = "mace::string %s = generateActorName(\"%s\", %s);" % (pname, parser_info.context_type, ParserUtil.MyConstants.ActorThisID)
+                    post_line = ParserUtil.MyUtil.generateActorNameDeclaration(pname, parser_info.context_type, ParserUtil.MyConstants.ActorThisID)
                     post_lines.append(post_line)
                     
                     cname = parser_info.nextVariableName()
-                    post_line = "mace::string %s = generateActorName(\"%s\", %s);" % (cname, new_tokens[i-1].contextType, new_tokens[i-1].value)
+                    post_line = ParserUtil.MyUtil.generateActorNameDeclaration(cname, new_tokens[i-1].contextType, new_tokens[i-1].value)
                     post_lines.append(post_line)
                     
                     post_line = 'createNewOwnership(%s, %s);' % (pname, cname)
                     post_lines.append(post_line)
+            elif tok.type == 'EQUALS' and new_tokens[i-1].type == ParserUtil.TokenType.ACTOR_COLLECTION and new_tokens[i-1].isChildContext and new_tokens[i+1].type != 'EQUALS':
+                # The whole child collection is reassigned
+                ids_name = parser_info.nextVariableName()
+                prefix_line = 'mace::vector<uint32_t> %s = contextIdsOf(%s);' % (ids_name, new_tokens[i-1].value)
+                prefix_lines.append(prefix_line)
+
+                pname = parser_info.nextVariableName()
+                post_line = ParserUtil.MyUtil.generateActorNameDeclaration(pname, parser_info.context_type, ParserUtil.MyConstants.ActorThisID)
+                post_lines.append(post_line)
+                post_line = 'replaceOwnerships(%s, "%s", %s, contextIdsOf(%s));' % (pname, new_tokens[i-1].contextType, ids_name, new_tokens[i-1].value)
+                post_lines.append(post_line)
         
         tabs = ""
         for i in range(0, n_tab):
@@ -552,14 +561,17 @@ class ActorclassMethodParser:
         output_lines.append(output_line)
         for i in range(0, len(post_lines) ):
             output_lines.append( tabs + post_lines[i] )
-        print("ActorclassMethodParser::parseImplementationLine end")
-        for i in range(0, len(output_lines)):
-            print(output_lines[i])
+        if diag.debug:
+            diag.write("ActorclassMethodParser::parseImplementationLine end")
+        if diag.trace:
+            for i in range(0, len(output_lines)):
+                diag.write(output_lines[i])
         return output_lines        
 
     @staticmethod    
     def parseActorMethodCall( parser_info, program_parser, line, pos, last_tok, prefix, new_tok ):
-        print("ActorclassMethodParser::parseActorMethodCall begin")
+        if diag.debug:
+            diag.write("ActorclassMethodParser::parseActorMethodCall begin")
         
         new_method_name = ParserUtil.MyUtil.generateContextMethodInvocationName( prefix, last_tok.contextType, line[pos+1].value )
         program_parser.markActorclassMethodCallType( prefix, last_tok.contextType, line[pos+1].value )
@@ -581,7 +593,7 @@ class ActorclassMethodParser:
         new_tok.type = ParserUtil.TokenType.CODE
 
         return_type = program_parser.getActorclassMethodReturnType(last_tok.contextType, line[pos+1].value)
-        var_info = VariableParser.VariableParser.analyzeActorclassType(return_type, program_parser.defined_actorclasses)
+        var_info = VariableParser.VariableParser.analyzeActorclassType(return_type, program_parser.symbols.actorclasses)
         if prefix == '':
             if var_info.type == VariableParser.VariableInfo.ActorType:
                 new_tok.type = ParserUtil.TokenType.ACTOR
@@ -596,13 +608,15 @@ class ActorclassMethodParser:
                 new_tok.collectionType = var_info.collectionType
         
         pos = arg_pos    
-        print("ActorclassMethodParser::parseActorMethodCall end")
+        if diag.debug:
+            diag.write("ActorclassMethodParser::parseActorMethodCall end")
         return pos
         
 
     @staticmethod
     def parseGetActorAPI(program_parser, line, pos, new_tok):
-        print("ActorclassMethodParser::parseGetActor begin")
+        if diag.debug:
+            diag.write("ActorclassMethodParser::parseGetActor begin")
         
         if pos+6 >= len(line) or line[pos+1].type != 'SMALL' or line[pos+2].type != 'NAME' or line[pos+3].type != 'LARGE':
             ParserUtil.MyUtil.exitWithError('Wrong for getActorAPI')
@@ -616,12 +630,21 @@ class ActorclassMethodParser:
 
     @staticmethod
     def parseCreateActorAPI(parser_info, line, pos, new_tok, prefix_lines):
-        print("ActorclassMethodParser::parseCreateActorAPI begin")
+        if diag.debug:
+            diag.write("ActorclassMethodParser::parseCreateActorAPI begin")
         
         if pos+5 >= len(line) or line[pos+1].type != 'SMALL' or line[pos+2].type != 'NAME' or line[pos+3].type != 'LARGE':
             ParserUtil.MyUtil.exitWithError('Wrong for createActor API')
 
-        if line[pos+5].type == 'CLOSE_PAREN':
+        bulk_creation = parser_info.getBulkCreation(line[pos])
+        if bulk_creation is not None:
+            # The context was created before the loop
+            new_tok.type = ParserUtil.TokenType.ACTOR
+            new_tok.value = '%s[%s]' % (bulk_creation.idsName, bulk_creation.loop.indexExpression())
+            new_tok.contextType = line[pos+2].value
+
+            pos = pos + 6
+        elif line[pos+5].type == 'CLOSE_PAREN':
             temp_var_name = parser_info.nextVariableName()
             impl_line = "int %s = createNewContext(\"%s\");" % (temp_var_name, line[pos+2].value)
             prefix_lines.append(impl_line)
@@ -637,108 +660,32 @@ class ActorclassMethodParser:
             new_tok.value = line[pos+5].value
                             
             pos = pos + 7
-        print("ActorclassMethodParser::parseCreateActorAPI end")
+        if diag.debug:
+            diag.write("ActorclassMethodParser::parseCreateActorAPI end")
         return pos
 
     @staticmethod
     def parseTokens(parser_info, program_parser, toks):
-        print("ActorclassMethodParser::parseTokens begin")
+        if diag.debug:
+            diag.write("ActorclassMethodParser::parseTokens begin")
         if len(toks) == 0 or len(toks) == 1:
-            print("ActorclassMethodParser::parseTokens len=%d" % len(toks))
+            if diag.debug:
+                diag.write("ActorclassMethodParser::parseTokens len=%d" % len(toks))
             return toks
-        tokens = toks
-        _continue = True
-
-        output_tokens = []
-        while _continue:
-            _continue = False
-            new_tokens = []
-            i = 0
-            while i < len(tokens):
-                curr_tok = tokens[i]
-                print("type=%s, value=%s, pos=%d" % ( curr_tok.type, curr_tok.value, i))
-                if curr_tok.type == 'NAME':
-                    varInfo = parser_info.getVarInfo(curr_tok.value)
-                    if varInfo.type == VariableParser.VariableInfo.ActorType:
-                        curr_tok.type = ParserUtil.TokenType.ACTOR
-                        curr_tok.contextType = varInfo.varType
-                        curr_tok.isChildContext = varInfo.isChildActor
-                        _continue = True
-                    elif curr_tok.type == VariableParser.VariableInfo.ActorCollectionType:
-                        curr_tok.type = ParserUtil.TokenType.ACTOR_COLLECTION
-                        curr_tok.contextType = varInfo.varType
-                        curr_tok.collectionType = varInfo.collectionType
-                        curr_tok.isChildContext = varInfo.isChildActor
-                        _continue = True
-                    elif curr_tok.type == VariableParser.VariableInfo.ActorCollectionIterType:
-                        curr_tok.type = ParserUtil.TokenType.ACTOR_COLLECTION_ITER
-                        curr_tok.contextType = varInfo.varType
-                        curr_tok.collectionType = varInfo.collectionType  
-                        _continue = True
-                    
-                    new_tokens.append(curr_tok)
-                    i = i+1
-                elif curr_tok.type == 'ASTERISK':
-                    if i+1 < len(tokens) and tokens[i+1].type == ParserUtil.TokenType.ACTOR_COLLECTION_ITER:
-                        curr_tok.type = ParserUtil.TokenType.ACTOR
-                        curr_tok.value = '*'+tokens[i+1].value
-                        i = i+2
-                        _continue = True
-                    else:
-                        i = i+1
-                    new_tokens.append( curr_tok )
-                elif curr_tok.type == 'REFERENCE':
-                    nl = len(new_tokens)
-                    if new_tokens[nl-1].type == 'ContextCollectionIter' and new_tokens[nl-1].collectionType == 'map':
-                        new_tokens[nl-1].type = ParserUtil.TokenType.ACTOR
-                        new_tokens[nl-1].value = new_tokens[nl-1].value+'->'+tokens[i+1].value
-                        i = i+2
-                        _continue = True
-                        # print new_tokens[nl-1].isChildContext
-                    else:
-                        new_tokens.append(curr_tok)
-                        i = i+1
-                elif curr_tok.type == 'PLUS':
-                    nl = len(new_tokens)
-                    if nl>1 and new_tokens[nl-1].type == 'ContextCollectionType' and i+1 < len(tokens) and tokens[i+1].type == 'PLUS':
-                        new_tokens[nl-1].value = new_tokens[nl-1].value + '++'
-                        i = i+2
-                        _continue = True
-                    else:
-                        new_tokens.append( curr_tok )
-                        i = i+1
-                elif curr_tok.type == 'MINUS':
-                    nl = len(new_tokens)
-                    if nl>1 and new_tokens[nl-1].type == 'ContextCollectionType' and i+1 < len(tokens) and tokens[i+1].type == 'MINUS':
-                        new_tokens[nl-1].value = new_tokens[nl-1].value + '--'
-                        i = i+2
-                        _continue = True
-                    else:
-                        new_tokens.append( curr_tok )
-                        i = i+1    
-                elif curr_tok.type == 'OPEN_PAREN':
-                    if i+2<len(tokens) and tokens[i+2].type == 'CLOSE_PAREN':
-                        curr_tok.value = '('+tokens[i+1].value+')'
-                        curr_tok.type = tokens[i+1].type
-                        curr_tok.contextType = tokens[i+1].contextType
-                        curr_tok.collectionType = tokens[i+1].collectionType
-                        curr_tok.isChildContext = tokens[i+1].isChildContext
-                        _continue = True
-
-                        new_tokens.append(curr_tok)
-                        i = i+3
-                    else:
-                        new_tokens.append(curr_tok)
-                        i = i+1
-                else:
-                    new_tokens.append(curr_tok)
-                    i = i+1
+        output_tokens = TokenRewriter.rewriteTokens(toks)
 
-
-            if not _continue:
-                output_tokens = new_tokens
-            else:
-                tokens = copy.copy(new_tokens)
+        # Names are resolved once the structure is rewritten, so a name folded
+        # into a parenthesized token is looked up with its parentheses
+        for i in range(len(output_tokens)):
+            curr_tok = output_tokens[i]
+            if diag.trace:
+                diag.write("type=%s, value=%s, pos=%d" % ( curr_tok.type, curr_tok.value, i))
+            if curr_tok.type == 'NAME':
+                varInfo = parser_info.getVarInfo(curr_tok.value)
+                if varInfo.type == VariableParser.VariableInfo.ActorType:
+                    curr_tok.type = ParserUtil.TokenType.ACTOR
+                    curr_tok.contextType = varInfo.varType
+                    curr_tok.isChildContext = varInfo.isChildActor
 
         tokens_with_space = []
 
@@ -778,7 +725,8 @@ class ActorclassMethodParser:
 
         return_toks.append(curr_tok)
 
-        print("ActorclassMethodParser::parseTokens end")
+        if diag.debug:
+            diag.write("ActorclassMethodParser::parseTokens end")
         return return_toks
 
     @staticmethod
@@ -824,7 +772,8 @@ class ActorclassMethodParser:
 
     @staticmethod
     def parseActorclassDeclaration( parser_info, line, pos, new_tok ):
-        print("ActorclassMethodParser::parseActorclassDeclaration begin") 
+        if diag.debug:
+            diag.write("ActorclassMethodParser::parseActorclassDeclaration begin")
         new_pos = pos+1
         new_tok.type = ParserUtil.TokenType.CODE
         new_tok.value = 'int'
@@ -846,7 +795,8 @@ class ActorclassMethodParser:
             else:
                 pos = new_pos
                 break
-        print('ActorclassMethodParser::parseActorclassDeclaration: ', new_tok.value)
+        if diag.debug:
+            diag.write('ActorclassMethodParser::parseActorclassDeclaration: %s' % new_tok.value)
         return pos
 
     @staticmethod
@@ -864,13 +814,15 @@ class ActorclassMethodParser:
 
     @staticmethod
     def parseArgTokens( parser_info, program_parser, line ):
-        print("ActorclassMethodParser::parseArgTokens begin")
+        if diag.debug:
+            diag.write("ActorclassMethodParser::parseArgTokens begin")
         
         tok_stack = ParserUtil.TokenStack()
         pos = 0
         while pos < len(line):
             tok = line[pos]
-            print("%s: %s" % (tok.type, tok.value))
+            if diag.trace:
+                diag.write("%s: %s" % (tok.type, tok.value))
             if tok.type == 'CLOSE_SQUARE_BRACKET':
                 tok_stack.push_back( tok )
                 pos = pos + 1
@@ -926,6 +878,7 @@ class ActorclassMethodParser:
                     tok.type = ParserUtil.TokenType.ACTOR_COLLECTION
                     tok.contextType = var_info.actorclass
                     tok.collectionType = var_info.collectionType
+                    tok.isChildContext = var_info.isChildActor
                 elif var_info.type == VariableParser.VariableInfo.ActorCollectionIterType:     
                     tok.type = 'ContextCollectionIter'
                     tok.contextType = var_info.varType
@@ -933,6 +886,9 @@ class ActorclassMethodParser:
                 
                 tok_stack.push_back(tok)
                 pos = pos + 1
+            else:
+                tok_stack.push_back(tok)
+                pos = pos + 1
                 
         new_toks = tok_stack.getTokens()
         new_tok = ParserUtil.MyToken()
@@ -945,12 +901,15 @@ class ActorclassMethodParser:
                 new_tok.type = new_toks[i].type
                 new_tok.contextType = new_toks[i].contextType
                 new_tok.collectionType = new_toks[i].collectionType
-        print("ActorclassMethodParser::parseArgTokens %s" % new_tok.value)
+                new_tok.isChildContext = new_toks[i].isChildContext
+        if diag.debug:
+            diag.write("ActorclassMethodParser::parseArgTokens %s" % new_tok.value)
         return new_tok        
 
     @staticmethod
     def extractMethodArgs( parser_info, program_parser, tokens, arg_pos, args):
-        print("ActorclassMethodParser::extractMethodArgs begin")
+        if diag.debug:
+            diag.write("ActorclassMethodParser::extractMethodArgs begin")
         cur_pos = arg_pos
         error_msg = 'Fail to parse for method arguments'
         if cur_pos >= len(tokens) or tokens[cur_pos].type != 'OPEN_PAREN':
@@ -962,7 +921,8 @@ class ActorclassMethodParser:
         while cur_pos < len(tokens):
             push_flag = True
             tok = tokens[cur_pos]
-            print("%s: %s" % (tok.type, tok.value))
+            if diag.trace:
+                diag.write("%s: %s" % (tok.type, tok.value))
             if tok.type == 'OPEN_PAREN':
                 paren_depth = paren_depth + 1
                 if paren_depth == 1:
@@ -989,12 +949,38 @@ class ActorclassMethodParser:
 
             cur_pos = cur_pos + 1
 
-        print("ActorclassMethodParser::extractMethodArgs end")
+        if diag.debug:
+            diag.write("ActorclassMethodParser::extractMethodArgs end")
         return arg_pos
 
+    @staticmethod
+    def parseActorCollectionBulkMethod( parser_info, last_tok, method_name, args, prefix_lines, post_lines ):
+        # Methods changing many elements of a child actor collection at once:
+        # the ownership of all of them changes with one call
+        if method_name == 'swap' and len(args) == 1 and args[0].type == ParserUtil.TokenType.ACTOR_COLLECTION and args[0].isChildContext:
+            # Both collections are owned by this actor before and after
+            return
+
+        ids_name = parser_info.nextVariableName()
+        if method_name == 'erase':
+            prefix_line = 'mace::vector<uint32_t> %s = contextIdRange(%s, %s);' % (ids_name, args[0].value, args[1].value)
+        else:
+            prefix_line = 'mace::vector<uint32_t> %s = contextIdsOf(%s);' % (ids_name, last_tok.value)
+        prefix_lines.append(prefix_line)
+
+        pname = parser_info.nextVariableName()
+        post_line = ParserUtil.MyUtil.generateActorNameDeclaration(pname, parser_info.context_type, ParserUtil.MyConstants.ActorThisID)
+        post_lines.append(post_line)
+        if method_name == 'clear' or method_name == 'erase':
+            post_line = 'removeOwnerships(%s, "%s", %s);' % (pname, last_tok.contextType, ids_name)
+        else:
+            post_line = 'replaceOwnerships(%s, "%s", %s, contextIdsOf(%s));' % (pname, last_tok.contextType, ids_name, last_tok.value)
+        post_lines.append(post_line)
+
     @staticmethod
     def parseActorCollectionMethod( parser_info, program_parser, line, pos, last_tok, prefix_lines, post_lines, new_tok ):
-        print("ActorclassMethodParser::parseActorCollectionMethod begin")
+        if diag.debug:
+            diag.write("ActorclassMethodParser::parseActorCollectionMethod begin")
 
         cur_pos = pos + 1
         method_name = line[cur_pos].value
@@ -1012,21 +998,26 @@ class ActorclassMethodParser:
                 new_tok.value = new_tok.value+', '+args[i].value
         new_tok.value = new_tok.value+')'
         
-        if last_tok.collectionType == 'vector':
+        if method_name in ['clear', 'assign', 'swap'] or (method_name == 'erase' and len(args) == 2):
+            ActorclassMethodParser.parseActorCollectionBulkMethod( parser_info, last_tok, method_name, args, prefix_lines, post_lines )
+        elif last_tok.collectionType == 'vector':
             if method_name == 'push_back':
-                print('narg=', len(args), ' contextType=', args[0].contextType)
+                if diag.debug:
+                    diag.write('narg=%d contextType=%s' % (len(args), args[0].contextType))
                 if len(args) != 1 or args[0].contextType == '':
                     ParserUtil.MyUtil.exitWithError('Error in vector::push_back')
-                pname = parser_info.nextVariableName()
-                post_line = "mace::string %s = generateActorName(\"%s\", %s);" % (pname, parser_info.context_type, ParserUtil.MyConstants.ActorThisID)
-                post_lines.append(post_line)
+                # In a bulk loop the ownership is recorded after the loop
+                if parser_info.getBulkCreation(line[pos+1]) is None:
+                    pname = parser_info.nextVariableName()
+                    post_line = ParserUtil.MyUtil.generateActorNameDeclaration(pname, parser_info.context_type, ParserUtil.MyConstants.ActorThisID)
+                    post_lines.append(post_line)
 
-                cname = parser_info.nextVariableName()
-                post_line = "mace::string %s = generateActorName(\"%s\", %s);" % (cname, args[0].contextType, args[0].value)
-                post_lines.append(post_line)
+                    cname = parser_info.nextVariableName()
+                    post_line = ParserUtil.MyUtil.generateActorNameDeclaration(cname, args[0].contextType, args[0].value)
+                    post_lines.append(post_line)
 
-                post_line = 'createNewOwnership( %s, %s);' % (pname, cname)
-                post_lines.append(post_line)
+                    post_line = 'createNewOwnership( %s, %s);' % (pname, cname)
+                    post_lines.append(post_line)
             elif method_name == 'pop_back':
                 var_back_name = parser_info.nextVariableName()
                 prefix_line = 'int %s = %s.back();' % ( var_back_name, line[pos-1].value )
@@ -1103,7 +1094,8 @@ class ActorclassMethodParser:
                 post_lines.append(post_line)
 
         pos = cur_pos
-        print("ActorclassMethodParser::parseActorCollectionMethod end")
+        if diag.debug:
+            diag.write("ActorclassMethodParser::parseActorCollectionMethod end")
         return pos
 
         
@@ -0,0 +1,213 @@
+import sys
+import argparse
+
+# The ownership relation between actorclasses.
+#
+# An actorclass owns the actorclasses of its actor variables and actor
+# collections that are not yield references.  Ownership has to be a DAG: an
+# actor cannot be (transitively) owned by an actor it owns.  The one
+# exception is an actorclass owning actors of its own class, e.g. the nodes
+# of a tree, which is recorded but is not a cycle.
+#
+# Cycles are found with Tarjan's strongly connected components, iteratively
+# and in time linear in the number of actorclasses and ownership edges, and
+# are reported as a path.  For an acyclic graph topologicalOrder() lists
+# owners before the actorclasses they own and depths() gives each
+# actorclass's distance from the furthest actorclass that owns nothing.
+
+class OwnershipCycleError(ValueError):
+    def __init__(self, cycle):
+        ValueError.__init__(self, "Actorclass ownership cycle: %s" % formatCycle(cycle))
+        self.cycle = cycle
+
+def formatCycle(cycle):
+    return " -> ".join(cycle)
+
+class OwnershipGraph:
+    def __init__(self):
+        # actorclass -> [owned actorclass], in declaration order
+        self.children = {}
+        # actorclasses that own actors of their own class
+        self.selfOwners = set()
+        self.components = None
+
+    def addActorclass(self, actorclass):
+        if not actorclass in self.children:
+            self.children[actorclass] = []
+            self.components = None
+
+    def addOwnership(self, owner, child):
+        self.addActorclass(owner)
+        self.addActorclass(child)
+        if owner == child:
+            self.selfOwners.add(owner)
+        elif not child in self.children[owner]:
+            self.children[owner].append(child)
+            self.components = None
+
+    def getChildren(self, actorclass):
+        return self.children.get(actorclass, [])
+
+    def getOwners(self, actorclass):
+        owners = []
+        for owner, children in self.children.items():
+            if actorclass in children:
+                owners.append(owner)
+        return owners
+
+    def roots(self):
+        # Actorclasses no other actorclass owns
+        owned = set()
+        for owner, children in self.children.items():
+            owned.update(children)
+        return [name for name in self.children if not name in owned]
+
+    def stronglyConnectedComponents(self):
+        # Tarjan's algorithm with an explicit stack; components come out with
+        # every component after the ones it owns
+        if self.components is not None:
+            return self.components
+
+        index = {}
+        lowlink = {}
+        on_stack = set()
+        stack = []
+        components = []
+        counter = 0
+        for root in self.children:
+            if root in index:
+                continue
+            index[root] = counter
+            lowlink[root] = counter
+            counter = counter + 1
+            stack.append(root)
+            on_stack.add(root)
+            work = [(root, iter(self.children[root]))]
+            while len(work) > 0:
+                node, children = work[-1]
+                descended = False
+                for child in children:
+                    if not child in index:
+                        index[child] = counter
+                        lowlink[child] = counter
+                        counter = counter + 1
+                        stack.append(child)
+                        on_stack.add(child)
+                        work.append((child, iter(self.children[child])))
+                        descended = True
+                        break
+                    elif child in on_stack and index[child] < lowlink[node]:
+                        lowlink[node] = index[child]
+                if descended:
+                    continue
+
+                work.pop()
+                if len(work) > 0:
+                    parent = work[-1][0]
+                    if lowlink[node] < lowlink[parent]:
+                        lowlink[parent] = lowlink[node]
+                if lowlink[node] == index[node]:
+                    component = []
+                    while True:
+                        member = stack.pop()
+                        on_stack.discard(member)
+                        component.append(member)
+                        if member == node:
+                            break
+                    components.append(component)
+
+        self.components = components
+        return components
+
+    def findCycle(self):
+        # [a, b, ..., a] for a shortest cycle through the first actorclass,
+        # in declaration order, of some strongly connected component with
+        # more than one member; None if ownership is acyclic
+        order = {}
+        for name in self.children:
+            order[name] = len(order)
+        cyclic = [component for component in self.stronglyConnectedComponents() if len(component) > 1]
+        if len(cyclic) == 0:
+            return None
+        starts = [min(component, key=lambda name: order[name]) for component in cyclic]
+        start = min(starts, key=lambda name: order[name])
+        component = set(cyclic[starts.index(start)])
+
+        # Breadth-first search back to start inside the component
+        previous = {start: None}
+        frontier = [start]
+        while len(frontier) > 0:
+            next_frontier = []
+            for node in frontier:
+                for child in self.children[node]:
+                    if child == start:
+                        path = [start]
+                        while node is not None:
+                            path.append(node)
+                            node = previous[node]
+                        path.reverse()
+                        return path
+                    if child in component and not child in previous:
+                        previous[child] = node
+                        next_frontier.append(child)
+            frontier = next_frontier
+        return None
+
+    def topologicalOrder(self):
+        # Owners before the actorclasses they own; raises OwnershipCycleError
+        cycle = self.findCycle()
+        if cycle is not None:
+            raise OwnershipCycleError(cycle)
+        order = []
+        for component in reversed(self.stronglyConnectedComponents()):
+            order.append(component[0])
+        return order
+
+    def depths(self):
+        # actorclass -> length of the longest ownership chain from an
+        # actorclass nobody owns down to it; raises OwnershipCycleError
+        depths = {}
+        for name in self.topologicalOrder():
+            depth = depths.setdefault(name, 0)
+            for child in self.children[name]:
+                if depths.get(child, 0) < depth + 1:
+                    depths[child] = depth + 1
+        return depths
+
+def build(actorclasses, symbols):
+    # From the parsed ActorclassInfo objects and the collection variables in
+    # the SymbolIndex, in actorclass definition order
+    graph = OwnershipGraph()
+    for name, actorclass_info in actorclasses.items():
+        graph.addActorclass(name)
+        for child in actorclass_info.childActorclasses:
+            graph.addOwnership(name, child)
+        for var_name, var_info in symbols.getCollectionVars(name).items():
+            if var_info.isChildActor and var_info.actorclass != "":
+                graph.addOwnership(name, var_info.actorclass)
+    return graph
+
+def main(argv=None):
+    import CppHeaderParser
+
+    arg_parser = argparse.ArgumentParser(description="Print the actorclass ownership graph of an AEON program")
+    arg_parser.add_argument("input", help="AEON source file")
+    args = arg_parser.parse_args(argv)
+
+    try:
+        parser = CppHeaderParser.AEONParser(args.input, "", declarations_only=True)
+    except CppHeaderParser.CppParseError as e:
+        print(e)
+        return 1
+
+    graph = parser.ownership
+    depths = graph.depths()
+    for name in graph.topologicalOrder():
+        children = graph.getChildren(name)
+        if name in graph.selfOwners:
+            children = children + [name]
+        print("%s%s -> %s" % ("\t" * depths[name], name, ", ".join(children)))
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
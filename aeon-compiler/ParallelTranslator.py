@@ -0,0 +1,97 @@
+import io
+import contextlib
+import traceback
+import multiprocessing
+
+# Translates deferred actorclass method definitions on several processes.
+#
+# A method body only reads what the prescan collected (actorclass names,
+# method return types) and the declaration of its own actorclass, so once
+# that declaration has been parsed the body can be translated at any time.
+# AEONParser queues such definitions as MethodJobs and hands them here after
+# the main scan.  The workers are forked from the parser process and so
+# inherit the complete symbol index; each returns the translated lines, the
+# return types it looked up, the event/async/sync call marks it made and
+# whatever it printed.  The parser applies the results in definition order,
+# which gives the same output as translating every body during the scan.
+#
+# Where fork is not available the jobs are translated in this process.
+
+class MethodJob:
+    __slots__ = ('tokens', 'declaration', 'implementations', 'contextType', 'methodName', 'token', 'cacheKey')
+
+    def __init__(self, tokens, declaration, implementations, context_type, method_name, token, cache_key):
+        self.tokens = tokens
+        # The ProgramGrammar.MethodHeader of the definition
+        self.declaration = declaration
+        # Filled in place with the translated lines; the actorclass's method
+        # info already refers to this list
+        self.implementations = implementations
+        self.contextType = context_type
+        self.methodName = method_name
+        # The token being parsed when the definition was queued, for errors
+        self.token = token
+        self.cacheKey = cache_key
+
+class JobResult:
+    __slots__ = ('lines', 'returnTypes', 'callMarks', 'log', 'failed')
+
+    def __init__(self):
+        self.lines = []
+        self.returnTypes = []
+        self.callMarks = []
+        # Everything the translation printed
+        self.log = ''
+        self.failed = False
+
+# The parser and jobs of the pool a worker process belongs to, set by
+# initWorker() in the worker itself; the parser process never sets it, so
+# several translations may run at once
+workerState = None
+
+def translateJob(parser, job):
+    result = JobResult()
+    log = io.StringIO()
+    parser.tokens = job.tokens
+    parser.declaration = job.declaration
+    try:
+        with contextlib.redirect_stdout(log):
+            parser_info, result.returnTypes, result.callMarks = parser.recordMethodTranslation(result.lines)
+    except SystemExit:
+        # ParserUtil.MyUtil.exitWithError(), which has printed the reason
+        result.failed = True
+    except Exception:
+        log.write(traceback.format_exc())
+        result.failed = True
+    parser.tokens = []
+    parser.declaration = None
+    result.log = log.getvalue()
+    return result
+
+def initWorker(parser, jobs):
+    # The pool's initargs; with fork they reach the worker without pickling
+    global workerState
+    workerState = (parser, jobs)
+
+def runJob(index):
+    parser, jobs = workerState
+    return translateJob(parser, jobs[index])
+
+def canFork():
+    return 'fork' in multiprocessing.get_all_start_methods()
+
+def translate(parser, jobs, workers):
+    # Returns a JobResult per job, in job order
+    if workers <= 1 or len(jobs) <= 1 or not canFork():
+        return [translateJob(parser, job) for job in jobs]
+
+    workers = min(workers, len(jobs))
+    pool = multiprocessing.get_context('fork').Pool(workers, initWorker, (parser, jobs))
+    try:
+        # A few chunks per worker evens out bodies of different sizes
+        chunksize = max(1, len(jobs) // (workers * 4))
+        results = pool.map(runJob, range(len(jobs)), chunksize)
+    finally:
+        pool.close()
+        pool.join()
+    return results
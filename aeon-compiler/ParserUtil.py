@@ -6,6 +6,10 @@ import re
 import inspect
 import copy
 
+import Diagnostics
+
+diag = Diagnostics.getChannel('method')
+
 class MyUtil:
     @staticmethod
     def exitWithError(msg):
@@ -18,13 +22,10 @@ class MyUtil:
         if len(tokens) == 1:
             return tokens[0]
 
-        new_token_value = ''
-        tok  = copy.copy(tokens[0])
-        for i in range(len(tokens)):
-            new_token_value = new_token_value+tokens[i].value
-
+        # The argument tokens are consumed here, so the first one is reused
+        tok = tokens[0]
         tok.type = 'NAME'
-        tok.value = new_token_value
+        tok.value = ''.join([t.value for t in tokens])
         return tok
     @staticmethod
     def printInfo(str):
@@ -32,7 +33,8 @@ class MyUtil:
 
     @staticmethod
     def extractMethodArgs(tokens, arg_pos, args):
-        print("MyUtil::extractMethodArgs begin")
+        if diag.debug:
+            diag.write("MyUtil::extractMethodArgs begin")
         cur_pos = arg_pos
         error_msg = 'Fail to parse for method arguments'
         if cur_pos >= len(tokens) or tokens[cur_pos].type != 'OPEN_PAREN':
@@ -44,7 +46,8 @@ class MyUtil:
         while cur_pos < len(tokens):
             push_flag = True
             tok = tokens[cur_pos]
-            print("type=%s, value=%s" % (tok.type, tok.value))
+            if diag.trace:
+                diag.write("type=%s, value=%s" % (tok.type, tok.value))
             if tok.type == 'OPEN_PAREN':
                 paren_depth = paren_depth + 1
                 if paren_depth == 1:
@@ -72,7 +75,8 @@ class MyUtil:
                 tmp_tokens.append(tok)
 
             cur_pos = cur_pos + 1
-        print("MyUtil::extractMethodArgs end")
+        if diag.debug:
+            diag.write("MyUtil::extractMethodArgs end")
         return cur_pos
 
     @staticmethod
@@ -113,6 +117,17 @@ class MyUtil:
         rStr = matchStr.group(1)
         return rStr
 
+    @staticmethod
+    def generateActorclassTypeIdName( contextType ):
+        # The constant numbering an actorclass in the generated service
+        return 'ACTORCLASS_' + contextType
+
+    @staticmethod
+    def generateActorNameDeclaration( varName, contextType, actorID ):
+        # Declares varName as the context name of an actor, which the runtime
+        # looks up in a per-thread cache and formats on a miss
+        return 'const mace::string %s = getContextName(%s, "%s", %s);' % (varName, MyUtil.generateActorclassTypeIdName(contextType), contextType, actorID)
+
     @staticmethod
     def generateContextMethodInvocationName( prefix, contextType, methodName ):
         #print 'MyUtil::generateContextMethodInvocationName'
@@ -198,8 +213,7 @@ class TokenStack:
             if tok.type in [TokenType.CODE, 'EQUALS', 'TAB']:
                 break
             else:
-                ntok = copy.copy(tok)
-                toks.append(ntok)
+                toks.append(tok)
                 self.items.pop()
 
             l = len(self.items)
@@ -252,13 +266,18 @@ class TokenType:
     ACTOR_COLLECTION_ITER = "ACTOR_COLLECTION_ITER"
     
 class MyToken:
+    __slots__ = ('type', 'value', 'contextType', 'collectionType', 'actorID', 'isChildContext')
+
     def __init__(self):
         self.type = ''
         self.value = ''
+        self.reset()
+
+    def reset(self):
         self.contextType = ''
         self.collectionType = ''
         self.actorID = ''
-        self.isChildContext = False 
+        self.isChildContext = False
 
 class MyConstants:
     ActorThisID = "_this_obj_id"
\ No newline at end of file
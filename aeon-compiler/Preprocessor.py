@@ -0,0 +1,195 @@
+import re
+import bisect
+
+from array import array
+
+# Single-pass source preprocessing for AEON programs.
+#
+# Template stripping, continuation folding, extern "C" stripping and removal of
+# ignored macro calls are recognized by one master pattern and applied while
+# the buffer is scanned once from left to right, so the cost is linear in the
+# input size however many matches there are.
+#
+# readTopLevelChunks() cuts a source file into pieces that can be
+# preprocessed and tokenized one at a time, for compiles that should not
+# hold the whole program in memory.
+
+NEWLINE_TEMP_REPLACEMENT = "<CppHeaderParser_newline_temp_replacement>\\n"
+
+class LineMap:
+    # Each entry (outOffset, origLine) says the preprocessed text starting at
+    # outOffset lies on original line origLine, and stays in step with the
+    # original line by line until the next entry.  Entries are only recorded
+    # where a rewrite changed the number of newlines, so the map stays small.
+    def __init__(self, first_line=1):
+        self.outOffsets = array('l', [0])
+        self.origLines = array('l', [first_line])
+
+    def addEntry(self, outOffset, origLine):
+        if self.outOffsets[-1] == outOffset:
+            self.origLines[-1] = origLine
+        else:
+            self.outOffsets.append(outOffset)
+            self.origLines.append(origLine)
+
+    def originalLine(self, text, offset):
+        i = bisect.bisect_right(self.outOffsets, offset) - 1
+        return self.origLines[i] + text.count("\n", self.outOffsets[i], offset)
+
+    def __len__(self):
+        return len(self.outOffsets)
+
+class PreprocessedSource:
+    def __init__(self, text, line_map):
+        self.text = text
+        self.lineMap = line_map
+
+    def originalLine(self, offset):
+        return self.lineMap.originalLine(self.text, offset)
+
+class AEONPreprocessor:
+    TEMPLATE = r'template[\t ]*<[^>]*>'
+
+    def __init__(self, ignore_symbols):
+        # Only symbols ending with "()" are stripped, to account for #define magic functions
+        self.ignoreCalls = [s[:-1] for s in ignore_symbols if s.endswith("()")]
+
+        patterns = [
+            # Change multi line #defines and expressions to single lines maintaining line numbers
+            # Based from http://stackoverflow.com/questions/2424458/regular-expression-to-match-cs-multiline-preprocessor-statements
+            r'(?P<continuation>^(?:.*\\\r?\n)+.*$)',
+            r'(?P<template>%s)' % AEONPreprocessor.TEMPLATE,
+            #Filter out Extern "C" statements.  These are order dependent
+            r'(?P<extern_block>extern[\t ]+"[Cc]"[\t \n\r]*{)',
+            r'(?P<extern>extern[ ]+"[Cc]"[ ]*)',
+        ]
+        if len(self.ignoreCalls) > 0:
+            patterns.append('(?P<ignore>%s)' % '|'.join([re.escape(s) for s in self.ignoreCalls]))
+
+        self.masterPattern = re.compile('|'.join(patterns), re.M)
+        self.templatePattern = re.compile(AEONPreprocessor.TEMPLATE)
+        self.isDefine = re.compile(r'[ \t\v]*#[Dd][Ee][Ff][Ii][Nn][Ee]')
+
+    def process(self, text, first_line=1):
+        # first_line is the line of the file text starts on
+        pieces = []
+        out_len = 0
+        line_map = LineMap(first_line)
+
+        pos = 0
+        orig_line = first_line
+        search = self.masterPattern.search
+        while True:
+            m = search(text, pos)
+            if m is None:
+                break
+
+            start = m.start()
+            end = m.end()
+            kind = m.lastgroup
+
+            if start > pos:
+                pieces.append(text[pos:start])
+                out_len = out_len + start - pos
+                orig_line = orig_line + text.count("\n", pos, start)
+
+            match_str = m.group()
+            orig_newlines = match_str.count("\n")
+
+            if kind == 'continuation':
+                block = self.templatePattern.sub("", match_str)
+                if self.isDefine.match(block):
+                    parts = block.split("\n")
+                    joint = NEWLINE_TEMP_REPLACEMENT
+                else:
+                    # Just expression taking up multiple lines, make it take 1 line for easier parsing
+                    parts = block.split("\\\n")
+                    joint = " "
+                part_line = orig_line
+                for i in range(len(parts)):
+                    if i > 0:
+                        pieces.append(joint)
+                        out_len = out_len + len(joint)
+                    line_map.addEntry(out_len, part_line)
+                    pieces.append(parts[i])
+                    out_len = out_len + len(parts[i])
+                    part_line = part_line + parts[i].count("\n") + 1
+                #Keep the newlines so that linecount doesnt break
+                replacement = "\n" * block.count("\n")
+            elif kind == 'template' or kind == 'extern':
+                replacement = ""
+            elif kind == 'extern_block':
+                replacement = "\n" * orig_newlines
+            else:
+                end = self.findCallEnd(text, end)
+                if end is None:
+                    end = m.end()
+                    replacement = match_str
+                else:
+                    #Strip it out but keep the linecount the same so line numbers are right
+                    orig_newlines = text.count("\n", start, end)
+                    replacement = "\n" * orig_newlines
+
+            pieces.append(replacement)
+            out_len = out_len + len(replacement)
+            orig_line = orig_line + orig_newlines
+            if kind == 'continuation' or replacement.count("\n") != orig_newlines:
+                line_map.addEntry(out_len, orig_line)
+            pos = end
+
+        pieces.append(text[pos:])
+        return PreprocessedSource("".join(pieces), line_map)
+
+    @staticmethod
+    def findCallEnd(text, pos):
+        #Now walk till we find the last paren and account for sub parens
+        paren_count = 1
+        in_quotes = False
+        for i in range(pos, len(text)):
+            c = text[i]
+            if not in_quotes:
+                if c == "(":
+                    paren_count += 1
+                elif c == ")":
+                    paren_count -= 1
+                elif c == '"':
+                    in_quotes = True
+                if paren_count == 0:
+                    return i + 1
+            else:
+                if c == '"' and text[i-1] != '\\':
+                    in_quotes = False
+        return None
+
+# Literals and macro lines are matched whole so the braces inside them are
+# not counted
+BRACE_SCAN = re.compile(r'"(?:[^"\\]|\\.)*"|\'.\'|\#.*|[{}]')
+
+# A line the preprocessor may join with the next one: a continuation, an
+# unfinished template parameter list or an extern "C" before its brace
+CONTINUED_LINE = re.compile(r'(?:\\|template[\t ]*<[^>]*|extern[\t ]+"[Cc]"[\t ]*)\r?\n$')
+
+def readTopLevelChunks(fd):
+    # Yields (text, first line) for runs of lines of fd, cut only after a
+    # line that closes every brace, so each actorclass or method
+    # definition lies within one piece and no pattern of AEONPreprocessor
+    # or token spans two pieces
+    lines = []
+    first_line = 1
+    line_no = 0
+    depth = 0
+    for line in fd:
+        line_no = line_no + 1
+        lines.append(line)
+        if '{' in line or '}' in line:
+            for m in BRACE_SCAN.finditer(line):
+                if m.group() == '{':
+                    depth = depth + 1
+                elif m.group() == '}':
+                    depth = depth - 1
+        if depth <= 0 and not CONTINUED_LINE.search(line):
+            yield "".join(lines), first_line
+            lines = []
+            first_line = line_no + 1
+    if len(lines) > 0:
+        yield "".join(lines), first_line
@@ -0,0 +1,285 @@
+import time
+import json
+import resource
+import cProfile
+import tracemalloc
+
+# Per-phase compile profiling for AEONParser.
+#
+# Each phase of a compile (preprocess, lex, prescan, the definition parsers,
+# the cycle check, code generation) runs inside profiler.phase(name).  Calls
+# of the same phase are aggregated; calls tagged with an item, such as an
+# actorclass or Actorclass::method, are also recorded per item.  Phases may
+# nest: the definition parsers run inside the parse phase.
+#
+# Peak memory comes from tracemalloc and is the most memory allocated above
+# the level the phase started at.  Tracing allocations slows the compile
+# down, so it can be turned off; the RSS high-water mark is always recorded.
+#
+# With cprofile enabled every phase gets its own cProfile.Profile, active
+# only while that phase is the innermost one, and the slowest phase's stats
+# can be dumped once the compile is done.
+
+FORMAT_VERSION = 1
+
+class PhaseStats:
+    __slots__ = ('calls', 'wall', 'cpu', 'peakMemory', 'counts')
+
+    def __init__(self):
+        self.calls = 0
+        self.wall = 0.0
+        self.cpu = 0.0
+        self.peakMemory = 0
+        self.counts = {}
+
+    def add(self, wall, cpu, peak_memory, counts):
+        self.calls = self.calls + 1
+        self.wall = self.wall + wall
+        self.cpu = self.cpu + cpu
+        if peak_memory > self.peakMemory:
+            self.peakMemory = peak_memory
+        for key, value in counts.items():
+            self.counts[key] = self.counts.get(key, 0) + value
+
+    def toDict(self):
+        return {
+            'calls': self.calls,
+            'wall': round(self.wall, 6),
+            'cpu': round(self.cpu, 6),
+            'peakMemory': self.peakMemory,
+            'counts': self.counts,
+        }
+
+class PhaseRecord:
+    def __init__(self, name, parent):
+        self.name = name
+        self.parent = parent
+        self.stats = PhaseStats()
+        # item -> PhaseStats
+        self.items = {}
+        self.profile = None
+
+class ActivePhase:
+    # Context manager for one call of a phase
+    __slots__ = ('profiler', 'record', 'item', 'counts', 'wallStart', 'cpuStart', 'memoryStart', 'peak')
+
+    def __init__(self, profiler, record, item):
+        self.profiler = profiler
+        self.record = record
+        self.item = item
+        self.counts = {}
+
+    def setItem(self, item):
+        self.item = item
+
+    def count(self, key, n=1):
+        self.counts[key] = self.counts.get(key, 0) + n
+
+    def __enter__(self):
+        self.profiler.enterPhase(self)
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.profiler.exitPhase(self)
+        return False
+
+class NullPhase:
+    def setItem(self, item):
+        pass
+
+    def count(self, key, n=1):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        return False
+
+class NullProfiler:
+    # Used when a compile is not profiled; every phase is the same no-op
+    enabled = False
+
+    def __init__(self):
+        self.nullPhase = NullPhase()
+
+    def start(self):
+        pass
+
+    def stop(self):
+        pass
+
+    def setInfo(self, key, value):
+        pass
+
+    def phase(self, name, item=None):
+        return self.nullPhase
+
+NULL_PROFILER = NullProfiler()
+
+class CompileProfiler:
+    enabled = True
+
+    def __init__(self, trace_memory=True, cprofile=False):
+        self.traceMemory = trace_memory
+        self.cprofile = cprofile
+        # name -> PhaseRecord, in the order phases were first entered
+        self.phases = {}
+        self.stack = []
+        self.startedTracing = False
+        self.wallStart = None
+        self.cpuStart = None
+        self.wallTotal = 0.0
+        self.cpuTotal = 0.0
+        self.peakTotal = 0
+        self.info = {}
+
+    def start(self):
+        if self.traceMemory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self.startedTracing = True
+        self.wallStart = time.perf_counter()
+        self.cpuStart = time.process_time()
+
+    def stop(self):
+        self.wallTotal = time.perf_counter() - self.wallStart
+        self.cpuTotal = time.process_time() - self.cpuStart
+        if self.traceMemory:
+            self.peakTotal = tracemalloc.get_traced_memory()[1]
+        if self.startedTracing:
+            tracemalloc.stop()
+            self.startedTracing = False
+
+    def setInfo(self, key, value):
+        self.info[key] = value
+
+    def phase(self, name, item=None):
+        record = self.phases.get(name)
+        if record is None:
+            parent = None
+            if len(self.stack) > 0:
+                parent = self.stack[-1].record.name
+            record = PhaseRecord(name, parent)
+            self.phases[name] = record
+        return ActivePhase(self, record, item)
+
+    def enterPhase(self, active):
+        if self.traceMemory:
+            # Fold the peak reached so far into the enclosing phases before
+            # restarting the peak for this one
+            current, peak = tracemalloc.get_traced_memory()
+            for outer in self.stack:
+                if peak > outer.peak:
+                    outer.peak = peak
+            tracemalloc.reset_peak()
+            active.memoryStart = current
+            active.peak = current
+        if self.cprofile:
+            if len(self.stack) > 0 and self.stack[-1].record.profile is not None:
+                self.stack[-1].record.profile.disable()
+            if active.record.profile is None:
+                active.record.profile = cProfile.Profile()
+            active.record.profile.enable()
+        self.stack.append(active)
+        active.wallStart = time.perf_counter()
+        active.cpuStart = time.process_time()
+
+    def exitPhase(self, active):
+        wall = time.perf_counter() - active.wallStart
+        cpu = time.process_time() - active.cpuStart
+        self.stack.pop()
+        if self.cprofile:
+            active.record.profile.disable()
+            if len(self.stack) > 0 and self.stack[-1].record.profile is not None:
+                self.stack[-1].record.profile.enable()
+
+        peak_memory = 0
+        if self.traceMemory:
+            peak = tracemalloc.get_traced_memory()[1]
+            if peak > active.peak:
+                active.peak = peak
+            if len(self.stack) > 0 and active.peak > self.stack[-1].peak:
+                self.stack[-1].peak = active.peak
+            peak_memory = active.peak - active.memoryStart
+
+        record = active.record
+        record.stats.add(wall, cpu, peak_memory, active.counts)
+        if active.item is not None:
+            item_stats = record.items.get(active.item)
+            if item_stats is None:
+                item_stats = PhaseStats()
+                record.items[active.item] = item_stats
+            item_stats.add(wall, cpu, peak_memory, active.counts)
+
+    def selfWall(self, record):
+        # Wall time of a phase minus the phases nested in it
+        wall = record.stats.wall
+        for name, child in self.phases.items():
+            if child.parent == record.name:
+                wall = wall - child.stats.wall
+        return wall
+
+    def slowestPhase(self):
+        slowest = None
+        slowest_wall = 0.0
+        for name, record in self.phases.items():
+            wall = self.selfWall(record)
+            if slowest is None or wall > slowest_wall:
+                slowest = record
+                slowest_wall = wall
+        return slowest
+
+    def dumpSlowestPhase(self, path):
+        # Writes pstats data for the slowest phase; returns its name
+        slowest = self.slowestPhase()
+        if slowest is None or slowest.profile is None:
+            return None
+        slowest.profile.dump_stats(path)
+        return slowest.name
+
+    def report(self):
+        phases = []
+        actorclasses = {}
+        for name, record in self.phases.items():
+            phase = record.stats.toDict()
+            phase['name'] = name
+            phase['parent'] = record.parent
+            phase['selfWall'] = round(self.selfWall(record), 6)
+            items = {}
+            for item, stats in record.items.items():
+                items[item] = stats.toDict()
+            phase['items'] = items
+            phases.append(phase)
+
+            # Regroup per actorclass: its declaration, then its methods
+            for item, stats in record.items.items():
+                if "::" in item:
+                    actorclass, method = item.split("::", 1)
+                    entry = actorclasses.setdefault(actorclass, {'declaration': None, 'methods': {}})
+                    entry['methods'][method] = stats.toDict()
+                elif name == 'parseActorclassDefinition':
+                    entry = actorclasses.setdefault(item, {'declaration': None, 'methods': {}})
+                    entry['declaration'] = stats.toDict()
+
+        slowest = self.slowestPhase()
+        return {
+            'version': FORMAT_VERSION,
+            'info': self.info,
+            'total': {
+                'wall': round(self.wallTotal, 6),
+                'cpu': round(self.cpuTotal, 6),
+                'peakMemory': self.peakTotal,
+                # ru_maxrss is in kilobytes on Linux
+                'maxRSS': resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024,
+            },
+            'traceMemory': self.traceMemory,
+            'slowestPhase': slowest.name if slowest is not None else None,
+            'phases': phases,
+            'actorclasses': actorclasses,
+        }
+
+    def writeJSON(self, path):
+        fd = open(path, "w")
+        json.dump(self.report(), fd, indent=2)
+        fd.write("\n")
+        fd.close()
@@ -0,0 +1,487 @@
+import os
+import sys
+import copy
+
+import ply.yacc as yacc
+
+# LALR grammar of an AEON program down to its declarations.
+#
+# A program is a sequence of definitions: configurable variables,
+# actorclasses, structs, messages, upcalls, actorclass method definitions
+# (ret A::name(...) {...}) and global methods, main among them.  Each one is
+# handed as a Definition with its tokens to a handler as soon as it is
+# reduced.  The grammar reads the declarations themselves: the variables and
+# method declarations of an actorclass, the fields of a struct or message,
+# the variable of a configurable and the header of a method definition come
+# with the Definition as declaration objects.  Method and upcall bodies are
+# only delimited, matching braces and parentheses, and are still read by
+# MethodParser.  The tokens between two braces inside a body are read as one
+# TOKENS symbol, so the parser takes a few steps per line of a body instead
+# of a few per token.
+#
+# The parse tables are generated once into ProgramGrammarTab.py next to this
+# file and read from there afterwards; PLY regenerates them when the grammar
+# changes.  Each parse runs on its own copy of the parser, so parses do not
+# share state.
+
+class Definition:
+    __slots__ = ('kind', 'tokens', 'declaration')
+
+    CONFIGURABLE = 'configurable'
+    ACTORCLASS = 'actorclass'
+    STRUCT = 'struct'
+    MESSAGE = 'message'
+    UPCALL = 'upcall'
+    ACTORCLASS_METHOD = 'actorclass method'
+    METHOD = 'method'
+
+    def __init__(self, kind, tokens, declaration):
+        self.kind = kind
+        # The LexTokens of the definition, keywords and braces included
+        self.tokens = tokens
+        # A VariableDeclaration for a configurable, an ActorclassDeclaration,
+        # a RecordDeclaration for a struct or message, a MethodHeader for a
+        # method definition and None for an upcall
+        self.declaration = declaration
+
+class QualifiedType:
+    __slots__ = ('qualifiers', 'type', 'special')
+
+    def __init__(self, qualifiers, type, special):
+        # 'const' and 'yield', as written before the type
+        self.qualifiers = qualifiers
+        # The NAME or COLLECTION_TYPE LexToken
+        self.type = type
+        # The '*' and '&' after the type, e.g. '&'
+        self.special = special
+
+class VariableDeclaration:
+    __slots__ = ('type', 'name', 'value')
+
+    def __init__(self, type, name, value):
+        self.type = type
+        # The NAME LexToken
+        self.name = name
+        # The LexTokens of the initializer after '=', if any
+        self.value = value
+
+class MethodDeclaration:
+    __slots__ = ('type', 'name', 'parameters')
+
+    def __init__(self, type, name, parameters):
+        # The QualifiedType of the return value
+        self.type = type
+        self.name = name
+        # A VariableDeclaration per parameter
+        self.parameters = parameters
+
+class ActorclassDeclaration:
+    __slots__ = ('name', 'members')
+
+    def __init__(self, name, members):
+        self.name = name
+        # VariableDeclarations and MethodDeclarations, in order
+        self.members = members
+
+class RecordDeclaration:
+    # A struct or message
+    __slots__ = ('name', 'fields')
+
+    def __init__(self, name, fields):
+        self.name = name
+        # A VariableDeclaration per field
+        self.fields = fields
+
+class MethodHeader:
+    __slots__ = ('returnType', 'actorclass', 'name', 'bodyStart')
+
+    def __init__(self, return_type, actorclass, name, body_start):
+        # The value of the first token of the signature
+        self.returnType = return_type
+        # The actorclass of A::name, None for a global method
+        self.actorclass = actorclass
+        self.name = name
+        # The position of the first token after the opening brace of the
+        # body in the definition's tokens
+        self.bodyStart = body_start
+
+class ProgramSyntaxError(Exception):
+    def __init__(self, tok):
+        if tok is None:
+            Exception.__init__(self, "Unexpected end of program")
+        else:
+            Exception.__init__(self, "Unexpected '%s'" % tok.value)
+        self.token = tok
+
+class TokenRun:
+    # The tokens between two braces inside a body; value is the list
+    __slots__ = ('type', 'value')
+
+    def __init__(self, run):
+        self.type = 'TOKENS'
+        self.value = run
+
+class Keyword:
+    # A NAME token retyped for the grammar; value is the LexToken itself
+    __slots__ = ('type', 'value')
+
+    def __init__(self, type, tok):
+        self.type = type
+        self.value = tok
+
+# Keywords starting a top-level definition
+KEYWORDS = {
+    'configurable': 'CONFIGURABLE',
+    'actorclass': 'ACTORCLASS',
+    'struct': 'STRUCT',
+    'message': 'MESSAGE',
+    'upcall': 'UPCALL',
+}
+# Keywords qualifying a type outside of method bodies
+QUALIFIERS = {
+    'const': 'CONST',
+    'yield': 'YIELD',
+}
+
+# The token types of CppHeaderParser's lexer, COLLECTION_TYPE, which
+# AEONParser.normalizeTokens() makes of collection types, the keywords and
+# TOKENS
+LEXER_TOKENS = [
+    'NUMBER', 'FLOAT_NUMBER', 'NAME', 'OPEN_PAREN', 'CLOSE_PAREN', 'OPEN_BRACE', 'CLOSE_BRACE',
+    'OPEN_SQUARE_BRACKET', 'CLOSE_SQUARE_BRACKET', 'COLON', 'SEMI_COLON', 'COMMA', 'TAB', 'BACKSLASH',
+    'PIPE', 'PERCENT', 'EXCLAMATION', 'CARET', 'COMMENT_SINGLELINE', 'COMMENT_MULTILINE', 'PRECOMP_MACRO',
+    'PRECOMP_MACRO_CONT', 'ASTERISK', 'AMPERSTAND', 'EQUALS', 'MINUS', 'PLUS', 'DIVIDE', 'CHAR_LITERAL',
+    'STRING_LITERAL', 'NEW_LINE', 'SQUOTE', 'REFERENCE', 'DOT', 'SMALL', 'LARGE', 'STRING',
+]
+tokens = LEXER_TOKENS + ['COLLECTION_TYPE'] + sorted(KEYWORDS.values()) + sorted(QUALIFIERS.values()) + ['TOKENS']
+
+# Tokens that go into the parentheses after a method name, all but braces
+# and parentheses
+ARGUMENT_TOKENS = [t for t in LEXER_TOKENS + ['COLLECTION_TYPE'] + sorted(QUALIFIERS.values())
+                   if not t in ('OPEN_BRACE', 'CLOSE_BRACE', 'OPEN_PAREN', 'CLOSE_PAREN')]
+# Tokens of a definition header, all but braces and semicolons
+WORD_TOKENS = [t for t in LEXER_TOKENS + ['COLLECTION_TYPE'] + sorted(QUALIFIERS.values())
+               if not t in ('OPEN_BRACE', 'CLOSE_BRACE', 'SEMI_COLON')]
+# Tokens of the return type of a method definition
+SIGNATURE_TOKENS = ['NAME', 'COLLECTION_TYPE', 'ASTERISK', 'AMPERSTAND', 'CONST']
+# Tokens of the initializer of a variable, which ends at a comma or semicolon
+EXPRESSION_TOKENS = [t for t in ARGUMENT_TOKENS if not t in ('COMMA', 'SEMI_COLON')]
+
+def alternatives(head, tails):
+    return '%s : %s' % (head, '\n| '.join(tails))
+
+def lexToken(p, n):
+    # The LexToken of terminal n; p.slice holds what the TokenStream
+    # returned, a Keyword wrapping it or the LexToken itself
+    tok = p.slice[n]
+    if isinstance(tok, Keyword):
+        return tok.value
+    return tok
+
+def p_program(p):
+    'program : definitions'
+    p[0] = p[1]
+
+def p_definitions(p):
+    '''definitions : definitions definition
+                   | empty'''
+    if len(p) == 2:
+        p[0] = 0
+    else:
+        p[0] = p[1] + p[2]
+
+def p_definition_configurable(p):
+    'definition : CONFIGURABLE variable SEMI_COLON'
+    p[0] = handle(p, Definition.CONFIGURABLE, p.lexer.take(p.slice[3]), p[2])
+
+def p_definition_actorclass(p):
+    'definition : ACTORCLASS NAME OPEN_BRACE members CLOSE_BRACE'
+    declaration = ActorclassDeclaration(p.slice[2], p[4])
+    p[0] = handle(p, Definition.ACTORCLASS, p.lexer.take(p.slice[5]), declaration)
+
+def p_definition_record(p):
+    '''definition : STRUCT NAME OPEN_BRACE fields CLOSE_BRACE
+                  | MESSAGE NAME OPEN_BRACE fields CLOSE_BRACE'''
+    declaration = RecordDeclaration(p.slice[2], p[4])
+    p[0] = handle(p, p[1].value, p.lexer.take(p.slice[5]), declaration)
+
+def p_definition_upcall(p):
+    'definition : UPCALL words block'
+    p[0] = handle(p, Definition.UPCALL, p.lexer.take(p[3][1]), None)
+
+def p_definition_method(p):
+    'definition : signature method_name parens words block'
+    definition_tokens = p.lexer.take(p[5][1])
+    body_start = 0
+    while not definition_tokens[body_start] is p[5][0]:
+        body_start = body_start + 1
+    actorclass, name = p[2]
+    header = MethodHeader(p[1], actorclass, name, body_start + 1)
+    if actorclass is None:
+        kind = Definition.METHOD
+    else:
+        kind = Definition.ACTORCLASS_METHOD
+    p[0] = handle(p, kind, definition_tokens, header)
+
+def p_definition_semi_colon(p):
+    'definition : SEMI_COLON'
+    # After the closing brace of an actorclass, struct or message
+    p.lexer.take(p.slice[1])
+    p[0] = 0
+
+def p_signature(p):
+    p[0] = p[1]
+p_signature.__doc__ = alternatives('signature', ['signature %s' % t for t in SIGNATURE_TOKENS])
+
+def p_signature_first(p):
+    p[0] = lexToken(p, 1).value
+p_signature_first.__doc__ = alternatives('signature', SIGNATURE_TOKENS)
+
+def p_method_name(p):
+    'method_name : NAME'
+    p[0] = (None, p[1])
+
+def p_method_name_actorclass(p):
+    'method_name : NAME COLON COLON NAME'
+    p[0] = (p[1], p[4])
+
+# Declarations
+
+def p_members(p):
+    '''members : members variable SEMI_COLON
+               | members method_declaration SEMI_COLON'''
+    p[1].append(p[2])
+    p[0] = p[1]
+
+def p_members_empty(p):
+    '''members : members SEMI_COLON
+               | empty'''
+    if len(p) == 2:
+        p[0] = []
+    else:
+        p[0] = p[1]
+
+def p_fields(p):
+    'fields : fields variable SEMI_COLON'
+    p[1].append(p[2])
+    p[0] = p[1]
+
+def p_fields_empty(p):
+    '''fields : fields SEMI_COLON
+              | empty'''
+    if len(p) == 2:
+        p[0] = []
+    else:
+        p[0] = p[1]
+
+def p_method_declaration(p):
+    '''method_declaration : qualified_type NAME OPEN_PAREN parameters CLOSE_PAREN
+                          | qualified_type NAME OPEN_PAREN CLOSE_PAREN'''
+    if len(p) == 6:
+        parameters = p[4]
+    else:
+        parameters = []
+    p[0] = MethodDeclaration(p[1], p.slice[2], parameters)
+
+def p_parameters(p):
+    'parameters : parameters COMMA variable'
+    p[1].append(p[3])
+    p[0] = p[1]
+
+def p_parameters_first(p):
+    'parameters : variable'
+    p[0] = [p[1]]
+
+def p_variable(p):
+    'variable : qualified_type NAME initializer'
+    p[0] = VariableDeclaration(p[1], p.slice[2], p[3])
+
+def p_qualified_type(p):
+    'qualified_type : qualifiers type_name specials'
+    p[0] = QualifiedType(p[1], p[2], p[3])
+
+def p_qualifiers(p):
+    '''qualifiers : qualifiers CONST
+                  | qualifiers YIELD'''
+    p[1].append(p[2].value)
+    p[0] = p[1]
+
+def p_qualifiers_empty(p):
+    'qualifiers : empty'
+    p[0] = []
+
+def p_type_name(p):
+    '''type_name : NAME
+                 | COLLECTION_TYPE'''
+    p[0] = p.slice[1]
+
+def p_specials(p):
+    '''specials : specials ASTERISK
+                | specials AMPERSTAND'''
+    p[0] = p[1] + p[2]
+
+def p_specials_empty(p):
+    'specials : empty'
+    p[0] = ''
+
+def p_initializer(p):
+    'initializer : EQUALS expression'
+    p[0] = p.lexer.since(p.slice[1], p[2])
+
+def p_initializer_empty(p):
+    'initializer : empty'
+    p[0] = []
+
+# An expression, and parens below, reduce to their last LexToken; the tokens
+# are taken from the TokenStream
+
+def p_expression(p):
+    p[0] = lexToken(p, len(p) - 1)
+p_expression.__doc__ = alternatives('expression', ['expression %s' % t for t in EXPRESSION_TOKENS] + EXPRESSION_TOKENS)
+
+def p_expression_parens(p):
+    '''expression : expression parens
+                  | parens'''
+    p[0] = p[len(p) - 1]
+
+# Bodies
+
+def p_words(p):
+    pass
+p_words.__doc__ = alternatives('words', ['words %s' % t for t in WORD_TOKENS] + ['empty'])
+
+def p_block(p):
+    'block : OPEN_BRACE body CLOSE_BRACE'
+    # The braces
+    p[0] = (p.slice[1], p.slice[3])
+
+def p_body(p):
+    '''body : body block
+            | body TOKENS
+            | empty'''
+    pass
+
+def p_parens(p):
+    'parens : OPEN_PAREN arguments CLOSE_PAREN'
+    p[0] = p.slice[3]
+
+def p_arguments(p):
+    pass
+p_arguments.__doc__ = alternatives('arguments', ['arguments parens', 'arguments block'] +
+                                   ['arguments %s' % t for t in ARGUMENT_TOKENS] + ['empty'])
+
+def p_empty(p):
+    'empty :'
+    pass
+
+def p_error(tok):
+    if isinstance(tok, Keyword):
+        tok = tok.value
+    elif isinstance(tok, TokenRun):
+        tok = tok.value[0]
+    raise ProgramSyntaxError(tok)
+
+def handle(p, kind, definition_tokens, declaration):
+    # Hands the definition to the handler of this parse; one definition
+    p.parser.handler(Definition(kind, definition_tokens, declaration))
+    return 1
+
+# The parser built from the cached tables, copied for each parse
+templateParser = None
+
+def getParser():
+    global templateParser
+    if templateParser is None:
+        templateParser = yacc.yacc(module=sys.modules[__name__], tabmodule='ProgramGrammarTab',
+                                   outputdir=os.path.dirname(os.path.abspath(__file__)), debug=False,
+                                   errorlog=yacc.NullLogger())
+    return copy.copy(templateParser)
+
+class TokenStream:
+    # The lexer interface yacc reads tokens through.  Retypes the keywords
+    # that start a top-level definition and the qualifiers, leaves out the
+    # tabs between declarations and groups the tokens inside the braces of a
+    # body into TokenRuns.  Every token read is kept until the definition it
+    # belongs to is taken
+    def __init__(self, program_tokens):
+        self.tokens = iter(program_tokens)
+        self.depth = 0
+        # The brace that ended the last TokenRun
+        self.pending = None
+        # Whether the next token at depth 0 starts a definition
+        self.definitionStart = True
+        # Whether depth 1 is the body of an actorclass, struct or message,
+        # whose tokens are read one by one
+        self.declarationBody = False
+        # The LexTokens read since the last definition taken
+        self.read = []
+
+    def token(self):
+        while True:
+            tok = self.pending
+            self.pending = None
+            if tok is None:
+                tok = next(self.tokens, None)
+                if tok is None:
+                    return None
+            if tok.type == 'OPEN_BRACE' or tok.type == 'CLOSE_BRACE':
+                break
+            if self.depth > 1 or (self.depth == 1 and not self.declarationBody):
+                run = [tok]
+                for tok in self.tokens:
+                    if tok.type == 'OPEN_BRACE' or tok.type == 'CLOSE_BRACE':
+                        self.pending = tok
+                        break
+                    run.append(tok)
+                self.read.extend(run)
+                return TokenRun(run)
+            self.read.append(tok)
+            if tok.type != 'TAB':
+                break
+
+        if tok.type == 'OPEN_BRACE':
+            self.read.append(tok)
+            self.depth = self.depth + 1
+        elif tok.type == 'CLOSE_BRACE':
+            self.read.append(tok)
+            self.depth = self.depth - 1
+            if self.depth == 0:
+                self.declarationBody = False
+                self.definitionStart = True
+        elif tok.type == 'NAME' and self.depth == 0 and self.definitionStart and tok.value in KEYWORDS:
+            tok = Keyword(KEYWORDS[tok.value], tok)
+            if tok.type in ('ACTORCLASS', 'STRUCT', 'MESSAGE'):
+                self.declarationBody = True
+        elif tok.type == 'NAME' and tok.value in QUALIFIERS:
+            tok = Keyword(QUALIFIERS[tok.value], tok)
+        if self.depth == 0:
+            self.definitionStart = tok.type == 'SEMI_COLON' or tok.type == 'CLOSE_BRACE'
+        return tok
+
+    def take(self, last):
+        # The tokens read up to last, which ends a definition, dropping them
+        # from the stream; at most the lookahead has been read after it
+        end = len(self.read) - 1
+        while not self.read[end] is last:
+            end = end - 1
+        definition_tokens = self.read[:end + 1]
+        del self.read[:end + 1]
+        return definition_tokens
+
+    def since(self, first, last):
+        # The tokens read after first up to last, tabs left out
+        end = len(self.read) - 1
+        while not self.read[end] is last:
+            end = end - 1
+        start = end
+        while not self.read[start] is first:
+            start = start - 1
+        return [tok for tok in self.read[start + 1:end + 1] if tok.type != 'TAB']
+
+def parse(program_tokens, handler):
+    # Calls handler with each Definition of the program, in order, as soon as
+    # its last token is read; returns the number of definitions.  Raises
+    # ProgramSyntaxError
+    parser = getParser()
+    parser.handler = handler
+    return parser.parse(lexer=TokenStream(program_tokens))
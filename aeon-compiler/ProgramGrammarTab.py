@@ -0,0 +1,228 @@
+
+# ProgramGrammarTab.py
+# This file is automatically generated. Do not edit.
+# pylint: disable=W,C,R
+_tabversion = '3.10'
+
+_lr_method = 'LALR'
+
+_lr_signature = 'ACTORCLASS AMPERSTAND ASTERISK BACKSLASH CARET CHAR_LITERAL CLOSE_BRACE CLOSE_PAREN CLOSE_SQUARE_BRACKET COLLECTION_TYPE COLON COMMA COMMENT_MULTILINE COMMENT_SINGLELINE CONFIGURABLE CONST DIVIDE DOT EQUALS EXCLAMATION FLOAT_NUMBER LARGE MESSAGE MINUS NAME NEW_LINE NUMBER OPEN_BRACE OPEN_PAREN OPEN_SQUARE_BRACKET PERCENT PIPE PLUS PRECOMP_MACRO PRECOMP_MACRO_CONT REFERENCE SEMI_COLON SMALL SQUOTE STRING STRING_LITERAL STRUCT TAB TOKENS UPCALL YIELDprogram : definitionsdefinitions : definitions definition\n                   | emptydefinition : CONFIGURABLE variable SEMI_COLONdefinition : ACTORCLASS NAME OPEN_BRACE members CLOSE_BRACEdefinition : STRUCT NAME OPEN_BRACE fields CLOSE_BRACE\n                  | MESSAGE NAME OPEN_BRACE fields CLOSE_BRACEdefinition : UPCALL words blockdefinition : signature method_name parens words blockdefinition : SEMI_COLONsignature : signature NAME\n| signature COLLECTION_TYPE\n| signature ASTERISK\n| signature AMPERSTAND\n| signature CONSTsignature : NAME\n| COLLECTION_TYPE\n| ASTERISK\n| AMPERSTAND\n| CONSTmethod_name : NAMEmethod_name : NAME COLON COLON NAMEmembers : members variable SEMI_COLON\n               | members method_declaration SEMI_COLONmembers : members SEMI_COLON\n               | emptyfields : fields variable SEMI_COLONfields : fields SEMI_COLON\n              | emptymethod_declaration : qualified_type NAME OPEN_PAREN parameters CLOSE_PAREN\n                          | qualified_type NAME OPEN_PAREN CLOSE_PARENparameters : parameters COMMA variableparameters : variablevariable : qualified_type NAME initializerqualified_type : qualifiers type_name specialsqualifiers : qualifiers CONST\n                  | qualifiers YIELDqualifiers : emptytype_name : NAME\n                 | COLLECTION_TYPEspecials : specials ASTERISK\n                | specials AMPERSTANDspecials : emptyinitializer : EQUALS expressioninitializer : emptyexpression : expression NUMBER\n| expression FLOAT_NUMBER\n| expression NAME\n| expression OPEN_SQUARE_BRACKET\n| expression CLOSE_SQUARE_BRACKET\n| expression COLON\n| expression TAB\n| expression BACKSLASH\n| expression PIPE\n| expression PERCENT\n| expression EXCLAMATION\n| expression CARET\n| expression COMMENT_SINGLELINE\n| expression COMMENT_MULTILINE\n| expression PRECOMP_MACRO\n| expression PRECOMP_MACRO_CONT\n| expression ASTERISK\n| expression AMPERSTAND\n| expression EQUALS\n| expression MINUS\n| expression PLUS\n| expression DIVIDE\n| expression CHAR_LITERAL\n| expression STRING_LITERAL\n| expression NEW_LINE\n| expression SQUOTE\n| expression REFERENCE\n| expression DOT\n| expression SMALL\n| expression LARGE\n| expression STRING\n| expression COLLECTION_TYPE\n| expression CONST\n| expression YIELD\n| NUMBER\n| FLOAT_NUMBER\n| NAME\n| OPEN_SQUARE_BRACKET\n| CLOSE_SQUARE_BRACKET\n| COLON\n| TAB\n| BACKSLASH\n| PIPE\n| PERCENT\n| EXCLAMATION\n| CARET\n| COMMENT_SINGLELINE\n| COMMENT_MULTILINE\n| PRECOMP_MACRO\n| PRECOMP_MACRO_CONT\n| ASTERISK\n| AMPERSTAND\n| EQUALS\n| MINUS\n| PLUS\n| DIVIDE\n| CHAR_LITERAL\n| STRING_LITERAL\n| NEW_LINE\n| SQUOTE\n| REFERENCE\n| DOT\n| SMALL\n| LARGE\n| STRING\n| COLLECTION_TYPE\n| CONST\n| YIELDexpression : expression parens\n                  | parenswords : words NUMBER\n| words FLOAT_NUMBER\n| words NAME\n| words OPEN_PAREN\n| words CLOSE_PAREN\n| words OPEN_SQUARE_BRACKET\n| words CLOSE_SQUARE_BRACKET\n| words COLON\n| words COMMA\n| words TAB\n| words BACKSLASH\n| words PIPE\n| words PERCENT\n| words EXCLAMATION\n| words CARET\n| words COMMENT_SINGLELINE\n| words COMMENT_MULTILINE\n| words PRECOMP_MACRO\n| words PRECOMP_MACRO_CONT\n| words ASTERISK\n| words AMPERSTAND\n| words EQUALS\n| words MINUS\n| words PLUS\n| words DIVIDE\n| words CHAR_LITERAL\n| words STRING_LITERAL\n| words NEW_LINE\n| words SQUOTE\n| words REFERENCE\n| words DOT\n| words SMALL\n| words LARGE\n| words STRING\n| words COLLECTION_TYPE\n| words CONST\n| words YIELD\n| emptyblock : OPEN_BRACE body CLOSE_BRACEbody : body block\n            | body TOKENS\n            | emptyparens : OPEN_PAREN arguments CLOSE_PARENarguments : arguments parens\n| arguments block\n| arguments NUMBER\n| arguments FLOAT_NUMBER\n| arguments NAME\n| arguments OPEN_SQUARE_BRACKET\n| arguments CLOSE_SQUARE_BRACKET\n| arguments COLON\n| arguments SEMI_COLON\n| arguments COMMA\n| arguments TAB\n| arguments BACKSLASH\n| arguments PIPE\n| arguments PERCENT\n| arguments EXCLAMATION\n| arguments CARET\n| arguments COMMENT_SINGLELINE\n| arguments COMMENT_MULTILINE\n| arguments PRECOMP_MACRO\n| arguments PRECOMP_MACRO_CONT\n| arguments ASTERISK\n| arguments AMPERSTAND\n| arguments EQUALS\n| arguments MINUS\n| arguments PLUS\n| arguments DIVIDE\n| arguments CHAR_LITERAL\n| arguments STRING_LITERAL\n| arguments NEW_LINE\n| arguments SQUOTE\n| arguments REFERENCE\n| arguments DOT\n| arguments SMALL\n| arguments LARGE\n| arguments STRING\n| arguments COLLECTION_TYPE\n| arguments CONST\n| arguments YIELD\n| emptyempty :'
+    
+_lr_action_items = {'CONFIGURABLE':([0,2,3,4,6,32,42,138,143,146,147,150,],[-198,5,-3,-2,-10,-4,-8,-5,-6,-7,-154,-9,]),'ACTORCLASS':([0,2,3,4,6,32,42,138,143,146,147,150,],[-198,7,-3,-2,-10,-4,-8,-5,-6,-7,-154,-9,]),'STRUCT':([0,2,3,4,6,32,42,138,143,146,147,150,],[-198,9,-3,-2,-10,-4,-8,-5,-6,-7,-154,-9,]),'MESSAGE':([0,2,3,4,6,32,42,138,143,146,147,150,],[-198,10,-3,-2,-10,-4,-8,-5,-6,-7,-154,-9,]),'UPCALL':([0,2,3,4,6,32,42,138,143,146,147,150,],[-198,11,-3,-2,-10,-4,-8,-5,-6,-7,-154,-9,]),'SEMI_COLON':([0,2,3,4,6,17,32,33,39,40,41,42,82,84,86,89,90,91,92,93,97,98,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,135,138,139,140,141,143,144,145,146,147,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,191,192,193,194,195,196,197,198,199,200,201,202,203,204,205,206,207,208,209,210,211,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,227,228,229,232,234,],[-198,6,-3,-2,-10,32,-4,-198,-198,-198,-198,-8,-198,-34,-45,140,-26,145,-29,145,160,-197,-98,-44,-80,-81,-82,-83,-84,-85,-86,-87,-88,-89,-90,-91,-92,-93,-94,-95,-96,-97,-99,-100,-101,-102,-103,-104,-105,-106,-107,-108,-109,-110,-111,-112,-113,-115,-5,226,-25,227,-6,229,-28,-7,-154,-9,-158,-159,-160,-161,-162,-163,-164,-165,-166,-167,-168,-169,-170,-171,-172,-173,-174,-175,-176,-177,-178,-179,-180,-181,-182,-183,-184,-185,-186,-187,-188,-189,-190,-191,-192,-193,-194,-195,-196,-64,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-65,-66,-67,-68,-69,-70,-71,-72,-73,-74,-75,-76,-77,-78,-79,-114,-23,-24,-198,-27,-31,-30,]),'NAME':([0,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,18,19,20,24,25,27,28,29,30,31,32,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,81,82,85,87,88,89,90,91,92,93,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,135,136,137,138,140,142,143,145,146,147,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,191,192,193,194,195,196,197,198,199,200,201,202,203,204,205,206,207,208,209,210,211,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,227,229,230,235,],[-198,8,-3,-2,-198,-10,21,-16,22,23,-198,27,-17,-18,-19,-20,33,37,-38,45,-153,-11,-12,-13,-14,-15,-4,-198,-36,-37,-39,-40,-198,-198,-198,-8,-116,-117,-118,-119,-120,-121,-122,-123,-124,-125,-126,-127,-128,-129,-130,-131,-132,-133,-134,-135,-136,-137,-138,-139,-140,-141,-142,-143,-144,-145,-146,-147,-148,-149,-150,-151,-152,-198,-198,104,-35,-43,-198,-26,-198,-29,-198,45,156,-197,190,-98,194,-80,-81,-82,-83,-84,-85,-86,-87,-88,-89,-90,-91,-92,-93,-94,-95,-96,-97,-99,-100,-101,-102,-103,-104,-105,-106,-107,-108,-109,-110,-111,-112,-113,-115,-41,-42,-5,-25,228,-6,-28,-7,-154,-9,-158,-159,-160,-161,-162,-163,-164,-165,-166,-167,-168,-169,-170,-171,-172,-173,-174,-175,-176,-177,-178,-179,-180,-181,-182,-183,-184,-185,-186,-187,-188,-189,-190,-191,-192,-193,-194,-195,-196,-64,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-65,-66,-67,-68,-69,-70,-71,-72,-73,-74,-75,-76,-77,-78,-79,-114,-23,-24,-27,-198,-198,]),'COLLECTION_TYPE':([0,2,3,4,5,6,8,11,12,13,14,15,16,19,20,24,25,27,28,29,30,31,32,35,36,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,81,82,85,89,90,91,92,93,96,97,98,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,135,138,140,143,145,146,147,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,191,192,193,194,195,196,197,198,199,200,201,202,203,204,205,206,207,208,209,210,211,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,227,229,230,235,],[-198,13,-3,-2,-198,-10,-16,-198,28,-17,-18,-19,-20,38,-38,77,-153,-11,-12,-13,-14,-15,-4,-36,-37,-198,-198,-198,-8,-116,-117,-118,-119,-120,-121,-122,-123,-124,-125,-126,-127,-128,-129,-130,-131,-132,-133,-134,-135,-136,-137,-138,-139,-140,-141,-142,-143,-144,-145,-146,-147,-148,-149,-150,-151,-152,-198,-198,132,-198,-26,-198,-29,-198,77,187,-197,-98,222,-80,-81,-82,-83,-84,-85,-86,-87,-88,-89,-90,-91,-92,-93,-94,-95,-96,-97,-99,-100,-101,-102,-103,-104,-105,-106,-107,-108,-109,-110,-111,-112,-113,-115,-5,-25,-6,-28,-7,-154,-9,-158,-159,-160,-161,-162,-163,-164,-165,-166,-167,-168,-169,-170,-171,-172,-173,-174,-175,-176,-177,-178,-179,-180,-181,-182,-183,-184,-185,-186,-187,-188,-189,-190,-191,-192,-193,-194,-195,-196,-64,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-65,-66,-67,-68,-69,-70,-71,-72,-73,-74,-75,-76,-77,-78,-79,-114,-23,-24,-27,-198,-198,]),'ASTERISK':([0,2,3,4,6,8,11,12,13,14,15,16,24,25,27,28,29,30,31,32,34,37,38,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,81,82,85,87,88,96,97,98,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,135,136,137,138,143,146,147,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,191,192,193,194,195,196,197,198,199,200,201,202,203,204,205,206,207,208,209,210,211,212,213,214,215,216,217,218,219,220,221,222,223,224,225,],[-198,14,-3,-2,-10,-16,-198,29,-17,-18,-19,-20,62,-153,-11,-12,-13,-14,-15,-4,-198,-39,-40,-8,-116,-117,-118,-119,-120,-121,-122,-123,-124,-125,-126,-127,-128,-129,-130,-131,-132,-133,-134,-135,-136,-137,-138,-139,-140,-141,-142,-143,-144,-145,-146,-147,-148,-149,-150,-151,-152,-198,-198,118,136,-43,62,172,-197,-98,208,-80,-81,-82,-83,-84,-85,-86,-87,-88,-89,-90,-91,-92,-93,-94,-95,-96,-97,-99,-100,-101,-102,-103,-104,-105,-106,-107,-108,-109,-110,-111,-112,-113,-115,-41,-42,-5,-6,-7,-154,-9,-158,-159,-160,-161,-162,-163,-164,-165,-166,-167,-168,-169,-170,-171,-172,-173,-174,-175,-176,-177,-178,-179,-180,-181,-182,-183,-184,-185,-186,-187,-188,-189,-190,-191,-192,-193,-194,-195,-196,-64,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-65,-66,-67,-68,-69,-70,-71,-72,-73,-74,-75,-76,-77,-78,-79,-114,]),'AMPERSTAND':([0,2,3,4,6,8,11,12,13,14,15,16,24,25,27,28,29,30,31,32,34,37,38,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,81,82,85,87,88,96,97,98,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,135,136,137,138,143,146,147,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,191,192,193,194,195,196,197,198,199,200,201,202,203,204,205,206,207,208,209,210,211,212,213,214,215,216,217,218,219,220,221,222,223,224,225,],[-198,15,-3,-2,-10,-16,-198,30,-17,-18,-19,-20,63,-153,-11,-12,-13,-14,-15,-4,-198,-39,-40,-8,-116,-117,-118,-119,-120,-121,-122,-123,-124,-125,-126,-127,-128,-129,-130,-131,-132,-133,-134,-135,-136,-137,-138,-139,-140,-141,-142,-143,-144,-145,-146,-147,-148,-149,-150,-151,-152,-198,-198,119,137,-43,63,173,-197,-98,209,-80,-81,-82,-83,-84,-85,-86,-87,-88,-89,-90,-91,-92,-93,-94,-95,-96,-97,-99,-100,-101,-102,-103,-104,-105,-106,-107,-108,-109,-110,-111,-112,-113,-115,-41,-42,-5,-6,-7,-154,-9,-158,-159,-160,-161,-162,-163,-164,-165,-166,-167,-168,-169,-170,-171,-172,-173,-174,-175,-176,-177,-178,-179,-180,-181,-182,-183,-184,-185,-186,-187,-188,-189,-190,-191,-192,-193,-194,-195,-196,-64,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-65,-66,-67,-68,-69,-70,-71,-72,-73,-74,-75,-76,-77,-78,-79,-114,]),'CONST':([0,2,3,4,5,6,8,11,12,13,14,15,16,19,20,24,25,27,28,29,30,31,32,35,36,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,81,82,85,89,90,91,92,93,96,97,98,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,135,138,140,143,145,146,147,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,191,192,193,194,195,196,197,198,199,200,201,202,203,204,205,206,207,208,209,210,211,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,227,229,230,235,],[-198,16,-3,-2,-198,-10,-16,-198,31,-17,-18,-19,-20,35,-38,78,-153,-11,-12,-13,-14,-15,-4,-36,-37,-198,-198,-198,-8,-116,-117,-118,-119,-120,-121,-122,-123,-124,-125,-126,-127,-128,-129,-130,-131,-132,-133,-134,-135,-136,-137,-138,-139,-140,-141,-142,-143,-144,-145,-146,-147,-148,-149,-150,-151,-152,-198,-198,133,-198,-26,-198,-29,-198,78,188,-197,-98,223,-80,-81,-82,-83,-84,-85,-86,-87,-88,-89,-90,-91,-92,-93,-94,-95,-96,-97,-99,-100,-101,-102,-103,-104,-105,-106,-107,-108,-109,-110,-111,-112,-113,-115,-5,-25,-6,-28,-7,-154,-9,-158,-159,-160,-161,-162,-163,-164,-165,-166,-167,-168,-169,-170,-171,-172,-173,-174,-175,-176,-177,-178,-179,-180,-181,-182,-183,-184,-185,-186,-187,-188,-189,-190,-191,-192,-193,-194,-195,-196,-64,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-65,-66,-67,-68,-69,-70,-71,-72,-73,-74,-75,-76,-77,-78,-79,-114,-23,-24,-27,-198,-198,]),'$end':([0,1,2,3,4,6,32,42,138,143,146,147,150,],[-198,0,-1,-3,-2,-10,-4,-8,-5,-6,-7,-154,-9,]),'YIELD':([5,11,19,20,24,25,35,36,39,40,41,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,81,82,85,89,90,91,92,93,96,97,98,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,135,140,145,147,151,152,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,191,192,193,194,195,196,197,198,199,200,201,202,203,204,205,206,207,208,209,210,211,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,227,229,230,235,],[-198,-198,36,-38,79,-153,-36,-37,-198,-198,-198,-116,-117,-118,-119,-120,-121,-122,-123,-124,-125,-126,-127,-128,-129,-130,-131,-132,-133,-134,-135,-136,-137,-138,-139,-140,-141,-142,-143,-144,-145,-146,-147,-148,-149,-150,-151,-152,-198,-198,134,-198,-26,-198,-29,-198,79,189,-197,-98,224,-80,-81,-82,-83,-84,-85,-86,-87,-88,-89,-90,-91,-92,-93,-94,-95,-96,-97,-99,-100,-101,-102,-103,-104,-105,-106,-107,-108,-109,-110,-111,-112,-113,-115,-25,-28,-154,-158,-159,-160,-161,-162,-163,-164,-165,-166,-167,-168,-169,-170,-171,-172,-173,-174,-175,-176,-177,-178,-179,-180,-181,-182,-183,-184,-185,-186,-187,-188,-189,-190,-191,-192,-193,-194,-195,-196,-64,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-65,-66,-67,-68,-69,-70,-71,-72,-73,-74,-75,-76,-77,-78,-79,-114,-23,-24,-27,-198,-198,]),'NUMBER':([11,24,25,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,81,82,85,96,97,98,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,135,147,151,152,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,191,192,193,194,195,196,197,198,199,200,201,202,203,204,205,206,207,208,209,210,211,212,213,214,215,216,217,218,219,220,221,222,223,224,225,],[-198,43,-153,-116,-117,-118,-119,-120,-121,-122,-123,-124,-125,-126,-127,-128,-129,-130,-131,-132,-133,-134,-135,-136,-137,-138,-139,-140,-141,-142,-143,-144,-145,-146,-147,-148,-149,-150,-151,-152,-198,-198,102,43,154,-197,-98,192,-80,-81,-82,-83,-84,-85,-86,-87,-88,-89,-90,-91,-92,-93,-94,-95,-96,-97,-99,-100,-101,-102,-103,-104,-105,-106,-107,-108,-109,-110,-111,-112,-113,-115,-154,-158,-159,-160,-161,-162,-163,-164,-165,-166,-167,-168,-169,-170,-171,-172,-173,-174,-175,-176,-177,-178,-179,-180,-181,-182,-183,-184,-185,-186,-187,-188,-189,-190,-191,-192,-193,-194,-195,-196,-64,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-65,-66,-67,-68,-69,-70,-71,-72,-73,-74,-75,-76,-77,-78,-79,-114,]),'FLOAT_NUMBER':([11,24,25,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,81,82,85,96,97,98,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,135,147,151,152,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,191,192,193,194,195,196,197,198,199,200,201,202,203,204,205,206,207,208,209,210,211,212,213,214,215,216,217,218,219,220,221,222,223,224,225,],[-198,44,-153,-116,-117,-118,-119,-120,-121,-122,-123,-124,-125,-126,-127,-128,-129,-130,-131,-132,-133,-134,-135,-136,-137,-138,-139,-140,-141,-142,-143,-144,-145,-146,-147,-148,-149,-150,-151,-152,-198,-198,103,44,155,-197,-98,193,-80,-81,-82,-83,-84,-85,-86,-87,-88,-89,-90,-91,-92,-93,-94,-95,-96,-97,-99,-100,-101,-102,-103,-104,-105,-106,-107,-108,-109,-110,-111,-112,-113,-115,-154,-158,-159,-160,-161,-162,-163,-164,-165,-166,-167,-168,-169,-170,-171,-172,-173,-174,-175,-176,-177,-178,-179,-180,-181,-182,-183,-184,-185,-186,-187,-188,-189,-190,-191,-192,-193,-194,-195,-196,-64,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-65,-66,-67,-68,-69,-70,-71,-72,-73,-74,-75,-76,-77,-78,-79,-114,]),'OPEN_PAREN':([11,24,25,26,27,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,81,82,85,96,97,98,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,135,147,151,152,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,205,206,207,208,209,210,211,212,213,214,215,216,217,218,219,220,221,222,223,224,225,228,],[-198,46,-153,82,-21,-116,-117,-118,-119,-120,-121,-122,-123,-124,-125,-126,-127,-128,-129,-130,-131,-132,-133,-134,-135,-136,-137,-138,-139,-140,-141,-142,-143,-144,-145,-146,-147,-148,-149,-150,-151,-152,-198,-198,82,46,82,-197,-98,82,-80,-81,-82,-83,-84,-85,-86,-87,-88,-89,-90,-91,-92,-93,-94,-95,-96,-97,-99,-100,-101,-102,-103,-104,-105,-106,-107,-108,-109,-110,-111,-112,-113,-115,-154,-158,-159,-160,-161,-162,-163,-164,-165,-166,-167,-168,-169,-170,-171,-172,-173,-174,-175,-176,-177,-178,-179,-180,-181,-182,-183,-184,-185,-186,-187,-188,-189,-190,-191,-192,-193,-194,-195,-196,-22,-64,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-65,-66,-67,-68,-69,-70,-71,-72,-73,-74,-75,-76,-77,-78,-79,-114,230,]),'CLOSE_PAREN':([11,24,25,33,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,81,82,84,86,96,97,98,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,135,147,151,152,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,191,192,193,194,195,196,197,198,199,200,201,202,203,204,205,206,207,208,209,210,211,212,213,214,215,216,217,218,219,220,221,222,223,224,225,230,231,233,236,],[-198,47,-153,-198,-116,-117,-118,-119,-120,-121,-122,-123,-124,-125,-126,-127,-128,-129,-130,-131,-132,-133,-134,-135,-136,-137,-138,-139,-140,-141,-142,-143,-144,-145,-146,-147,-148,-149,-150,-151,-152,-198,-198,-34,-45,47,151,-197,-98,-44,-80,-81,-82,-83,-84,-85,-86,-87,-88,-89,-90,-91,-92,-93,-94,-95,-96,-97,-99,-100,-101,-102,-103,-104,-105,-106,-107,-108,-109,-110,-111,-112,-113,-115,-154,-158,-159,-160,-161,-162,-163,-164,-165,-166,-167,-168,-169,-170,-171,-172,-173,-174,-175,-176,-177,-178,-179,-180,-181,-182,-183,-184,-185,-186,-187,-188,-189,-190,-191,-192,-193,-194,-195,-196,-64,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-65,-66,-67,-68,-69,-70,-71,-72,-73,-74,-75,-76,-77,-78,-79,-114,232,234,-33,-32,]),'OPEN_SQUARE_BRACKET':([11,24,25,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,81,82,85,96,97,98,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,135,147,151,152,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,191,192,193,194,195,196,197,198,199,200,201,202,203,204,205,206,207,208,209,210,211,212,213,214,215,216,217,218,219,220,221,222,223,224,225,],[-198,48,-153,-116,-117,-118,-119,-120,-121,-122,-123,-124,-125,-126,-127,-128,-129,-130,-131,-132,-133,-134,-135,-136,-137,-138,-139,-140,-141,-142,-143,-144,-145,-146,-147,-148,-149,-150,-151,-152,-198,-198,105,48,157,-197,-98,195,-80,-81,-82,-83,-84,-85,-86,-87,-88,-89,-90,-91,-92,-93,-94,-95,-96,-97,-99,-100,-101,-102,-103,-104,-105,-106,-107,-108,-109,-110,-111,-112,-113,-115,-154,-158,-159,-160,-161,-162,-163,-164,-165,-166,-167,-168,-169,-170,-171,-172,-173,-174,-175,-176,-177,-178,-179,-180,-181,-182,-183,-184,-185,-186,-187,-188,-189,-190,-191,-192,-193,-194,-195,-196,-64,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-65,-66,-67,-68,-69,-70,-71,-72,-73,-74,-75,-76,-77,-78,-79,-114,]),'CLOSE_SQUARE_BRACKET':([11,24,25,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,81,82,85,96,97,98,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,135,147,151,152,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,191,192,193,194,195,196,197,198,199,200,201,202,203,204,205,206,207,208,209,210,211,212,213,214,215,216,217,218,219,220,221,222,223,224,225,],[-198,49,-153,-116,-117,-118,-119,-120,-121,-122,-123,-124,-125,-126,-127,-128,-129,-130,-131,-132,-133,-134,-135,-136,-137,-138,-139,-140,-141,-142,-143,-144,-145,-146,-147,-148,-149,-150,-151,-152,-198,-198,106,49,158,-197,-98,196,-80,-81,-82,-83,-84,-85,-86,-87,-88,-89,-90,-91,-92,-93,-94,-95,-96,-97,-99,-100,-101,-102,-103,-104,-105,-106,-107,-108,-109,-110,-111,-112,-113,-115,-154,-158,-159,-160,-161,-162,-163,-164,-165,-166,-167,-168,-169,-170,-171,-172,-173,-174,-175,-176,-177,-178,-179,-180,-181,-182,-183,-184,-185,-186,-187,-188,-189,-190,-191,-192,-193,-194,-195,-196,-64,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-65,-66,-67,-68,-69,-70,-71,-72,-73,-74,-75,-76,-77,-78,-79,-114,]),'COLON':([11,24,25,27,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,81,82,83,85,96,97,98,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,135,147,151,152,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,191,192,193,194,195,196,197,198,199,200,201,202,203,204,205,206,207,208,209,210,211,212,213,214,215,216,217,218,219,220,221,222,223,224,225,],[-198,50,-153,83,-116,-117,-118,-119,-120,-121,-122,-123,-124,-125,-126,-127,-128,-129,-130,-131,-132,-133,-134,-135,-136,-137,-138,-139,-140,-141,-142,-143,-144,-145,-146,-147,-148,-149,-150,-151,-152,-198,-198,99,107,50,159,-197,-98,197,-80,-81,-82,-83,-84,-85,-86,-87,-88,-89,-90,-91,-92,-93,-94,-95,-96,-97,-99,-100,-101,-102,-103,-104,-105,-106,-107,-108,-109,-110,-111,-112,-113,-115,-154,-158,-159,-160,-161,-162,-163,-164,-165,-166,-167,-168,-169,-170,-171,-172,-173,-174,-175,-176,-177,-178,-179,-180,-181,-182,-183,-184,-185,-186,-187,-188,-189,-190,-191,-192,-193,-194,-195,-196,-64,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-65,-66,-67,-68,-69,-70,-71,-72,-73,-74,-75,-76,-77,-78,-79,-114,]),'COMMA':([11,24,25,33,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,81,82,84,86,96,97,98,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,135,147,151,152,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,191,192,193,194,195,196,197,198,199,200,201,202,203,204,205,206,207,208,209,210,211,212,213,214,215,216,217,218,219,220,221,222,223,224,225,231,233,236,],[-198,51,-153,-198,-116,-117,-118,-119,-120,-121,-122,-123,-124,-125,-126,-127,-128,-129,-130,-131,-132,-133,-134,-135,-136,-137,-138,-139,-140,-141,-142,-143,-144,-145,-146,-147,-148,-149,-150,-151,-152,-198,-198,-34,-45,51,161,-197,-98,-44,-80,-81,-82,-83,-84,-85,-86,-87,-88,-89,-90,-91,-92,-93,-94,-95,-96,-97,-99,-100,-101,-102,-103,-104,-105,-106,-107,-108,-109,-110,-111,-112,-113,-115,-154,-158,-159,-160,-161,-162,-163,-164,-165,-166,-167,-168,-169,-170,-171,-172,-173,-174,-175,-176,-177,-178,-179,-180,-181,-182,-183,-184,-185,-186,-187,-188,-189,-190,-191,-192,-193,-194,-195,-196,-64,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-65,-66,-67,-68,-69,-70,-71,-72,-73,-74,-75,-76,-77,-78,-79,-114,235,-33,-32,]),'TAB':([11,24,25,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,81,82,85,96,97,98,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,135,147,151,152,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,191,192,193,194,195,196,197,198,199,200,201,202,203,204,205,206,207,208,209,210,211,212,213,214,215,216,217,218,219,220,221,222,223,224,225,],[-198,52,-153,-116,-117,-118,-119,-120,-121,-122,-123,-124,-125,-126,-127,-128,-129,-130,-131,-132,-133,-134,-135,-136,-137,-138,-139,-140,-141,-142,-143,-144,-145,-146,-147,-148,-149,-150,-151,-152,-198,-198,108,52,162,-197,-98,198,-80,-81,-82,-83,-84,-85,-86,-87,-88,-89,-90,-91,-92,-93,-94,-95,-96,-97,-99,-100,-101,-102,-103,-104,-105,-106,-107,-108,-109,-110,-111,-112,-113,-115,-154,-158,-159,-160,-161,-162,-163,-164,-165,-166,-167,-168,-169,-170,-171,-172,-173,-174,-175,-176,-177,-178,-179,-180,-181,-182,-183,-184,-185,-186,-187,-188,-189,-190,-191,-192,-193,-194,-195,-196,-64,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-65,-66,-67,-68,-69,-70,-71,-72,-73,-74,-75,-76,-77,-78,-79,-114,]),'BACKSLASH':([11,24,25,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,81,82,85,96,97,98,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,135,147,151,152,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,191,192,193,194,195,196,197,198,199,200,201,202,203,204,205,206,207,208,209,210,211,212,213,214,215,216,217,218,219,220,221,222,223,224,225,],[-198,53,-153,-116,-117,-118,-119,-120,-121,-122,-123,-124,-125,-126,-127,-128,-129,-130,-131,-132,-133,-134,-135,-136,-137,-138,-139,-140,-141,-142,-143,-144,-145,-146,-147,-148,-149,-150,-151,-152,-198,-198,109,53,163,-197,-98,199,-80,-81,-82,-83,-84,-85,-86,-87,-88,-89,-90,-91,-92,-93,-94,-95,-96,-97,-99,-100,-101,-102,-103,-104,-105,-106,-107,-108,-109,-110,-111,-112,-113,-115,-154,-158,-159,-160,-161,-162,-163,-164,-165,-166,-167,-168,-169,-170,-171,-172,-173,-174,-175,-176,-177,-178,-179,-180,-181,-182,-183,-184,-185,-186,-187,-188,-189,-190,-191,-192,-193,-194,-195,-196,-64,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-65,-66,-67,-68,-69,-70,-71,-72,-73,-74,-75,-76,-77,-78,-79,-114,]),'PIPE':([11,24,25,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,81,82,85,96,97,98,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,135,147,151,152,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,191,192,193,194,195,196,197,198,199,200,201,202,203,204,205,206,207,208,209,210,211,212,213,214,215,216,217,218,219,220,221,222,223,224,225,],[-198,54,-153,-116,-117,-118,-119,-120,-121,-122,-123,-124,-125,-126,-127,-128,-129,-130,-131,-132,-133,-134,-135,-136,-137,-138,-139,-140,-141,-142,-143,-144,-145,-146,-147,-148,-149,-150,-151,-152,-198,-198,110,54,164,-197,-98,200,-80,-81,-82,-83,-84,-85,-86,-87,-88,-89,-90,-91,-92,-93,-94,-95,-96,-97,-99,-100,-101,-102,-103,-104,-105,-106,-107,-108,-109,-110,-111,-112,-113,-115,-154,-158,-159,-160,-161,-162,-163,-164,-165,-166,-167,-168,-169,-170,-171,-172,-173,-174,-175,-176,-177,-178,-179,-180,-181,-182,-183,-184,-185,-186,-187,-188,-189,-190,-191,-192,-193,-194,-195,-196,-64,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-65,-66,-67,-68,-69,-70,-71,-72,-73,-74,-75,-76,-77,-78,-79,-114,]),'PERCENT':([11,24,25,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,81,82,85,96,97,98,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,135,147,151,152,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,191,192,193,194,195,196,197,198,199,200,201,202,203,204,205,206,207,208,209,210,211,212,213,214,215,216,217,218,219,220,221,222,223,224,225,],[-198,55,-153,-116,-117,-118,-119,-120,-121,-122,-123,-124,-125,-126,-127,-128,-129,-130,-131,-132,-133,-134,-135,-136,-137,-138,-139,-140,-141,-142,-143,-144,-145,-146,-147,-148,-149,-150,-151,-152,-198,-198,111,55,165,-197,-98,201,-80,-81,-82,-83,-84,-85,-86,-87,-88,-89,-90,-91,-92,-93,-94,-95,-96,-97,-99,-100,-101,-102,-103,-104,-105,-106,-107,-108,-109,-110,-111,-112,-113,-115,-154,-158,-159,-160,-161,-162,-163,-164,-165,-166,-167,-168,-169,-170,-171,-172,-173,-174,-175,-176,-177,-178,-179,-180,-181,-182,-183,-184,-185,-186,-187,-188,-189,-190,-191,-192,-193,-194,-195,-196,-64,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-65,-66,-67,-68,-69,-70,-71,-72,-73,-74,-75,-76,-77,-78,-79,-114,]),'EXCLAMATION':([11,24,25,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,81,82,85,96,97,98,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,135,147,151,152,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,191,192,193,194,195,196,197,198,199,200,201,202,203,204,205,206,207,208,209,210,211,212,213,214,215,216,217,218,219,220,221,222,223,224,225,],[-198,56,-153,-116,-117,-118,-119,-120,-121,-122,-123,-124,-125,-126,-127,-128,-129,-130,-131,-132,-133,-134,-135,-136,-137,-138,-139,-140,-141,-142,-143,-144,-145,-146,-147,-148,-149,-150,-151,-152,-198,-198,112,56,166,-197,-98,202,-80,-81,-82,-83,-84,-85,-86,-87,-88,-89,-90,-91,-92,-93,-94,-95,-96,-97,-99,-100,-101,-102,-103,-104,-105,-106,-107,-108,-109,-110,-111,-112,-113,-115,-154,-158,-159,-160,-161,-162,-163,-164,-165,-166,-167,-168,-169,-170,-171,-172,-173,-174,-175,-176,-177,-178,-179,-180,-181,-182,-183,-184,-185,-186,-187,-188,-189,-190,-191,-192,-193,-194,-195,-196,-64,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-65,-66,-67,-68,-69,-70,-71,-72,-73,-74,-75,-76,-77,-78,-79,-114,]),'CARET':([11,24,25,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,81,82,85,96,97,98,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,135,147,151,152,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,191,192,193,194,195,196,197,198,199,200,201,202,203,204,205,206,207,208,209,210,211,212,213,214,215,216,217,218,219,220,221,222,223,224,225,],[-198,57,-153,-116,-117,-118,-119,-120,-121,-122,-123,-124,-125,-126,-127,-128,-129,-130,-131,-132,-133,-134,-135,-136,-137,-138,-139,-140,-141,-142,-143,-144,-145,-146,-147,-148,-149,-150,-151,-152,-198,-198,113,57,167,-197,-98,203,-80,-81,-82,-83,-84,-85,-86,-87,-88,-89,-90,-91,-92,-93,-94,-95,-96,-97,-99,-100,-101,-102,-103,-104,-105,-106,-107,-108,-109,-110,-111,-112,-113,-115,-154,-158,-159,-160,-161,-162,-163,-164,-165,-166,-167,-168,-169,-170,-171,-172,-173,-174,-175,-176,-177,-178,-179,-180,-181,-182,-183,-184,-185,-186,-187,-188,-189,-190,-191,-192,-193,-194,-195,-196,-64,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-65,-66,-67,-68,-69,-70,-71,-72,-73,-74,-75,-76,-77,-78,-79,-114,]),'COMMENT_SINGLELINE':([11,24,25,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,81,82,85,96,97,98,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,135,147,151,152,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,191,192,193,194,195,196,197,198,199,200,201,202,203,204,205,206,207,208,209,210,211,212,213,214,215,216,217,218,219,220,221,222,223,224,225,],[-198,58,-153,-116,-117,-118,-119,-120,-121,-122,-123,-124,-125,-126,-127,-128,-129,-130,-131,-132,-133,-134,-135,-136,-137,-138,-139,-140,-141,-142,-143,-144,-145,-146,-147,-148,-149,-150,-151,-152,-198,-198,114,58,168,-197,-98,204,-80,-81,-82,-83,-84,-85,-86,-87,-88,-89,-90,-91,-92,-93,-94,-95,-96,-97,-99,-100,-101,-102,-103,-104,-105,-106,-107,-108,-109,-110,-111,-112,-113,-115,-154,-158,-159,-160,-161,-162,-163,-164,-165,-166,-167,-168,-169,-170,-171,-172,-173,-174,-175,-176,-177,-178,-179,-180,-181,-182,-183,-184,-185,-186,-187,-188,-189,-190,-191,-192,-193,-194,-195,-196,-64,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-65,-66,-67,-68,-69,-70,-71,-72,-73,-74,-75,-76,-77,-78,-79,-114,]),'COMMENT_MULTILINE':([11,24,25,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,81,82,85,96,97,98,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,135,147,151,152,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,191,192,193,194,195,196,197,198,199,200,201,202,203,204,205,206,207,208,209,210,211,212,213,214,215,216,217,218,219,220,221,222,223,224,225,],[-198,59,-153,-116,-117,-118,-119,-120,-121,-122,-123,-124,-125,-126,-127,-128,-129,-130,-131,-132,-133,-134,-135,-136,-137,-138,-139,-140,-141,-142,-143,-144,-145,-146,-147,-148,-149,-150,-151,-152,-198,-198,115,59,169,-197,-98,205,-80,-81,-82,-83,-84,-85,-86,-87,-88,-89,-90,-91,-92,-93,-94,-95,-96,-97,-99,-100,-101,-102,-103,-104,-105,-106,-107,-108,-109,-110,-111,-112,-113,-115,-154,-158,-159,-160,-161,-162,-163,-164,-165,-166,-167,-168,-169,-170,-171,-172,-173,-174,-175,-176,-177,-178,-179,-180,-181,-182,-183,-184,-185,-186,-187,-188,-189,-190,-191,-192,-193,-194,-195,-196,-64,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-65,-66,-67,-68,-69,-70,-71,-72,-73,-74,-75,-76,-77,-78,-79,-114,]),'PRECOMP_MACRO':([11,24,25,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,81,82,85,96,97,98,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,135,147,151,152,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,191,192,193,194,195,196,197,198,199,200,201,202,203,204,205,206,207,208,209,210,211,212,213,214,215,216,217,218,219,220,221,222,223,224,225,],[-198,60,-153,-116,-117,-118,-119,-120,-121,-122,-123,-124,-125,-126,-127,-128,-129,-130,-131,-132,-133,-134,-135,-136,-137,-138,-139,-140,-141,-142,-143,-144,-145,-146,-147,-148,-149,-150,-151,-152,-198,-198,116,60,170,-197,-98,206,-80,-81,-82,-83,-84,-85,-86,-87,-88,-89,-90,-91,-92,-93,-94,-95,-96,-97,-99,-100,-101,-102,-103,-104,-105,-106,-107,-108,-109,-110,-111,-112,-113,-115,-154,-158,-159,-160,-161,-162,-163,-164,-165,-166,-167,-168,-169,-170,-171,-172,-173,-174,-175,-176,-177,-178,-179,-180,-181,-182,-183,-184,-185,-186,-187,-188,-189,-190,-191,-192,-193,-194,-195,-196,-64,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-65,-66,-67,-68,-69,-70,-71,-72,-73,-74,-75,-76,-77,-78,-79,-114,]),'PRECOMP_MACRO_CONT':([11,24,25,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,81,82,85,96,97,98,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,135,147,151,152,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,191,192,193,194,195,196,197,198,199,200,201,202,203,204,205,206,207,208,209,210,211,212,213,214,215,216,217,218,219,220,221,222,223,224,225,],[-198,61,-153,-116,-117,-118,-119,-120,-121,-122,-123,-124,-125,-126,-127,-128,-129,-130,-131,-132,-133,-134,-135,-136,-137,-138,-139,-140,-141,-142,-143,-144,-145,-146,-147,-148,-149,-150,-151,-152,-198,-198,117,61,171,-197,-98,207,-80,-81,-82,-83,-84,-85,-86,-87,-88,-89,-90,-91,-92,-93,-94,-95,-96,-97,-99,-100,-101,-102,-103,-104,-105,-106,-107,-108,-109,-110,-111,-112,-113,-115,-154,-158,-159,-160,-161,-162,-163,-164,-165,-166,-167,-168,-169,-170,-171,-172,-173,-174,-175,-176,-177,-178,-179,-180,-181,-182,-183,-184,-185,-186,-187,-188,-189,-190,-191,-192,-193,-194,-195,-196,-64,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-65,-66,-67,-68,-69,-70,-71,-72,-73,-74,-75,-76,-77,-78,-79,-114,]),'EQUALS':([11,24,25,33,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,81,82,85,96,97,98,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,135,147,151,152,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,191,192,193,194,195,196,197,198,199,200,201,202,203,204,205,206,207,208,209,210,211,212,213,214,215,216,217,218,219,220,221,222,223,224,225,228,],[-198,64,-153,85,-116,-117,-118,-119,-120,-121,-122,-123,-124,-125,-126,-127,-128,-129,-130,-131,-132,-133,-134,-135,-136,-137,-138,-139,-140,-141,-142,-143,-144,-145,-146,-147,-148,-149,-150,-151,-152,-198,-198,100,64,174,-197,-98,191,-80,-81,-82,-83,-84,-85,-86,-87,-88,-89,-90,-91,-92,-93,-94,-95,-96,-97,-99,-100,-101,-102,-103,-104,-105,-106,-107,-108,-109,-110,-111,-112,-113,-115,-154,-158,-159,-160,-161,-162,-163,-164,-165,-166,-167,-168,-169,-170,-171,-172,-173,-174,-175,-176,-177,-178,-179,-180,-181,-182,-183,-184,-185,-186,-187,-188,-189,-190,-191,-192,-193,-194,-195,-196,-64,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-65,-66,-67,-68,-69,-70,-71,-72,-73,-74,-75,-76,-77,-78,-79,-114,85,]),'MINUS':([11,24,25,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,81,82,85,96,97,98,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,135,147,151,152,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,191,192,193,194,195,196,197,198,199,200,201,202,203,204,205,206,207,208,209,210,211,212,213,214,215,216,217,218,219,220,221,222,223,224,225,],[-198,65,-153,-116,-117,-118,-119,-120,-121,-122,-123,-124,-125,-126,-127,-128,-129,-130,-131,-132,-133,-134,-135,-136,-137,-138,-139,-140,-141,-142,-143,-144,-145,-146,-147,-148,-149,-150,-151,-152,-198,-198,120,65,175,-197,-98,210,-80,-81,-82,-83,-84,-85,-86,-87,-88,-89,-90,-91,-92,-93,-94,-95,-96,-97,-99,-100,-101,-102,-103,-104,-105,-106,-107,-108,-109,-110,-111,-112,-113,-115,-154,-158,-159,-160,-161,-162,-163,-164,-165,-166,-167,-168,-169,-170,-171,-172,-173,-174,-175,-176,-177,-178,-179,-180,-181,-182,-183,-184,-185,-186,-187,-188,-189,-190,-191,-192,-193,-194,-195,-196,-64,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-65,-66,-67,-68,-69,-70,-71,-72,-73,-74,-75,-76,-77,-78,-79,-114,]),'PLUS':([11,24,25,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,81,82,85,96,97,98,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,135,147,151,152,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,191,192,193,194,195,196,197,198,199,200,201,202,203,204,205,206,207,208,209,210,211,212,213,214,215,216,217,218,219,220,221,222,223,224,225,],[-198,66,-153,-116,-117,-118,-119,-120,-121,-122,-123,-124,-125,-126,-127,-128,-129,-130,-131,-132,-133,-134,-135,-136,-137,-138,-139,-140,-141,-142,-143,-144,-145,-146,-147,-148,-149,-150,-151,-152,-198,-198,121,66,176,-197,-98,211,-80,-81,-82,-83,-84,-85,-86,-87,-88,-89,-90,-91,-92,-93,-94,-95,-96,-97,-99,-100,-101,-102,-103,-104,-105,-106,-107,-108,-109,-110,-111,-112,-113,-115,-154,-158,-159,-160,-161,-162,-163,-164,-165,-166,-167,-168,-169,-170,-171,-172,-173,-174,-175,-176,-177,-178,-179,-180,-181,-182,-183,-184,-185,-186,-187,-188,-189,-190,-191,-192,-193,-194,-195,-196,-64,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-65,-66,-67,-68,-69,-70,-71,-72,-73,-74,-75,-76,-77,-78,-79,-114,]),'DIVIDE':([11,24,25,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,81,82,85,96,97,98,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,135,147,151,152,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,191,192,193,194,195,196,197,198,199,200,201,202,203,204,205,206,207,208,209,210,211,212,213,214,215,216,217,218,219,220,221,222,223,224,225,],[-198,67,-153,-116,-117,-118,-119,-120,-121,-122,-123,-124,-125,-126,-127,-128,-129,-130,-131,-132,-133,-134,-135,-136,-137,-138,-139,-140,-141,-142,-143,-144,-145,-146,-147,-148,-149,-150,-151,-152,-198,-198,122,67,177,-197,-98,212,-80,-81,-82,-83,-84,-85,-86,-87,-88,-89,-90,-91,-92,-93,-94,-95,-96,-97,-99,-100,-101,-102,-103,-104,-105,-106,-107,-108,-109,-110,-111,-112,-113,-115,-154,-158,-159,-160,-161,-162,-163,-164,-165,-166,-167,-168,-169,-170,-171,-172,-173,-174,-175,-176,-177,-178,-179,-180,-181,-182,-183,-184,-185,-186,-187,-188,-189,-190,-191,-192,-193,-194,-195,-196,-64,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-65,-66,-67,-68,-69,-70,-71,-72,-73,-74,-75,-76,-77,-78,-79,-114,]),'CHAR_LITERAL':([11,24,25,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,81,82,85,96,97,98,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,135,147,151,152,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,191,192,193,194,195,196,197,198,199,200,201,202,203,204,205,206,207,208,209,210,211,212,213,214,215,216,217,218,219,220,221,222,223,224,225,],[-198,68,-153,-116,-117,-118,-119,-120,-121,-122,-123,-124,-125,-126,-127,-128,-129,-130,-131,-132,-133,-134,-135,-136,-137,-138,-139,-140,-141,-142,-143,-144,-145,-146,-147,-148,-149,-150,-151,-152,-198,-198,123,68,178,-197,-98,213,-80,-81,-82,-83,-84,-85,-86,-87,-88,-89,-90,-91,-92,-93,-94,-95,-96,-97,-99,-100,-101,-102,-103,-104,-105,-106,-107,-108,-109,-110,-111,-112,-113,-115,-154,-158,-159,-160,-161,-162,-163,-164,-165,-166,-167,-168,-169,-170,-171,-172,-173,-174,-175,-176,-177,-178,-179,-180,-181,-182,-183,-184,-185,-186,-187,-188,-189,-190,-191,-192,-193,-194,-195,-196,-64,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-65,-66,-67,-68,-69,-70,-71,-72,-73,-74,-75,-76,-77,-78,-79,-114,]),'STRING_LITERAL':([11,24,25,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,81,82,85,96,97,98,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,135,147,151,152,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,191,192,193,194,195,196,197,198,199,200,201,202,203,204,205,206,207,208,209,210,211,212,213,214,215,216,217,218,219,220,221,222,223,224,225,],[-198,69,-153,-116,-117,-118,-119,-120,-121,-122,-123,-124,-125,-126,-127,-128,-129,-130,-131,-132,-133,-134,-135,-136,-137,-138,-139,-140,-141,-142,-143,-144,-145,-146,-147,-148,-149,-150,-151,-152,-198,-198,124,69,179,-197,-98,214,-80,-81,-82,-83,-84,-85,-86,-87,-88,-89,-90,-91,-92,-93,-94,-95,-96,-97,-99,-100,-101,-102,-103,-104,-105,-106,-107,-108,-109,-110,-111,-112,-113,-115,-154,-158,-159,-160,-161,-162,-163,-164,-165,-166,-167,-168,-169,-170,-171,-172,-173,-174,-175,-176,-177,-178,-179,-180,-181,-182,-183,-184,-185,-186,-187,-188,-189,-190,-191,-192,-193,-194,-195,-196,-64,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-65,-66,-67,-68,-69,-70,-71,-72,-73,-74,-75,-76,-77,-78,-79,-114,]),'NEW_LINE':([11,24,25,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,81,82,85,96,97,98,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,135,147,151,152,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,191,192,193,194,195,196,197,198,199,200,201,202,203,204,205,206,207,208,209,210,211,212,213,214,215,216,217,218,219,220,221,222,223,224,225,],[-198,70,-153,-116,-117,-118,-119,-120,-121,-122,-123,-124,-125,-126,-127,-128,-129,-130,-131,-132,-133,-134,-135,-136,-137,-138,-139,-140,-141,-142,-143,-144,-145,-146,-147,-148,-149,-150,-151,-152,-198,-198,125,70,180,-197,-98,215,-80,-81,-82,-83,-84,-85,-86,-87,-88,-89,-90,-91,-92,-93,-94,-95,-96,-97,-99,-100,-101,-102,-103,-104,-105,-106,-107,-108,-109,-110,-111,-112,-113,-115,-154,-158,-159,-160,-161,-162,-163,-164,-165,-166,-167,-168,-169,-170,-171,-172,-173,-174,-175,-176,-177,-178,-179,-180,-181,-182,-183,-184,-185,-186,-187,-188,-189,-190,-191,-192,-193,-194,-195,-196,-64,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-65,-66,-67,-68,-69,-70,-71,-72,-73,-74,-75,-76,-77,-78,-79,-114,]),'SQUOTE':([11,24,25,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,81,82,85,96,97,98,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,135,147,151,152,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,191,192,193,194,195,196,197,198,199,200,201,202,203,204,205,206,207,208,209,210,211,212,213,214,215,216,217,218,219,220,221,222,223,224,225,],[-198,71,-153,-116,-117,-118,-119,-120,-121,-122,-123,-124,-125,-126,-127,-128,-129,-130,-131,-132,-133,-134,-135,-136,-137,-138,-139,-140,-141,-142,-143,-144,-145,-146,-147,-148,-149,-150,-151,-152,-198,-198,126,71,181,-197,-98,216,-80,-81,-82,-83,-84,-85,-86,-87,-88,-89,-90,-91,-92,-93,-94,-95,-96,-97,-99,-100,-101,-102,-103,-104,-105,-106,-107,-108,-109,-110,-111,-112,-113,-115,-154,-158,-159,-160,-161,-162,-163,-164,-165,-166,-167,-168,-169,-170,-171,-172,-173,-174,-175,-176,-177,-178,-179,-180,-181,-182,-183,-184,-185,-186,-187,-188,-189,-190,-191,-192,-193,-194,-195,-196,-64,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-65,-66,-67,-68,-69,-70,-71,-72,-73,-74,-75,-76,-77,-78,-79,-114,]),'REFERENCE':([11,24,25,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,81,82,85,96,97,98,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,135,147,151,152,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,191,192,193,194,195,196,197,198,199,200,201,202,203,204,205,206,207,208,209,210,211,212,213,214,215,216,217,218,219,220,221,222,223,224,225,],[-198,72,-153,-116,-117,-118,-119,-120,-121,-122,-123,-124,-125,-126,-127,-128,-129,-130,-131,-132,-133,-134,-135,-136,-137,-138,-139,-140,-141,-142,-143,-144,-145,-146,-147,-148,-149,-150,-151,-152,-198,-198,127,72,182,-197,-98,217,-80,-81,-82,-83,-84,-85,-86,-87,-88,-89,-90,-91,-92,-93,-94,-95,-96,-97,-99,-100,-101,-102,-103,-104,-105,-106,-107,-108,-109,-110,-111,-112,-113,-115,-154,-158,-159,-160,-161,-162,-163,-164,-165,-166,-167,-168,-169,-170,-171,-172,-173,-174,-175,-176,-177,-178,-179,-180,-181,-182,-183,-184,-185,-186,-187,-188,-189,-190,-191,-192,-193,-194,-195,-196,-64,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-65,-66,-67,-68,-69,-70,-71,-72,-73,-74,-75,-76,-77,-78,-79,-114,]),'DOT':([11,24,25,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,81,82,85,96,97,98,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,135,147,151,152,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,191,192,193,194,195,196,197,198,199,200,201,202,203,204,205,206,207,208,209,210,211,212,213,214,215,216,217,218,219,220,221,222,223,224,225,],[-198,73,-153,-116,-117,-118,-119,-120,-121,-122,-123,-124,-125,-126,-127,-128,-129,-130,-131,-132,-133,-134,-135,-136,-137,-138,-139,-140,-141,-142,-143,-144,-145,-146,-147,-148,-149,-150,-151,-152,-198,-198,128,73,183,-197,-98,218,-80,-81,-82,-83,-84,-85,-86,-87,-88,-89,-90,-91,-92,-93,-94,-95,-96,-97,-99,-100,-101,-102,-103,-104,-105,-106,-107,-108,-109,-110,-111,-112,-113,-115,-154,-158,-159,-160,-161,-162,-163,-164,-165,-166,-167,-168,-169,-170,-171,-172,-173,-174,-175,-176,-177,-178,-179,-180,-181,-182,-183,-184,-185,-186,-187,-188,-189,-190,-191,-192,-193,-194,-195,-196,-64,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-65,-66,-67,-68,-69,-70,-71,-72,-73,-74,-75,-76,-77,-78,-79,-114,]),'SMALL':([11,24,25,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,81,82,85,96,97,98,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,135,147,151,152,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,191,192,193,194,195,196,197,198,199,200,201,202,203,204,205,206,207,208,209,210,211,212,213,214,215,216,217,218,219,220,221,222,223,224,225,],[-198,74,-153,-116,-117,-118,-119,-120,-121,-122,-123,-124,-125,-126,-127,-128,-129,-130,-131,-132,-133,-134,-135,-136,-137,-138,-139,-140,-141,-142,-143,-144,-145,-146,-147,-148,-149,-150,-151,-152,-198,-198,129,74,184,-197,-98,219,-80,-81,-82,-83,-84,-85,-86,-87,-88,-89,-90,-91,-92,-93,-94,-95,-96,-97,-99,-100,-101,-102,-103,-104,-105,-106,-107,-108,-109,-110,-111,-112,-113,-115,-154,-158,-159,-160,-161,-162,-163,-164,-165,-166,-167,-168,-169,-170,-171,-172,-173,-174,-175,-176,-177,-178,-179,-180,-181,-182,-183,-184,-185,-186,-187,-188,-189,-190,-191,-192,-193,-194,-195,-196,-64,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-65,-66,-67,-68,-69,-70,-71,-72,-73,-74,-75,-76,-77,-78,-79,-114,]),'LARGE':([11,24,25,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,81,82,85,96,97,98,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,135,147,151,152,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,191,192,193,194,195,196,197,198,199,200,201,202,203,204,205,206,207,208,209,210,211,212,213,214,215,216,217,218,219,220,221,222,223,224,225,],[-198,75,-153,-116,-117,-118,-119,-120,-121,-122,-123,-124,-125,-126,-127,-128,-129,-130,-131,-132,-133,-134,-135,-136,-137,-138,-139,-140,-141,-142,-143,-144,-145,-146,-147,-148,-149,-150,-151,-152,-198,-198,130,75,185,-197,-98,220,-80,-81,-82,-83,-84,-85,-86,-87,-88,-89,-90,-91,-92,-93,-94,-95,-96,-97,-99,-100,-101,-102,-103,-104,-105,-106,-107,-108,-109,-110,-111,-112,-113,-115,-154,-158,-159,-160,-161,-162,-163,-164,-165,-166,-167,-168,-169,-170,-171,-172,-173,-174,-175,-176,-177,-178,-179,-180,-181,-182,-183,-184,-185,-186,-187,-188,-189,-190,-191,-192,-193,-194,-195,-196,-64,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-65,-66,-67,-68,-69,-70,-71,-72,-73,-74,-75,-76,-77,-78,-79,-114,]),'STRING':([11,24,25,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,81,82,85,96,97,98,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,135,147,151,152,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,191,192,193,194,195,196,197,198,199,200,201,202,203,204,205,206,207,208,209,210,211,212,213,214,215,216,217,218,219,220,221,222,223,224,225,],[-198,76,-153,-116,-117,-118,-119,-120,-121,-122,-123,-124,-125,-126,-127,-128,-129,-130,-131,-132,-133,-134,-135,-136,-137,-138,-139,-140,-141,-142,-143,-144,-145,-146,-147,-148,-149,-150,-151,-152,-198,-198,131,76,186,-197,-98,221,-80,-81,-82,-83,-84,-85,-86,-87,-88,-89,-90,-91,-92,-93,-94,-95,-96,-97,-99,-100,-101,-102,-103,-104,-105,-106,-107,-108,-109,-110,-111,-112,-113,-115,-154,-158,-159,-160,-161,-162,-163,-164,-165,-166,-167,-168,-169,-170,-171,-172,-173,-174,-175,-176,-177,-178,-179,-180,-181,-182,-183,-184,-185,-186,-187,-188,-189,-190,-191,-192,-193,-194,-195,-196,-64,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-65,-66,-67,-68,-69,-70,-71,-72,-73,-74,-75,-76,-77,-78,-79,-114,]),'OPEN_BRACE':([11,21,22,23,24,25,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,94,95,96,97,98,147,148,149,151,152,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,],[-198,39,40,41,80,-153,-116,-117,-118,-119,-120,-121,-122,-123,-124,-125,-126,-127,-128,-129,-130,-131,-132,-133,-134,-135,-136,-137,-138,-139,-140,-141,-142,-143,-144,-145,-146,-147,-148,-149,-150,-151,-152,-198,-198,-198,80,-157,80,80,-197,-154,-155,-156,-158,-159,-160,-161,-162,-163,-164,-165,-166,-167,-168,-169,-170,-171,-172,-173,-174,-175,-176,-177,-178,-179,-180,-181,-182,-183,-184,-185,-186,-187,-188,-189,-190,-191,-192,-193,-194,-195,-196,]),'CLOSE_BRACE':([39,40,41,80,89,90,91,92,93,94,95,140,145,147,148,149,226,227,229,],[-198,-198,-198,-198,138,-26,143,-29,146,147,-157,-25,-28,-154,-155,-156,-23,-24,-27,]),'TOKENS':([80,94,95,147,148,149,],[-198,149,-157,-154,-155,-156,]),}
+
+_lr_action = {}
+for _k, _v in _lr_action_items.items():
+   for _x,_y in zip(_v[0],_v[1]):
+      if not _x in _lr_action:  _lr_action[_x] = {}
+      _lr_action[_x][_k] = _y
+del _lr_action_items
+
+_lr_goto_items = {'program':([0,],[1,]),'definitions':([0,],[2,]),'empty':([0,5,11,33,34,39,40,41,80,81,82,89,91,93,228,230,235,],[3,20,25,86,88,90,92,92,95,25,98,20,20,20,86,20,20,]),'definition':([2,],[4,]),'signature':([2,],[12,]),'variable':([5,89,91,93,230,235,],[17,139,144,144,233,236,]),'qualified_type':([5,89,91,93,230,235,],[18,142,18,18,18,18,]),'qualifiers':([5,89,91,93,230,235,],[19,19,19,19,19,19,]),'words':([11,81,],[24,96,]),'method_name':([12,],[26,]),'type_name':([19,],[34,]),'block':([24,94,96,97,],[42,148,150,153,]),'parens':([26,85,97,101,],[81,135,152,225,]),'initializer':([33,228,],[84,84,]),'specials':([34,],[87,]),'members':([39,],[89,]),'fields':([40,41,],[91,93,]),'body':([80,],[94,]),'arguments':([82,],[97,]),'expression':([85,],[101,]),'method_declaration':([89,],[141,]),'parameters':([230,],[231,]),}
+
+_lr_goto = {}
+for _k, _v in _lr_goto_items.items():
+   for _x, _y in zip(_v[0], _v[1]):
+       if not _x in _lr_goto: _lr_goto[_x] = {}
+       _lr_goto[_x][_k] = _y
+del _lr_goto_items
+_lr_productions = [
+  ("S' -> program","S'",1,None,None,None),
+  ('program -> definitions','program',1,'p_program','ProgramGrammar.py',182),
+  ('definitions -> definitions definition','definitions',2,'p_definitions','ProgramGrammar.py',186),
+  ('definitions -> empty','definitions',1,'p_definitions','ProgramGrammar.py',187),
+  ('definition -> CONFIGURABLE variable SEMI_COLON','definition',3,'p_definition_configurable','ProgramGrammar.py',194),
+  ('definition -> ACTORCLASS NAME OPEN_BRACE members CLOSE_BRACE','definition',5,'p_definition_actorclass','ProgramGrammar.py',198),
+  ('definition -> STRUCT NAME OPEN_BRACE fields CLOSE_BRACE','definition',5,'p_definition_record','ProgramGrammar.py',203),
+  ('definition -> MESSAGE NAME OPEN_BRACE fields CLOSE_BRACE','definition',5,'p_definition_record','ProgramGrammar.py',204),
+  ('definition -> UPCALL words block','definition',3,'p_definition_upcall','ProgramGrammar.py',209),
+  ('definition -> signature method_name parens words block','definition',5,'p_definition_method','ProgramGrammar.py',213),
+  ('definition -> SEMI_COLON','definition',1,'p_definition_semi_colon','ProgramGrammar.py',227),
+  ('signature -> signature NAME','signature',2,'p_signature','ProgramGrammar.py',233),
+  ('signature -> signature COLLECTION_TYPE','signature',2,'p_signature','ProgramGrammar.py',234),
+  ('signature -> signature ASTERISK','signature',2,'p_signature','ProgramGrammar.py',235),
+  ('signature -> signature AMPERSTAND','signature',2,'p_signature','ProgramGrammar.py',236),
+  ('signature -> signature CONST','signature',2,'p_signature','ProgramGrammar.py',237),
+  ('signature -> NAME','signature',1,'p_signature_first','ProgramGrammar.py',237),
+  ('signature -> COLLECTION_TYPE','signature',1,'p_signature_first','ProgramGrammar.py',238),
+  ('signature -> ASTERISK','signature',1,'p_signature_first','ProgramGrammar.py',239),
+  ('signature -> AMPERSTAND','signature',1,'p_signature_first','ProgramGrammar.py',240),
+  ('signature -> CONST','signature',1,'p_signature_first','ProgramGrammar.py',241),
+  ('method_name -> NAME','method_name',1,'p_method_name','ProgramGrammar.py',241),
+  ('method_name -> NAME COLON COLON NAME','method_name',4,'p_method_name_actorclass','ProgramGrammar.py',245),
+  ('members -> members variable SEMI_COLON','members',3,'p_members','ProgramGrammar.py',251),
+  ('members -> members method_declaration SEMI_COLON','members',3,'p_members','ProgramGrammar.py',252),
+  ('members -> members SEMI_COLON','members',2,'p_members_empty','ProgramGrammar.py',257),
+  ('members -> empty','members',1,'p_members_empty','ProgramGrammar.py',258),
+  ('fields -> fields variable SEMI_COLON','fields',3,'p_fields','ProgramGrammar.py',265),
+  ('fields -> fields SEMI_COLON','fields',2,'p_fields_empty','ProgramGrammar.py',270),
+  ('fields -> empty','fields',1,'p_fields_empty','ProgramGrammar.py',271),
+  ('method_declaration -> qualified_type NAME OPEN_PAREN parameters CLOSE_PAREN','method_declaration',5,'p_method_declaration','ProgramGrammar.py',278),
+  ('method_declaration -> qualified_type NAME OPEN_PAREN CLOSE_PAREN','method_declaration',4,'p_method_declaration','ProgramGrammar.py',279),
+  ('parameters -> parameters COMMA variable','parameters',3,'p_parameters','ProgramGrammar.py',287),
+  ('parameters -> variable','parameters',1,'p_parameters_first','ProgramGrammar.py',292),
+  ('variable -> qualified_type NAME initializer','variable',3,'p_variable','ProgramGrammar.py',296),
+  ('qualified_type -> qualifiers type_name specials','qualified_type',3,'p_qualified_type','ProgramGrammar.py',300),
+  ('qualifiers -> qualifiers CONST','qualifiers',2,'p_qualifiers','ProgramGrammar.py',304),
+  ('qualifiers -> qualifiers YIELD','qualifiers',2,'p_qualifiers','ProgramGrammar.py',305),
+  ('qualifiers -> empty','qualifiers',1,'p_qualifiers_empty','ProgramGrammar.py',310),
+  ('type_name -> NAME','type_name',1,'p_type_name','ProgramGrammar.py',314),
+  ('type_name -> COLLECTION_TYPE','type_name',1,'p_type_name','ProgramGrammar.py',315),
+  ('specials -> specials ASTERISK','specials',2,'p_specials','ProgramGrammar.py',319),
+  ('specials -> specials AMPERSTAND','specials',2,'p_specials','ProgramGrammar.py',320),
+  ('specials -> empty','specials',1,'p_specials_empty','ProgramGrammar.py',324),
+  ('initializer -> EQUALS expression','initializer',2,'p_initializer','ProgramGrammar.py',328),
+  ('initializer -> empty','initializer',1,'p_initializer_empty','ProgramGrammar.py',332),
+  ('expression -> expression NUMBER','expression',2,'p_expression','ProgramGrammar.py',339),
+  ('expression -> expression FLOAT_NUMBER','expression',2,'p_expression','ProgramGrammar.py',340),
+  ('expression -> expression NAME','expression',2,'p_expression','ProgramGrammar.py',341),
+  ('expression -> expression OPEN_SQUARE_BRACKET','expression',2,'p_expression','ProgramGrammar.py',342),
+  ('expression -> expression CLOSE_SQUARE_BRACKET','expression',2,'p_expression','ProgramGrammar.py',343),
+  ('expression -> expression COLON','expression',2,'p_expression','ProgramGrammar.py',344),
+  ('expression -> expression TAB','expression',2,'p_expression','ProgramGrammar.py',345),
+  ('expression -> expression BACKSLASH','expression',2,'p_expression','ProgramGrammar.py',346),
+  ('expression -> expression PIPE','expression',2,'p_expression','ProgramGrammar.py',347),
+  ('expression -> expression PERCENT','expression',2,'p_expression','ProgramGrammar.py',348),
+  ('expression -> expression EXCLAMATION','expression',2,'p_expression','ProgramGrammar.py',349),
+  ('expression -> expression CARET','expression',2,'p_expression','ProgramGrammar.py',350),
+  ('expression -> expression COMMENT_SINGLELINE','expression',2,'p_expression','ProgramGrammar.py',351),
+  ('expression -> expression COMMENT_MULTILINE','expression',2,'p_expression','ProgramGrammar.py',352),
+  ('expression -> expression PRECOMP_MACRO','expression',2,'p_expression','ProgramGrammar.py',353),
+  ('expression -> expression PRECOMP_MACRO_CONT','expression',2,'p_expression','ProgramGrammar.py',354),
+  ('expression -> expression ASTERISK','expression',2,'p_expression','ProgramGrammar.py',355),
+  ('expression -> expression AMPERSTAND','expression',2,'p_expression','ProgramGrammar.py',356),
+  ('expression -> expression EQUALS','expression',2,'p_expression','ProgramGrammar.py',357),
+  ('expression -> expression MINUS','expression',2,'p_expression','ProgramGrammar.py',358),
+  ('expression -> expression PLUS','expression',2,'p_expression','ProgramGrammar.py',359),
+  ('expression -> expression DIVIDE','expression',2,'p_expression','ProgramGrammar.py',360),
+  ('expression -> expression CHAR_LITERAL','expression',2,'p_expression','ProgramGrammar.py',361),
+  ('expression -> expression STRING_LITERAL','expression',2,'p_expression','ProgramGrammar.py',362),
+  ('expression -> expression NEW_LINE','expression',2,'p_expression','ProgramGrammar.py',363),
+  ('expression -> expression SQUOTE','expression',2,'p_expression','ProgramGrammar.py',364),
+  ('expression -> expression REFERENCE','expression',2,'p_expression','ProgramGrammar.py',365),
+  ('expression -> expression DOT','expression',2,'p_expression','ProgramGrammar.py',366),
+  ('expression -> expression SMALL','expression',2,'p_expression','ProgramGrammar.py',367),
+  ('expression -> expression LARGE','expression',2,'p_expression','ProgramGrammar.py',368),
+  ('expression -> expression STRING','expression',2,'p_expression','ProgramGrammar.py',369),
+  ('expression -> expression COLLECTION_TYPE','expression',2,'p_expression','ProgramGrammar.py',370),
+  ('expression -> expression CONST','expression',2,'p_expression','ProgramGrammar.py',371),
+  ('expression -> expression YIELD','expression',2,'p_expression','ProgramGrammar.py',372),
+  ('expression -> NUMBER','expression',1,'p_expression','ProgramGrammar.py',373),
+  ('expression -> FLOAT_NUMBER','expression',1,'p_expression','ProgramGrammar.py',374),
+  ('expression -> NAME','expression',1,'p_expression','ProgramGrammar.py',375),
+  ('expression -> OPEN_SQUARE_BRACKET','expression',1,'p_expression','ProgramGrammar.py',376),
+  ('expression -> CLOSE_SQUARE_BRACKET','expression',1,'p_expression','ProgramGrammar.py',377),
+  ('expression -> COLON','expression',1,'p_expression','ProgramGrammar.py',378),
+  ('expression -> TAB','expression',1,'p_expression','ProgramGrammar.py',379),
+  ('expression -> BACKSLASH','expression',1,'p_expression','ProgramGrammar.py',380),
+  ('expression -> PIPE','expression',1,'p_expression','ProgramGrammar.py',381),
+  ('expression -> PERCENT','expression',1,'p_expression','ProgramGrammar.py',382),
+  ('expression -> EXCLAMATION','expression',1,'p_expression','ProgramGrammar.py',383),
+  ('expression -> CARET','expression',1,'p_expression','ProgramGrammar.py',384),
+  ('expression -> COMMENT_SINGLELINE','expression',1,'p_expression','ProgramGrammar.py',385),
+  ('expression -> COMMENT_MULTILINE','expression',1,'p_expression','ProgramGrammar.py',386),
+  ('expression -> PRECOMP_MACRO','expression',1,'p_expression','ProgramGrammar.py',387),
+  ('expression -> PRECOMP_MACRO_CONT','expression',1,'p_expression','ProgramGrammar.py',388),
+  ('expression -> ASTERISK','expression',1,'p_expression','ProgramGrammar.py',389),
+  ('expression -> AMPERSTAND','expression',1,'p_expression','ProgramGrammar.py',390),
+  ('expression -> EQUALS','expression',1,'p_expression','ProgramGrammar.py',391),
+  ('expression -> MINUS','expression',1,'p_expression','ProgramGrammar.py',392),
+  ('expression -> PLUS','expression',1,'p_expression','ProgramGrammar.py',393),
+  ('expression -> DIVIDE','expression',1,'p_expression','ProgramGrammar.py',394),
+  ('expression -> CHAR_LITERAL','expression',1,'p_expression','ProgramGrammar.py',395),
+  ('expression -> STRING_LITERAL','expression',1,'p_expression','ProgramGrammar.py',396),
+  ('expression -> NEW_LINE','expression',1,'p_expression','ProgramGrammar.py',397),
+  ('expression -> SQUOTE','expression',1,'p_expression','ProgramGrammar.py',398),
+  ('expression -> REFERENCE','expression',1,'p_expression','ProgramGrammar.py',399),
+  ('expression -> DOT','expression',1,'p_expression','ProgramGrammar.py',400),
+  ('expression -> SMALL','expression',1,'p_expression','ProgramGrammar.py',401),
+  ('expression -> LARGE','expression',1,'p_expression','ProgramGrammar.py',402),
+  ('expression -> STRING','expression',1,'p_expression','ProgramGrammar.py',403),
+  ('expression -> COLLECTION_TYPE','expression',1,'p_expression','ProgramGrammar.py',404),
+  ('expression -> CONST','expression',1,'p_expression','ProgramGrammar.py',405),
+  ('expression -> YIELD','expression',1,'p_expression','ProgramGrammar.py',406),
+  ('expression -> expression parens','expression',2,'p_expression_parens','ProgramGrammar.py',343),
+  ('expression -> parens','expression',1,'p_expression_parens','ProgramGrammar.py',344),
+  ('words -> words NUMBER','words',2,'p_words','ProgramGrammar.py',350),
+  ('words -> words FLOAT_NUMBER','words',2,'p_words','ProgramGrammar.py',351),
+  ('words -> words NAME','words',2,'p_words','ProgramGrammar.py',352),
+  ('words -> words OPEN_PAREN','words',2,'p_words','ProgramGrammar.py',353),
+  ('words -> words CLOSE_PAREN','words',2,'p_words','ProgramGrammar.py',354),
+  ('words -> words OPEN_SQUARE_BRACKET','words',2,'p_words','ProgramGrammar.py',355),
+  ('words -> words CLOSE_SQUARE_BRACKET','words',2,'p_words','ProgramGrammar.py',356),
+  ('words -> words COLON','words',2,'p_words','ProgramGrammar.py',357),
+  ('words -> words COMMA','words',2,'p_words','ProgramGrammar.py',358),
+  ('words -> words TAB','words',2,'p_words','ProgramGrammar.py',359),
+  ('words -> words BACKSLASH','words',2,'p_words','ProgramGrammar.py',360),
+  ('words -> words PIPE','words',2,'p_words','ProgramGrammar.py',361),
+  ('words -> words PERCENT','words',2,'p_words','ProgramGrammar.py',362),
+  ('words -> words EXCLAMATION','words',2,'p_words','ProgramGrammar.py',363),
+  ('words -> words CARET','words',2,'p_words','ProgramGrammar.py',364),
+  ('words -> words COMMENT_SINGLELINE','words',2,'p_words','ProgramGrammar.py',365),
+  ('words -> words COMMENT_MULTILINE','words',2,'p_words','ProgramGrammar.py',366),
+  ('words -> words PRECOMP_MACRO','words',2,'p_words','ProgramGrammar.py',367),
+  ('words -> words PRECOMP_MACRO_CONT','words',2,'p_words','ProgramGrammar.py',368),
+  ('words -> words ASTERISK','words',2,'p_words','ProgramGrammar.py',369),
+  ('words -> words AMPERSTAND','words',2,'p_words','ProgramGrammar.py',370),
+  ('words -> words EQUALS','words',2,'p_words','ProgramGrammar.py',371),
+  ('words -> words MINUS','words',2,'p_words','ProgramGrammar.py',372),
+  ('words -> words PLUS','words',2,'p_words','ProgramGrammar.py',373),
+  ('words -> words DIVIDE','words',2,'p_words','ProgramGrammar.py',374),
+  ('words -> words CHAR_LITERAL','words',2,'p_words','ProgramGrammar.py',375),
+  ('words -> words STRING_LITERAL','words',2,'p_words','ProgramGrammar.py',376),
+  ('words -> words NEW_LINE','words',2,'p_words','ProgramGrammar.py',377),
+  ('words -> words SQUOTE','words',2,'p_words','ProgramGrammar.py',378),
+  ('words -> words REFERENCE','words',2,'p_words','ProgramGrammar.py',379),
+  ('words -> words DOT','words',2,'p_words','ProgramGrammar.py',380),
+  ('words -> words SMALL','words',2,'p_words','ProgramGrammar.py',381),
+  ('words -> words LARGE','words',2,'p_words','ProgramGrammar.py',382),
+  ('words -> words STRING','words',2,'p_words','ProgramGrammar.py',383),
+  ('words -> words COLLECTION_TYPE','words',2,'p_words','ProgramGrammar.py',384),
+  ('words -> words CONST','words',2,'p_words','ProgramGrammar.py',385),
+  ('words -> words YIELD','words',2,'p_words','ProgramGrammar.py',386),
+  ('words -> empty','words',1,'p_words','ProgramGrammar.py',387),
+  ('block -> OPEN_BRACE body CLOSE_BRACE','block',3,'p_block','ProgramGrammar.py',354),
+  ('body -> body block','body',2,'p_body','ProgramGrammar.py',359),
+  ('body -> body TOKENS','body',2,'p_body','ProgramGrammar.py',360),
+  ('body -> empty','body',1,'p_body','ProgramGrammar.py',361),
+  ('parens -> OPEN_PAREN arguments CLOSE_PAREN','parens',3,'p_parens','ProgramGrammar.py',365),
+  ('arguments -> arguments parens','arguments',2,'p_arguments','ProgramGrammar.py',369),
+  ('arguments -> arguments block','arguments',2,'p_arguments','ProgramGrammar.py',370),
+  ('arguments -> arguments NUMBER','arguments',2,'p_arguments','ProgramGrammar.py',371),
+  ('arguments -> arguments FLOAT_NUMBER','arguments',2,'p_arguments','ProgramGrammar.py',372),
+  ('arguments -> arguments NAME','arguments',2,'p_arguments','ProgramGrammar.py',373),
+  ('arguments -> arguments OPEN_SQUARE_BRACKET','arguments',2,'p_arguments','ProgramGrammar.py',374),
+  ('arguments -> arguments CLOSE_SQUARE_BRACKET','arguments',2,'p_arguments','ProgramGrammar.py',375),
+  ('arguments -> arguments COLON','arguments',2,'p_arguments','ProgramGrammar.py',376),
+  ('arguments -> arguments SEMI_COLON','arguments',2,'p_arguments','ProgramGrammar.py',377),
+  ('arguments -> arguments COMMA','arguments',2,'p_arguments','ProgramGrammar.py',378),
+  ('arguments -> arguments TAB','arguments',2,'p_arguments','ProgramGrammar.py',379),
+  ('arguments -> arguments BACKSLASH','arguments',2,'p_arguments','ProgramGrammar.py',380),
+  ('arguments -> arguments PIPE','arguments',2,'p_arguments','ProgramGrammar.py',381),
+  ('arguments -> arguments PERCENT','arguments',2,'p_arguments','ProgramGrammar.py',382),
+  ('arguments -> arguments EXCLAMATION','arguments',2,'p_arguments','ProgramGrammar.py',383),
+  ('arguments -> arguments CARET','arguments',2,'p_arguments','ProgramGrammar.py',384),
+  ('arguments -> arguments COMMENT_SINGLELINE','arguments',2,'p_arguments','ProgramGrammar.py',385),
+  ('arguments -> arguments COMMENT_MULTILINE','arguments',2,'p_arguments','ProgramGrammar.py',386),
+  ('arguments -> arguments PRECOMP_MACRO','arguments',2,'p_arguments','ProgramGrammar.py',387),
+  ('arguments -> arguments PRECOMP_MACRO_CONT','arguments',2,'p_arguments','ProgramGrammar.py',388),
+  ('arguments -> arguments ASTERISK','arguments',2,'p_arguments','ProgramGrammar.py',389),
+  ('arguments -> arguments AMPERSTAND','arguments',2,'p_arguments','ProgramGrammar.py',390),
+  ('arguments -> arguments EQUALS','arguments',2,'p_arguments','ProgramGrammar.py',391),
+  ('arguments -> arguments MINUS','arguments',2,'p_arguments','ProgramGrammar.py',392),
+  ('arguments -> arguments PLUS','arguments',2,'p_arguments','ProgramGrammar.py',393),
+  ('arguments -> arguments DIVIDE','arguments',2,'p_arguments','ProgramGrammar.py',394),
+  ('arguments -> arguments CHAR_LITERAL','arguments',2,'p_arguments','ProgramGrammar.py',395),
+  ('arguments -> arguments STRING_LITERAL','arguments',2,'p_arguments','ProgramGrammar.py',396),
+  ('arguments -> arguments NEW_LINE','arguments',2,'p_arguments','ProgramGrammar.py',397),
+  ('arguments -> arguments SQUOTE','arguments',2,'p_arguments','ProgramGrammar.py',398),
+  ('arguments -> arguments REFERENCE','arguments',2,'p_arguments','ProgramGrammar.py',399),
+  ('arguments -> arguments DOT','arguments',2,'p_arguments','ProgramGrammar.py',400),
+  ('arguments -> arguments SMALL','arguments',2,'p_arguments','ProgramGrammar.py',401),
+  ('arguments -> arguments LARGE','arguments',2,'p_arguments','ProgramGrammar.py',402),
+  ('arguments -> arguments STRING','arguments',2,'p_arguments','ProgramGrammar.py',403),
+  ('arguments -> arguments COLLECTION_TYPE','arguments',2,'p_arguments','ProgramGrammar.py',404),
+  ('arguments -> arguments CONST','arguments',2,'p_arguments','ProgramGrammar.py',405),
+  ('arguments -> arguments YIELD','arguments',2,'p_arguments','ProgramGrammar.py',406),
+  ('arguments -> empty','arguments',1,'p_arguments','ProgramGrammar.py',407),
+  ('empty -> <empty>','empty',0,'p_empty','ProgramGrammar.py',374),
+]
@@ -0,0 +1,218 @@
+import sys
+import json
+import hashlib
+import argparse
+
+import VariableParser
+import ActorclassParser
+import MethodParser
+import CompileCache
+
+# Versioned on-disk form of a compiled program's model.
+#
+# dump() writes the actorclasses (variables, method declarations with their
+# translated bodies and call tags, child actorclasses), the global methods
+# including main, the configurable variables and the symbol index of an
+# AEONParser that has compiled a program.  load() rebuilds those objects on
+# a fresh parser, sharing VariableInfo objects between the model and the
+# symbol index as a compile does, so analysis and generateAEONFile() can
+# run without lexing or parsing; see AEONParser.fromProgramIR().  The IR of
+# a --declarations-only compile has no method bodies: its header says so and
+# no output is generated from it.
+#
+# The file is JSON.  Every object is an array of its fields in the order of
+# the *_FIELDS tuples below, which keeps the file small and quick to load;
+# any change to those tuples needs a new FORMAT_VERSION.
+
+FORMAT = "aeon-program-ir"
+FORMAT_VERSION = 2
+
+VARIABLE_FIELDS = ('type', 'varType', 'varName', 'value', 'special', 'const', 'collectionType', 'actorId',
+                   'collectionPos', 'includedActorclasses', 'actorclass', 'isChildActor',
+                   'contextId', 'contextObjPos', 'isChildContext')
+
+# Legacy fields that VariableInfo does not always set; None means unset
+OPTIONAL_VARIABLE_FIELDS = ('contextId', 'contextObjPos', 'isChildContext')
+
+METHOD_FIELDS = ('valid', 'returnType', 'actorclass', 'methodType', 'definedName', 'generatedName',
+                 'eventTag', 'asyncTag', 'syncTag')
+
+class ProgramIRError(ValueError): pass
+
+def dumpVariable(var_info):
+    return [getattr(var_info, name, None) for name in VARIABLE_FIELDS]
+
+def loadVariable(values):
+    var_info = VariableParser.VariableInfo()
+    for name, value in zip(VARIABLE_FIELDS, values):
+        if value is None and name in OPTIONAL_VARIABLE_FIELDS:
+            continue
+        setattr(var_info, name, value)
+    return var_info
+
+def dumpMethod(method_info):
+    # [fields..., arguments, implementation]
+    values = [getattr(method_info, name) for name in METHOD_FIELDS]
+    values.append([dumpVariable(arg) for arg in method_info.arguments])
+    # A list, or the SpooledLines of a streaming compile
+    values.append(list(method_info.implementation))
+    return values
+
+def loadMethod(values):
+    method_info = MethodParser.ActorclassMethodInfo()
+    n = len(METHOD_FIELDS)
+    for name, value in zip(METHOD_FIELDS, values[:n]):
+        setattr(method_info, name, value)
+    method_info.arguments = [loadVariable(arg) for arg in values[n]]
+    method_info.implementation = values[n+1]
+    return method_info
+
+def dumpActorclass(actorclass_info):
+    # [name, variables, methods, children]
+    return [
+        actorclass_info.actorclassName,
+        [dumpVariable(var_info) for var_info in actorclass_info.variables.values()],
+        [dumpMethod(method_info) for method_info in actorclass_info.methods.values()],
+        actorclass_info.childActorclasses,
+    ]
+
+def loadActorclass(values):
+    actorclass_info = ActorclassParser.ActorclassInfo()
+    actorclass_info.actorclassName = values[0]
+    for var_values in values[1]:
+        var_info = loadVariable(var_values)
+        actorclass_info.variables[var_info.varName] = var_info
+    for method_values in values[2]:
+        method_info = loadMethod(method_values)
+        actorclass_info.methods[method_info.definedName] = method_info
+    actorclass_info.childActorclasses = values[3]
+    return actorclass_info
+
+def fileDigest(path):
+    try:
+        fd = open(path, "rb")
+    except (IOError, OSError):
+        return None
+    digest = hashlib.sha256(fd.read()).hexdigest()
+    fd.close()
+    return digest
+
+def dump(parser, path):
+    symbols = parser.symbols
+    return_types = []
+    for actorclass in symbols.actorclassNames:
+        for method_name in symbols.methodNames.get(actorclass, []):
+            return_types.append([actorclass, method_name, symbols.getMethodReturnType(actorclass, method_name)])
+    collection_vars = []
+    for actorclass in symbols.actorclassNames:
+        for var_info in symbols.getCollectionVars(actorclass).values():
+            collection_vars.append([actorclass, dumpVariable(var_info)])
+
+    program = {
+        'format': FORMAT,
+        'version': FORMAT_VERSION,
+        'source': parser.appFileName,
+        # Of the source file as it is when the IR is written
+        'sourceDigest': fileDigest(parser.appFileName),
+        'compiler': CompileCache.getCompilerFingerprint(),
+        # Method bodies were skipped, so the IR cannot generate a .mac
+        'declarationsOnly': parser.declarationsOnly,
+        'actorclassNames': symbols.actorclassNames,
+        'returnTypes': return_types,
+        'collectionVars': collection_vars,
+        'actorclasses': [dumpActorclass(info) for info in parser.actorclasses.values()],
+        'methods': [[name, dumpMethod(info)] for name, info in parser.methods.items()],
+        'configVariables': [dumpVariable(info) for info in parser.configVariables.values()],
+        'precompMacros': parser.precompMacros,
+    }
+    fd = open(path, "w")
+    json.dump(program, fd, separators=(',', ':'))
+    fd.write("\n")
+    fd.close()
+
+def read(path):
+    fd = open(path)
+    try:
+        program = json.load(fd)
+    except ValueError as e:
+        raise ProgramIRError("%s is not a program IR file: %s" % (path, e))
+    finally:
+        fd.close()
+    if not isinstance(program, dict) or program.get('format') != FORMAT:
+        raise ProgramIRError("%s is not a program IR file" % path)
+    if program.get('version') != FORMAT_VERSION:
+        raise ProgramIRError("%s has IR version %s, expected %d" % (path, program.get('version'), FORMAT_VERSION))
+    return program
+
+def load(path, parser):
+    # Fills a parser fresh from AEONParser.initState() with the program in path
+    program = read(path)
+    parser.appFileName = program['source']
+    parser.irInfo = {
+        'source': program['source'],
+        'sourceDigest': program['sourceDigest'],
+        'compiler': program['compiler'],
+    }
+    parser.declarationsOnly = program['declarationsOnly']
+
+    symbols = parser.symbols
+    for actorclass in program['actorclassNames']:
+        symbols.addActorclass(actorclass)
+    for actorclass, method_name, return_type in program['returnTypes']:
+        symbols.addMethod(actorclass, method_name, return_type)
+    for actorclass, var_values in program['collectionVars']:
+        symbols.addCollectionVar(actorclass, loadVariable(var_values))
+    for values in program['actorclasses']:
+        actorclass_info = loadActorclass(values)
+        symbols.registerActorclass(actorclass_info)
+        parser.actorclasses[actorclass_info.actorclassName] = actorclass_info
+
+    for name, values in program['methods']:
+        parser.methods[name] = loadMethod(values)
+    for values in program['configVariables']:
+        var_info = loadVariable(values)
+        parser.configVariables[var_info.varName] = var_info
+    parser.precompMacros = program['precompMacros']
+    parser.checkActorclassCycle()
+    return parser
+
+def isCurrent(path):
+    # Whether the IR in path was written for its source file as it is now
+    program = read(path)
+    return program['sourceDigest'] is not None and fileDigest(program['source']) == program['sourceDigest']
+
+def main(argv=None):
+    import CppHeaderParser
+
+    arg_parser = argparse.ArgumentParser(description="Inspect a program IR file or generate its Mace service")
+    arg_parser.add_argument("ir", help="file written by CppHeaderParser.py --emit-ir")
+    arg_parser.add_argument("-o", "--output", metavar="FILE", help="generate the .mac file from the IR")
+    arg_parser.add_argument("--summary", action="store_true", help="list actorclasses, variables and method signatures")
+    args = arg_parser.parse_args(argv)
+
+    try:
+        parser = CppHeaderParser.AEONParser.fromProgramIR(args.ir, args.output or "")
+    except (ValueError, IOError, OSError) as e:
+        print(e)
+        return 1
+
+    if args.summary:
+        if parser.declarationsOnly:
+            print("%s (source %s, declarations only)" % (args.ir, parser.appFileName))
+        else:
+            print("%s (source %s)" % (args.ir, parser.appFileName))
+        for name, info in parser.actorclasses.items():
+            print("actorclass %s" % name)
+            for var_name, var_info in info.variables.items():
+                print("\t%s %s" % (var_info.varType, var_name))
+            for method_name, method_info in info.methods.items():
+                args_str = ", ".join(["%s %s" % (arg.varType, arg.varName) for arg in method_info.arguments])
+                print("\t%s %s(%s)" % (method_info.returnType, method_name, args_str))
+            if len(info.childActorclasses) > 0:
+                print("\tchildren: %s" % ", ".join(info.childActorclasses))
+    if args.output is not None:
+        parser.generateAEONFile()
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,69 @@
+import VariableParser
+
+# Scoped symbol table used while translating a method body.
+#
+# Every visible name maps to a stack of bindings, innermost last, so a lookup
+# is one dict probe whatever the nesting depth.  Opening a scope only records
+# the length of the declaration log; closing it unwinds the declarations made
+# since then, which makes outer bindings of shadowed names visible again.
+# Declaring a name twice in the same scope replaces the earlier binding.
+
+# Returned for every miss.  Callers only read .type from it, never mutate it.
+NOT_FOUND = VariableParser.VariableInfo()
+
+class ScopedSymbolTable:
+    def __init__(self):
+        # name -> [(depth, VariableInfo)], innermost binding last
+        self.bindings = {}
+        # names in declaration order; scopeMarks[i] is the log length when scope i+1 opened
+        self.declarationLog = []
+        self.scopeMarks = []
+        # Outermost fallback, e.g. the variables of the enclosing actorclass
+        self.baseScope = {}
+
+    def setBaseScope(self, variables):
+        self.baseScope = variables
+
+    def depth(self):
+        return len(self.scopeMarks)
+
+    def pushScope(self):
+        self.scopeMarks.append(len(self.declarationLog))
+
+    def popScope(self):
+        if len(self.scopeMarks) == 0:
+            return
+        mark = self.scopeMarks.pop()
+        log = self.declarationLog
+        bindings = self.bindings
+        while len(log) > mark:
+            name = log.pop()
+            stack = bindings[name]
+            stack.pop()
+            if len(stack) == 0:
+                del bindings[name]
+
+    def insert(self, name, var_info):
+        depth = len(self.scopeMarks)
+        stack = self.bindings.get(name)
+        if stack is None:
+            self.bindings[name] = [(depth, var_info)]
+        elif stack[-1][0] == depth:
+            stack[-1] = (depth, var_info)
+            return
+        else:
+            stack.append((depth, var_info))
+        self.declarationLog.append(name)
+
+    def lookup(self, name):
+        stack = self.bindings.get(name)
+        if stack is not None:
+            return stack[-1][1]
+        return self.baseScope.get(name, NOT_FOUND)
+
+    def update(self, name, var_info):
+        stack = self.bindings.get(name)
+        if stack is None:
+            return False
+        stack[-1] = (stack[-1][0], var_info)
+        return True
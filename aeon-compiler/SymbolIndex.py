@@ -0,0 +1,137 @@
+import hashlib
+
+# Program-wide symbol index.
+#
+# Filled once by the AEONParser pre-scan (actorclass names, method return
+# types) and completed as actorclass declarations are parsed (arguments,
+# variables, collection variables, child actorclasses).  Every lookup is a
+# dict or set probe so the parse stages can query it per token.
+#
+# The digests identify the entries a cached translation depends on; each is
+# computed on demand and dropped when the entries it covers change.
+
+class SymbolIndex:
+    def __init__(self):
+        self.actorclasses = set()
+        # Declaration order, for stable iteration
+        self.actorclassNames = []
+
+        # (actorclass, method) -> return type
+        self.methodReturnTypes = {}
+        # (actorclass, method) -> [VariableInfo]
+        self.methodArgs = {}
+
+        # actorclass -> { varName: VariableInfo }
+        self.variables = {}
+        # actorclass -> { varName: VariableInfo } for actor collections
+        self.collectionVars = {}
+        # actorclass -> [child actorclass]
+        self.childActorclasses = {}
+
+        # actorclass -> [method name], in declaration order
+        self.methodNames = {}
+        self.namesDigestCache = None
+        # actorclass -> digest
+        self.actorclassDigests = {}
+
+    ## Actorclasses ############################################################
+    def addActorclass(self, actorclass):
+        if actorclass in self.actorclasses:
+            return
+        self.actorclasses.add(actorclass)
+        self.actorclassNames.append(actorclass)
+        self.namesDigestCache = None
+        self.variables[actorclass] = {}
+        self.collectionVars[actorclass] = {}
+        self.childActorclasses[actorclass] = []
+
+    def isActorclass(self, name):
+        return name in self.actorclasses
+
+    ## Methods #################################################################
+    def addMethod(self, actorclass, method_name, return_type):
+        if not (actorclass, method_name) in self.methodReturnTypes:
+            self.methodNames.setdefault(actorclass, []).append(method_name)
+        self.methodReturnTypes[(actorclass, method_name)] = return_type
+        self.actorclassDigests.pop(actorclass, None)
+
+    def hasMethod(self, actorclass, method_name):
+        return (actorclass, method_name) in self.methodReturnTypes
+
+    def getMethodReturnType(self, actorclass, method_name):
+        return self.methodReturnTypes.get((actorclass, method_name), None)
+
+    def setMethodArgs(self, actorclass, method_name, args):
+        self.methodArgs[(actorclass, method_name)] = args
+        self.actorclassDigests.pop(actorclass, None)
+
+    def getMethodArgs(self, actorclass, method_name):
+        return self.methodArgs.get((actorclass, method_name), [])
+
+    ## Variables ###############################################################
+    def addVariable(self, actorclass, var_info):
+        self.variables[actorclass][var_info.varName] = var_info
+        self.actorclassDigests.pop(actorclass, None)
+
+    def getVariables(self, actorclass):
+        return self.variables.get(actorclass, {})
+
+    def addCollectionVar(self, actorclass, var_info):
+        self.collectionVars[actorclass][var_info.varName] = var_info
+        self.actorclassDigests.pop(actorclass, None)
+
+    def getCollectionVars(self, actorclass):
+        return self.collectionVars.get(actorclass, {})
+
+    ## Ownership ###############################################################
+    def addChild(self, actorclass, child):
+        children = self.childActorclasses[actorclass]
+        if not child in children:
+            children.append(child)
+            self.actorclassDigests.pop(actorclass, None)
+
+    def getChildren(self, actorclass):
+        return self.childActorclasses.get(actorclass, [])
+
+    def registerActorclass(self, actorclass_info):
+        name = actorclass_info.actorclassName
+        self.addActorclass(name)
+        for var_name, var_info in actorclass_info.variables.items():
+            self.addVariable(name, var_info)
+        for method_name, method_info in actorclass_info.methods.items():
+            self.setMethodArgs(name, method_name, method_info.arguments)
+            if not self.hasMethod(name, method_name):
+                self.addMethod(name, method_name, method_info.returnType)
+        for child in actorclass_info.childActorclasses:
+            self.addChild(name, child)
+
+    ## Digests #################################################################
+    def namesDigest(self):
+        # Which names are actorclasses
+        if self.namesDigestCache is None:
+            text = "\n".join(sorted(self.actorclasses))
+            self.namesDigestCache = hashlib.sha256(text.encode()).hexdigest()
+        return self.namesDigestCache
+
+    def actorclassDigest(self, actorclass):
+        # Variables, collection variables, methods and children of one actorclass
+        digest = self.actorclassDigests.get(actorclass)
+        if digest is None:
+            parts = []
+            for var_name, var_info in self.getVariables(actorclass).items():
+                parts.append("var %s" % variableSignature(var_info))
+            for var_name, var_info in self.getCollectionVars(actorclass).items():
+                parts.append("collection %s" % variableSignature(var_info))
+            for method_name in self.methodNames.get(actorclass, []):
+                args = [variableSignature(arg) for arg in self.getMethodArgs(actorclass, method_name)]
+                parts.append("method %s %s %s" % (method_name, self.getMethodReturnType(actorclass, method_name), args))
+            parts.append("children %s" % self.getChildren(actorclass))
+            digest = hashlib.sha256("\n".join(parts).encode()).hexdigest()
+            self.actorclassDigests[actorclass] = digest
+        return digest
+
+def variableSignature(var_info):
+    values = []
+    for name in var_info.__slots__:
+        values.append(getattr(var_info, name, None))
+    return repr(values)
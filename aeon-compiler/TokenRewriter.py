@@ -0,0 +1,105 @@
+import ParserUtil
+
+# Single-pass rewriting of expression tokens for ActorclassMethodParser.parseTokens.
+#
+# Tokens are shifted onto an output stack from left to right.  Each rule is
+# keyed by the type of the token being shifted and may fold it into the
+# tokens already on the stack; a token produced by a fold goes back through
+# the rules, so nested reductions such as ( ( *iter ) ) complete in the same
+# pass instead of needing another scan of the whole list.
+
+class TokenRewriter:
+    def __init__(self, tokens):
+        self.tokens = tokens
+        self.pos = 0
+        self.stack = []
+
+    def peek(self):
+        if self.pos < len(self.tokens):
+            return self.tokens[self.pos]
+        return None
+
+    def skip(self):
+        self.pos = self.pos + 1
+
+    def run(self):
+        rules = RULES
+        stack = self.stack
+        while self.pos < len(self.tokens):
+            tok = self.tokens[self.pos]
+            self.pos = self.pos + 1
+            # A rule returns the token to shift next: the same one if it did
+            # not fire, or the result of a fold that must be re-examined
+            while tok is not None:
+                rule = rules.get(tok.type)
+                if rule is None:
+                    stack.append(tok)
+                    break
+                new_tok = rule(self, tok)
+                if new_tok is tok:
+                    stack.append(tok)
+                    break
+                tok = new_tok
+        return stack
+
+def reduceParen(rewriter, tok):
+    # ( X ) -> one token carrying X's type, e.g. (iter) stays an iterator
+    stack = rewriter.stack
+    if len(stack) < 2 or stack[-2].type != 'OPEN_PAREN':
+        return tok
+    inner = stack.pop()
+    paren = stack.pop()
+    paren.value = '(' + inner.value + ')'
+    paren.type = inner.type
+    paren.contextType = inner.contextType
+    paren.collectionType = inner.collectionType
+    paren.isChildContext = inner.isChildContext
+    return paren
+
+def reduceDeref(rewriter, tok):
+    # * iter -> the actor the iterator points to
+    stack = rewriter.stack
+    if len(stack) == 0 or stack[-1].type != 'ASTERISK':
+        return tok
+    star = stack.pop()
+    star.type = ParserUtil.TokenType.ACTOR
+    star.value = '*' + tok.value
+    return star
+
+def reduceMapIterMember(rewriter, tok):
+    # map_iter -> second
+    stack = rewriter.stack
+    next_tok = rewriter.peek()
+    if len(stack) == 0 or next_tok is None or stack[-1].type != 'ContextCollectionIter' or stack[-1].collectionType != 'map':
+        return tok
+    rewriter.skip()
+    last = stack[-1]
+    last.type = ParserUtil.TokenType.ACTOR
+    last.value = last.value + '->' + next_tok.value
+    return None
+
+def reduceIncrement(rewriter, tok):
+    return reduceRepeatedOperator(rewriter, tok, '++')
+
+def reduceDecrement(rewriter, tok):
+    return reduceRepeatedOperator(rewriter, tok, '--')
+
+def reduceRepeatedOperator(rewriter, tok, op):
+    stack = rewriter.stack
+    next_tok = rewriter.peek()
+    if len(stack) < 2 or next_tok is None or stack[-1].type != 'ContextCollectionType' or next_tok.type != tok.type:
+        return tok
+    rewriter.skip()
+    stack[-1].value = stack[-1].value + op
+    return None
+
+RULES = {
+    'CLOSE_PAREN': reduceParen,
+    ParserUtil.TokenType.ACTOR_COLLECTION_ITER: reduceDeref,
+    'REFERENCE': reduceMapIterMember,
+    'PLUS': reduceIncrement,
+    'MINUS': reduceDecrement,
+}
+
+def rewriteTokens(tokens):
+    return TokenRewriter(tokens).run()
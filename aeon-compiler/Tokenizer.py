@@ -0,0 +1,169 @@
+import ply.lex as lex
+import sys
+import re
+
+import ParserUtil
+
+# Bulk tokenizer for AEON programs.
+#
+# The t_* rules of a rule module (CppHeaderParser) are compiled once into a
+# single master pattern, ordered the same way PLY orders them: function rules
+# by definition line, then string rules by decreasing regex length.  A whole
+# preprocessed buffer is then tokenized in one pass instead of pulling tokens
+# one at a time through lex.token().
+#
+# tokenizeDeclarations() leaves out the bodies of top-level method
+# definitions, found by brace matching on the text, for scans that only need
+# the declarations.
+
+class LexToken(ParserUtil.MyToken):
+    # A MyToken plus its position in the preprocessed buffer, so the method
+    # parser can rewrite it in place.  The actor fields are only filled in by
+    # the method parser, see ParserUtil.MyToken.reset()
+    __slots__ = ('lineno', 'lexpos', 'lexer')
+
+    def __init__(self, type, value, lineno, lexpos):
+        self.type = type
+        self.value = value
+        self.lineno = lineno
+        self.lexpos = lexpos
+
+    def __str__(self):
+        return 'LexToken(%s,%r,%d,%d)' % (self.type, self.value, self.lineno, self.lexpos)
+
+    def __repr__(self):
+        return str(self)
+
+# Each match skips a run of uninteresting characters and then takes one
+# construct.  String and character literals and macro lines are matched whole
+# so the braces inside them are not counted; 'body' is set on a brace that
+# follows a closing parenthesis, as the body of a method definition does
+BRACE_SCAN = re.compile(r'[^"\'#){}]*(?:"(?:[^"\\]|\\.)*"|\'.\'|\#.*|(?P<body>\)\s*)?(?P<brace>[{}])|[\s\S]|\Z)')
+
+def findMethodBodies(data):
+    # (start, end) offsets of the braces around every top-level method body
+    bodies = []
+    depth = 0
+    body_start = None
+    for m in BRACE_SCAN.finditer(data):
+        brace = m.group('brace')
+        if brace is None:
+            continue
+        if brace == '{':
+            if depth == 0 and m.group('body') is not None:
+                body_start = m.start('brace')
+            depth = depth + 1
+        else:
+            depth = depth - 1
+            if depth == 0 and body_start is not None:
+                bodies.append((body_start, m.start('brace')))
+                body_start = None
+    return bodies
+
+class TokenizerState:
+    # Stand-in for the PLY lexer object handed to function rules as t.lexer
+    def __init__(self):
+        self.lineno = 1
+        self.lexpos = 0
+
+class AEONTokenizer:
+    ERROR_GROUP = '_ERROR'
+
+    def __init__(self, rules, reflags=re.VERBOSE):
+        self.tokens = list(rules['tokens'])
+        self.ignore = rules.get('t_ignore', '')
+        self.errorFunc = rules.get('t_error', None)
+
+        func_rules = []
+        str_rules = []
+        for name in [f for f in rules if f[:2] == 't_']:
+            if name in ('t_ignore', 't_error'):
+                continue
+            rule = rules[name]
+            if hasattr(rule, '__call__'):
+                func_rules.append((name, rule))
+            else:
+                str_rules.append((name, rule))
+        func_rules.sort(key=lambda x: x[1].__code__.co_firstlineno)
+        str_rules.sort(key=lambda x: len(x[1]), reverse=True)
+
+        patterns = []
+        actions = {}
+        for name, func in func_rules:
+            patterns.append('(?P<%s>%s)' % (name, func.__doc__))
+            actions[name] = (name[2:], func)
+        for name, regex in str_rules:
+            patterns.append('(?P<%s>%s)' % (name, regex))
+            actions[name] = (name[2:], None)
+        patterns.append('(?P<%s>(?s:.))' % AEONTokenizer.ERROR_GROUP)
+        # Matches the ignored characters left at the end of the buffer
+        patterns.append(r'\Z')
+
+        # Ignored characters are swallowed as a prefix of every match, so they
+        # never produce a match object of their own
+        prefix = ''
+        if self.ignore != '':
+            prefix = '[%s]*' % re.escape(self.ignore)
+        self.masterPattern = re.compile('%s(?:%s)' % (prefix, '|'.join(patterns)), reflags)
+
+        # group index -> (group index, token type, rule function or None);
+        # slot 0 stands for the end-of-buffer match, which has no group
+        self.groupActions = [None] * (self.masterPattern.groups + 1)
+        for name, index in self.masterPattern.groupindex.items():
+            if name in actions:
+                self.groupActions[index] = (index, actions[name][0], actions[name][1])
+        self.errorIndex = self.masterPattern.groupindex[AEONTokenizer.ERROR_GROUP]
+
+    def tokenize(self, data, pos=0, endpos=None, state=None):
+        # Tokens of data[pos:endpos]; state carries the line number on from
+        # an earlier call
+        program_tokens = []
+        append = program_tokens.append
+        if state is None:
+            state = TokenizerState()
+        if endpos is None:
+            endpos = len(data)
+        actions = self.groupActions
+        error_index = self.errorIndex
+        intern = sys.intern
+
+        for m in self.masterPattern.finditer(data, pos, endpos):
+            action = actions[m.lastindex or 0]
+            if action is None:
+                if m.lastindex == error_index:
+                    self.raiseError(data, m.start(error_index), state)
+                continue
+
+            index, tok_type, func = action
+            # Identifiers and punctuation repeat all over a program; interning
+            # keeps one string per distinct spelling instead of one per token
+            tok = LexToken(tok_type, intern(m.group(index)), state.lineno, m.start(index))
+            if func is not None:
+                tok.lexer = state
+                state.lexpos = m.end()
+                tok = func(tok)
+                if not tok:
+                    continue
+            append(tok)
+
+        return program_tokens
+
+    def tokenizeDeclarations(self, data):
+        # As tokenize(), but every top-level method body comes out as an
+        # empty pair of braces
+        program_tokens = []
+        state = TokenizerState()
+        pos = 0
+        for start, end in findMethodBodies(data):
+            program_tokens.extend(self.tokenize(data, pos, start + 1, state))
+            state.lineno = state.lineno + data.count("\n", start, end)
+            pos = end
+        program_tokens.extend(self.tokenize(data, pos, len(data), state))
+        return program_tokens
+
+    def raiseError(self, data, pos, state):
+        if self.errorFunc is not None:
+            tok = LexToken('error', data[pos:], state.lineno, pos)
+            tok.lexer = state
+            self.errorFunc(tok)
+        raise lex.LexError("Scanning error. Illegal character '%s'" % data[pos], data[pos:])
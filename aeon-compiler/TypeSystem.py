@@ -0,0 +1,156 @@
+import re
+
+# Interned, structured types.
+#
+# A type spelling such as "map<int, Item>" is parsed once into a TypeInfo
+# recording its namespace, name and template arguments; parseType() returns
+# the same TypeInfo for every later occurrence of the spelling, so the
+# parsers and generators can ask for the collection kind, the key and value
+# types or the actorclass held by a collection without re-parsing strings.
+#
+# TypeInfos do not depend on the program being compiled.  Whether a name is
+# an actorclass does, so the methods that need to know take the set of
+# actorclass names.
+
+COLLECTION_KINDS = ('vector', 'deque', 'set', 'map')
+
+TYPE_TOKEN = re.compile(r'::|[A-Za-z_][A-Za-z0-9_]*|[0-9]+|\S')
+
+class TypeInfo:
+    __slots__ = ('spelling', 'namespace', 'name', 'arguments', 'suffix')
+
+    def __init__(self, namespace, name, arguments, suffix):
+        self.namespace = namespace
+        self.name = name
+        # TypeInfos of the template arguments
+        self.arguments = arguments
+        # '*' or '&' after the type
+        self.suffix = suffix
+        self.spelling = self.format(None)
+
+    def format(self, actorclasses):
+        # The spelling, with actorclasses written as the int ids the
+        # generated service refers to actors by when actorclasses is given
+        if actorclasses is not None and len(self.arguments) == 0 and self.name in actorclasses:
+            return 'int' + self.suffix
+        spelling = self.name
+        if self.namespace != '':
+            spelling = self.namespace + '::' + spelling
+        if len(self.arguments) > 0:
+            args = ', '.join([arg.format(actorclasses) for arg in self.arguments])
+            if args.endswith('>'):
+                args = args + ' '
+            spelling = spelling + '<' + args + '>'
+        return spelling + self.suffix
+
+    def isCollection(self):
+        return self.name in COLLECTION_KINDS and len(self.arguments) > 0
+
+    def collectionKind(self):
+        # 'vector', 'deque', 'set', 'map' or ''
+        if self.isCollection():
+            return self.name
+        return ''
+
+    def keyType(self):
+        if self.name == 'map' and len(self.arguments) == 2:
+            return self.arguments[0]
+        return None
+
+    def valueType(self):
+        if self.isCollection():
+            return self.arguments[-1]
+        return None
+
+    def isActorclass(self, actorclasses):
+        return len(self.arguments) == 0 and self.suffix == '' and self.name in actorclasses
+
+    def actorclassElement(self, actorclasses):
+        # (actorclass, position) of the first template argument, counted
+        # from 1, that is an actorclass; (None, 0) if there is none
+        for i in range(len(self.arguments)):
+            if self.arguments[i].isActorclass(actorclasses):
+                return self.arguments[i].name, i + 1
+        return None, 0
+
+    def outputSpelling(self, actorclasses):
+        # As declared in the generated service: a collection gets the mace
+        # namespace and holds actor ids instead of actorclasses
+        if self.isCollection() and self.namespace == '':
+            return 'mace::' + self.format(actorclasses)
+        return self.format(actorclasses)
+
+    def __str__(self):
+        return self.spelling
+
+    def __repr__(self):
+        return 'TypeInfo(%s)' % self.spelling
+
+# spelling as written or canonical -> TypeInfo
+internedTypes = {}
+
+def parseType(spelling):
+    type_info = internedTypes.get(spelling)
+    if type_info is None:
+        tokens = TYPE_TOKEN.findall(spelling)
+        type_info, pos = parseTokens(tokens, 0)
+        if type_info is None or pos != len(tokens):
+            # Not a type this module understands; kept whole
+            type_info = internType(TypeInfo('', spelling.strip(), [], ''))
+        internedTypes[spelling] = type_info
+    return type_info
+
+def parseParts(parts):
+    # The type spelled by a list of token values, e.g. ['map', '<', 'int', ',', 'Item', '>']
+    return parseType(' '.join(parts))
+
+def internType(type_info):
+    interned = internedTypes.get(type_info.spelling)
+    if interned is None:
+        internedTypes[type_info.spelling] = type_info
+        interned = type_info
+    return interned
+
+def parseTokens(tokens, pos):
+    # Returns (TypeInfo, position after it), or (None, pos) on a syntax error
+    namespace = ''
+    name = ''
+    while pos < len(tokens) and isName(tokens[pos]):
+        if pos + 1 < len(tokens) and tokens[pos+1] == '::':
+            if namespace != '':
+                namespace = namespace + '::'
+            namespace = namespace + tokens[pos]
+            pos = pos + 2
+        else:
+            # Multi word names such as unsigned int
+            if name != '':
+                name = name + ' '
+            name = name + tokens[pos]
+            pos = pos + 1
+    if name == '':
+        return None, pos
+
+    arguments = []
+    if pos < len(tokens) and tokens[pos] == '<':
+        pos = pos + 1
+        while True:
+            argument, pos = parseTokens(tokens, pos)
+            if argument is None or pos >= len(tokens):
+                return None, pos
+            arguments.append(argument)
+            if tokens[pos] == ',':
+                pos = pos + 1
+            elif tokens[pos] == '>':
+                pos = pos + 1
+                break
+            else:
+                return None, pos
+
+    suffix = ''
+    while pos < len(tokens) and tokens[pos] in ('*', '&'):
+        suffix = suffix + tokens[pos]
+        pos = pos + 1
+    return internType(TypeInfo(namespace, name, arguments, suffix)), pos
+
+def isName(token):
+    return token[0].isalpha() or token[0] == '_'
@@ -7,12 +7,11 @@ import inspect
 import copy
 
 import ParserUtil
+import Diagnostics
+import TypeSystem
 
-class VariableParseStatus:
-    NoneStatus = 0
-    ToGetVariableType = 1
-    ToGetVariableName = 2
-    ToGetVariableValue = 3
+diag = Diagnostics.getChannel('actorclass')
+codegen = Diagnostics.getChannel('codegen')
 
 class VariableInfo:
     InvalidType = 0
@@ -21,6 +20,10 @@ class VariableInfo:
     ActorCollectionType = 3
     ActorCollectionIterType = 4
 
+    __slots__ = ('type', 'varType', 'varName', 'value', 'special', 'const', 'collectionType', 'actorId',
+                 'collectionPos', 'includedActorclasses', 'actorclass', 'isChildActor',
+                 'contextId', 'contextObjPos', 'isChildContext')
+
     def __init__(self):
         self.type = VariableInfo.InvalidType
         self.varType = ""
@@ -39,7 +42,8 @@ class VariableInfo:
         self.isChildActor = False
 
     def generateVarDeclaration(self):
-        print('VariableInfo::generateVarDeclaration: ', self.varName)
+        if codegen.debug:
+            codegen.write('VariableInfo::generateVarDeclaration: %s' % self.varName)
         line = ''
         var_type = ''
         if self.type == VariableInfo.DefaultType:
@@ -76,9 +80,12 @@ class VariableInfo:
         # print 'VariableInfo::generateOutputContextCollectionType'
         output_type = ''
         if self.collectionType == 'map':
-            output_type = 'map<'
+            output_type = 'mace::map<'
             if self.collectionPos == 1:
-                output_type = output_type + 'int, ' + self.contextId + '>'
+                output_type = output_type + 'int, ' + self.contextId
+                if self.contextId.endswith('>'):
+                    output_type = output_type + ' '
+                output_type = output_type + '>'
             else:
                 output_type = output_type + self.contextId + ', int>'
         else:
@@ -89,53 +96,45 @@ class VariableInfo:
 
 class VariableParser:
     @staticmethod
-    def parseVariableDeclaration(tokens, actorclasses, actorclass_collection_vars):
-        print("VariableParser::parseVariableDeclaration")
+    def makeVariable(declaration, actorclasses, actorclass_collection_vars):
+        # The VariableInfo of a ProgramGrammar.VariableDeclaration; the
+        # collections of actors recorded for the actorclass are returned as
+        # they are
+        if diag.debug:
+            diag.write("VariableParser::makeVariable: %s" % declaration.name.value)
+        type_tok = declaration.type.type
+        if type_tok.type == 'COLLECTION_TYPE' and declaration.name.value in actorclass_collection_vars:
+            return actorclass_collection_vars[ declaration.name.value ]
+
         var_info = VariableInfo()
         var_info.type = VariableInfo.DefaultType
-        status = VariableParseStatus.ToGetVariableType
-        
-        for i in range(len(tokens)):
-            tok = tokens[i]
-            print("type=%s, value=%s" % ( tok.type, tok.value))
-            if tok.value == "yield":
-                continue
-
-            if tok.type == "COLLECTION_TYPE" and tokens[i+1].value in actorclass_collection_vars:
-                return actorclass_collection_vars[ tokens[i+1].value ]
-            
-            if status == VariableParseStatus.ToGetVariableValue:
-                var_info.value = tok.value
-            elif tok.type in ('ASTERISK', 'AMPERSTAND'):
-                var_info.special = tok.value
-            elif tok.type == 'NAME' or tok.type == 'COLLECTION_TYPE':
-                if tok.value == 'configurable':
-                    continue
-                elif tok.value == 'const':
-                    var_info.const = tok.value
-                elif status == VariableParseStatus.ToGetVariableType:
-                    var_info.varType = tok.value
-                    if var_info.varType in actorclasses:
-                        var_info.isChildActor = True
-                        var_info.type = VariableInfo.ActorType
-                        var_info.actorclass = var_info.varType
-                    status = VariableParseStatus.ToGetVariableName
-                elif status == VariableParseStatus.ToGetVariableName:
-                    var_info.varName = tok.value
-                    #print 'varable name: ', var_info.varName
-                    if var_info.varName in actorclass_collection_vars:
-                        var_actorclasses = actorclass_collection_vars[ var_info.varName ]
-                        for j in range(0, len(var_actorclasses)):
-                            if not var_actorclasses[j] in var_info.includedActorclasses:
-                                var_info.includedActorclasses.append( var_actorclasses[j] )
-
-                else:
-                	ParserUtil.MyUtil.exitWithError('Syntax error here!')
-            elif tok.type == 'EQUALS':
-                status == VariableParseStatus.ToGetVariableValue
-            
-          
-        #print 'type=', var_info.varType 
+        var_info.varType = type_tok.value
+        if var_info.varType in actorclasses:
+            var_info.isChildActor = True
+            var_info.type = VariableInfo.ActorType
+            var_info.actorclass = var_info.varType
+        if 'const' in declaration.type.qualifiers:
+            var_info.const = 'const'
+        var_info.special = declaration.type.special
+        var_info.varName = declaration.name.value
+        var_info.value = " ".join([tok.value for tok in declaration.value])
+        return var_info
+
+    @staticmethod
+    def makeActorCollectionVariable(collection_type, var_name, actorclasses):
+        # The variable of an actorclass declared as a collection of actors,
+        # e.g. vector<Item> items; collection_type is its TypeSystem.TypeInfo
+        actorclass, pos = collection_type.actorclassElement(actorclasses)
+        var_info = VariableInfo()
+        var_info.type = VariableInfo.ActorCollectionType
+        var_info.varType = collection_type.outputSpelling(actorclasses)
+        var_info.varName = var_name
+        var_info.collectionType = collection_type.collectionKind()
+        var_info.actorclass = actorclass
+        var_info.collectionPos = pos
+        var_info.isChildActor = True
+        if var_info.collectionType == 'map':
+            var_info.contextId = collection_type.arguments[2 - pos].format(actorclasses)
         return var_info
 
     @staticmethod
@@ -143,41 +142,20 @@ class VariableParser:
         # print 'VariableParser::parseContextCollectionType'
         
         var_info = VariableInfo()
-        m = re.search('.+::(.+)<.+>', collection_type)
-        if not m:
+        type_info = TypeSystem.parseType(collection_type)
+        if not type_info.isCollection():
+            return var_info
+
+        actorclass, pos = type_info.actorclassElement(context_types)
+        if actorclass is None:
             return var_info
 
-        collectionType = m.group(1)
-        if collectionType == 'vector' or collectionType == 'set' or collectionType == 'deque':
-            m =  re.search('[a-z]+<(.+)>', collection_type)
-            if not m:
-                return var_info
-            subType = m.group(1)
-            # print subType
-            if subType in context_types:
-                var_info.type = VariableInfo.ContextCollectionType
-                var_info.varType = subType
-                var_info.collectionType = collectionType
-        elif collectionType == 'map':
-            m = re.search('map<(.+), (.+)>', collection_type)
-            if not m:
-                return var_info
-            subType1 = m.group(1)
-            subType2 = m.group(2)
-            # print subType1, '; ', subType2
-
-            if subType1 in context_types:
-                var_info.type = VariableInfo.ContextCollectionType
-                var_info.varType = subType1
-                var_info.collectionType = collectionType
-                var_info.contextObjPos = 1
-                var_info.contextId = subType2
-            elif subType2 in context_types:
-                var_info.type = VariableInfo.ContextCollectionType
-                var_info.varType = subType2
-                var_info.collectionType = collectionType
-                var_info.contextObjPos = 2
-                var_info.contextId = subType1
+        var_info.type = VariableInfo.ActorCollectionType
+        var_info.varType = actorclass
+        var_info.collectionType = type_info.collectionKind()
+        if var_info.collectionType == 'map':
+            var_info.contextObjPos = pos
+            var_info.contextId = type_info.arguments[2 - pos].spelling
         
         return var_info
 
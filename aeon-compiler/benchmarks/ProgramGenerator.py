@@ -0,0 +1,148 @@
+#!/usr/bin/python
+# Synthetic AEON programs for the compiler benchmarks.
+#
+# Actorclass i owns actorclass i+1 through a child variable and owns later
+# actorclasses through vector collections, so the ownership graph is always
+# acyclic.  Method bodies mix arithmetic with calls on the child and
+# broadcasts over the collections, nested in for/if blocks.  The same
+# parameters and seed always give the same program.
+#
+#   python ProgramGenerator.py [-a actorclasses] [-m methods] ... > program.cc
+import sys
+import random
+import argparse
+
+class ProgramGenerator:
+    def __init__(self, actorclasses=8, methods=4, statements=12, depth=2, collections=1, call_density=0.3, seed=0):
+        self.actorclasses = actorclasses
+        self.methods = methods
+        # statements per method body, spread over the nesting levels
+        self.statements = statements
+        self.depth = depth
+        # vector collection variables per actorclass
+        self.collections = collections
+        # fraction of statements that call another actor
+        self.callDensity = call_density
+        self.seed = seed
+
+    def describe(self):
+        return {
+            'actorclasses': self.actorclasses,
+            'methods': self.methods,
+            'statements': self.statements,
+            'depth': self.depth,
+            'collections': self.collections,
+            'callDensity': self.callDensity,
+            'seed': self.seed,
+        }
+
+    def actorclassName(self, index):
+        return "Actor%d" % index
+
+    def collectionsOf(self, index):
+        # (variable name, element actorclass) for the collections of actorclass index
+        result = []
+        if index + 1 >= self.actorclasses:
+            return result
+        for k in range(self.collections):
+            element = index + 1 + (k % (self.actorclasses - index - 1))
+            result.append(("items%d" % k, self.actorclassName(element)))
+        return result
+
+    def generate(self):
+        rand = random.Random(self.seed)
+        lines = []
+        for index in range(self.actorclasses):
+            self.generateActorclass(rand, index, lines)
+        lines.append("void main() {")
+        lines.append("\t%s a = createActor<%s>();" % (self.actorclassName(0), self.actorclassName(0)))
+        lines.append("\tevent a.initialize(4);")
+        lines.append("}")
+        return "\n".join(lines) + "\n"
+
+    def generateActorclass(self, rand, index, lines):
+        name = self.actorclassName(index)
+        has_child = index + 1 < self.actorclasses
+        collections = self.collectionsOf(index)
+
+        lines.append("actorclass %s {" % name)
+        if has_child:
+            lines.append("\t%s child;" % self.actorclassName(index + 1))
+        for var, element in collections:
+            lines.append("\tvector<%s> %s;" % (element, var))
+        lines.append("\tint count;")
+        lines.append("")
+        lines.append("\tvoid initialize(int n);")
+        for m in range(self.methods):
+            lines.append("\tvoid method%d(int n);" % m)
+        lines.append("}")
+        lines.append("")
+
+        lines.append("void %s::initialize(int n) {" % name)
+        lines.append("\tcount = 0;")
+        if has_child:
+            lines.append("\tchild = createActor<%s>();" % self.actorclassName(index + 1))
+            lines.append("\tevent child.initialize(n);")
+        for var, element in collections:
+            lines.append("\tfor(int i=0; i<n; i++) {")
+            lines.append("\t\t%s e = createActor<%s>();" % (element, element))
+            lines.append("\t\t%s.push_back(e);" % var)
+            lines.append("\t}")
+        lines.append("}")
+        lines.append("")
+
+        for m in range(self.methods):
+            lines.append("void %s::method%d(int n) {" % (name, m))
+            self.generateBlock(rand, has_child, collections, 1, lines)
+            lines.append("}")
+            lines.append("")
+
+    def generateBlock(self, rand, has_child, collections, level, lines):
+        tabs = "\t" * level
+        per_level = max(1, (self.statements + self.depth) // (self.depth + 1))
+        for s in range(per_level):
+            if rand.random() < self.callDensity and (has_child or len(collections) > 0):
+                self.generateCall(rand, has_child, collections, level, lines)
+            else:
+                k = rand.randint(1, 9)
+                lines.append("%scount = (count + %d) * (n - %d);" % (tabs, k, k))
+        if level <= self.depth:
+            if level % 2 == 1:
+                var = "d%d" % level
+                lines.append("%sfor(int %s=0; %s<n; %s++) {" % (tabs, var, var, var))
+            else:
+                lines.append("%sif( (count %% %d) == 0) {" % (tabs, level + 1))
+            self.generateBlock(rand, has_child, collections, level + 1, lines)
+            lines.append("%s}" % tabs)
+
+    def generateCall(self, rand, has_child, collections, level, lines):
+        tabs = "\t" * level
+        method = rand.randrange(self.methods)
+        kind = rand.randrange(3)
+        if len(collections) > 0 and (kind == 2 or not has_child):
+            var, element = collections[rand.randrange(len(collections))]
+            lines.append("%sfor(int c=0; c<%s.size(); c++) {" % (tabs, var))
+            lines.append("%s\tasync %s[c].method%d(n - 1);" % (tabs, var, method))
+            lines.append("%s}" % tabs)
+        elif kind == 1:
+            lines.append("%sevent child.method%d(n - 1);" % (tabs, method))
+        else:
+            lines.append("%schild.method%d(n - 1);" % (tabs, method))
+
+def main():
+    arg_parser = argparse.ArgumentParser(description="Generate a synthetic AEON program")
+    arg_parser.add_argument("-a", "--actorclasses", type=int, default=8)
+    arg_parser.add_argument("-m", "--methods", type=int, default=4)
+    arg_parser.add_argument("-s", "--statements", type=int, default=12)
+    arg_parser.add_argument("-d", "--depth", type=int, default=2)
+    arg_parser.add_argument("-c", "--collections", type=int, default=1)
+    arg_parser.add_argument("-p", "--call-density", type=float, default=0.3)
+    arg_parser.add_argument("--seed", type=int, default=0)
+    args = arg_parser.parse_args()
+
+    generator = ProgramGenerator(args.actorclasses, args.methods, args.statements, args.depth,
+                                 args.collections, args.call_density, args.seed)
+    sys.stdout.write(generator.generate())
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,242 @@
+#!/usr/bin/python
+# Broadcast events, messages and permission rounds of the GameApp service
+# with and without broadcast batching, counted in the logs of the runtime.
+#
+# The example never calls Room::updatePlayer, so the service is compiled
+# from a copy of gameapp.cc in which Building::initialize calls it once the
+# room is set up with the given number of players:
+#
+#   python benchBroadcastFusion.py --emit GameApp.mac [-p players]
+#
+# --build DIR does the rest in one go: it copies the aeon tree into DIR,
+# replaces services/GameApp/GameApp.mac with the emitted service, builds
+# contextrun (aeon/application/testrun) there and runs it on one node once
+# with batching and once without:
+#
+#   python benchBroadcastFusion.py --build DIR [-p players] [--save FILE]
+#
+# The build needs what the runtime needs (cmake, boost, GSL and the Perl
+# Parse::RecDescent module for the Mace compiler).  A contextrun built some
+# other way is run with --contextrun PATH; --params FILE replaces the
+# one-node params file written for it.
+#
+# Each run enables the broadcast log selectors of the runtime, writes them
+# to a file of its own and counts
+#
+#   events    broadcast requests forwarded to their target contexts
+#   messages  async event messages sent for them: one per request
+#             ContextService::broadcastHead() forwards, one per target node
+#             for a batch ContextService::broadcastHeads() fuses
+#   rounds    "permission round" lines, one per event order lock a context
+#             takes to check broadcast requests
+#
+# BROADCAST_BATCH=0 makes the runtime forward the calls of a batched loop one
+# at a time, so every event is a message of its own.  With batching the
+# players of one node get their updatePlayer events in one message.
+import os
+import io
+import re
+import sys
+import json
+import shutil
+import argparse
+import tempfile
+import contextlib
+import subprocess
+
+sys.path = [os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")] + sys.path
+import CppHeaderParser
+
+EXAMPLE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "examples", "gameapp.cc")
+AEON = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "aeon")
+DRIVER_LINE = "\troom.initialize(4, 2);\n"
+DRIVER = "\troom.initialize(%d, 2);\n\tevent room.updatePlayer();\n"
+
+SELECTORS = ["ContextService::broadcastHead",
+             "ContextService::broadcastHeads",
+             "ContextBaseClass::checkBroadcastRequestExecutePermission",
+             "ContextBaseClass::checkBroadcastRequestsExecutePermission"]
+EVENT_LINE = "Forward broadcast event:"
+FUSED_LINE = re.compile(r"Forward fused broadcast event of (\d+) request")
+ROUND_LINE = "permission round for"
+
+# One node running GameApp, after aeon/demo/params.default
+PARAMS = """run_time = %d
+MACE_ADDRESS_ALLOW_LOOPBACK = 1
+MACE_PORT = %d
+NUM_ASYNC_THREADS = 4
+MAX_ASYNC_THREADS = 8
+MIN_CONTEXT_THREADS = 4
+MAX_CONTEXT_THREADS = 8
+service = GameApp
+mapping = 0:Root
+ownership = globalContext:Root
+lib.ContextJobApplication.nodeset = IPV4/127.0.0.1:%d
+nodeset = 127.0.0.1:%d
+"""
+
+def emitService(output, players):
+    # Compiles the driven example to output; returns the translated lines of
+    # Room::updatePlayer
+    fd = open(EXAMPLE)
+    text = fd.read()
+    fd.close()
+    if not DRIVER_LINE in text:
+        raise RuntimeError("Building::initialize of %s has changed" % EXAMPLE)
+    text = text.replace(DRIVER_LINE, DRIVER % players, 1)
+
+    workdir = tempfile.mkdtemp(prefix="aeon-bench-")
+    try:
+        source = os.path.join(workdir, "gameapp.cc")
+        fd = open(source, "w")
+        fd.write(text)
+        fd.close()
+        with contextlib.redirect_stdout(io.StringIO()):
+            CppHeaderParser.AEONParser(source, output)
+    finally:
+        shutil.rmtree(workdir)
+
+    fd = open(output)
+    lines = fd.read().split("\n")
+    fd.close()
+    method = []
+    for line in lines:
+        if len(method) == 0 and not "Room_updatePlayer(const int&" in line:
+            continue
+        method.append(line)
+        if line == "}":
+            break
+    return method
+
+def buildContextrun(service, build_dir, jobs):
+    # Builds contextrun with service as GameApp in build_dir; returns its path
+    source = os.path.join(build_dir, "aeon")
+    build = os.path.join(build_dir, "build")
+    if os.path.exists(source):
+        shutil.rmtree(source)
+    shutil.copytree(AEON, source)
+    shutil.copyfile(service, os.path.join(source, "services", "GameApp", "GameApp.mac"))
+    if not os.path.exists(build):
+        os.makedirs(build)
+
+    log = os.path.join(build_dir, "build.log")
+    fd = open(log, "w")
+    steps = [["cmake", source], ["make", "-j", str(jobs), "contextrun"]]
+    for command in steps:
+        fd.write("$ %s\n" % " ".join(command))
+        fd.flush()
+        if subprocess.call(command, cwd=build, stdout=fd, stderr=subprocess.STDOUT) != 0:
+            fd.close()
+            raise RuntimeError("%s failed, see %s" % (command[0], log))
+    fd.close()
+
+    contextrun = os.path.join(build, "application", "testrun", "contextrun")
+    if not os.path.exists(contextrun):
+        raise RuntimeError("%s was not built, see %s" % (contextrun, log))
+    return contextrun
+
+def writeParams(path, run_time, port):
+    fd = open(path, "w")
+    fd.write(PARAMS % (run_time, port, port, port))
+    fd.close()
+
+def runService(contextrun, params, batch, timeout):
+    # (events, messages, rounds) counted in the log of one run
+    workdir = tempfile.mkdtemp(prefix="aeon-bench-")
+    try:
+        log = os.path.join(workdir, "broadcast.log")
+        command = [contextrun, params,
+                   "-BROADCAST_BATCH", str(batch),
+                   "-MACE_LOG_LEVEL", "1",
+                   "-MACE_LOG_FILE", log,
+                   "-MACE_LOG_AUTO_SELECTORS", " ".join(SELECTORS)]
+        subprocess.run(command, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, timeout=timeout, check=True)
+
+        events = 0
+        messages = 0
+        rounds = 0
+        fd = open(log, errors="replace")
+        for line in fd:
+            fused = FUSED_LINE.search(line)
+            if fused is not None:
+                events = events + int(fused.group(1))
+                messages = messages + 1
+            elif EVENT_LINE in line:
+                events = events + 1
+                messages = messages + 1
+            elif ROUND_LINE in line:
+                rounds = rounds + 1
+        fd.close()
+    finally:
+        shutil.rmtree(workdir)
+    return events, messages, rounds
+
+def main():
+    arg_parser = argparse.ArgumentParser(description="Broadcast batching benchmark on GameApp")
+    arg_parser.add_argument("--emit", metavar="FILE", help="write the GameApp service driving Room::updatePlayer to FILE")
+    arg_parser.add_argument("-p", "--players", type=int, default=64, help="players in the room (default 64)")
+    arg_parser.add_argument("--build", metavar="DIR", help="build contextrun with the driven service in DIR and run it")
+    arg_parser.add_argument("-j", "--jobs", type=int, default=4, help="with --build, parallel make jobs (default 4)")
+    arg_parser.add_argument("--contextrun", metavar="PATH", help="run a contextrun built against the emitted service")
+    arg_parser.add_argument("--params", metavar="FILE", help="params file of the runs (default: GameApp on one node)")
+    arg_parser.add_argument("--port", type=int, default=6501, help="MACE_PORT of the default params (default 6501)")
+    arg_parser.add_argument("--run-time", type=int, default=10, help="seconds a run of the default params lasts (default 10)")
+    arg_parser.add_argument("--timeout", type=float, default=300, help="seconds a run may take (default 300)")
+    arg_parser.add_argument("--save", metavar="FILE", help="store the counts as JSON")
+    args = arg_parser.parse_args()
+    if args.emit is None and args.build is None and args.contextrun is None:
+        arg_parser.error("give --emit, --build or --contextrun")
+    if args.build is not None and args.contextrun is not None:
+        arg_parser.error("--build and --contextrun exclude each other")
+
+    workdir = tempfile.mkdtemp(prefix="aeon-bench-")
+    try:
+        service = args.emit
+        if service is None and args.build is not None:
+            service = os.path.join(workdir, "GameApp.mac")
+        if service is not None:
+            method = emitService(service, args.players)
+            if len(method) == 0:
+                print("Room::updatePlayer is not in the output")
+                return 1
+            print("\n".join(method))
+            print("")
+            print("GameApp written with %d players" % args.players)
+
+        contextrun = args.contextrun
+        if args.build is not None:
+            try:
+                contextrun = buildContextrun(service, os.path.abspath(args.build), args.jobs)
+            except RuntimeError as e:
+                print(e)
+                return 1
+            print("%s built" % contextrun)
+        if contextrun is None:
+            return 0
+
+        params = args.params
+        if params is None:
+            params = os.path.join(workdir, "params.gameapp")
+            writeParams(params, args.run_time, args.port)
+
+        results = {}
+        print("%10s %10s %10s %10s" % ("batching", "events", "messages", "rounds"))
+        for batch in [0, 1]:
+            events, messages, rounds = runService(contextrun, params, batch, args.timeout)
+            name = "on" if batch else "off"
+            results[name] = {'events': events, 'messages': messages, 'rounds': rounds}
+            print("%10s %10d %10d %10d" % (name, events, messages, rounds))
+    finally:
+        shutil.rmtree(workdir)
+
+    if args.save is not None:
+        fd = open(args.save, "w")
+        # The players of a contextrun built elsewhere are not known
+        players = args.players if service is not None else None
+        json.dump({'players': players, 'results': results}, fd, indent=2, sort_keys=True)
+        fd.write("\n")
+        fd.close()
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,69 @@
+#!/usr/bin/python
+# Compile time with the on-disk compile cache.
+#
+# For each program size: a compile without the cache, a cold compile that
+# fills an empty cache, a warm compile of the unchanged program, and a
+# compile after one method body was edited.
+#
+#   python benchCache.py [-a actorclasses ...] [-r rounds]
+import os
+import sys
+import time
+import shutil
+import argparse
+import tempfile
+
+sys.path = [os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")] + sys.path
+import CppHeaderParser
+import CompileCache
+from ProgramGenerator import ProgramGenerator
+
+def timeCompile(source, output, cache_dir=None):
+    cache = None
+    if cache_dir is not None:
+        cache = CompileCache.CompileCache(cache_dir)
+    start = time.perf_counter()
+    CppHeaderParser.AEONParser(source, output, cache=cache)
+    if cache is not None:
+        cache.flush()
+    return time.perf_counter() - start, cache
+
+def writeFile(path, text):
+    fd = open(path, "w")
+    fd.write(text)
+    fd.close()
+
+def main():
+    arg_parser = argparse.ArgumentParser(description="Compile cache benchmark")
+    arg_parser.add_argument("-a", "--actorclasses", type=int, nargs="+", default=[16, 64, 256])
+    arg_parser.add_argument("-r", "--rounds", type=int, default=3)
+    args = arg_parser.parse_args()
+
+    print("%-8s %8s %10s %10s %10s %10s %9s" % ("classes", "lines", "no cache", "cold", "warm", "1 edit", "edit hits"))
+    workdir = tempfile.mkdtemp(prefix="aeon-bench-")
+    try:
+        source = os.path.join(workdir, "program.cc")
+        output = os.path.join(workdir, "program.mac")
+        for actorclasses in args.actorclasses:
+            text = ProgramGenerator(actorclasses=actorclasses).generate()
+            edited = text.replace("\tcount = 0;", "\tcount = 1;", 1)
+            best = None
+            for i in range(args.rounds):
+                cache_dir = os.path.join(workdir, "cache")
+                shutil.rmtree(cache_dir, ignore_errors=True)
+                writeFile(source, text)
+                plain, cache = timeCompile(source, output)
+                cold, cache = timeCompile(source, output, cache_dir)
+                warm, cache = timeCompile(source, output, cache_dir)
+                writeFile(source, edited)
+                edit, cache = timeCompile(source, output, cache_dir)
+                row = (plain, cold, warm, edit, cache.stats['method'].hitRate())
+                if best is None or row[2] < best[2]:
+                    best = row
+            print("%-8d %8d %10.1f %10.1f %10.1f %10.1f %8.1f%%" % (actorclasses, text.count("\n"), best[0] * 1000,
+                                                                   best[1] * 1000, best[2] * 1000, best[3] * 1000, best[4] * 100))
+    finally:
+        shutil.rmtree(workdir)
+
+if __name__ == '__main__':
+    main()
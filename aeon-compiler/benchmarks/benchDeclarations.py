@@ -0,0 +1,54 @@
+#!/usr/bin/python
+# Full compile against the declaration-only scan on generated programs of
+# growing size.
+#
+#   python benchDeclarations.py [-a actorclasses ...] [-r repeat]
+import os
+import io
+import sys
+import time
+import shutil
+import argparse
+import tempfile
+import contextlib
+
+sys.path = [os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")] + sys.path
+import CppHeaderParser
+from ProgramGenerator import ProgramGenerator
+
+def bestTime(repeat, func):
+    best = None
+    for i in range(repeat):
+        start = time.perf_counter()
+        with contextlib.redirect_stdout(io.StringIO()):
+            func()
+        elapsed = time.perf_counter() - start
+        if best is None or elapsed < best:
+            best = elapsed
+    return best
+
+def main():
+    arg_parser = argparse.ArgumentParser(description="Declaration-only scan benchmark")
+    arg_parser.add_argument("-a", "--actorclasses", type=int, nargs="+", default=[16, 64, 256])
+    arg_parser.add_argument("-r", "--repeat", type=int, default=3)
+    args = arg_parser.parse_args()
+
+    workdir = tempfile.mkdtemp(prefix="aeon-bench-")
+    try:
+        print("%12s %8s %12s %12s %8s" % ("actorclasses", "lines", "full (ms)", "decl (ms)", "speedup"))
+        for actorclasses in args.actorclasses:
+            text = ProgramGenerator(actorclasses=actorclasses).generate()
+            source = os.path.join(workdir, "program.cc")
+            output = os.path.join(workdir, "program.mac")
+            fd = open(source, "w")
+            fd.write(text)
+            fd.close()
+
+            full = bestTime(args.repeat, lambda: CppHeaderParser.AEONParser(source, output))
+            decl = bestTime(args.repeat, lambda: CppHeaderParser.AEONParser(source, "", declarations_only=True))
+            print("%12d %8d %12.1f %12.1f %7.1fx" % (actorclasses, text.count("\n"), full * 1000, decl * 1000, full / decl))
+    finally:
+        shutil.rmtree(workdir)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,98 @@
+#!/usr/bin/python
+# Peak memory of a full compile, per 10k lines of actorclass source.
+#
+# Every compile runs in a fresh interpreter so the peak RSS reported by the
+# kernel belongs to that compile alone.  Pass -c to measure another checkout
+# of the compiler, e.g. an older revision, against the same programs.
+#
+#   python benchMemory.py [-l lines ...] [-c compiler_dir]
+import os
+import sys
+import shutil
+import argparse
+import tempfile
+import subprocess
+
+COMPILER_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+
+MEASURE = """
+import os, sys, contextlib, resource
+sys.path.insert(0, sys.argv[1])
+import CppHeaderParser
+base = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+with contextlib.redirect_stdout(open(os.devnull, "w")):
+    CppHeaderParser.AEONParser(sys.argv[2], sys.argv[3])
+print(base, resource.getrusage(resource.RUSAGE_SELF).ru_maxrss)
+"""
+
+def actorclassSource(index):
+    lines = []
+    lines.append("actorclass Worker%d {" % index)
+    lines.append("\tWorker%d peer;" % index)
+    lines.append("\tvector<Worker%d> workers;" % index)
+    lines.append("\tint count;")
+    lines.append("\tvoid initialize(int n);")
+    lines.append("\tvoid work(int n);")
+    lines.append("}")
+    lines.append("void Worker%d::initialize(int n) {" % index)
+    lines.append("\tcount = 0;")
+    lines.append("\tfor(int i=0; i<n; i++) {")
+    lines.append("\t\tWorker%d w = createActor<Worker%d>();" % (index, index))
+    lines.append("\t\tworkers.push_back(w);")
+    lines.append("\t}")
+    lines.append("}")
+    lines.append("void Worker%d::work(int n) {" % index)
+    for k in range(8):
+        lines.append("\tcount = (count + %d) * (n - %d);" % (k, k))
+        lines.append("\tif( (count %% %d) == 0) {" % (k + 2))
+        lines.append("\t\tpeer.work(n - 1);")
+        lines.append("\t}")
+    lines.append("\tfor(int i=0; i<workers.size(); i++) {")
+    lines.append("\t\tasync workers[i].work(n - 1);")
+    lines.append("\t}")
+    lines.append("}")
+    return lines
+
+def programSource(n_lines):
+    lines = []
+    index = 0
+    while len(lines) < n_lines:
+        lines.extend(actorclassSource(index))
+        index = index + 1
+    lines.append("void main() {")
+    lines.append("\tWorker0 w = createActor<Worker0>();")
+    lines.append("\tevent w.initialize(4);")
+    lines.append("}")
+    return "\n".join(lines) + "\n", len(lines)
+
+def measure(compiler_dir, source, output):
+    result = subprocess.run([sys.executable, "-c", MEASURE, compiler_dir, source, output],
+                            stdout=subprocess.PIPE, universal_newlines=True, check=True)
+    base, peak = result.stdout.split()
+    # ru_maxrss is in kilobytes on Linux
+    return int(base) / 1024.0, int(peak) / 1024.0
+
+def main():
+    arg_parser = argparse.ArgumentParser(description="Compiler peak memory benchmark")
+    arg_parser.add_argument("-l", "--lines", type=int, nargs="+", default=[10000, 20000, 40000])
+    arg_parser.add_argument("-c", "--compiler", default=COMPILER_DIR)
+    args = arg_parser.parse_args()
+    compiler_dir = os.path.abspath(args.compiler)
+
+    print("compiler: %s" % compiler_dir)
+    print("%-8s %12s %12s %16s" % ("lines", "startup MB", "peak MB", "MB per 10k lines"))
+    workdir = tempfile.mkdtemp(prefix="aeon-bench-")
+    try:
+        for n_lines in args.lines:
+            source = os.path.join(workdir, "program_%d.cc" % n_lines)
+            text, real_lines = programSource(n_lines)
+            fd = open(source, "w")
+            fd.write(text)
+            fd.close()
+            base, peak = measure(compiler_dir, source, os.path.join(workdir, "program_%d.mac" % n_lines))
+            print("%-8d %12.1f %12.1f %16.1f" % (real_lines, base, peak, (peak - base) * 10000.0 / real_lines))
+    finally:
+        shutil.rmtree(workdir)
+
+if __name__ == '__main__':
+    main()
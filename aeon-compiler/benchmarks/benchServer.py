@@ -0,0 +1,78 @@
+#!/usr/bin/python
+# Edit-compile loop latency: a fresh CppHeaderParser.py process per compile
+# against a compile request to a running CompileServer.
+#
+# Each round edits one method body of a generated program and recompiles it.
+#
+#   python benchServer.py [-a actorclasses] [-e edits]
+import os
+import sys
+import time
+import json
+import shutil
+import argparse
+import tempfile
+import subprocess
+
+COMPILER_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+sys.path = [COMPILER_DIR] + sys.path
+from ProgramGenerator import ProgramGenerator
+
+def editedProgram(text, round):
+    # Changes the constant of the first statement of Actor0::initialize
+    return text.replace("\tcount = 0;", "\tcount = %d;" % (round + 1), 1)
+
+def writeFile(path, text):
+    fd = open(path, "w")
+    fd.write(text)
+    fd.close()
+
+def main():
+    arg_parser = argparse.ArgumentParser(description="Compile server edit loop benchmark")
+    arg_parser.add_argument("-a", "--actorclasses", type=int, default=64)
+    arg_parser.add_argument("-e", "--edits", type=int, default=5)
+    args = arg_parser.parse_args()
+
+    text = ProgramGenerator(actorclasses=args.actorclasses).generate()
+    workdir = tempfile.mkdtemp(prefix="aeon-bench-")
+    try:
+        source = os.path.join(workdir, "program.cc")
+        output = os.path.join(workdir, "program.mac")
+        writeFile(source, text)
+
+        cli = []
+        for i in range(args.edits):
+            writeFile(source, editedProgram(text, i))
+            start = time.perf_counter()
+            subprocess.run([sys.executable, os.path.join(COMPILER_DIR, "CppHeaderParser.py"), source, output], check=True)
+            cli.append(time.perf_counter() - start)
+
+        server = subprocess.Popen([sys.executable, os.path.join(COMPILER_DIR, "CompileServer.py"), "--stdio"],
+                                  stdin=subprocess.PIPE, stdout=subprocess.PIPE, universal_newlines=True)
+        def request(message):
+            server.stdin.write(json.dumps(message) + "\n")
+            server.stdin.flush()
+            return json.loads(server.stdout.readline())
+
+        writeFile(source, text)
+        first = request({'cmd': 'add', 'input': source, 'output': output})
+        served = []
+        for i in range(args.edits):
+            writeFile(source, editedProgram(text, i))
+            start = time.perf_counter()
+            response = request({'cmd': 'compile'})
+            served.append((time.perf_counter() - start, response['results'][0]))
+        request({'cmd': 'shutdown'})
+        server.wait()
+
+        print("%d lines, %d edits" % (text.count("\n"), args.edits))
+        print("%-28s %10.1f ms" % ("CLI process per compile", min(cli) * 1000))
+        print("%-28s %10.1f ms" % ("server, first compile", first['latency'] * 1000))
+        best, result = min(served, key=lambda item: item[0])
+        print("%-28s %10.1f ms  (%d of %d method bodies reused)" % ("server, after one edit", best * 1000,
+                                                                  result['methodHits'], result['methodHits'] + result['methodMisses']))
+    finally:
+        shutil.rmtree(workdir)
+
+if __name__ == '__main__':
+    main()
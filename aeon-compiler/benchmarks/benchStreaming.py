@@ -0,0 +1,57 @@
+#!/usr/bin/python
+# Peak memory and time of a whole-file compile against a streaming compile
+# on generated programs of growing size.  The streaming peak should stay
+# flat apart from the declarations, which every compile keeps.
+#
+#   python benchStreaming.py [-a actorclasses ...]
+import os
+import io
+import sys
+import time
+import shutil
+import argparse
+import tempfile
+import contextlib
+import tracemalloc
+
+sys.path = [os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")] + sys.path
+import CppHeaderParser
+from ProgramGenerator import ProgramGenerator
+
+def measure(source, output, streaming):
+    tracemalloc.start()
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        CppHeaderParser.AEONParser(source, output, streaming=streaming).close()
+    elapsed = time.perf_counter() - start
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return elapsed, peak
+
+def main():
+    arg_parser = argparse.ArgumentParser(description="Streaming compile benchmark")
+    arg_parser.add_argument("-a", "--actorclasses", type=int, nargs="+", default=[16, 64, 256])
+    args = arg_parser.parse_args()
+
+    workdir = tempfile.mkdtemp(prefix="aeon-bench-")
+    try:
+        print("%12s %8s %10s %12s %12s %12s %12s" % ("actorclasses", "lines", "source", "full peak", "stream peak",
+                                                      "full (ms)", "stream (ms)"))
+        for actorclasses in args.actorclasses:
+            text = ProgramGenerator(actorclasses=actorclasses).generate()
+            source = os.path.join(workdir, "program.cc")
+            output = os.path.join(workdir, "program.mac")
+            fd = open(source, "w")
+            fd.write(text)
+            fd.close()
+
+            full_time, full_peak = measure(source, output, False)
+            stream_time, stream_peak = measure(source, output, True)
+            print("%12d %8d %9.1fK %11.1fK %11.1fK %12.1f %12.1f" % (actorclasses, text.count("\n"), len(text) / 1024.0,
+                                                                     full_peak / 1024.0, stream_peak / 1024.0,
+                                                                     full_time * 1000, stream_time * 1000))
+    finally:
+        shutil.rmtree(workdir)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,188 @@
+#!/usr/bin/python
+# Compiler scaling benchmark on synthetic programs.
+#
+# Each sweep varies one ProgramGenerator parameter and compiles the
+# generated programs through the full AEONParser pipeline, timing the whole
+# compile and each phase (from Profiler.CompileProfiler).  The table shows
+# how time grows with input size: "exp" is the growth exponent against the
+# previous row, ~1 for linear growth, ~2 for quadratic.
+#
+# Results can be saved and later runs compared against them:
+#
+#   python benchSuite.py --save results/baseline.json
+#   python benchSuite.py --baseline results/baseline.json
+#
+#   python benchSuite.py [-s sweep ...] [-r rounds] [--save FILE] [--baseline FILE]
+import os
+import sys
+import json
+import math
+import time
+import shutil
+import argparse
+import platform
+import tempfile
+
+sys.path = [os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")] + sys.path
+import CppHeaderParser
+import Profiler
+from ProgramGenerator import ProgramGenerator
+
+RESULTS_VERSION = 1
+
+BASE_PARAMS = {
+    'actorclasses': 8,
+    'methods': 4,
+    'statements': 12,
+    'depth': 2,
+    'collections': 1,
+    'call_density': 0.3,
+}
+
+# sweep name -> (generator parameter, values)
+SWEEPS = {
+    'actorclasses': ('actorclasses', [4, 16, 64, 256]),
+    'methods': ('methods', [2, 8, 32, 128]),
+    'statements': ('statements', [8, 32, 128, 512]),
+    'depth': ('depth', [1, 4, 16, 64]),
+    'collections': ('collections', [1, 4, 16, 64]),
+    'calls': ('call_density', [0.0, 0.25, 0.5, 1.0]),
+}
+
+# Columns of the table; parse is the main scan without the definition parsers
+PHASE_COLUMNS = [
+    ('lex', 'lex'),
+    ('prescan', 'prescan'),
+    ('parse', 'scan'),
+    ('parseActorclassDefinition', 'decl'),
+    ('parseActorclassMethodDefinition', 'methods'),
+    ('generateAEONFile', 'codegen'),
+]
+
+def compileOnce(source, output):
+    profiler = Profiler.CompileProfiler(trace_memory=False)
+    CppHeaderParser.AEONParser(source, output, profiler=profiler)
+    phases = {}
+    for name, record in profiler.phases.items():
+        phases[name] = profiler.selfWall(record)
+    return profiler.wallTotal, phases
+
+def runConfig(params, rounds, workdir):
+    generator = ProgramGenerator(**params)
+    text = generator.generate()
+    source = os.path.join(workdir, "program.cc")
+    fd = open(source, "w")
+    fd.write(text)
+    fd.close()
+
+    best_wall = None
+    best_phases = None
+    for i in range(rounds):
+        wall, phases = compileOnce(source, os.path.join(workdir, "program.mac"))
+        if best_wall is None or wall < best_wall:
+            best_wall = wall
+            best_phases = phases
+    return {
+        'params': generator.describe(),
+        'lines': text.count("\n"),
+        'wall': best_wall,
+        'phases': best_phases,
+    }
+
+def growthExponent(prev, curr):
+    if prev is None or curr['lines'] == prev['lines'] or prev['wall'] <= 0:
+        return None
+    return math.log(curr['wall'] / prev['wall']) / math.log(float(curr['lines']) / prev['lines'])
+
+def printHeader(sweep):
+    columns = "".join(["%10s" % label for name, label in PHASE_COLUMNS])
+    print("%-14s %8s %10s %9s%s %6s" % (sweep, "lines", "total ms", "us/line", columns, "exp"))
+
+def printRow(value, result, exponent):
+    columns = "".join(["%10.1f" % (result['phases'].get(name, 0.0) * 1000) for name, label in PHASE_COLUMNS])
+    exp_str = "%6.2f" % exponent if exponent is not None else "%6s" % "-"
+    print("%-14s %8d %10.1f %9.1f%s %s" % (value, result['lines'], result['wall'] * 1000,
+                                         result['wall'] * 1e6 / result['lines'], columns, exp_str))
+
+def runSweep(sweep, rounds, workdir):
+    param, values = SWEEPS[sweep]
+    printHeader(sweep)
+    results = []
+    prev = None
+    for value in values:
+        params = dict(BASE_PARAMS)
+        params[param] = value
+        result = runConfig(params, rounds, workdir)
+        result['value'] = value
+        printRow(value, result, growthExponent(prev, result))
+        results.append(result)
+        prev = result
+    print("")
+    return results
+
+def compareWithBaseline(results, baseline, threshold):
+    # Returns the number of configurations slower than baseline by more than threshold
+    print("%-14s %-10s %12s %12s %8s" % ("sweep", "value", "baseline ms", "current ms", "ratio"))
+    regressions = 0
+    for sweep, rows in results['sweeps'].items():
+        base_rows = {}
+        for row in baseline.get('sweeps', {}).get(sweep, []):
+            base_rows[str(row['value'])] = row
+        for row in rows:
+            base = base_rows.get(str(row['value']))
+            if base is None or base['params'] != row['params']:
+                continue
+            ratio = row['wall'] / base['wall']
+            flag = ""
+            if ratio > 1.0 + threshold:
+                flag = "  slower"
+                regressions = regressions + 1
+            elif ratio < 1.0 - threshold:
+                flag = "  faster"
+            print("%-14s %-10s %12.1f %12.1f %8.2f%s" % (sweep, row['value'], base['wall'] * 1000, row['wall'] * 1000, ratio, flag))
+    return regressions
+
+def main():
+    arg_parser = argparse.ArgumentParser(description="Compiler scaling benchmark suite")
+    arg_parser.add_argument("-s", "--sweep", nargs="+", choices=sorted(SWEEPS), default=sorted(SWEEPS))
+    arg_parser.add_argument("-r", "--rounds", type=int, default=3)
+    arg_parser.add_argument("--save", metavar="FILE", help="store the results as JSON")
+    arg_parser.add_argument("--baseline", metavar="FILE", help="compare against results stored with --save")
+    arg_parser.add_argument("--threshold", type=float, default=0.2,
+                            help="relative slowdown against the baseline reported as a regression (default 0.2)")
+    args = arg_parser.parse_args()
+
+    results = {
+        'version': RESULTS_VERSION,
+        'python': platform.python_version(),
+        'machine': platform.machine(),
+        'time': time.strftime("%Y-%m-%dT%H:%M:%S"),
+        'rounds': args.rounds,
+        'sweeps': {},
+    }
+    workdir = tempfile.mkdtemp(prefix="aeon-bench-")
+    try:
+        for sweep in args.sweep:
+            results['sweeps'][sweep] = runSweep(sweep, args.rounds, workdir)
+    finally:
+        shutil.rmtree(workdir)
+
+    if args.save is not None:
+        fd = open(args.save, "w")
+        json.dump(results, fd, indent=2, sort_keys=True)
+        fd.write("\n")
+        fd.close()
+        print("results written to %s" % args.save)
+
+    if args.baseline is not None:
+        fd = open(args.baseline)
+        baseline = json.load(fd)
+        fd.close()
+        if baseline.get('version') != RESULTS_VERSION:
+            print("baseline %s has results version %s, expected %d" % (args.baseline, baseline.get('version'), RESULTS_VERSION))
+            sys.exit(2)
+        if compareWithBaseline(results, baseline, args.threshold) > 0:
+            sys.exit(1)
+
+if __name__ == '__main__':
+    main()
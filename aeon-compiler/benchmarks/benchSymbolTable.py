@@ -0,0 +1,143 @@
+#!/usr/bin/python
+# Lookup cost of method-body symbol tables on deeply nested bodies.
+#
+# Compares ScopedSymbolTable against the previous block-stack scheme (one
+# dict per block, linear walk outwards, a fresh VariableInfo on every miss),
+# then times a full compile of a generated program with deeply nested loops.
+#
+#   python benchSymbolTable.py [-d depth ...] [-r rounds]
+import os
+import io
+import sys
+import time
+import shutil
+import argparse
+import tempfile
+import contextlib
+
+sys.path = [os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")] + sys.path
+import VariableParser
+import ScopedSymbolTable
+import CppHeaderParser
+
+class BlockStackTable:
+    # The scheme ScopedSymbolTable replaced, kept here as the baseline
+    def __init__(self):
+        self.block_infos = []
+        self.current_block = {}
+        self.baseScope = {}
+
+    def pushScope(self):
+        self.block_infos.append(self.current_block)
+        self.current_block = {}
+
+    def popScope(self):
+        if len(self.block_infos) > 0:
+            self.current_block = self.block_infos.pop()
+
+    def insert(self, name, var_info):
+        self.current_block[name] = var_info
+
+    def blockLookup(self, block, name):
+        if name in block.keys():
+            return block[name]
+        return VariableParser.VariableInfo()
+
+    def lookup(self, name):
+        var_info = self.blockLookup(self.current_block, name)
+        if var_info.type == VariableParser.VariableInfo.InvalidType:
+            j = len(self.block_infos) - 1
+            while j >= 0:
+                var_info = self.blockLookup(self.block_infos[j], name)
+                if var_info.type != VariableParser.VariableInfo.InvalidType:
+                    break
+                j = j - 1
+        if var_info.type == VariableParser.VariableInfo.InvalidType and name in self.baseScope:
+            return self.baseScope[name]
+        return var_info
+
+def nestedWorkload(table, depth, names_per_scope, lookups_per_scope):
+    var_info = VariableParser.VariableInfo()
+    var_info.type = VariableParser.VariableInfo.ActorType
+    table.baseScope = {'count': var_info, 'items': var_info}
+    found = 0
+    for d in range(depth):
+        table.pushScope()
+        for k in range(names_per_scope):
+            table.insert('v%d_%d' % (d, k), var_info)
+        for k in range(lookups_per_scope):
+            # outermost local, the class variable, and names that resolve to
+            # nothing (loop counters, keywords, library calls)
+            for name in ('v0_0', 'count', 'i', 'maceout', 'size'):
+                if table.lookup(name).type != VariableParser.VariableInfo.InvalidType:
+                    found = found + 1
+    for d in range(depth):
+        table.popScope()
+    return found
+
+def nestedProgram(depth):
+    lines = []
+    lines.append("actorclass Node {")
+    lines.append("\tNode child;")
+    lines.append("\tint count;")
+    lines.append("\tvoid visit(int n);")
+    lines.append("}")
+    lines.append("void Node::visit(int n) {")
+    lines.append("\tNode other = child;")
+    for d in range(depth):
+        lines.append("\t" * (d + 1) + "for(int i%d=0; i%d<n; i%d++) {" % (d, d, d))
+        lines.append("\t" * (d + 2) + "count = count + i%d;" % d)
+        lines.append("\t" * (d + 2) + "other.visit(n - 1);")
+    for d in range(depth, 0, -1):
+        lines.append("\t" * d + "}")
+    lines.append("}")
+    lines.append("void main() {")
+    lines.append("\tNode n = createActor<Node>();")
+    lines.append("\tevent n.visit(3);")
+    lines.append("}")
+    return "\n".join(lines) + "\n"
+
+def best(func, rounds):
+    result = None
+    best_time = None
+    for i in range(rounds):
+        start = time.perf_counter()
+        result = func()
+        elapsed = time.perf_counter() - start
+        if best_time is None or elapsed < best_time:
+            best_time = elapsed
+    return best_time, result
+
+def runDepth(depth, rounds, workdir):
+    old_time, old_found = best(lambda: nestedWorkload(BlockStackTable(), depth, 4, 20), rounds)
+    new_time, new_found = best(lambda: nestedWorkload(ScopedSymbolTable.ScopedSymbolTable(), depth, 4, 20), rounds)
+    if old_found != new_found:
+        print("MISMATCH at depth %d: %d != %d" % (depth, old_found, new_found))
+        sys.exit(1)
+
+    source = os.path.join(workdir, "nested_%d.cc" % depth)
+    fd = open(source, "w")
+    fd.write(nestedProgram(depth))
+    fd.close()
+    output = os.path.join(workdir, "nested_%d.mac" % depth)
+    with contextlib.redirect_stdout(io.StringIO()):
+        compile_time, result = best(lambda: CppHeaderParser.AEONParser(source, output), 1)
+
+    print("%-6d %14.2f %14.2f %7.1fx %12.2f" % (depth, old_time * 1000, new_time * 1000, old_time / new_time, compile_time * 1000))
+
+def main():
+    arg_parser = argparse.ArgumentParser(description="Scoped symbol table benchmark")
+    arg_parser.add_argument("-d", "--depth", type=int, nargs="+", default=[4, 16, 64, 256])
+    arg_parser.add_argument("-r", "--rounds", type=int, default=5)
+    args = arg_parser.parse_args()
+
+    print("%-6s %14s %14s %8s %12s" % ("depth", "block-stack ms", "scoped ms", "speedup", "compile ms"))
+    workdir = tempfile.mkdtemp(prefix="aeon-bench-")
+    try:
+        for depth in args.depth:
+            runDepth(depth, args.rounds, workdir)
+    finally:
+        shutil.rmtree(workdir)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,83 @@
+#!/usr/bin/python
+# Tokens-per-second comparison between the bulk tokenizer and the PLY lex.token() path.
+#
+#   python benchTokenizer.py [source] [-n copies] [-r rounds]
+import os
+import sys
+import gc
+import time
+import argparse
+
+sys.path = [os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")] + sys.path
+import ply.lex as lex
+import CppHeaderParser
+
+def plyTokenize(lexer, data):
+    lexer.lineno = 1
+    lexer.input(data)
+    program_tokens = []
+    while True:
+        tok = lexer.token()
+        if not tok: break
+        program_tokens.append(tok)
+    return program_tokens
+
+def bulkTokenize(tokenizer, data):
+    return tokenizer.tokenize(data)
+
+def timeIt(func, rounds):
+    best = None
+    result = None
+    for i in range(rounds):
+        # Don't let the previous round's token list skew the collector
+        result = None
+        gc.collect()
+        start = time.perf_counter()
+        result = func()
+        elapsed = time.perf_counter() - start
+        if best is None or elapsed < best:
+            best = elapsed
+    return best, result
+
+def main():
+    default_source = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "examples", "gameapp.cc")
+    arg_parser = argparse.ArgumentParser(description="Compare bulk tokenizer against PLY lexing")
+    arg_parser.add_argument("source", nargs="?", default=default_source)
+    arg_parser.add_argument("-n", "--copies", type=int, default=200, help="concatenate the source this many times")
+    arg_parser.add_argument("-r", "--rounds", type=int, default=5)
+    args = arg_parser.parse_args()
+
+    fd = open(args.source)
+    data = "".join(fd.readlines())
+    fd.close()
+    data = "\n".join([data] * args.copies)
+
+    build_start = time.perf_counter()
+    lexer = lex.lex(module=CppHeaderParser)
+    ply_build = time.perf_counter() - build_start
+
+    build_start = time.perf_counter()
+    tokenizer = CppHeaderParser.Tokenizer.AEONTokenizer(vars(CppHeaderParser))
+    bulk_build = time.perf_counter() - build_start
+
+    # Check the two engines agree before timing them; nothing is kept alive
+    # across the timed runs so the collector sees the same heap for both
+    ply_stream = [(t.type, t.value, t.lineno, t.lexpos) for t in plyTokenize(lexer, data)]
+    bulk_stream = [(t.type, t.value, t.lineno, t.lexpos) for t in bulkTokenize(tokenizer, data)]
+    if ply_stream != bulk_stream:
+        print("MISMATCH: token streams differ")
+        sys.exit(1)
+    n = len(bulk_stream)
+    ply_stream = None
+    bulk_stream = None
+
+    ply_time, result = timeIt(lambda: len(plyTokenize(lexer, data)), args.rounds)
+    bulk_time, result = timeIt(lambda: len(bulkTokenize(tokenizer, data)), args.rounds)
+
+    print("input: %d bytes, %d lines, %d tokens" % (len(data), data.count("\n") + 1, n))
+    print("%-6s build %8.2f ms  lex %8.2f ms  %12.0f tokens/s" % ("ply", ply_build * 1000, ply_time * 1000, n / ply_time))
+    print("%-6s build %8.2f ms  lex %8.2f ms  %12.0f tokens/s" % ("bulk", bulk_build * 1000, bulk_time * 1000, n / bulk_time))
+    print("speedup: %.2fx" % (ply_time / bulk_time))
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,71 @@
+#!/usr/bin/python
+# Compiles a corpus of actorclass sources concurrently from a thread pool and
+# checks every output is byte-identical to a serial compile of the same source.
+#
+#   python stressConcurrentCompile.py [sources...] [-j workers] [-n copies]
+import os
+import sys
+import io
+import shutil
+import tempfile
+import argparse
+import contextlib
+import concurrent.futures
+
+sys.path = [os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")] + sys.path
+import CppHeaderParser
+
+def compileOne(source, output):
+    CppHeaderParser.AEONParser(source, output)
+    fd = open(output, "rb")
+    data = fd.read()
+    fd.close()
+    return data
+
+def main():
+    default_source = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "examples", "gameapp.cc")
+    arg_parser = argparse.ArgumentParser(description="Concurrent AEONParser stress test")
+    arg_parser.add_argument("sources", nargs="*", default=[default_source])
+    arg_parser.add_argument("-j", "--workers", type=int, default=16)
+    arg_parser.add_argument("-n", "--copies", type=int, default=64, help="compilations per source")
+    args = arg_parser.parse_args()
+
+    workdir = tempfile.mkdtemp(prefix="aeon-stress-")
+    failures = 0
+    try:
+        # The translator is chatty on stdout; keep it out of the report
+        with contextlib.redirect_stdout(io.StringIO()):
+            expected = {}
+            for i in range(len(args.sources)):
+                expected[args.sources[i]] = compileOne(args.sources[i], os.path.join(workdir, "serial_%d.mac" % i))
+
+            jobs = []
+            with concurrent.futures.ThreadPoolExecutor(max_workers=args.workers) as pool:
+                for i in range(len(args.sources)):
+                    for j in range(args.copies):
+                        output = os.path.join(workdir, "concurrent_%d_%d.mac" % (i, j))
+                        jobs.append((args.sources[i], pool.submit(compileOne, args.sources[i], output)))
+
+                results = []
+                for source, future in jobs:
+                    try:
+                        results.append((source, future.result(), None))
+                    except Exception as e:
+                        results.append((source, None, e))
+
+        for source, data, error in results:
+            if error is not None:
+                print("FAIL %s: %s" % (source, error))
+                failures = failures + 1
+            elif data != expected[source]:
+                print("FAIL %s: output differs from serial compile" % source)
+                failures = failures + 1
+    finally:
+        shutil.rmtree(workdir)
+
+    print("%d compilations on %d threads, %d failures" % (len(jobs), args.workers, failures))
+    if failures > 0:
+        sys.exit(1)
+
+if __name__ == '__main__':
+    main()
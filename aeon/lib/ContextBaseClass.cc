@@ -745,6 +745,7 @@ bool mace::ContextBaseClass::checkBroadcastRequestExecutePermission( BaseMaceSer
   const mace::string dominator = contextStructure.getUpperBoundContextName( this->contextName );
   
   ScopedLock order_sl(this->contextEventOrderMutex);
+  macedbg(1) << "In context("<< this->contextName <<"): permission round for 1 broadcast request" << Log::endl;
   mace::set<mace::string> permitContexts;
   if( this->checkEventExecutePermission(sv, eventOpInfo, false, permitContexts) ){
     macedbg(1) << "In context("<< this->contextName <<"): " << eventOpInfo << " could be forwarded directly!" << Log::endl;
@@ -762,6 +763,60 @@ bool mace::ContextBaseClass::checkBroadcastRequestExecutePermission( BaseMaceSer
   return false;
 }
 
+std::vector<mace::AsyncEvent_Message*> mace::ContextBaseClass::checkBroadcastRequestsExecutePermission( BaseMaceService* sv, 
+    std::vector<mace::AsyncEvent_Message*> const& reqObjs ) {
+  ADD_SELECTORS("ContextBaseClass::checkBroadcastRequestsExecutePermission");
+  std::vector<mace::AsyncEvent_Message*> permittedReqObjs;
+
+  ScopedLock order_sl(this->contextEventOrderMutex);
+  macedbg(1) << "In context("<< this->contextName <<"): permission round for "<< reqObjs.size() <<" broadcast requests" << Log::endl;
+  for( uint32_t i=0; i<reqObjs.size(); i++ ) {
+    const mace::EventOperationInfo& eventOpInfo = reqObjs[i]->getEvent().eventOpInfo;
+    mace::set<mace::string> permitContexts;
+    if( this->checkEventExecutePermission(sv, eventOpInfo, false, permitContexts) ){
+      macedbg(1) << "In context("<< this->contextName <<"): " << eventOpInfo << " could be forwarded directly!" << Log::endl;
+      permittedReqObjs.push_back( reqObjs[i] );
+      continue;
+    }
+
+    ScopedLock sl(this->executeEventMutex);
+    macedbg(1) << "In dominator("<< this->contextName <<"): " << eventOpInfo << " should be enqueue until getting the permission!" << Log::endl;
+    uint8_t ctxEventType = ContextEvent::TYPE_BROADCAST_EVENT;
+    OrderID const& eventId = eventOpInfo.eventId;
+    __EventStorageStruct__ eventStorage(reqObjs[i], ctxEventType, mace::InternalMessage::ASYNC_EVENT, this->serviceId, eventOpInfo);
+
+    waitingEvents[eventId].push_back(eventStorage);
+    eventStorage.msg = NULL;
+  }
+  return permittedReqObjs;
+}
+
+void mace::ContextBaseClass::beginBroadcastBatch( mace::OrderID const& eventId ) {
+  ScopedLock sl(eventExecutingSyncMutex);
+  broadcastBatches[eventId];
+}
+
+bool mace::ContextBaseClass::enqueueBroadcastBatchRequest( mace::OrderID const& eventId, mace::AsyncEvent_Message* reqObj ) {
+  ScopedLock sl(eventExecutingSyncMutex);
+  std::map< mace::OrderID, std::vector<mace::AsyncEvent_Message*> >::iterator iter = broadcastBatches.find(eventId);
+  if( iter == broadcastBatches.end() ) {
+    return false;
+  }
+  (iter->second).push_back(reqObj);
+  return true;
+}
+
+std::vector<mace::AsyncEvent_Message*> mace::ContextBaseClass::endBroadcastBatch( mace::OrderID const& eventId ) {
+  ScopedLock sl(eventExecutingSyncMutex);
+  std::vector<mace::AsyncEvent_Message*> reqObjs;
+  std::map< mace::OrderID, std::vector<mace::AsyncEvent_Message*> >::iterator iter = broadcastBatches.find(eventId);
+  if( iter != broadcastBatches.end() ) {
+    reqObjs = iter->second;
+    broadcastBatches.erase(iter);
+  }
+  return reqObjs;
+}
+
 void mace::ContextBaseClass::initializeDominator( const mace::string& contextName, const mace::string& domCtx, const uint64_t& ver,
     const mace::vector<mace::string>& dominateCtxs ) {
   dominator.initialize(contextName, domCtx, ver, dominateCtxs );
@@ -1526,6 +1581,21 @@ void ContextBaseClass::enqueueOwnershipOpInfo( mace::OrderID const& eventId, mac
   // mace::eMonitor::applyElasticityRule(behavior);
 }
 
+void ContextBaseClass::enqueueOwnershipOpInfos( mace::OrderID const& eventId, mace::vector<mace::EventOperationInfo> const& ops ) {
+  ADD_SELECTORS("ContextBaseClass::enqueueOwnershipOpInfos");
+  ScopedLock sl(eventExecutingSyncMutex);
+  macedbg(1) << "Enqueue "<< ops.size() <<" ownershipOps to event("<< eventId <<") in context("<< this->contextName <<")" << Log::endl;
+  mace::map<OrderID, EventExecutionInfo>::iterator eeinfo_iter = getEventExecutionInfo(eventId);
+  if( eeinfo_iter == eventExecutionInfos.end() ) {
+    EventExecutionInfo ee_info;
+    eventExecutionInfos[eventId] = ee_info;
+    eeinfo_iter = getEventExecutionInfo(eventId);
+  }
+  for( uint32_t i=0; i<ops.size(); i++ ) {
+    (eeinfo_iter->second).enqueueOwnershipOpInfo(ops[i]);
+  }
+}
+
 mace::vector<mace::EventOperationInfo> ContextBaseClass::extractOwnershipOpInfos( OrderID const& eventId ) {
   //ASSERT( eventId == this->now_serving_eventId );
   ScopedLock sl(eventExecutingSyncMutex);
@@ -2059,6 +2129,36 @@ uint32_t mace::ContextBaseClass::createNewContext(BaseMaceService* sv, mace::str
   return new_ctx_id;
 }
 
+uint32_t mace::ContextBaseClass::createNewContexts(BaseMaceService* sv, mace::string const& contextTypeName, const uint32_t nContexts,
+    mace::EventOperationInfo& eop ) {
+  ADD_SELECTORS("ContextBaseClass::createNewContexts");
+  ContextService* _service = static_cast<ContextService*>(sv);
+
+  const mace::OrderID& eventId = ThreadStructure::myEventID();
+  macedbg(1) << "Event("<< eventId <<") try to create "<< nContexts <<" new contexts of "<< contextTypeName << "!" << Log::endl;
+  const mace::EventOperationInfo& eventOpInfo = ThreadStructure::myEvent().eventOpInfo;
+  
+  ScopedLock sl(eventExecutingSyncMutex);
+  _service->send__event_createNewContexts(this->contextName, contextTypeName, nContexts, eventOpInfo);
+  pthread_cond_t cond;
+  pthread_cond_init( &cond, NULL );
+  eventExecutingSyncConds[ eventOpInfo ] = &cond;
+  pthread_cond_wait( &cond, &eventExecutingSyncMutex );
+  mace::map<mace::OrderID, mace::EventExecutionInfo>::iterator iter = getEventExecutionInfo(eventId);
+  ASSERT( iter != eventExecutionInfos.end() );
+  pthread_cond_destroy( &cond );
+  eventExecutingSyncConds[eventOpInfo] = NULL;
+  eventExecutingSyncConds.erase(eventOpInfo);
+  // The head hands out consecutive ids
+  uint32_t first_ctx_id = (iter->second).getNewContextID();
+
+  for( uint32_t i=0; i<nContexts; i++ ) {
+    eop.newCreateContexts.insert( Util::generateContextName(contextTypeName, first_ctx_id + i) );
+  }
+  macedbg(1) << "Event("<< eop.eventId <<") creates "<< nContexts <<" new contexts of "<< contextTypeName <<" from id "<< first_ctx_id <<" in " << this->contextName << Log::endl;
+  return first_ctx_id;
+}
+
 void mace::ContextBaseClass::handleCreateNewContextReply(mace::EventOperationInfo const& eventOpInfo, const uint32_t& newContextId) {
   ADD_SELECTORS("ContextBaseClass::handleCreateNewContextReply");
   const mace::OrderID& eventId = eventOpInfo.eventId;
@@ -656,6 +656,8 @@ public:
     uint64_t now_max_execute_ticket;
 
     mace::map< mace::OrderID, EventExecutionInfo > eventExecutionInfos;
+    // Events batching their broadcast requests, guarded by eventExecutingSyncMutex
+    std::map< mace::OrderID, std::vector<mace::AsyncEvent_Message*> > broadcastBatches;
 
 		mace::set<mace::OrderID> readerEvents;
     mace::set<mace::OrderID> writerEvents;
@@ -1021,6 +1023,16 @@ public:
 
     bool checkBroadcastRequestExecutePermission( BaseMaceService* sv, const mace::EventOperationInfo& eventOpInfo, 
       mace::AsyncEvent_Message* reqObj);
+    // checkBroadcastRequestExecutePermission() for the requests of a broadcast batch, in order and
+    // under one event order lock; returns the requests that can be forwarded now
+    std::vector<mace::AsyncEvent_Message*> checkBroadcastRequestsExecutePermission( BaseMaceService* sv, 
+      std::vector<mace::AsyncEvent_Message*> const& reqObjs );
+
+    // Broadcast requests an event collects between ContextService::beginBroadcastBatch() and
+    // endBroadcastBatch()
+    void beginBroadcastBatch( mace::OrderID const& eventId );
+    bool enqueueBroadcastBatchRequest( mace::OrderID const& eventId, mace::AsyncEvent_Message* reqObj );
+    std::vector<mace::AsyncEvent_Message*> endBroadcastBatch( mace::OrderID const& eventId );
 
     void initializeDominator( const mace::string& contextName, const mace::string& domCtx, const uint64_t& ver,
       const mace::vector<mace::string>& dominateCtxs );
@@ -1049,6 +1061,7 @@ public:
 
     mace::vector<EventOperationInfo> extractOwnershipOpInfos( OrderID const& eventId );
     void enqueueOwnershipOpInfo( mace::OrderID const& eventId, mace::EventOperationInfo const& op );
+    void enqueueOwnershipOpInfos( mace::OrderID const& eventId, mace::vector<mace::EventOperationInfo> const& ops );
     bool checkParentChildRelation(mace::OrderID& eventId, mace::string const& parentContextName, mace::string const& childContextName );
    
     void deleteEventExecutionInfo( OrderID const& eventId );
@@ -1063,6 +1076,7 @@ public:
     void enqueueReadyCreateEventQueueWithLock();
 
     uint32_t createNewContext(BaseMaceService* sv, mace::string const& contextTypeName, mace::EventOperationInfo& eop);
+    uint32_t createNewContexts(BaseMaceService* sv, mace::string const& contextTypeName, const uint32_t nContexts, mace::EventOperationInfo& eop);
     void handleCreateNewContextReply(mace::EventOperationInfo const& eventOpInfo, const uint32_t& newContextId);
     void enqueueSubEvent(BaseMaceService* sv, mace::EventOperationInfo const& eventOpInfo, mace::string const& targetContextName, 
         mace::EventRequestWrapper const& reqObject);
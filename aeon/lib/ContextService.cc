@@ -314,6 +314,19 @@ void ContextService::handleInternalMessages( mace::InternalMessage const& messag
       }
       break;
     }
+    case mace::InternalMessage::ASYNC_EVENTS:{
+      mace::AsyncEvents_Message* h = static_cast< mace::AsyncEvents_Message*>( message.getHelper() );
+      macedbg(1) << "Received a fused message of " << h->events.size() << " async events" << Log::endl;
+      // Each event is handled as if it had come in a message of its own
+      for( uint32_t i=0; i<h->events.size(); i++ ){
+        mace::Event& event = h->events[i]->getEvent();
+        mace::InternalMessageID msgId( message.getOrigAddr(), event.eventOpInfo.toContextName, 0);
+        mace::InternalMessage eventMessage( h->events[i], msgId, h->sid );
+        handleInternalMessages( eventMessage, src, msg_size / h->events.size() );
+      }
+      h->unlinkEvents();
+      break;
+    }
     case mace::InternalMessage::APPUPCALL:{
       mace::ApplicationUpcall_Message* m = static_cast< mace::ApplicationUpcall_Message* >( message.getHelper() );
       processRPCApplicationUpcall( m, src );
@@ -439,6 +452,8 @@ void ContextService::handleInternalMessages( mace::InternalMessage const& messag
         ASSERTMSG(false, "No EventExecutionControl_Message::EVENT_OP_DONE any more!");
       } else if( m->control_type == mace::EventExecutionControl_Message::CREATE_NEW_CONTEXT) {
         this->handle__event_NewContextCreation( m->src_contextName, m->contextNames[0], m->opInfos[0]);
+      } else if( m->control_type == mace::EventExecutionControl_Message::CREATE_NEW_CONTEXTS) {
+        this->handle__event_NewContextCreation( m->src_contextName, m->contextNames[0], m->opInfos[0], m->newContextId);
       } else if( m->control_type == mace::EventExecutionControl_Message::CREATE_NEW_CONTEXT_REPLY) {
         mace::ContextBaseClass* ctxObj = getContextObjByName(m->dest_contextName);
         ASSERT( ctxObj != NULL );
@@ -1161,14 +1176,16 @@ void ContextService::handle__event_ExternalCommControl( const mace::ExternalComm
 }
 
 void ContextService::handle__event_NewContextCreation( const mace::string& create_ctx_name, const mace::string& created_ctx_type, 
-    const mace::EventOperationInfo& op_info) {
+    const mace::EventOperationInfo& op_info, const uint32_t nContexts) {
+  // The nContexts ids from newContextId on are reserved
   uint32_t newContextId = 0;
   ScopedLock sl(serviceSharedDataMutex);
   mace::map<mace::string, uint32_t>::iterator iter = contextIds.find(created_ctx_type);
   if( iter != contextIds.end() ) {
-    newContextId = iter->second ++;
+    newContextId = iter->second;
+    iter->second += nContexts;
   } else {
-    contextIds[created_ctx_type] = 2;
+    contextIds[created_ctx_type] = 1 + nContexts;
     newContextId = 1;
   }
   sl.unlock();
@@ -1301,24 +1318,52 @@ void ContextService::broadcastHead( mace::Message* msg ){
     return;
   }
 
+  mace::MaceAddr destAddr = getBroadcastTargetNode( event );
+  macedbg(1) << "Forward broadcast event: " << event.eventOpInfo << Log::endl;
+  send__event_asyncEvent( destAddr, msgObj, event.eventOpInfo.toContextName);
+  //macedbg(1) << "After event("<< event.eventId <<") broadcast request is send out!" << Log::endl;
+}
+
+void ContextService::broadcastHeads( std::vector<mace::AsyncEvent_Message*> const& msgObjs ){
+  ADD_SELECTORS("ContextService::broadcastHeads");
+  // The requests whose target contexts are on the same node go out in one message
+  std::map< mace::MaceAddr, std::vector<mace::AsyncEvent_Message*> > nodeMsgObjs;
+  for( uint32_t i=0; i<msgObjs.size(); i++ ){
+    mace::Event& event = msgObjs[i]->getEvent();
+    if( event.eventType == mace::Event::UNDEFEVENT ){
+      continue;
+    }
+    nodeMsgObjs[ getBroadcastTargetNode(event) ].push_back( msgObjs[i] );
+  }
+
+  std::map< mace::MaceAddr, std::vector<mace::AsyncEvent_Message*> >::iterator iter;
+  for( iter = nodeMsgObjs.begin(); iter != nodeMsgObjs.end(); iter++ ){
+    if( iter->second.size() == 1 ){
+      mace::Event& event = iter->second[0]->getEvent();
+      macedbg(1) << "Forward broadcast event: " << event.eventOpInfo << Log::endl;
+      send__event_asyncEvent( iter->first, iter->second[0], event.eventOpInfo.toContextName);
+    } else {
+      macedbg(1) << "Forward fused broadcast event of "<< iter->second.size() <<" request(s) to "<< iter->first << Log::endl;
+      send__event_asyncEvents( iter->first, iter->second );
+    }
+  }
+}
+
+mace::MaceAddr ContextService::getBroadcastTargetNode( mace::Event& event ){
   const mace::ContextMapping& snapshotContext = contextMapping.getLatestContextMapping();
   uint32_t contextId = mace::ContextMapping::hasContext2( snapshotContext, event.eventOpInfo.toContextName );
   if( contextId > 0 ){ // the context exists
-    macedbg(1) << "Forward broadcast event: " << event.eventOpInfo << Log::endl;
-    send__event_asyncEvent( mace::ContextMapping::getNodeByContext( snapshotContext, contextId),  msgObj, event.eventOpInfo.toContextName);
-  }else{// create a new context
-    mace::vector< mace::pair<mace::string, mace::string> > ownershipPairs;
-    mace::map< mace::string, uint64_t> vers;
-    trytoCreateNewContextObject( event.eventOpInfo.toContextName, event.eventId, ownershipPairs, vers );
-
-    const mace::ContextMapping& newSnapshotContext = contextMapping.getLatestContextMapping();
-    contextId = mace::ContextMapping::hasContext2( newSnapshotContext, event.eventOpInfo.toContextName );
-    ASSERTMSG(contextId > 0, "Fail to create context!");
-    macedbg(1) << "Forward broadcast event: " << event.eventOpInfo << Log::endl;
-    send__event_asyncEvent( mace::ContextMapping::getNodeByContext( newSnapshotContext, contextId),  msgObj, event.eventOpInfo.toContextName);
-    
+    return mace::ContextMapping::getNodeByContext( snapshotContext, contextId);
   }
-  //macedbg(1) << "After event("<< event.eventId <<") broadcast request is send out!" << Log::endl;
+  // create a new context
+  mace::vector< mace::pair<mace::string, mace::string> > ownershipPairs;
+  mace::map< mace::string, uint64_t> vers;
+  trytoCreateNewContextObject( event.eventOpInfo.toContextName, event.eventId, ownershipPairs, vers );
+
+  const mace::ContextMapping& newSnapshotContext = contextMapping.getLatestContextMapping();
+  contextId = mace::ContextMapping::hasContext2( newSnapshotContext, event.eventOpInfo.toContextName );
+  ASSERTMSG(contextId > 0, "Fail to create context!");
+  return mace::ContextMapping::getNodeByContext( newSnapshotContext, contextId);
 }
 
 void ContextService::__beginTransition( const uint32_t targetContextID, mace::vector<uint32_t> const& snapshotContextIDs, bool isRelease = true, bool newExecuteTicket = false  ) const {
@@ -1975,6 +2020,31 @@ void ContextService::modifyOwnership( const uint8_t opType, mace::string const&
   ctxObj->enqueueOwnershipOpInfo(myEvent.eventId, opInfo);
 }
 
+void ContextService::modifyOwnerships( mace::string const& parentContextName, mace::string const& contextTypeName, 
+    mace::vector<uint32_t> const& removedContextIds, mace::vector<uint32_t> const& addedContextIds ) {
+  ADD_SELECTORS("ContextService::modifyOwnerships");
+  if( removedContextIds.empty() && addedContextIds.empty() ) {
+    return;
+  }
+  mace::ContextBaseClass* ctxObj = ThreadStructure::myContext();
+  mace::Event& myEvent = ThreadStructure::myEvent();
+  macedbg(1) << "Event("<< myEvent.eventId <<") modify ownerships: p="<<parentContextName << ", removed="<< removedContextIds.size() 
+    << ", added="<< addedContextIds.size() << " contexts of " << contextTypeName <<Log::endl; 
+
+  mace::vector<mace::EventOperationInfo> opInfos;
+  for( uint32_t i=0; i<removedContextIds.size(); i++ ) {
+    mace::string childContextName = Util::generateContextName(contextTypeName, removedContextIds[i]);
+    mace::EventOperationInfo opInfo(myEvent.eventId, mace::EventOperationInfo::DELETE_OWNERSHIP_OP, childContextName, parentContextName, 0, false);
+    opInfos.push_back(opInfo);
+  }
+  for( uint32_t i=0; i<addedContextIds.size(); i++ ) {
+    mace::string childContextName = Util::generateContextName(contextTypeName, addedContextIds[i]);
+    mace::EventOperationInfo opInfo(myEvent.eventId, mace::EventOperationInfo::ADD_OWNERSHIP_OP, childContextName, parentContextName, 0, false);
+    opInfos.push_back(opInfo);
+  }
+  ctxObj->enqueueOwnershipOpInfos(myEvent.eventId, opInfos);
+}
+
 
 
 void ContextService::newBroadcastEventID() {
@@ -2006,18 +2076,56 @@ void ContextService::downgradeBroadcastEvent( mace::string const& ctxName, mace:
 void ContextService::executeEventBroadcastRequest( mace::AsyncEvent_Message* reqObj ) {
   ADD_SELECTORS("ContextService::executeEventBroadcastRequest");
 
-  mace::__asyncExtraField& extra = reqObj->getExtra();
   mace::Event& event = ThreadStructure::myEvent();
+  mace::ContextBaseClass* ctxObj = ThreadStructure::myContext();
+  ASSERT( ctxObj != NULL );
+
+  if( ctxObj->enqueueBroadcastBatchRequest(event.eventId, reqObj) ) {
+    macedbg(1) << "Event("<< event.eventId <<") batches a broadcast call to context("<< reqObj->getExtra().targetContextID <<")!" << Log::endl;
+    return;
+  }
+
+  applyBroadcastOwnershipOperations( ctxObj, event );
+  prepareBroadcastRequest( ctxObj, event, reqObj );
   mace::Event& reqEvent = reqObj->getEvent();
-  ASSERT( !extra.targetContextID.empty() );
+  if( ctxObj->checkBroadcastRequestExecutePermission(this, reqEvent.eventOpInfo, reqObj) ) {
+    broadcastHead(reqObj);
+  } 
+}
+
+void ContextService::beginBroadcastBatch() {
+  if( broadcastBatchFlag == 0 ) {
+    return;
+  }
+  mace::Event& event = ThreadStructure::myEvent();
   mace::ContextBaseClass* ctxObj = ThreadStructure::myContext();
   ASSERT( ctxObj != NULL );
+  ctxObj->beginBroadcastBatch(event.eventId);
+}
 
-  if( contextInfoCollectFlag>0 ){
-      (ctxObj->runtimeInfo).addCalleeContext( extra.targetContextID, extra.methodName );
+void ContextService::endBroadcastBatch() {
+  ADD_SELECTORS("ContextService::endBroadcastBatch");
+
+  mace::Event& event = ThreadStructure::myEvent();
+  mace::ContextBaseClass* ctxObj = ThreadStructure::myContext();
+  ASSERT( ctxObj != NULL );
+
+  std::vector<mace::AsyncEvent_Message*> reqObjs = ctxObj->endBroadcastBatch(event.eventId);
+  if( reqObjs.empty() ) {
+    return;
   }
-  macedbg(1) << "Event("<< event.eventId <<") make a broadcast call to context("<< extra.targetContextID <<") from context("<< ctxObj->contextName <<")!" << Log::endl;
+  macedbg(1) << "Event("<< event.eventId <<") makes "<< reqObjs.size() <<" batched broadcast calls from context("<< ctxObj->contextName <<")!" << Log::endl;
 
+  applyBroadcastOwnershipOperations( ctxObj, event );
+  for( uint32_t i=0; i<reqObjs.size(); i++ ) {
+    prepareBroadcastRequest( ctxObj, event, reqObjs[i] );
+  }
+  std::vector<mace::AsyncEvent_Message*> permittedReqObjs = ctxObj->checkBroadcastRequestsExecutePermission(this, reqObjs);
+  broadcastHeads(permittedReqObjs);
+}
+
+void ContextService::applyBroadcastOwnershipOperations( mace::ContextBaseClass* ctxObj, mace::Event& event ) {
+  // Ownership changes the event made so far are in place before its broadcast calls run
   mace::vector<mace::EventOperationInfo> ownershipOpInfos = ctxObj->extractOwnershipOpInfos(event.eventId);
   if( ownershipOpInfos.size() > 0 ) {
     mace::EventOperationInfo& eop = event.eventOpInfo;
@@ -2026,6 +2134,19 @@ void ContextService::executeEventBroadcastRequest( mace::AsyncEvent_Message* req
       eop.newCreateContexts.erase( ownershipOpInfos[i].toContextName );
     }
   }
+}
+
+void ContextService::prepareBroadcastRequest( mace::ContextBaseClass* ctxObj, mace::Event& event, mace::AsyncEvent_Message* reqObj ) {
+  ADD_SELECTORS("ContextService::prepareBroadcastRequest");
+
+  mace::__asyncExtraField& extra = reqObj->getExtra();
+  mace::Event& reqEvent = reqObj->getEvent();
+  ASSERT( !extra.targetContextID.empty() );
+
+  if( contextInfoCollectFlag>0 ){
+      (ctxObj->runtimeInfo).addCalleeContext( extra.targetContextID, extra.methodName );
+  }
+  macedbg(1) << "Event("<< event.eventId <<") make a broadcast call to context("<< extra.targetContextID <<") from context("<< ctxObj->contextName <<")!" << Log::endl;
 
   if( !contextStructure.checkParentChildRelation(ctxObj->contextName, extra.targetContextID) ) {
     maceerr << "Context("<< ctxObj->contextName <<") is not Context("<< extra.targetContextID <<")'s parent!!" << Log::endl;
@@ -2046,9 +2167,6 @@ void ContextService::executeEventBroadcastRequest( mace::AsyncEvent_Message* req
   reqEvent.eventOpInfo.newCreateContexts = event.eventOpInfo.newCreateContexts;
 
   ctxObj->addEventToContext( reqEvent.eventId, extra.targetContextID );
-  if( ctxObj->checkBroadcastRequestExecutePermission(this, reqEvent.eventOpInfo, reqObj) ) {
-    broadcastHead(reqObj);
-  } 
 }
 
 void ExternalCommClass::createEvent(BaseMaceService* sv, mace::Event& event, const mace::string& targetContextID, 
@@ -2267,6 +2385,13 @@ void ContextService::send__event_commit( MaceAddr const& destNode, mace::Event c
     forwardInternalMessage(dest, msg);
   }
 
+  void ContextService::send__event_asyncEvents( mace::MaceAddr const& dest, std::vector<mace::AsyncEvent_Message*> const& eventObjects ) {
+    ADD_SELECTORS("ContextService::send__event_asyncEvents");
+    mace::InternalMessageID msgId( Util::getMaceAddr(), "", 0);
+    mace::InternalMessage msg( new mace::AsyncEvents_Message(instanceUniqueID, eventObjects), msgId );
+    forwardInternalMessage(dest, msg);
+  }
+
   void ContextService::send__event_externalCommControlMsg( mace::MaceAddr const& dest, const uint8_t& control_type, const uint32_t& externalCommId, 
       const uint32_t& externalCommContextId ) {
     ADD_SELECTORS("ContextService::send__event_externalCommControlMsg");
@@ -2714,18 +2839,132 @@ void ContextService::createNewOwnership(mace::string const& pContextName, mace::
   modifyOwnership( mace::EventOperationInfo::ADD_OWNERSHIP_OP, pContextName, cContextName);
 }
 
+void ContextService::createNewOwnerships(mace::string const& pContextName, mace::string const& contextTypeName, 
+    mace::vector<uint32_t> const& contextIds) {
+  ADD_SELECTORS("ContextService::createNewOwnerships");
+  macedbg(1) << "Create new ownerships("<< pContextName<<", " << contextIds.size() << " contexts of " << contextTypeName <<")!" << Log::endl;
+  mace::vector<uint32_t> noContextIds;
+  modifyOwnerships( pContextName, contextTypeName, noContextIds, contextIds );
+}
+
 void ContextService::removeOwnership(mace::string const& pContextName, mace::string const& cContextName) {
   ADD_SELECTORS("ContextService::removeOwnership");
   macedbg(1) << "Remove ownership("<< pContextName<<", " << cContextName<<")!" << Log::endl;
   modifyOwnership( mace::EventOperationInfo::DELETE_OWNERSHIP_OP, pContextName, cContextName);
 }
 
+void ContextService::removeOwnerships(mace::string const& pContextName, mace::string const& contextTypeName, 
+    mace::vector<uint32_t> const& contextIds) {
+  ADD_SELECTORS("ContextService::removeOwnerships");
+  macedbg(1) << "Remove ownerships("<< pContextName<<", " << contextIds.size() << " contexts of " << contextTypeName <<")!" << Log::endl;
+  mace::vector<uint32_t> noContextIds;
+  modifyOwnerships( pContextName, contextTypeName, contextIds, noContextIds );
+}
+
+void ContextService::replaceOwnerships(mace::string const& pContextName, mace::string const& contextTypeName, 
+    mace::vector<uint32_t> const& oldContextIds, mace::vector<uint32_t> const& newContextIds) {
+  ADD_SELECTORS("ContextService::replaceOwnerships");
+  macedbg(1) << "Replace ownerships("<< pContextName<<", " << oldContextIds.size() << " by " << newContextIds.size() << " contexts of " << contextTypeName <<")!" << Log::endl;
+  mace::set<uint32_t> oldIds;
+  mace::set<uint32_t> newIds;
+  oldIds.insert( oldContextIds.begin(), oldContextIds.end() );
+  newIds.insert( newContextIds.begin(), newContextIds.end() );
+
+  mace::vector<uint32_t> removedContextIds;
+  mace::vector<uint32_t> addedContextIds;
+  for( mace::set<uint32_t>::const_iterator iter = oldIds.begin(); iter != oldIds.end(); iter++ ) {
+    if( newIds.count(*iter) == 0 ) {
+      removedContextIds.push_back(*iter);
+    }
+  }
+  for( mace::set<uint32_t>::const_iterator iter = newIds.begin(); iter != newIds.end(); iter++ ) {
+    if( oldIds.count(*iter) == 0 ) {
+      addedContextIds.push_back(*iter);
+    }
+  }
+  modifyOwnerships( pContextName, contextTypeName, removedContextIds, addedContextIds );
+}
+
+namespace {
+  // Context names recently asked for by one thread, so getContextName() takes no lock.
+  // The cache is direct mapped: a name replaces whichever name had its slot, which
+  // bounds it at CONTEXT_NAME_CACHE_SIZE names per thread
+  class ContextNameCache {
+  public:
+    static const uint32_t CONTEXT_NAME_CACHE_SIZE = 1024;
+
+    struct Entry {
+      // Type numbers are given per service, so the type name tells services apart
+      const char* contextTypeName;
+      uint32_t contextTypeId;
+      uint32_t ctxId;
+      mace::string name;
+
+      Entry(): contextTypeName(NULL), contextTypeId(0), ctxId(0) { }
+    };
+
+    Entry entries[ CONTEXT_NAME_CACHE_SIZE ];
+
+    static ContextNameCache* init() {
+      pthread_once( &keyOnce, ContextNameCache::initKey );
+      ContextNameCache* t = (ContextNameCache*)pthread_getspecific( pkey );
+      if( t == NULL ) {
+        t = new ContextNameCache();
+        ASSERT( pthread_setspecific( pkey, t ) == 0 );
+      }
+      return t;
+    }
+
+  private:
+    static pthread_key_t pkey;
+    static pthread_once_t keyOnce;
+
+    static void initKey() {
+      ASSERT( pthread_key_create( &pkey, ContextNameCache::destroy ) == 0 );
+    }
+
+    static void destroy( void* t ) {
+      delete (ContextNameCache*)t;
+    }
+  };
+
+  pthread_key_t ContextNameCache::pkey;
+  pthread_once_t ContextNameCache::keyOnce = PTHREAD_ONCE_INIT;
+}
+
+mace::string ContextService::getContextName( const uint32_t contextTypeId, const char* contextTypeName, const uint32_t ctxId ) {
+  ContextNameCache* cache = ContextNameCache::init();
+  ContextNameCache::Entry& entry = cache->entries[ (ctxId * 2654435761u + contextTypeId) % ContextNameCache::CONTEXT_NAME_CACHE_SIZE ];
+  if( entry.contextTypeName != contextTypeName || entry.contextTypeId != contextTypeId || entry.ctxId != ctxId ) {
+    entry.name = Util::generateContextName( contextTypeName, ctxId );
+    entry.contextTypeName = contextTypeName;
+    entry.contextTypeId = contextTypeId;
+    entry.ctxId = ctxId;
+  }
+  // A copy: the entry is replaced when another name maps to its slot
+  return entry.name;
+}
+
 uint32_t ContextService::createNewContext(mace::string const& contextTypeName) {
   mace::ContextBaseClass* ctxObj = ThreadStructure::myContext();
   mace::EventOperationInfo& eop = (ThreadStructure::myEvent()).eventOpInfo;
   return ctxObj->createNewContext(this, contextTypeName, eop);
 }
 
+mace::vector<uint32_t> ContextService::createNewContexts(mace::string const& contextTypeName, const int32_t nContexts) {
+  mace::vector<uint32_t> newContextIds;
+  if( nContexts <= 0 ) {
+    return newContextIds;
+  }
+  mace::ContextBaseClass* ctxObj = ThreadStructure::myContext();
+  mace::EventOperationInfo& eop = (ThreadStructure::myEvent()).eventOpInfo;
+  uint32_t first_ctx_id = ctxObj->createNewContexts(this, contextTypeName, nContexts, eop);
+  for( int32_t i=0; i<nContexts; i++ ) {
+    newContextIds.push_back( first_ctx_id + i );
+  }
+  return newContextIds;
+}
+
 void ContextService::addNewContextName( const mace::string& new_ctx_name ) {
   mace::EventOperationInfo& eop = (ThreadStructure::myEvent()).eventOpInfo;
   eop.newCreateContexts.insert(new_ctx_name);
@@ -2750,6 +2989,24 @@ void ContextService::send__event_createNewContext( mace::string const& src_conte
   forwardInternalMessage(headAddr, msg);
 }
 
+void ContextService::send__event_createNewContexts( mace::string const& src_contextName, mace::string const& contextTypeName, 
+    const uint32_t nContexts, mace::EventOperationInfo const& eventOpInfo ) const {
+  
+  const mace::ContextMapping& snapshot = getLatestContextMapping();
+  const mace::MaceAddr& headAddr = mace::ContextMapping::getHead(snapshot);
+  mace::InternalMessageID msgId( Util::getMaceAddr(), mace::ContextMapping::GLOBAL_CONTEXT_NAME, 0);
+
+  mace::vector<mace::string> contextNames; 
+  contextNames.push_back( contextTypeName );
+
+  mace::vector<mace::EventOperationInfo> opInfos;
+  opInfos.push_back(eventOpInfo);
+
+  mace::InternalMessage msg(mace::EventExecutionControl, msgId, mace::EventExecutionControl_Message::CREATE_NEW_CONTEXTS, 
+    src_contextName, mace::ContextMapping::GLOBAL_CONTEXT_NAME, eventOpInfo.eventId, contextNames, opInfos, nContexts );
+  forwardInternalMessage(headAddr, msg);
+}
+
 void ContextService::send__event_createNewContextReply( mace::string const& dest_contextName, mace::EventOperationInfo const& eventOpInfo, const uint32_t& newContextId) const {
   const mace::ContextMapping& snapshot = getLatestContextMapping();
   const mace::MaceAddr& destAddr = mace::ContextMapping::getNodeByContext(snapshot, dest_contextName);
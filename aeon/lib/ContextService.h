@@ -247,6 +247,8 @@ public:
     nextExternalCommClassId = 0;
 
     contextInfoCollectFlag = params::get<uint16_t>("CONTEXT_INFO_COLLECT_FLAG", 0);
+    // 0 forwards the broadcast calls of batched loops one at a time, as unbatched calls are
+    broadcastBatchFlag = params::get<uint16_t>("BROADCAST_BATCH", 1);
 
     uint32_t minThreadSize = params::get<uint32_t>("MIN_CONTEXT_THREADS", 2);
     uint32_t maxThreadSize = params::get<uint32_t>("MAX_CONTEXT_THREADS", 8);
@@ -451,6 +453,10 @@ protected:
   void addEventRequest( mace::AsyncEvent_Message* reqObject);
 
   void executeEventBroadcastRequest( mace::AsyncEvent_Message* reqObj );
+  // The broadcast calls an event makes between beginBroadcastBatch() and endBroadcastBatch()
+  // are forwarded together by endBroadcastBatch(), their permissions checked under one lock
+  void beginBroadcastBatch();
+  void endBroadcastBatch();
   void newBroadcastEventID();
 
   void addTimerEventRequest( mace::AsyncEvent_Message* reqObject){
@@ -845,6 +851,7 @@ private:
   void send__event_delete_context( mace::string const& contextName );
 
   void send__event_asyncEvent( mace::MaceAddr const& dest, mace::AsyncEvent_Message* const eventObject, mace::string const& ctxName );
+  void send__event_asyncEvents( mace::MaceAddr const& dest, std::vector<mace::AsyncEvent_Message*> const& eventObjects );
 
   void send__event_externalCommControlMsg( mace::MaceAddr const& dest, const uint8_t& control_type, const uint32_t& externalCommId, 
     const uint32_t& externalCommContextId);
@@ -932,7 +939,8 @@ private:
   void handle__event_contextmapping_update_suggest( const uint64_t ver);
   void handle__event_ExternalCommControl( const mace::ExternalCommControl_Message* msg);
   
-  void handle__event_NewContextCreation( const mace::string& create_ctx_name, const mace::string& created_ctx_type, const mace::EventOperationInfo& op_info);
+  void handle__event_NewContextCreation( const mace::string& create_ctx_name, const mace::string& created_ctx_type, const mace::EventOperationInfo& op_info,
+    const uint32_t nContexts = 1);
 
 
   static void waitExit(){
@@ -1038,6 +1046,7 @@ private:
 
 public:
   uint16_t contextInfoCollectFlag;
+  uint16_t broadcastBatchFlag;
   ContextStructure contextStructure;
   mace::ElasticityConfiguration eConfig;
   
@@ -1091,6 +1100,8 @@ public:
   void send__event_createNewContext( mace::string const& src_contextName, mace::string const& contextTypeName, 
     mace::EventOperationInfo const& eventOpInfo ) const;
   void send__event_createNewContextReply( mace::string const& dest_contextName, mace::EventOperationInfo const& eventOpInfo, const uint32_t& newContextId) const;
+  void send__event_createNewContexts( mace::string const& src_contextName, mace::string const& contextTypeName, const uint32_t nContexts,
+    mace::EventOperationInfo const& eventOpInfo ) const;
   void send__event_enqueueSubEvent( mace::EventOperationInfo const& eventOpInfo, mace::string const& dest_contextName, mace::string const& src_contextName,
     mace::EventRequestWrapper const& eventRequest) const;
   void send__event_enqueueSubEventReply( mace::EventOperationInfo const& eventOpInfo, mace::string const& dest_contextName, 
@@ -1149,6 +1160,11 @@ public:
   mace::MaceAddr const& asyncHead( const mace::OrderID& eventId, const mace::string& targetContextName, 
     const mace::vector< mace::pair<mace::string, mace::string> >& ownershipPairs, const mace::map< mace::string, uint64_t>& vers );
   void broadcastHead( mace::Message* msg );
+  // Sends the requests of one broadcast batch, one message per target node
+  void broadcastHeads( std::vector<mace::AsyncEvent_Message*> const& msgObjs );
+  mace::MaceAddr getBroadcastTargetNode( mace::Event& event );
+  void applyBroadcastOwnershipOperations( mace::ContextBaseClass* ctxObj, mace::Event& event );
+  void prepareBroadcastRequest( mace::ContextBaseClass* ctxObj, mace::Event& event, mace::AsyncEvent_Message* reqObj );
 
   mace::MaceAddr getExternalCommContextAddr(const MaceKey& src, const mace::string& identifier);
   void checkAndWaitExternalMessageHandle();
@@ -1165,10 +1181,42 @@ public:
 
   // Ownership methods
   void createNewOwnership(mace::string const& pContextName, mace::string const& cContextName );
+  // Ownership of pContextName over the contexts of one type, queued in one batch
+  void createNewOwnerships(mace::string const& pContextName, mace::string const& contextTypeName, mace::vector<uint32_t> const& contextIds );
   void removeOwnership(mace::string const& pContextName, mace::string const& cContextName);
+  void removeOwnerships(mace::string const& pContextName, mace::string const& contextTypeName, mace::vector<uint32_t> const& contextIds );
+  // Ownership of pContextName over the contexts in oldContextIds and not in newContextIds
+  // is removed and over those only in newContextIds created, in one batch
+  void replaceOwnerships(mace::string const& pContextName, mace::string const& contextTypeName, 
+    mace::vector<uint32_t> const& oldContextIds, mace::vector<uint32_t> const& newContextIds );
   void modifyOwnership( const uint8_t opType, mace::string const& parentContextName, mace::string const& childContextName );
+  void modifyOwnerships( mace::string const& parentContextName, mace::string const& contextTypeName, 
+    mace::vector<uint32_t> const& removedContextIds, mace::vector<uint32_t> const& addedContextIds );
+
+  // The context ids held by an actor collection, or by a range of one: the elements of
+  // vectors, deques and sets, the values of maps
+  static uint32_t contextIdOf( const int contextId ) { return contextId; }
+  template<typename K>
+  static uint32_t contextIdOf( std::pair<const K, int> const& entry ) { return entry.second; }
+  template<typename Iterator>
+  static mace::vector<uint32_t> contextIdRange( Iterator first, Iterator last ) {
+    mace::vector<uint32_t> contextIds;
+    for( ; first != last; first++ ) {
+      contextIds.push_back( contextIdOf(*first) );
+    }
+    return contextIds;
+  }
+  template<typename Collection>
+  static mace::vector<uint32_t> contextIdsOf( Collection const& collection ) { return contextIdRange(collection.begin(), collection.end()); }
+
+  // The name of context ctxId of an actorclass, looked up in a bounded cache of the
+  // calling thread and formatted on a miss.  contextTypeId is the number the compiler
+  // gives the actorclass
+  mace::string getContextName( const uint32_t contextTypeId, const char* contextTypeName, const uint32_t ctxId );
 
   uint32_t createNewContext(mace::string const& contextTypeName);
+  // Creates nContexts contexts of one type with one request to the head
+  mace::vector<uint32_t> createNewContexts(mace::string const& contextTypeName, const int32_t nContexts);
   mace::string getParentContextName(mace::string const& ctxName) const { return contextStructure.getParentContextName(ctxName); }
 
   void addNewContextName( const mace::string& ctx_name );
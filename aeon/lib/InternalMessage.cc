@@ -22,6 +22,7 @@ const uint8_t mace::EventExecutionControl_Message::RELEASE_LOCK_ON_CONTEXT;
 const uint8_t mace::EventExecutionControl_Message::ENQUEUE_LOCK_CONTEXTS;
 const uint8_t mace::EventExecutionControl_Message::ENQUEUE_OWNERSHIP_OPS;
 const uint8_t mace::EventExecutionControl_Message::ENQUEUE_OWNERSHIP_OPS_REPLY;
+const uint8_t mace::EventExecutionControl_Message::CREATE_NEW_CONTEXTS;
 
 const uint8_t mace::EventExecutionControl_Message::PRINT_CTX_INFO;
 
@@ -114,3 +115,37 @@ mace::TransferContext_Message::~TransferContext_Message() {
         ctxParams = NULL;
     }
 }
+
+void mace::AsyncEvents_Message::serialize(std::string& str) const {
+    size_t initsize = str.size();
+    mace::serialize(str, &sid);
+    uint32_t nEvents = events.size();
+    mace::serialize(str, &nEvents);
+    for( uint32_t i=0; i<nEvents; i++ ){
+        events[i]->serialize(str);
+    }
+    serializedByteSize = str.size() - initsize;
+}
+
+int mace::AsyncEvents_Message::deserialize(std::istream& __mace_in) throw (mace::SerializationException) {
+    serializedByteSize = 0;
+
+    serializedByteSize += mace::deserialize(__mace_in, &sid);
+    uint32_t nEvents = 0;
+    serializedByteSize += mace::deserialize(__mace_in, &nEvents);
+
+    BaseMaceService* serviceInstance = BaseMaceService::getInstance( sid );
+    for( uint32_t i=0; i<nEvents; i++ ){
+        mace::Message* ptr;
+        serializedByteSize += serviceInstance->deserializeMethod( __mace_in, ptr );
+        events.push_back( static_cast< mace::AsyncEvent_Message* >( ptr ) );
+    }
+    return serializedByteSize;
+}
+
+mace::AsyncEvents_Message::~AsyncEvents_Message() {
+    for( uint32_t i=0; i<events.size(); i++ ){
+        delete events[i];
+    }
+    events.clear();
+}
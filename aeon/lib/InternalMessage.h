@@ -1457,6 +1457,9 @@ class ContextMigrationRequest_Message: public InternalMessageHelper, virtual pub
     static const uint8_t ENQUEUE_LOCK_CONTEXTS = 17;
     static const uint8_t ENQUEUE_OWNERSHIP_OPS = 18;
     static const uint8_t ENQUEUE_OWNERSHIP_OPS_REPLY = 19;
+    // newContextId carries the number of contexts to create; the reply is a
+    // CREATE_NEW_CONTEXT_REPLY with the first of the consecutive new ids
+    static const uint8_t CREATE_NEW_CONTEXTS = 20;
 
     static const uint8_t PRINT_CTX_INFO = 30;
     
@@ -1741,6 +1744,35 @@ class ContextMigrationRequest_Message: public InternalMessageHelper, virtual pub
     
   };
 
+  // The async events of one broadcast batch whose target contexts are on the
+  // same node. The receiving node hands each event to its context as if it
+  // had come in an ASYNC_EVENT message of its own.
+  class AsyncEvents_Message: public InternalMessageHelper, virtual public PrintPrintable{
+    mutable size_t serializedByteSize;
+  public:
+    AsyncEvents_Message() : serializedByteSize(0), sid(0), events() {}
+    AsyncEvents_Message( const uint8_t my_sid, std::vector<mace::AsyncEvent_Message*> const& my_events ) : serializedByteSize(0), 
+      sid(my_sid), events(my_events) {}
+    virtual ~AsyncEvents_Message();
+
+    // The events are owned by the contexts they were handed to
+    void unlinkEvents() { events.clear(); }
+
+    void print(std::ostream& __out) const {
+      __out << "AsyncEvents(";
+      __out << "sid=";  mace::printItem(__out, &(sid));
+      __out << ", ";
+      __out << "events=" << events.size();
+      __out << ")";
+    }
+    void serialize(std::string& str) const;
+
+    int deserialize(std::istream& __mace_in) throw (mace::SerializationException);
+
+    uint8_t sid;
+    std::vector<mace::AsyncEvent_Message*> events;
+  };
+
   class create_Message: public InternalMessageHelper, virtual public PrintPrintable{
     struct create_struct {
       __asyncExtraField extra ;
@@ -3166,6 +3198,7 @@ class ContextMigrationRequest_Message: public InternalMessageHelper, virtual pub
   const static uint8_t ENQUEUE_MESSAGE_REPLY = 42;
   const static uint8_t ELASTICITY_CONTROL = 43;
   const static uint8_t COMMIT_CONTEXT_MIGRATION = 44;
+  const static uint8_t ASYNC_EVENTS = 45;
   
     InternalMessage() {}
     InternalMessage( AllocateContextObject_type t, MaceAddr const & destNode, mace::map< uint32_t, mace::string > const& ContextID, 
@@ -3280,6 +3313,8 @@ class ContextMigrationRequest_Message: public InternalMessageHelper, virtual pub
 
     InternalMessage( mace::AsyncEvent_Message* m, InternalMessageID const& msgId, uint8_t sid): msgType( ASYNC_EVENT ), sid(sid), msgId(msgId), helper(m ) {}
 
+    InternalMessage( mace::AsyncEvents_Message* m, InternalMessageID const& msgId): msgType( ASYNC_EVENTS ), sid(m->sid), msgId(msgId), helper(m ) {}
+
     InternalMessage( mace::ApplicationUpcall_Message* m, uint8_t sid): msgType( APPUPCALL ), sid(sid), helper(m ) {}
 
     InternalMessage( mace::Routine_Message* m, InternalMessageID const& msgId, uint8_t sid): msgType( ROUTINE ), sid(sid), msgId(msgId), helper(m ) {}
@@ -3432,6 +3467,7 @@ class ContextMigrationRequest_Message: public InternalMessageHelper, virtual pub
   case NEW_HEAD_READY: helper = InternalMessageHelperPtr( new new_head_ready_Message() ); break;
   case ROUTINE_RETURN: helper = InternalMessageHelperPtr( new routine_return_Message() ); break;
   case APPUPCALL_RETURN: helper = InternalMessageHelperPtr( new appupcall_return_Message()); break;
+  case ASYNC_EVENTS: helper = InternalMessageHelperPtr( new AsyncEvents_Message() ); break;
 
   case ASYNC_EVENT: {
     count += mace::deserialize(in, &sid );